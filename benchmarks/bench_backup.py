@@ -0,0 +1,85 @@
+"""
+差分・圧縮バックアップのベンチマーク
+
+使い方:
+    python -m benchmarks.bench_backup [タスク数] [圧縮方式] [チャンクサイズ(KiB)]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from ccpm.config import BACKUP_CHUNK_SIZE
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.backup import BackupManager
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    compression = sys.argv[2] if len(sys.argv) > 2 else "zlib"
+    chunk_size = int(sys.argv[3]) * 1024 if len(sys.argv) > 3 else BACKUP_CHUNK_SIZE
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        work = Path(work_dir)
+        db = DatabaseManager(f"sqlite:///{work / 'ccpm.db'}")
+        db.init_schema()
+        project = Project(name="bench")
+        SqliteProjectRepository(db).save(project)
+        task_repo = SqliteTaskRepository(db)
+        tasks = [
+            Task(name=f"task-{i}", project_id=project.id, description=f"説明 {uuid4()}")
+            for i in range(task_count)
+        ]
+        task_repo.save_many(tasks)
+
+        manager = BackupManager(
+            db, work / "backups", chunk_size=chunk_size, compression=compression
+        )
+        size_mb = (work / "ccpm.db").stat().st_size / 1024 / 1024
+        print(
+            f"tasks={task_count} database={size_mb:.1f}MB "
+            f"compression={compression} chunk={chunk_size // 1024}KiB"
+        )
+
+        def report(label: str, elapsed: float, stored: int, chunks: str = "") -> None:
+            print(
+                f"{label:<22}: {elapsed * 1000:8.1f}ms ({size_mb / elapsed:7.1f} MB/s)"
+                f" stored={stored / 1024 / 1024:6.2f}MB {chunks}"
+            )
+
+        full = manager.create_snapshot()
+        report("full snapshot", full.elapsed_seconds, full.stored_bytes,
+               f"chunks={full.new_chunks}/{len(full.chunks)}")
+
+        unchanged = manager.create_snapshot()
+        report("unchanged snapshot", unchanged.elapsed_seconds, unchanged.stored_bytes,
+               f"chunks={unchanged.new_chunks}/{len(unchanged.chunks)}")
+
+        # 日常的な編集を想定し、一部のタスクの実績時間を更新
+        edited = tasks[::max(1, task_count // 20)]
+        for task in edited:
+            task.actual_hours += 1.0
+        task_repo.save_many(edited)
+        incremental = manager.create_snapshot()
+        report(
+            "incremental snapshot",
+            incremental.elapsed_seconds,
+            incremental.stored_bytes,
+            f"chunks={incremental.new_chunks}/{len(incremental.chunks)}",
+        )
+
+        started = time.perf_counter()
+        manager.restore(target_path=work / "restored.db")
+        report("restore", time.perf_counter() - started, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+バッファステータス判定（プロジェクトごと vs 一括）のベンチマーク
+
+使い方:
+    python -m benchmarks.bench_buffer_status [プロジェクト数]
+"""
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.services.buffer_calculation import BufferCalculationService
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    project_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    rng = np.random.default_rng(0)
+    sizes = rng.uniform(0.0, 200.0, project_count)
+    sizes[rng.random(project_count) < 0.05] = 0.0
+    consumed = sizes * rng.uniform(0.0, 1.2, project_count)
+    completion = rng.uniform(0.0, 1.0, project_count)
+    completion[rng.random(project_count) < 0.05] = 0.0
+    projects: List[Project] = [
+        Project(
+            name=f"project-{i}", buffer_size=float(size), buffer_consumed=float(used)
+        )
+        for i, (size, used) in enumerate(zip(sizes, consumed))
+    ]
+    service = BufferCalculationService()
+
+    started = time.perf_counter()
+    statuses = [
+        service.get_buffer_status(project, value)
+        for project, value in zip(projects, completion.tolist())
+    ]
+    single = time.perf_counter() - started
+
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        batch = service.get_buffer_statuses(sizes, consumed, completion)
+        timings.append(time.perf_counter() - started)
+
+    mismatches = sum(
+        status.color is not color for status, color in zip(statuses, batch.colors())
+    )
+    print(
+        f"projects={project_count} "
+        f"counts={ {color.value: n for color, n in batch.counts().items()} }"
+    )
+    print(f"get_buffer_status (per project): {single * 1000:.1f}ms")
+    print(f"get_buffer_statuses (batch): best={min(timings) * 1000:.2f}ms "
+          f"speedup={single / min(timings):.0f}x mismatches={mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+エンティティ一括コーデックのベンチマーク
+
+使い方:
+    python -m benchmarks.bench_codec [タスク数]
+"""
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+from uuid import uuid4
+
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.serialization.entity_codec import TASK_CODEC
+
+
+def generate_tasks(
+    task_count: int,
+    project_count: int = 20,
+    seed: int = 0
+) -> List[Task]:
+    """
+    日時・依存関係・タグを含むタスクリストを生成
+
+    Args:
+        task_count: タスク数
+        project_count: プロジェクト数
+        seed: 乱数シード
+
+    Returns:
+        List[Task]: 生成されたタスクリスト
+    """
+    rng = random.Random(seed)
+    project_ids = [uuid4() for _ in range(project_count)]
+    base = datetime(2024, 1, 1)
+    tasks: List[Task] = []
+    for i in range(task_count):
+        created_at = base + timedelta(minutes=rng.randrange(500_000))
+        task = Task(
+            name=f"task-{i}",
+            project_id=rng.choice(project_ids),
+            description="設計とレビュー" if i % 3 else "",
+            estimated_hours=rng.uniform(1.0, 40.0),
+            actual_hours=rng.uniform(0.0, 40.0),
+            category=rng.choice(["設計", "実装", "テスト"]),
+            tags=rng.sample(
+                ["backend", "frontend", "infra", "docs"], rng.randint(0, 2)
+            ),
+            resource=f"member-{rng.randrange(30)}",
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        if i and rng.random() < 0.7:
+            task.start_date = created_at + timedelta(hours=1)
+            task.dependencies = [
+                tasks[j].id for j in rng.sample(range(max(0, i - 50), i), min(i, 2))
+            ]
+        tasks.append(task)
+    return tasks
+
+
+def best_of(function: Callable[[], object], repeat: int = 3) -> float:
+    """
+    複数回実行した中で最短の所要時間を計測
+
+    Args:
+        function: 計測する処理
+        repeat: 実行回数
+
+    Returns:
+        float: 最短の所要時間（秒）
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    tasks = generate_tasks(task_count)
+    dicts = [task.to_dict() for task in tasks]
+    text = json.dumps(dicts, ensure_ascii=False)
+    packed = TASK_CODEC.pack(tasks)
+
+    cases = [
+        ("to_dict (per object)", lambda: [task.to_dict() for task in tasks]),
+        ("codec.to_dicts", lambda: TASK_CODEC.to_dicts(tasks)),
+        (
+            "codec.to_dicts (no derived)",
+            lambda: TASK_CODEC.to_dicts(tasks, derived=False),
+        ),
+        ("from_dict (per object)", lambda: [Task.from_dict(data) for data in dicts]),
+        ("codec.from_dicts", lambda: TASK_CODEC.from_dicts(dicts)),
+        (
+            "json.dumps + to_dict",
+            lambda: json.dumps([task.to_dict() for task in tasks], ensure_ascii=False),
+        ),
+        ("codec.dumps_json", lambda: TASK_CODEC.dumps_json(tasks)),
+        (
+            "json.loads + from_dict",
+            lambda: [Task.from_dict(data) for data in json.loads(text)],
+        ),
+        ("codec.loads_json", lambda: TASK_CODEC.loads_json(text)),
+        ("codec.pack", lambda: TASK_CODEC.pack(tasks)),
+        ("codec.unpack", lambda: TASK_CODEC.unpack(packed)),
+    ]
+
+    print(
+        f"tasks={task_count} json={len(text.encode('utf-8')):,}B "
+        f"binary={len(packed):,}B"
+    )
+    for label, function in cases:
+        elapsed = best_of(function)
+        print(
+            f"{label:<28}: {elapsed * 1000:8.1f}ms "
+            f"({task_count / elapsed:>10,.0f} tasks/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
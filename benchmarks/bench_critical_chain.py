@@ -0,0 +1,117 @@
+"""
+クリティカルチェーン計算のベンチマーク
+
+使い方:
+    python -m benchmarks.bench_critical_chain [タスク数] [エッジ数]
+"""
+import random
+import sys
+import time
+from typing import List
+from uuid import uuid4
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.services.incremental_critical_chain import IncrementalCriticalChain
+from ccpm.domain.services.task_graph import CycleError
+
+
+def generate_tasks(task_count: int, edge_count: int, seed: int = 0) -> List[Task]:
+    """
+    ランダムなDAGを構成するタスクリストを生成
+
+    各タスクは自分より前のタスクにのみ依存するため、循環は発生しません。
+    依存先は直近のタスクに偏らせ、ダイヤモンド状の合流を多数含むグラフにします。
+
+    Args:
+        task_count: タスク数
+        edge_count: 依存関係の総数（目安）
+        seed: 乱数シード
+
+    Returns:
+        List[Task]: 生成されたタスクリスト
+    """
+    rng = random.Random(seed)
+    project_id = uuid4()
+    tasks = [
+        Task(
+            name=f"task-{i}",
+            project_id=project_id,
+            estimated_hours=rng.uniform(1.0, 40.0),
+        )
+        for i in range(task_count)
+    ]
+    edges_per_task = edge_count / max(1, task_count - 1)
+    for i in range(1, task_count):
+        count = min(i, int(edges_per_task) + (rng.random() < edges_per_task % 1))
+        window = min(i, 64)
+        for j in rng.sample(range(i - window, i), min(count, window)):
+            tasks[i].dependencies.append(tasks[j].id)
+    return tasks
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    tasks = generate_tasks(task_count, edge_count)
+    actual_edges = sum(len(task.dependencies) for task in tasks)
+    service = CriticalChainService()
+
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        chain = service.identify_critical_chain(tasks)
+        timings.append(time.perf_counter() - started)
+
+    print(f"tasks={task_count} edges={actual_edges} chain_length={len(chain)}")
+    print(f"identify_critical_chain: best={min(timings) * 1000:.1f}ms "
+          f"median={sorted(timings)[len(timings) // 2] * 1000:.1f}ms")
+
+    rng = random.Random(1)
+    incremental = IncrementalCriticalChain(tasks)
+    edits = []
+    for _ in range(200):
+        task = rng.choice(tasks)
+        started = time.perf_counter()
+        incremental.set_estimate(task.id, rng.uniform(1.0, 40.0))
+        edits.append(time.perf_counter() - started)
+    edits.sort()
+    print(
+        "IncrementalCriticalChain.set_estimate: "
+        f"median={edits[len(edits) // 2] * 1e6:.0f}us "
+        f"p90={edits[int(len(edits) * 0.9)] * 1e6:.0f}us"
+    )
+
+    # 依存関係の追加: 順序に沿うエッジ（生成順に沿うため循環しない）を追加した後、
+    # 生成順に逆らうエッジ（並べ替えまたは循環による拒否）を追加する
+    forward, reordered, rejected = [], [], []
+    for _ in range(200):
+        i, j = sorted(rng.sample(range(task_count), 2))
+        started = time.perf_counter()
+        incremental.add_dependency(tasks[j].id, tasks[i].id)
+        forward.append(time.perf_counter() - started)
+    while len(reordered) < 50 or len(rejected) < 200:
+        i, j = sorted(rng.sample(range(task_count), 2))
+        started = time.perf_counter()
+        try:
+            incremental.add_dependency(tasks[i].id, tasks[j].id)
+            reordered.append(time.perf_counter() - started)
+        except CycleError:
+            rejected.append(time.perf_counter() - started)
+    for label, samples in (
+        ("forward", forward),
+        ("reordered", reordered),
+        ("cycle rejected", rejected),
+    ):
+        samples.sort()
+        print(
+            f"IncrementalCriticalChain.add_dependency ({label}): "
+            f"median={samples[len(samples) // 2] * 1e6:.0f}us "
+            f"p90={samples[int(len(samples) * 0.9)] * 1e6:.0f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+ダッシュボード読み取りモデルのベンチマーク
+
+使い方:
+    python -m benchmarks.bench_dashboard [プロジェクト数] [プロジェクトあたりのタスク数]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ccpm.application.services.dashboard_read_model import DashboardReadModel
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    project_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    task_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        db = DatabaseManager(f"sqlite:///{Path(work_dir) / 'ccpm.db'}")
+        db.init_schema()
+        project_repo = SqliteProjectRepository(db)
+        task_repo = SqliteTaskRepository(db)
+        chain_service = CriticalChainService()
+
+        projects = [
+            Project(name=f"project-{i}", buffer_size=100.0)
+            for i in range(project_count)
+        ]
+        project_repo.save_many(projects)
+        edited = None
+        for project in projects:
+            tasks = [
+                Task(name=f"task-{j}", project_id=project.id, estimated_hours=4.0)
+                for j in range(task_count)
+            ]
+            for previous, task in zip(tasks, tasks[1:]):
+                task.dependencies = [previous.id]
+            project.critical_chain = chain_service.identify_critical_chain(tasks)
+            task_repo.save_many(tasks)
+            edited = edited or tasks[0]
+        project_repo.save_many(projects)
+
+        read_model = DashboardReadModel(project_repo, task_repo)
+
+        def measure(label: str, function) -> None:
+            started = time.perf_counter()
+            result = function()
+            print(
+                f"{label:<24}: {(time.perf_counter() - started) * 1000:8.1f}ms "
+                f"({result})"
+            )
+
+        print(f"projects={project_count} tasks/project={task_count}")
+        measure("initial refresh", read_model.refresh)
+        measure("unchanged refresh", read_model.refresh)
+        edited.complete()
+        task_repo.save(edited)
+        measure("refresh after 1 edit", read_model.refresh)
+        measure("summary page", lambda: len(read_model.list_summaries().items))
+        measure(
+            "task detail page",
+            lambda: len(read_model.load_task_page(edited.project_id, page=1).items),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+見積り補正係数（完了タスクの走査 vs 逐次統計）のベンチマーク
+
+使い方:
+    python -m benchmarks.bench_estimation [完了タスク数]
+"""
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from ccpm.application.services.estimation_service import EstimationService
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_estimation_stats_repository import (
+    SqliteEstimationStatsRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+RESOURCES = [f"user-{i}" for i in range(20)]
+CATEGORIES = ["設計", "実装", "テスト", "レビュー", "調整"]
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    db = DatabaseManager("sqlite:///:memory:")
+    db.init_schema()
+    project_repository = SqliteProjectRepository(db)
+    task_repository = SqliteTaskRepository(db)
+    service = EstimationService(task_repository, SqliteEstimationStatsRepository(db))
+
+    rng = random.Random(0)
+    project = Project(name="bench", start_date=datetime.now())
+    project_repository.save(project)
+    tasks = []
+    for i in range(task_count):
+        estimated = rng.choice([2.0, 4.0, 8.0, 16.0])
+        task = Task(
+            name=f"task-{i}",
+            project_id=project.id,
+            estimated_hours=estimated,
+            actual_hours=estimated * rng.lognormvariate(0.2, 0.4),
+            category=rng.choice(CATEGORIES),
+            resource=rng.choice(RESOURCES),
+            status="完了",
+        )
+        tasks.append(task)
+
+    started = time.perf_counter()
+    for start in range(0, task_count, 1000):
+        task_repository.save_many(tasks[start:start + 1000])
+    saving = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ratios = [
+        task.variance_ratio for task in task_repository.find_by_status("完了")
+        if task.resource == RESOURCES[0] and task.category == CATEGORIES[0]
+    ]
+    scanned = statistics.median(ratios)
+    scan = time.perf_counter() - started
+
+    timings = []
+    for _ in range(100):
+        started = time.perf_counter()
+        factor = service.calculate_correction_factor(RESOURCES[0], CATEGORIES[0])
+        timings.append(time.perf_counter() - started)
+
+    print(f"completed_tasks={task_count} save_many (with stats)={saving * 1000:.0f}ms")
+    print(f"scan median={scanned:.3f}: {scan * 1000:.1f}ms")
+    print(
+        f"calculate_correction_factor={factor:.3f}: "
+        f"median={statistics.median(timings) * 1e6:.0f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+リソース平準化スケジューラのベンチマーク
+
+使い方:
+    python -m benchmarks.bench_resource_leveling [タスク数] [リソース数]
+"""
+import random
+import sys
+import time
+from typing import List
+from uuid import uuid4
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.resource_leveling import ResourceLevelingService
+
+
+def generate_layered_tasks(
+    task_count: int,
+    width: int,
+    resource_count: int,
+    seed: int = 0
+) -> List[Task]:
+    """
+    幅 width の層状DAGを構成するタスクリストを生成
+
+    各タスクは直前の層から最大3つのタスクに依存し、ランダムなリソースに割り当てられます。
+
+    Args:
+        task_count: タスク数
+        width: 1層あたりのタスク数（グラフの幅）
+        resource_count: リソース数
+        seed: 乱数シード
+
+    Returns:
+        List[Task]: 生成されたタスクリスト
+    """
+    rng = random.Random(seed)
+    project_id = uuid4()
+    resources = [f"member-{i}" for i in range(resource_count)]
+    tasks = [
+        Task(
+            name=f"task-{i}",
+            project_id=project_id,
+            estimated_hours=rng.uniform(1.0, 16.0),
+            resource=rng.choice(resources),
+        )
+        for i in range(task_count)
+    ]
+    for i in range(width, task_count):
+        layer_start = (i // width - 1) * width
+        for j in rng.sample(range(layer_start, layer_start + width), min(3, width)):
+            tasks[i].dependencies.append(tasks[j].id)
+    return tasks
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    resource_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    service = ResourceLevelingService()
+
+    print(f"tasks={task_count} resources={resource_count}")
+    for width in (1, 10, 100, 1_000, 10_000):
+        tasks = generate_layered_tasks(task_count, width, resource_count)
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            schedule = service.schedule(tasks)
+            timings.append(time.perf_counter() - started)
+        print(
+            f"width={width:>6}: best={min(timings) * 1000:7.1f}ms "
+            f"makespan={schedule.makespan:10.1f}h chain={len(schedule.critical_chain)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+類似タスク検索（転置インデックス）のベンチマーク
+
+使い方:
+    python -m benchmarks.bench_similar_tasks [完了タスク数]
+"""
+import random
+import statistics
+import sys
+import time
+from uuid import uuid4
+
+from ccpm.domain.services.similar_task_index import SimilarTaskIndex
+
+WORDS = [
+    "ログイン", "画面", "API", "設計", "実装", "テスト", "レビュー", "データベース", "移行", "バッチ",
+    "帳票", "検索", "通知", "認証", "決済", "管理", "一覧", "詳細", "登録", "更新",
+    "削除", "CSV", "出力", "取込", "性能", "改善", "調査", "対応", "障害", "修正",
+]
+CATEGORIES = ["設計", "実装", "テスト", "レビュー", "調整"]
+TAGS = ["ui", "api", "db", "infra", "security"]
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    rng = random.Random(0)
+    rows = []
+    project_ids = [uuid4() for _ in range(100)]
+    for i in range(task_count):
+        estimated = rng.choice([2.0, 4.0, 8.0, 16.0])
+        rows.append((
+            uuid4(),
+            rng.choice(project_ids),
+            "".join(rng.sample(WORDS, 3)) + f" {rng.randint(1, 500)}",
+            "",
+            rng.choice(CATEGORIES),
+            rng.sample(TAGS, rng.randint(0, 2)),
+            "完了",
+            estimated,
+            estimated * rng.lognormvariate(0.2, 0.4),
+        ))
+
+    started = time.perf_counter()
+    index = SimilarTaskIndex.build(rows)
+    building = time.perf_counter() - started
+
+    timings = []
+    for _ in range(100):
+        name = "".join(rng.sample(WORDS, 2)) + "の対応"
+        started = time.perf_counter()
+        suggestion = index.suggest(
+            name, category=rng.choice(CATEGORIES), tags=[rng.choice(TAGS)]
+        )
+        timings.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    index.remove(row[0] for row in rows[::2])
+    removing = time.perf_counter() - started
+
+    print(f"completed_tasks={task_count} build={building * 1000:.0f}ms")
+    print(
+        f"suggest: median={statistics.median(timings) * 1000:.2f}ms "
+        f"max={max(timings) * 1000:.2f}ms "
+        f"matches={suggestion.count}"
+    )
+    print(
+        f"remove half (with compaction)={removing * 1000:.0f}ms remaining={len(index)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
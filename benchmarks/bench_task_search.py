@@ -0,0 +1,102 @@
+"""
+タスク検索（全タスクの照合 vs FTS5 と索引による検索）のベンチマーク
+
+使い方:
+    python -m benchmarks.bench_task_search [タスク数]
+"""
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+WORDS = [
+    "ログイン", "画面", "API", "設計", "実装", "テスト", "レビュー", "データベース", "移行", "バッチ",
+    "帳票", "検索", "通知", "認証", "決済", "管理", "一覧", "詳細", "登録", "更新",
+]
+STATUSES = ["未着手", "進行中", "完了"]
+CATEGORIES = ["設計", "実装", "テスト", "レビュー", "調整"]
+TAGS = ["ui", "api", "db", "infra", "security"]
+QUERIES = [
+    TaskSearchCriteria("データベース移行"),
+    TaskSearchCriteria("ログイン画面", statuses=["未着手", "進行中"]),
+    TaskSearchCriteria("決済", categories=["実装"], tags=["api"]),
+    TaskSearchCriteria(priorities=[1], tags=["security"]),
+]
+
+
+def search_by_scan(repository: TaskRepository, criteria: TaskSearchCriteria) -> int:
+    """
+    TaskRepository の既定実装（全タスクを読み込んで照合）で検索
+
+    Args:
+        repository: タスクリポジトリ
+        criteria: 検索条件
+
+    Returns:
+        int: 一致したタスク数
+    """
+    return TaskRepository.search(repository, criteria).total
+
+
+def main() -> None:
+    """ベンチマークを実行"""
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    db = DatabaseManager("sqlite:///:memory:")
+    db.init_schema()
+    project_repository = SqliteProjectRepository(db)
+    task_repository = SqliteTaskRepository(db)
+
+    rng = random.Random(0)
+    project = Project(name="bench", start_date=datetime.now())
+    project_repository.save(project)
+    tasks = [
+        Task(
+            name="".join(rng.sample(WORDS, 3)),
+            project_id=project.id,
+            description=" ".join(rng.sample(WORDS, 5)),
+            status=rng.choice(STATUSES),
+            priority=rng.randint(1, 5),
+            category=rng.choice(CATEGORIES),
+            tags=rng.sample(TAGS, rng.randint(0, 2)),
+        )
+        for _ in range(task_count)
+    ]
+    started = time.perf_counter()
+    for start in range(0, task_count, 1000):
+        task_repository.save_many(tasks[start:start + 1000])
+    saving = time.perf_counter() - started
+    print(f"tasks={task_count} save_many (with search index)={saving * 1000:.0f}ms")
+
+    for criteria in QUERIES:
+        started = time.perf_counter()
+        scanned = search_by_scan(task_repository, criteria)
+        scan = time.perf_counter() - started
+
+        timings = []
+        for _ in range(20):
+            started = time.perf_counter()
+            result = task_repository.search(criteria, page=1)
+            timings.append(time.perf_counter() - started)
+        assert result.total == scanned
+        print(
+            f"{criteria.text or '-'} statuses={list(criteria.statuses)} "
+            f"tags={list(criteria.tags)}: "
+            f"total={result.total} scan={scan * 1000:.0f}ms "
+            f"search={statistics.median(timings) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
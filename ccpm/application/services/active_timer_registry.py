@@ -0,0 +1,272 @@
+"""
+記録中のタイマー（終了していない時間記録）の管理とWIP制限の適用
+"""
+import copy
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+from ccpm.config import WIP_LIMIT
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.repositories.time_repository import TimeRepository
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class WipLimitExceededError(ValueError):
+    """
+    担当者の記録中のタスク数がWIP制限に達しているため、タイマーを開始できないことを表す例外
+    """
+
+    def __init__(self, resource: str, limit: int, active_task_ids: List[UUID]):
+        """
+        例外の初期化
+
+        Args:
+            resource: 担当者
+            limit: WIP制限
+            active_task_ids: 担当者の記録中のタスクIDのリスト
+        """
+        super().__init__(f"担当者 {resource} の記録中のタスクがWIP制限（{limit}件）に達しています")
+        self.resource = resource
+        self.limit = limit
+        self.active_task_ids = active_task_ids
+
+
+class ActiveTimerRegistry:
+    """
+    記録中のタイマーをメモリ上に保持し、担当者ごとのWIP制限を適用するレジストリ
+
+    起動時に記録中の時間記録（部分インデックスで読み込み）と担当者を読み込み、以降は
+    タスクごと・担当者ごとの辞書で参照するため、記録中のタイマーの参照は時間記録の件数によらず
+    一定時間で済みます。開始時の制限の判定と保存は TimeRepository.start_record が
+    1つのトランザクションで行い（SQLite では BEGIN IMMEDIATE）、メモリ上の辞書はその結果を
+    反映するキャッシュとして扱うため、複数のプロセスから同時に開始しても制限を超えません。
+    担当者のいないタスクには制限を適用しません。
+
+    レジストリを通さずに時間記録を保存・削除した場合や、記録中のタスクの担当者を変更した場合は
+    reload で読み込み直してください。
+    """
+
+    def __init__(
+        self,
+        time_repository: TimeRepository,
+        task_repository: TaskRepository,
+        wip_limit: Optional[int] = WIP_LIMIT
+    ):
+        """
+        レジストリの初期化（記録中の時間記録を読み込みます）
+
+        Args:
+            time_repository: 時間記録リポジトリ
+            task_repository: タスクリポジトリ（担当者の取得に使用）
+            wip_limit: 担当者ごとに同時に記録中にできるタスク数（None の場合は制限なし）
+
+        Raises:
+            ValueError: WIP制限が1未満の場合
+        """
+        if wip_limit is not None and wip_limit < 1:
+            raise ValueError("WIP制限は1以上である必要があります")
+        self.time_repository = time_repository
+        self.task_repository = task_repository
+        self.wip_limit = wip_limit
+        self._lock = threading.RLock()
+        self._records: Dict[UUID, TimeRecord] = {}
+        self._resources: Dict[UUID, str] = {}
+        self._tasks_by_resource: Dict[str, Set[UUID]] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """記録中の時間記録と担当者をリポジトリから読み込み直す"""
+        with self._lock:
+            self._records = {}
+            self._resources = {}
+            self._tasks_by_resource = {}
+            # 開始時刻順のため、同じタスクに複数ある場合は最後に開始したもの（find_active_record と同じ）が残る
+            for record in self.time_repository.find_active_records():
+                if record.task_id not in self._resources:
+                    task = self.task_repository.find_by_id(record.task_id)
+                    self._register(record.task_id, task.resource if task else "")
+                self._records[record.task_id] = record
+            logger.info(f"Loaded {len(self._records)} active timers")
+
+    def _register(self, task_id: UUID, resource: str) -> None:
+        """
+        タスクの担当者を登録
+
+        Args:
+            task_id: タスクID
+            resource: 担当者
+        """
+        self._resources[task_id] = resource
+        self._tasks_by_resource.setdefault(resource, set()).add(task_id)
+
+    def _unregister(self, task_id: UUID) -> None:
+        """
+        タスクの記録中のタイマーと担当者の登録を除く
+
+        Args:
+            task_id: タスクID
+        """
+        self._records.pop(task_id, None)
+        resource = self._resources.pop(task_id, None)
+        if resource is not None:
+            task_ids = self._tasks_by_resource[resource]
+            task_ids.discard(task_id)
+            if not task_ids:
+                del self._tasks_by_resource[resource]
+
+    def start(
+        self,
+        task_id: UUID,
+        start_time: Optional[datetime] = None,
+        description: str = ""
+    ) -> TimeRecord:
+        """
+        タスクのタイマーを開始
+
+        タスクのタイマーがすでに記録中の場合は、その時間記録をそのまま返します。
+        制限の判定にはリポジトリに保存されている記録中の時間記録を使います。
+
+        Args:
+            task_id: タスクID
+            start_time: 開始時刻（省略時は現在時刻）
+            description: 作業内容メモ
+
+        Returns:
+            TimeRecord: 記録中の時間記録
+
+        Raises:
+            ValueError: タスクが存在しない場合
+            WipLimitExceededError: 担当者の記録中のタスク数がWIP制限に達している場合
+        """
+        with self._lock:
+            active = self._records.get(task_id)
+            if active is not None:
+                return active
+
+            task = self.task_repository.find_by_id(task_id)
+            if task is None:
+                raise ValueError(f"タスクが見つかりません: {task_id}")
+            record, running = self.time_repository.start_record(
+                TimeRecord(
+                    task_id=task_id, start_time=start_time, description=description
+                ),
+                task.resource,
+                self.wip_limit,
+                self._tasks_by_resource.get(task.resource, set()),
+            )
+            if record is None:
+                raise WipLimitExceededError(task.resource, self.wip_limit or 0, running)
+            self._register(task_id, task.resource)
+            self._records[task_id] = record
+            return record
+
+    def stop(
+        self,
+        task_id: UUID,
+        end_time: Optional[datetime] = None
+    ) -> Optional[TimeRecord]:
+        """
+        タスクのタイマーを停止
+
+        Args:
+            task_id: タスクID
+            end_time: 終了時刻（省略時は現在時刻）
+
+        Returns:
+            Optional[TimeRecord]: 停止した時間記録、記録中でない場合はNone
+        """
+        with self._lock:
+            active = self._records.get(task_id)
+            if active is None:
+                return None
+            # 保存に失敗した場合にメモリ上の記録を記録中のまま残すため、複製を停止して保存する
+            stopped = copy.copy(active)
+            stopped.stop(end_time)
+            self.time_repository.save(stopped)
+            self._unregister(task_id)
+            return stopped
+
+    def active_record(self, task_id: UUID) -> Optional[TimeRecord]:
+        """
+        タスクの記録中の時間記録を取得
+
+        Args:
+            task_id: タスクID
+
+        Returns:
+            Optional[TimeRecord]: 記録中の時間記録、記録中でない場合はNone
+        """
+        return self._records.get(task_id)
+
+    def is_running(self, task_id: UUID) -> bool:
+        """
+        タスクのタイマーが記録中かどうか
+
+        Args:
+            task_id: タスクID
+
+        Returns:
+            bool: 記録中の場合はTrue
+        """
+        return task_id in self._records
+
+    def active_count(self, resource: str) -> int:
+        """
+        担当者の記録中のタスク数を取得
+
+        Args:
+            resource: 担当者
+
+        Returns:
+            int: 記録中のタスク数
+        """
+        return len(self._tasks_by_resource.get(resource, ()))
+
+    def active_for_resource(self, resource: str) -> List[TimeRecord]:
+        """
+        担当者の記録中の時間記録を取得
+
+        Args:
+            resource: 担当者
+
+        Returns:
+            List[TimeRecord]: 記録中の時間記録のリスト（開始時刻順）
+        """
+        with self._lock:
+            records = [
+                self._records[task_id]
+                for task_id in self._tasks_by_resource.get(resource, ())
+            ]
+        return sorted(records, key=lambda record: record.start_time)
+
+    def can_start(self, task_id: UUID, resource: str) -> bool:
+        """
+        タスクのタイマーを開始できるかどうか（開始ボタンの表示判定用）
+
+        Args:
+            task_id: タスクID
+            resource: タスクの担当者
+
+        Returns:
+            bool: すでに記録中か、担当者の記録中のタスク数がWIP制限未満の場合はTrue
+        """
+        if task_id in self._records or self.wip_limit is None or not resource:
+            return True
+        return self.active_count(resource) < self.wip_limit
+
+    def all_active(self) -> List[TimeRecord]:
+        """
+        すべての記録中の時間記録を取得
+
+        Returns:
+            List[TimeRecord]: 記録中の時間記録のリスト（開始時刻順）
+        """
+        with self._lock:
+            records = list(self._records.values())
+        return sorted(records, key=lambda record: record.start_time)
@@ -0,0 +1,139 @@
+"""
+バッファ履歴の記録とトレンド・フィーバーチャート系列の取得サービス
+"""
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.repositories.buffer_history_repository import BufferHistoryRepository
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.services.buffer_trend import BufferTrendService
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.value_objects.buffer_history import BufferState, BufferTrend
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class BufferHistoryService:
+    """
+    プロジェクトのバッファ履歴を扱うアプリケーションサービス
+
+    バッファサイズ・消費量の変更はプロジェクトの保存時に記録されるため、このサービスは
+    完了率の変更の記録と、日次スナップショットを使った読み取りを担当します。
+    トレンド分析やフィーバーチャートでは全イベントを再生せず、事前計算済みの系列を読み込みます。
+    """
+
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        task_repository: TaskRepository,
+        history_repository: BufferHistoryRepository,
+        trend_service: Optional[BufferTrendService] = None
+    ):
+        """
+        バッファ履歴サービスの初期化
+
+        Args:
+            project_repository: プロジェクトリポジトリ
+            task_repository: タスクリポジトリ
+            history_repository: バッファ履歴リポジトリ
+            trend_service: トレンド分析サービス（省略時は全期間で分析）
+        """
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+        self.history_repository = history_repository
+        self.trend_service = trend_service or BufferTrendService()
+        self.critical_chain_service = CriticalChainService()
+
+    def record_progress(
+        self,
+        project_id: UUID,
+        occurred_at: Optional[datetime] = None
+    ) -> float:
+        """
+        現在のタスクからクリティカルチェーンの完了率を計算して記録
+
+        Args:
+            project_id: プロジェクトID
+            occurred_at: 発生日時（省略時は現在日時）
+
+        Returns:
+            float: 計算した完了率（0.0〜1.0）
+
+        Raises:
+            ValueError: プロジェクトが存在しない場合、または最後のイベントより前の日時の場合
+        """
+        project = self.project_repository.find_by_id(project_id)
+        if project is None:
+            raise ValueError(f"プロジェクトが見つかりません: {project_id}")
+        table = TaskTable.from_tasks(
+            self.task_repository.find_by_project_id(project_id)
+        )
+        completion = self.critical_chain_service.calculate_project_completion(
+            project, table
+        )
+        if self.history_repository.record_progress(project_id, completion, occurred_at):
+            logger.debug("完了率を記録しました: %s %.3f", project_id, completion)
+        return completion
+
+    def state_as_of(self, project_id: UUID, at: datetime) -> Optional[BufferState]:
+        """
+        指定日時の時点のバッファの状態を取得
+
+        Args:
+            project_id: プロジェクトID
+            at: 時点
+
+        Returns:
+            Optional[BufferState]: バッファの状態、その時点までに記録がない場合はNone
+        """
+        return self.history_repository.state_as_of(project_id, at)
+
+    def analyze_trend(
+        self,
+        project_id: UUID,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> BufferTrend:
+        """
+        日次スナップショットからバッファ消費トレンドを分析
+
+        Args:
+            project_id: プロジェクトID
+            start: 開始日（省略時は制限なし）
+            end: 終了日（省略時は制限なし）
+
+        Returns:
+            BufferTrend: 分析結果
+        """
+        states = self.history_repository.daily_states(project_id, start, end)
+        return self.trend_service.analyze(project_id, states)
+
+    def fever_chart_series(
+        self,
+        project_id: UUID,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        フィーバーチャートの系列（日ごとの完了率とバッファ消費率）を取得
+
+        Args:
+            project_id: プロジェクトID
+            start: 開始日（省略時は制限なし）
+            end: 終了日（省略時は制限なし）
+
+        Returns:
+            Dict[str, List[Any]]: 系列の辞書
+                {"completion": [...], "consumption": [...], "labels": [...]}
+        """
+        states = self.history_repository.daily_states(project_id, start, end)
+        return {
+            "completion": [state.completion for state in states],
+            "consumption": [state.consumption_rate for state in states],
+            "labels": [state.at.strftime("%m/%d") for state in states],
+        }
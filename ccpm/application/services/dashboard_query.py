@@ -0,0 +1,226 @@
+"""
+ダッシュボード表示用データの並行読み込みサービス
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ccpm.config import DEFAULT_PROJECT_BUFFER_RATIO
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.services.buffer_calculation import BufferCalculationService
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.value_objects.buffer_status import BufferStatus, ThresholdProfile
+from ccpm.infrastructure.repositories.async_repositories import (
+    AsyncProjectRepository,
+    AsyncTaskRepository,
+    AsyncTimeRepository,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class ProjectOverview:
+    """
+    ダッシュボードに表示する1プロジェクト分のデータ
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        tasks: List[Task],
+        completion: float,
+        buffer_status: BufferStatus
+    ):
+        """
+        プロジェクト概要の初期化
+
+        Args:
+            project: プロジェクト
+            tasks: プロジェクト内のタスクリスト
+            completion: 完了率（0.0〜1.0）
+            buffer_status: バッファステータス
+        """
+        self.project = project
+        self.tasks = tasks
+        self.completion = completion
+        self.buffer_status = buffer_status
+
+
+class DashboardData:
+    """
+    ダッシュボード1画面分のデータと読み込み時間
+    """
+
+    def __init__(
+        self,
+        overviews: List[ProjectOverview],
+        time_records: List[TimeRecord],
+        elapsed_seconds: float
+    ):
+        """
+        ダッシュボードデータの初期化
+
+        Args:
+            overviews: プロジェクト概要のリスト
+            time_records: 期間内の時間記録のリスト
+            elapsed_seconds: 読み込みの所要時間（秒）
+        """
+        self.overviews = overviews
+        self.time_records = time_records
+        self.elapsed_seconds = elapsed_seconds
+
+
+class DashboardQueryService:
+    """
+    ダッシュボードに必要なプロジェクト・タスク・時間記録・バッファステータスを
+    asyncio.gather で並行に読み込むアプリケーションサービス
+
+    プロジェクトごとのタスク読み込みと時間記録の読み込みを同時に発行するため、
+    1画面の読み込み時間は各クエリの合計ではなく、ほぼ最も遅いクエリの時間になります。
+    同時実行数はリポジトリの実行器（接続プールの接続数）で制限されます。
+    """
+
+    def __init__(
+        self,
+        project_repository: AsyncProjectRepository,
+        task_repository: AsyncTaskRepository,
+        time_repository: Optional[AsyncTimeRepository] = None,
+        buffer_ratio: float = DEFAULT_PROJECT_BUFFER_RATIO,
+        thresholds: Optional[Dict[str, float]] = None
+    ):
+        """
+        ダッシュボード読み込みサービスの初期化
+
+        Args:
+            project_repository: 非同期プロジェクトリポジトリ
+            task_repository: 非同期タスクリポジトリ
+            time_repository: 非同期時間記録リポジトリ（省略時は時間記録を読み込まない）
+            buffer_ratio: プロジェクトバッファ比率
+            thresholds: バッファステータスの閾値（省略時は設定ファイルの値）
+        """
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+        self.time_repository = time_repository
+        self.thresholds = ThresholdProfile.of(thresholds)
+        self.critical_chain_service = CriticalChainService()
+        self.buffer_calculation = BufferCalculationService(
+            buffer_ratio, self.thresholds
+        )
+
+    async def load_dashboard(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> DashboardData:
+        """
+        ダッシュボード1画面分のデータを並行に読み込む
+
+        Args:
+            status: 絞り込むプロジェクトのステータス（省略時はすべて）
+            since: 読み込む時間記録の開始日時（省略時は時間記録を読み込まない）
+            until: 読み込む時間記録の終了日時（省略時は現在時刻）
+
+        Returns:
+            DashboardData: ダッシュボードデータ
+        """
+        started = time.perf_counter()
+        if status is None:
+            projects_query = self.project_repository.find_all()
+        else:
+            projects_query = self.project_repository.find_by_status(status)
+
+        time_records_query = None
+        if self.time_repository is not None and since is not None:
+            time_records_query = asyncio.ensure_future(
+                self.time_repository.find_by_date_range(since, until or datetime.now())
+            )
+
+        try:
+            projects = await projects_query
+            overviews = await asyncio.gather(
+                *(self._load_overview(project) for project in projects)
+            )
+            time_records = (
+                await time_records_query if time_records_query is not None else []
+            )
+        except BaseException:
+            if time_records_query is not None:
+                time_records_query.cancel()
+            raise
+
+        data = DashboardData(
+            list(overviews), time_records, time.perf_counter() - started
+        )
+        logger.debug(
+            f"Loaded dashboard for {len(projects)} projects in "
+            f"{data.elapsed_seconds:.3f}s"
+        )
+        return data
+
+    async def load_project_overview(
+        self,
+        project_id: UUID
+    ) -> Optional[ProjectOverview]:
+        """
+        1プロジェクト分の概要を読み込む（プロジェクトとタスクを並行に取得）
+
+        Args:
+            project_id: プロジェクトID
+
+        Returns:
+            Optional[ProjectOverview]: プロジェクト概要、プロジェクトが存在しない場合はNone
+        """
+        project, tasks = await asyncio.gather(
+            self.project_repository.find_by_id(project_id),
+            self.task_repository.find_by_project_id(project_id),
+        )
+        if project is None:
+            return None
+        return await self.task_repository.executor.run(
+            self.build_overview, project, tasks
+        )
+
+    async def _load_overview(self, project: Project) -> ProjectOverview:
+        """
+        プロジェクトのタスクを読み込み、概要を作成
+
+        Args:
+            project: プロジェクト
+
+        Returns:
+            ProjectOverview: プロジェクト概要
+        """
+        tasks = await self.task_repository.find_by_project_id(project.id)
+        # 完了率の計算もワーカースレッドで行い、イベントループを止めない
+        return await self.task_repository.executor.run(
+            self.build_overview, project, tasks
+        )
+
+    def build_overview(self, project: Project, tasks: List[Task]) -> ProjectOverview:
+        """
+        プロジェクトとタスクから完了率とバッファステータスを計算
+
+        Args:
+            project: プロジェクト
+            tasks: プロジェクト内のタスクリスト
+
+        Returns:
+            ProjectOverview: プロジェクト概要
+        """
+        completion = self.critical_chain_service.calculate_project_completion(
+            project, TaskTable.from_tasks(tasks)
+        )
+        consumption = self.buffer_calculation.calculate_buffer_consumption_rate(
+            project, completion
+        )
+        return ProjectOverview(
+            project, tasks, completion, BufferStatus(consumption, self.thresholds)
+        )
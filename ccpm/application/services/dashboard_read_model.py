@@ -0,0 +1,389 @@
+"""
+ダッシュボードの読み取りモデル（プロジェクトごとの事前計算済みサマリー）
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Set
+from uuid import UUID
+
+from ccpm.config import DASHBOARD_PAGE_SIZE, DEFAULT_PROJECT_BUFFER_RATIO
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.services.buffer_calculation import BufferCalculationService
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.value_objects.buffer_status import BufferStatus, ThresholdProfile
+from ccpm.domain.value_objects.pagination import Page, check_page
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# サマリー一覧の並び替えに使える項目
+SUMMARY_SORT_KEYS = ("name", "completion", "buffer_consumption", "task_count")
+
+# タスク明細テーブルの既定の列
+TASK_PAGE_COLUMNS = (
+    "id",
+    "name",
+    "status",
+    "estimated_hours",
+    "actual_hours",
+    "resource",
+)
+
+
+class ProjectSummary:
+    """
+    ダッシュボードに表示する1プロジェクト分の事前計算済みサマリー
+    """
+
+    def __init__(
+        self,
+        project_id: UUID,
+        name: str,
+        status: str,
+        completion: float,
+        buffer_consumption: float,
+        buffer_color: str,
+        next_task_id: Optional[UUID],
+        next_task_name: Optional[str],
+        task_count: int,
+        completed_task_count: int,
+        revision: Optional[int],
+        computed_at: Optional[datetime] = None
+    ):
+        """
+        サマリーの初期化
+
+        Args:
+            project_id: プロジェクトID
+            name: プロジェクト名
+            status: プロジェクトのステータス
+            completion: 完了率（0.0〜1.0）
+            buffer_consumption: バッファ消費率（0.0〜1.0）
+            buffer_color: バッファステータスの色（green/yellow/red）
+            next_task_id: クリティカルチェーン上で次に取り組むタスクのID
+            next_task_name: クリティカルチェーン上で次に取り組むタスクの名前
+            task_count: タスク数
+            completed_task_count: 完了したタスク数
+            revision: 計算時点のプロジェクトの変更リビジョン（不明な場合はNone）
+            computed_at: 計算日時
+        """
+        self.project_id = project_id
+        self.name = name
+        self.status = status
+        self.completion = completion
+        self.buffer_consumption = buffer_consumption
+        self.buffer_color = buffer_color
+        self.next_task_id = next_task_id
+        self.next_task_name = next_task_name
+        self.task_count = task_count
+        self.completed_task_count = completed_task_count
+        self.revision = revision
+        self.computed_at = computed_at or datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: サマリーの辞書表現
+        """
+        return {
+            "project_id": str(self.project_id),
+            "name": self.name,
+            "status": self.status,
+            "completion": self.completion,
+            "buffer_consumption": self.buffer_consumption,
+            "buffer_color": self.buffer_color,
+            "next_task_id": str(self.next_task_id) if self.next_task_id else None,
+            "next_task_name": self.next_task_name,
+            "task_count": self.task_count,
+            "completed_task_count": self.completed_task_count,
+            "revision": self.revision,
+            "computed_at": self.computed_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProjectSummary":
+        """
+        辞書からサマリーを作成
+
+        Args:
+            data: サマリーデータの辞書
+
+        Returns:
+            ProjectSummary: 作成されたサマリー
+        """
+        return cls(
+            project_id=UUID(data["project_id"]),
+            name=data["name"],
+            status=data["status"],
+            completion=float(data["completion"]),
+            buffer_consumption=float(data["buffer_consumption"]),
+            buffer_color=data["buffer_color"],
+            next_task_id=(
+                UUID(data["next_task_id"]) if data.get("next_task_id") else None
+            ),
+            next_task_name=data.get("next_task_name"),
+            task_count=int(data["task_count"]),
+            completed_task_count=int(data["completed_task_count"]),
+            revision=data.get("revision"),
+            computed_at=(
+                datetime.fromisoformat(data["computed_at"])
+                if data.get("computed_at")
+                else None
+            ),
+        )
+
+
+class DashboardReadModel:
+    """
+    プロジェクトごとのサマリー（完了率・バッファ消費率・バッファの色・次のクリティカルタスク）を
+    保持するダッシュボードの読み取りモデル
+
+    refresh はプロジェクトの変更リビジョンだけを読み込み、前回から変わったプロジェクトの
+    サマリーだけを再計算します。画面描画では保持済みのサマリーをページ単位で返し、
+    タスク明細は表示するページの分だけ読み込みます。
+    """
+
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        task_repository: TaskRepository,
+        buffer_ratio: float = DEFAULT_PROJECT_BUFFER_RATIO,
+        thresholds: Optional[Dict[str, float]] = None
+    ):
+        """
+        読み取りモデルの初期化
+
+        Args:
+            project_repository: プロジェクトリポジトリ
+            task_repository: タスクリポジトリ
+            buffer_ratio: プロジェクトバッファ比率
+            thresholds: バッファステータスの閾値（省略時は設定ファイルの値）
+        """
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+        self.thresholds = ThresholdProfile.of(thresholds)
+        self.critical_chain_service = CriticalChainService()
+        self.buffer_calculation = BufferCalculationService(
+            buffer_ratio, self.thresholds
+        )
+        self._summaries: Dict[UUID, ProjectSummary] = {}
+        self._dirty: Set[UUID] = set()
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """
+        変更されたプロジェクトのサマリーを再計算
+
+        Returns:
+            int: 再計算したプロジェクト数
+        """
+        started = time.perf_counter()
+        with self._lock:
+            project_ids = [
+                row[0] for row in self.project_repository.iter_columns(["id"])
+            ]
+            revisions = self.project_repository.find_revisions()
+
+            for project_id in set(self._summaries) - set(project_ids):
+                del self._summaries[project_id]
+
+            stale = [
+                project_id for project_id in project_ids
+                if self._is_stale(project_id, revisions.get(project_id))
+            ]
+            for project_id in stale:
+                project = self.project_repository.find_by_id(project_id)
+                self._dirty.discard(project_id)
+                if project is None:
+                    self._summaries.pop(project_id, None)
+                    continue
+                tasks = self.task_repository.find_by_project_id(project_id)
+                self._summaries[project_id] = self.summarize(
+                    project, tasks, revisions.get(project_id)
+                )
+
+        if stale:
+            logger.debug(
+                f"Refreshed {len(stale)}/{len(project_ids)} dashboard summaries "
+                f"in {time.perf_counter() - started:.3f}s"
+            )
+        return len(stale)
+
+    def _is_stale(self, project_id: UUID, revision: Optional[int]) -> bool:
+        """
+        サマリーの再計算が必要かどうか
+
+        Args:
+            project_id: プロジェクトID
+            revision: 現在の変更リビジョン（不明な場合はNone）
+
+        Returns:
+            bool: 再計算が必要な場合はTrue
+        """
+        summary = self._summaries.get(project_id)
+        return (
+            summary is None
+            or project_id in self._dirty
+            or revision is None
+            or summary.revision != revision
+        )
+
+    def invalidate(self, project_id: Optional[UUID] = None) -> None:
+        """
+        次回の refresh でサマリーを再計算させる
+
+        変更リビジョンを管理しないリポジトリや、リポジトリを経由しない変更の反映に使います。
+
+        Args:
+            project_id: 対象のプロジェクトID（省略時はすべて）
+        """
+        with self._lock:
+            if project_id is None:
+                self._dirty.update(self._summaries)
+            else:
+                self._dirty.add(project_id)
+
+    def summarize(
+        self,
+        project: Project,
+        tasks: List[Task],
+        revision: Optional[int] = None
+    ) -> ProjectSummary:
+        """
+        プロジェクトとタスクからサマリーを計算
+
+        Args:
+            project: プロジェクト
+            tasks: プロジェクト内のタスクリスト
+            revision: 計算時点の変更リビジョン
+
+        Returns:
+            ProjectSummary: 計算したサマリー
+        """
+        completion = self.critical_chain_service.calculate_project_completion(
+            project, TaskTable.from_tasks(tasks)
+        )
+        consumption = self.buffer_calculation.calculate_buffer_consumption_rate(
+            project, completion
+        )
+        buffer_status = BufferStatus(consumption, self.thresholds)
+
+        tasks_by_id = {task.id: task for task in tasks}
+        next_task = next(
+            (
+                tasks_by_id[task_id] for task_id in project.critical_chain
+                if task_id in tasks_by_id and not tasks_by_id[task_id].is_completed
+            ),
+            None,
+        )
+        return ProjectSummary(
+            project_id=project.id,
+            name=project.name,
+            status=project.status,
+            completion=completion,
+            buffer_consumption=buffer_status.consumption_rate,
+            buffer_color=buffer_status.color.value,
+            next_task_id=next_task.id if next_task else None,
+            next_task_name=next_task.name if next_task else None,
+            task_count=len(tasks),
+            completed_task_count=sum(1 for task in tasks if task.is_completed),
+            revision=revision,
+        )
+
+    def get_summary(self, project_id: UUID) -> Optional[ProjectSummary]:
+        """
+        保持しているプロジェクトのサマリーを取得
+
+        Args:
+            project_id: プロジェクトID
+
+        Returns:
+            Optional[ProjectSummary]: サマリー、存在しない場合はNone
+        """
+        return self._summaries.get(project_id)
+
+    def list_summaries(
+        self,
+        page: int = 0,
+        page_size: int = DASHBOARD_PAGE_SIZE,
+        status: Optional[str] = None,
+        sort_by: str = "buffer_consumption",
+        descending: bool = True
+    ) -> Page:
+        """
+        保持しているサマリーをページ単位で取得
+
+        Args:
+            page: ページ番号（0始まり）
+            page_size: 1ページの行数
+            status: 絞り込むプロジェクトのステータス（省略時はすべて）
+            sort_by: 並び替えの項目（name/completion/buffer_consumption/task_count）
+            descending: 降順に並べるかどうか
+
+        Returns:
+            Page: ProjectSummary のページ
+
+        Raises:
+            ValueError: ページ指定または並び替えの項目が不正な場合
+        """
+        check_page(page, page_size)
+        if sort_by not in SUMMARY_SORT_KEYS:
+            raise ValueError(f"並び替えできない項目です: {sort_by}")
+
+        summaries = [
+            summary for summary in list(self._summaries.values())
+            if status is None or summary.status == status
+        ]
+        summaries.sort(
+            key=lambda summary: getattr(summary, sort_by), reverse=descending
+        )
+        start = page * page_size
+        return Page(summaries[start:start + page_size], len(summaries), page, page_size)
+
+    def load_task_page(
+        self,
+        project_id: UUID,
+        page: int = 0,
+        page_size: int = DASHBOARD_PAGE_SIZE,
+        columns: Sequence[str] = TASK_PAGE_COLUMNS
+    ) -> Page:
+        """
+        プロジェクトのタスク明細を表示するページの分だけ読み込む
+
+        Args:
+            project_id: プロジェクトID
+            page: ページ番号（0始まり）
+            page_size: 1ページの行数
+            columns: 読み込む項目名のリスト（dependencies は指定できません）
+
+        Returns:
+            Page: 項目名をキーとする辞書のページ
+
+        Raises:
+            ValueError: ページ指定または項目名が不正な場合
+        """
+        check_page(page, page_size)
+        summary = self._summaries.get(project_id)
+        total = (
+            summary.task_count
+            if summary is not None
+            else self.task_repository.count(project_id)
+        )
+
+        start = page * page_size
+        rows = self.task_repository.iter_columns(
+            columns, project_id=project_id, fetch_size=page_size
+        )
+        items = [
+            dict(zip(columns, row)) for row in islice(rows, start, start + page_size)
+        ]
+        return Page(items, total, page, page_size)
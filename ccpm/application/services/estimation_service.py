@@ -0,0 +1,122 @@
+"""
+見積り補正係数と見積り精度の取得サービス
+"""
+import logging
+from typing import List, Optional
+from uuid import UUID
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.repositories.estimation_stats_repository import (
+    EstimationStatsRepository,
+)
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.services.estimation_correction import EstimationCorrectionService
+from ccpm.domain.value_objects.estimation_accuracy import (
+    EstimationAccuracy,
+    EstimationStats,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class EstimationService:
+    """
+    見積り分析（calculateCorrectionFactor / analyzeEstimationAccuracy）を提供するアプリケーションサービス
+
+    完了タスクを走査せず、タスク保存時に更新される単位ごとの統計だけを読み込みます。
+    ユーザーはタスクの担当者（resource）で識別します。
+    """
+
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        stats_repository: EstimationStatsRepository,
+        correction_service: Optional[EstimationCorrectionService] = None
+    ):
+        """
+        見積りサービスの初期化
+
+        Args:
+            task_repository: タスクリポジトリ
+            stats_repository: 見積り統計リポジトリ
+            correction_service: 見積り補正サービス（省略時は設定ファイルの最小標本数）
+        """
+        self.task_repository = task_repository
+        self.stats_repository = stats_repository
+        self.correction_service = correction_service or EstimationCorrectionService()
+
+    def calculate_correction_factor(
+        self,
+        user_id: str,
+        category: Optional[str] = None
+    ) -> float:
+        """
+        見積り補正係数を計算
+
+        Args:
+            user_id: ユーザー（タスクの担当者）
+            category: タスクカテゴリ（省略可）
+
+        Returns:
+            float: 補正係数（予実比率の中央値、十分な標本がない場合は1.0）
+        """
+        keys = self.correction_service.candidate_keys(user_id, category or "")
+        stats = self.stats_repository.find_many(keys)
+        return self.correction_service.correction_factor(stats, user_id, category or "")
+
+    def corrected_estimate(self, task: Task) -> float:
+        """
+        担当者・カテゴリの補正係数で補正したタスクの見積り工数を計算
+
+        Args:
+            task: タスク
+
+        Returns:
+            float: 補正後の見積り工数
+        """
+        factor = self.calculate_correction_factor(task.resource, task.category)
+        return self.correction_service.correct_estimate(task.estimated_hours, factor)
+
+    def analyze_estimation_accuracy(
+        self,
+        task_id: UUID
+    ) -> Optional[EstimationAccuracy]:
+        """
+        タスクの見積り精度を、同じ担当者・カテゴリの完了タスクの分布と比較して分析
+
+        Args:
+            task_id: タスクID
+
+        Returns:
+            Optional[EstimationAccuracy]: 見積り精度、十分な標本の統計がない場合はNone
+
+        Raises:
+            ValueError: タスクが存在しない場合
+        """
+        task = self.task_repository.find_by_id(task_id)
+        if task is None:
+            raise ValueError(f"タスクが見つかりません: {task_id}")
+        keys = self.correction_service.candidate_keys(task.resource, task.category)
+        return self.correction_service.evaluate(
+            task, self.stats_repository.find_many(keys)
+        )
+
+    def list_statistics(
+        self,
+        scope: Optional[str] = None,
+        user_id: Optional[str] = None,
+        min_count: int = 0
+    ) -> List[EstimationStats]:
+        """
+        単位ごとの予実比率の統計を件数の多い順に取得
+
+        Args:
+            scope: 統計の単位（all/resource/category/tag/resource_category、省略時はすべて）
+            user_id: ユーザー（タスクの担当者、省略時はすべて）
+            min_count: 最小件数
+
+        Returns:
+            List[EstimationStats]: 統計のリスト
+        """
+        return self.stats_repository.find_all(scope, user_id, min_count)
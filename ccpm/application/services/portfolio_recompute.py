@@ -0,0 +1,422 @@
+"""
+ポートフォリオ一括再計算サービス
+"""
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from ccpm.config import DEFAULT_PROJECT_BUFFER_RATIO
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.services.buffer_calculation import BufferCalculationService
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.services.feeding_buffer import FeedingBufferService
+from ccpm.domain.value_objects.buffer_status import (
+    BufferStatus,
+    BufferStatusBatch,
+    ThresholdProfile,
+)
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# ワーカーに渡すプロジェクト単位の入力:
+# (プロジェクト番号, プロジェクトID, タスクID(16バイトずつ連結), 見積り工数, 実績工数,
+#  ステータスコード, 依存関係CSR(indptr, indices), 消費済みバッファ, フィーディングバッファ)
+GraphPayload = Tuple[
+    int, UUID, bytes, List[float], List[float], bytes, List[int], List[int], float,
+    List[FeedingBuffer],
+]
+
+# ワーカーから返るプロジェクト単位の結果:
+# (プロジェクト番号, クリティカルチェーン, バッファサイズ, 完了率, バッファ消費率,
+#  フィーディングバッファ)
+GraphResult = Tuple[int, List[UUID], float, float, float, List[FeedingBuffer]]
+
+
+def build_payload(number: int, project: Project, tasks: List[Task]) -> GraphPayload:
+    """
+    プロジェクトとタスクからワーカーに渡す軽量な入力を作成
+
+    Task オブジェクトを pickle せずに済むよう、タスクテーブルの列と CSR 形式の依存関係を渡します。
+
+    Args:
+        number: バッチ内のプロジェクト番号
+        project: プロジェクト
+        tasks: プロジェクト内のタスクリスト
+
+    Returns:
+        GraphPayload: ワーカー入力
+    """
+    table = TaskTable.from_tasks(tasks)
+    return (
+        number,
+        project.id,
+        b"".join(task_id.bytes for task_id in table.ids),
+        table.estimated_hours.tolist(),
+        table.actual_hours.tolist(),
+        table.status.tobytes(),
+        table.indptr.tolist(),
+        table.indices.tolist(),
+        project.buffer_consumed,
+        project.feeding_buffers,
+    )
+
+
+def payload_table(payload: GraphPayload) -> TaskTable:
+    """
+    ワーカー入力からタスクテーブルを復元
+
+    再計算に使わない列（タスク名・カテゴリ・担当リソース）は空文字列です。
+
+    Args:
+        payload: ワーカー入力
+
+    Returns:
+        TaskTable: タスクテーブル
+    """
+    _, project_id, id_bytes, estimated, actual, statuses, indptr, indices, _, _ = (
+        payload
+    )
+    size = len(estimated)
+    blank = [""] * size
+    return TaskTable(
+        ids=[UUID(bytes=id_bytes[i * 16:(i + 1) * 16]) for i in range(size)],
+        project_ids=[project_id] * size,
+        names=blank,
+        categories=blank,
+        resources=blank,
+        estimated_hours=np.array(estimated, dtype=np.float64),
+        actual_hours=np.array(actual, dtype=np.float64),
+        status=np.frombuffer(statuses, dtype=np.int8),
+        indptr=np.array(indptr, dtype=np.int32),
+        indices=np.array(indices, dtype=np.int32),
+    )
+
+
+def recompute_payloads(
+    payloads: List[GraphPayload],
+    buffer_ratio: float
+) -> List[GraphResult]:
+    """
+    ワーカープロセスでプロジェクト群のクリティカルチェーンとバッファを再計算
+
+    クリティカルチェーン・完了率・フィーディングバッファは単体のプロジェクト更新と同じく
+    CriticalChainService と FeedingBufferService で計算します。
+
+    Args:
+        payloads: ワーカー入力のリスト
+        buffer_ratio: プロジェクトバッファ比率
+
+    Returns:
+        List[GraphResult]: プロジェクトごとの再計算結果
+
+    Raises:
+        ValueError: 依存関係に循環がある場合
+    """
+    critical_chain_service = CriticalChainService()
+    feeding_buffer_service = FeedingBufferService(buffer_ratio)
+    buffer_calculation = BufferCalculationService(buffer_ratio)
+    results: List[GraphResult] = []
+
+    for payload in payloads:
+        number, project_id, _, _, _, _, _, _, buffer_consumed, feeding_buffers = payload
+        table = payload_table(payload)
+        chain = critical_chain_service.identify_critical_chain(table)
+        rows = [table.index[task_id] for task_id in chain]
+        buffer_size = float(table.estimated_hours[rows].sum()) * buffer_ratio
+
+        project = Project(
+            name="",
+            buffer_size=buffer_size,
+            buffer_consumed=buffer_consumed,
+            feeding_buffers=feeding_buffers,
+            id=project_id,
+        )
+        project.critical_chain = chain
+        completion = critical_chain_service.calculate_project_completion(project, table)
+        consumption = buffer_calculation.calculate_buffer_consumption_rate(
+            project, completion
+        )
+        feeding_buffer_service.update_project_feeding_buffers(project, table)
+        results.append(
+            (
+                number,
+                chain,
+                buffer_size,
+                completion,
+                consumption,
+                project.feeding_buffers,
+            )
+        )
+
+    return results
+
+
+class ProjectRecomputeResult:
+    """
+    1プロジェクト分の再計算結果
+    """
+
+    def __init__(
+        self,
+        project_id: UUID,
+        critical_chain: List[UUID],
+        buffer_size: float,
+        completion: float,
+        buffer_status: BufferStatus
+    ):
+        """
+        再計算結果の初期化
+
+        Args:
+            project_id: プロジェクトID
+            critical_chain: クリティカルチェーンを構成するタスクIDのリスト
+            buffer_size: プロジェクトバッファサイズ（時間）
+            completion: 完了率（0.0〜1.0）
+            buffer_status: バッファステータス
+        """
+        self.project_id = project_id
+        self.critical_chain = critical_chain
+        self.buffer_size = buffer_size
+        self.completion = completion
+        self.buffer_status = buffer_status
+
+
+class PortfolioRecomputeReport:
+    """
+    ポートフォリオ一括再計算の実行結果と所要時間
+    """
+
+    def __init__(
+        self,
+        results: List[ProjectRecomputeResult],
+        failed: Dict[UUID, str],
+        load_seconds: float,
+        compute_seconds: float,
+        write_seconds: float
+    ):
+        """
+        実行結果の初期化
+
+        Args:
+            results: 再計算に成功したプロジェクトの結果
+            failed: 再計算に失敗したプロジェクトIDとエラーメッセージ
+            load_seconds: 読み込みとワーカー入力作成の所要時間（秒）
+            compute_seconds: 再計算の所要時間（秒）
+            write_seconds: 書き戻しの所要時間（秒）
+        """
+        self.results = results
+        self.failed = failed
+        self.load_seconds = load_seconds
+        self.compute_seconds = compute_seconds
+        self.write_seconds = write_seconds
+
+    @property
+    def total_seconds(self) -> float:
+        """全体の所要時間（秒）"""
+        return self.load_seconds + self.compute_seconds + self.write_seconds
+
+
+class PortfolioRecomputeService:
+    """
+    全プロジェクトのクリティカルチェーン・バッファサイズ・フィーディングバッファ・
+    バッファステータスを一括再計算するアプリケーションサービス
+
+    プロジェクトをバッチに分割して ProcessPoolExecutor に分配し、結果はまとめて書き戻します。
+    """
+
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        task_repository: TaskRepository,
+        buffer_ratio: float = DEFAULT_PROJECT_BUFFER_RATIO,
+        thresholds: Optional[Dict[str, float]] = None,
+        workers: Optional[int] = None,
+        batch_size: int = 50
+    ):
+        """
+        一括再計算サービスの初期化
+
+        Args:
+            project_repository: プロジェクトリポジトリ
+            task_repository: タスクリポジトリ
+            buffer_ratio: プロジェクトバッファ比率
+            thresholds: バッファステータスの閾値（省略時は設定ファイルの値）
+            workers: ワーカープロセス数（None の場合はCPU数、1 の場合はプロセスを使わない）
+            batch_size: ワーカーに一度に渡すプロジェクト数
+        """
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+        self.buffer_ratio = buffer_ratio
+        self.thresholds = ThresholdProfile.of(thresholds)
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def recompute_all(
+        self,
+        projects: Optional[List[Project]] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> PortfolioRecomputeReport:
+        """
+        プロジェクト群を一括再計算して書き戻す
+
+        Args:
+            projects: 対象プロジェクト（省略時は全プロジェクト）
+            progress: 進捗通知コールバック（完了プロジェクト数, 全プロジェクト数）
+
+        Returns:
+            PortfolioRecomputeReport: 実行結果
+        """
+        started = time.perf_counter()
+        if projects is None:
+            projects = self.project_repository.find_all()
+
+        # タスクはプロジェクトごとに問い合わせず、1回の走査でプロジェクト別に振り分ける
+        tasks_by_project: Dict[UUID, List[Task]] = {
+            project.id: [] for project in projects
+        }
+        for task in self.task_repository.iter_all():
+            project_tasks = tasks_by_project.get(task.project_id)
+            if project_tasks is not None:
+                project_tasks.append(task)
+        payloads = [
+            build_payload(number, project, tasks_by_project[project.id])
+            for number, project in enumerate(projects)
+        ]
+        del tasks_by_project
+        loaded = time.perf_counter()
+
+        raw_results, failed_numbers = self._run(payloads, progress)
+        computed = time.perf_counter()
+
+        statuses = BufferStatusBatch(
+            np.array([result[4] for result in raw_results], dtype=np.float64),
+            self.thresholds,
+        )
+        results: List[ProjectRecomputeResult] = []
+        updated: List[Project] = []
+        for index, result in enumerate(raw_results):
+            number, chain, buffer_size, completion, _, feeding_buffers = result
+            project = projects[number]
+            project.critical_chain = chain
+            project.buffer_size = buffer_size
+            project.feeding_buffers = feeding_buffers
+            updated.append(project)
+            results.append(
+                ProjectRecomputeResult(
+                    project_id=project.id,
+                    critical_chain=project.critical_chain,
+                    buffer_size=buffer_size,
+                    completion=completion,
+                    buffer_status=statuses[index],
+                )
+            )
+        if updated:
+            self.project_repository.save_many(updated)
+        written = time.perf_counter()
+
+        failed = {
+            projects[number].id: message for number, message in failed_numbers.items()
+        }
+        report = PortfolioRecomputeReport(
+            results=results,
+            failed=failed,
+            load_seconds=loaded - started,
+            compute_seconds=computed - loaded,
+            write_seconds=written - computed,
+        )
+        logger.info(
+            f"Recomputed {len(results)}/{len(projects)} projects in "
+            f"{report.total_seconds:.2f}s "
+            f"(load {report.load_seconds:.2f}s, compute {report.compute_seconds:.2f}s, "
+            f"write {report.write_seconds:.2f}s)"
+        )
+        for project_id, message in failed.items():
+            logger.warning(f"Failed to recompute project {project_id}: {message}")
+        return report
+
+    def _run(
+        self,
+        payloads: List[GraphPayload],
+        progress: Optional[Callable[[int, int], None]]
+    ) -> Tuple[List[GraphResult], Dict[int, str]]:
+        """
+        ワーカー入力をバッチに分けて再計算
+
+        Args:
+            payloads: ワーカー入力のリスト
+            progress: 進捗通知コールバック
+
+        Returns:
+            Tuple[List[GraphResult], Dict[int, str]]: (再計算結果, 失敗したプロジェクト番号とエラー)
+        """
+        total = len(payloads)
+        batches = [
+            payloads[i:i + self.batch_size] for i in range(0, total, self.batch_size)
+        ]
+        results: List[GraphResult] = []
+        failed: Dict[int, str] = {}
+        done = 0
+
+        def collect(
+            batch: List[GraphPayload],
+            batch_results: List[GraphResult]
+        ) -> None:
+            nonlocal done
+            results.extend(batch_results)
+            done += len(batch)
+            if progress:
+                progress(done, total)
+
+        if self.workers == 1 or len(batches) <= 1:
+            for batch in batches:
+                collect(batch, self._recompute_batch(batch, failed))
+            return results, failed
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(recompute_payloads, batch, self.buffer_ratio): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    batch_results = future.result()
+                except ValueError:
+                    # 循環など一部のプロジェクトが失敗した場合はバッチ内を個別に再計算
+                    batch_results = self._recompute_batch(batch, failed)
+                collect(batch, batch_results)
+
+        return results, failed
+
+    def _recompute_batch(
+        self,
+        batch: List[GraphPayload],
+        failed: Dict[int, str]
+    ) -> List[GraphResult]:
+        """
+        バッチ内のプロジェクトを現在のプロセスで1件ずつ再計算
+
+        Args:
+            batch: ワーカー入力のリスト
+            failed: 失敗したプロジェクト番号とエラーの記録先
+
+        Returns:
+            List[GraphResult]: 再計算に成功したプロジェクトの結果
+        """
+        results: List[GraphResult] = []
+        for payload in batch:
+            try:
+                results.extend(recompute_payloads([payload], self.buffer_ratio))
+            except ValueError as e:
+                failed[payload[0]] = str(e)
+        return results
@@ -0,0 +1,416 @@
+"""
+プロジェクトのエクスポート・インポートサービス
+"""
+import logging
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TextIO
+from uuid import UUID, uuid4
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.repositories.time_repository import TimeRepository
+from ccpm.infrastructure.serialization.entity_codec import (
+    PROJECT_CODEC,
+    TASK_CODEC,
+    TIME_RECORD_CODEC,
+)
+from ccpm.infrastructure.serialization.record_stream import (
+    FORMAT_JSONL,
+    RECORD_HEADER,
+    RECORD_PROJECT,
+    RECORD_TASK,
+    RECORD_TIME_RECORD,
+    RecordWriter,
+    iter_records,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# マージ戦略
+MERGE_COPY = "copy"  # すべてのIDを振り直し、別プロジェクトとして取り込む
+MERGE_REPLACE = "replace"  # 同じIDの既存プロジェクトを削除してから取り込む
+MERGE_UPSERT = "merge"  # IDを保ったまま上書き保存し、ファイルにないタスクは残す
+MERGE_STRATEGIES = (MERGE_COPY, MERGE_REPLACE, MERGE_UPSERT)
+
+# 進捗通知コールバック（処理済みタスク数, 全タスク数（不明な場合は0））
+ProgressCallback = Callable[[int, int], None]
+
+
+class ProjectTransferService:
+    """
+    プロジェクト・タスク・時間記録を1行1エンティティでエクスポート・インポートする
+    アプリケーションサービス
+
+    エンティティはバッチ単位で読み書きするため、メモリ使用量はプロジェクトの大きさに
+    よらずバッチサイズ分のエンティティに収まります（インポート時のみ、依存関係の解決に
+    使うタスクIDの対応表を保持します）。
+    """
+
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        task_repository: TaskRepository,
+        time_repository: Optional[TimeRepository] = None,
+        batch_size: int = 1000
+    ):
+        """
+        エクスポート・インポートサービスの初期化
+
+        Args:
+            project_repository: プロジェクトリポジトリ
+            task_repository: タスクリポジトリ
+            time_repository: 時間記録リポジトリ（省略時は時間記録を扱わない）
+            batch_size: 1回に変換・保存するエンティティ数
+        """
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+        self.time_repository = time_repository
+        self.batch_size = batch_size
+
+    def export_project(
+        self,
+        project_id: UUID,
+        stream: TextIO,
+        format: str = FORMAT_JSONL,
+        progress: Optional[ProgressCallback] = None
+    ) -> int:
+        """
+        プロジェクトをストリームにエクスポート
+
+        プロジェクト、タスク（バッチごと）、そのバッチのタスクの時間記録の順に書き出します。
+
+        Args:
+            project_id: エクスポートするプロジェクトID
+            stream: 書き込み先のテキストストリーム
+            format: 出力形式（"jsonl" または "csv"）
+            progress: 進捗通知コールバック（処理済みタスク数, 全タスク数）
+
+        Returns:
+            int: 書き出したエンティティ数
+
+        Raises:
+            ValueError: プロジェクトが存在しない場合、または不明な形式の場合
+        """
+        writer = RecordWriter(stream, format)
+        project = self.project_repository.find_by_id(project_id)
+        if project is None:
+            raise ValueError(f"プロジェクトが見つかりません: {project_id}")
+
+        total = self.task_repository.count(project_id=project_id)
+        writer.write_header({
+            "project_id": str(project_id),
+            "task_count": total,
+            "exported_at": datetime.now().isoformat(),
+        })
+        writer.write(RECORD_PROJECT, [project])
+
+        done = 0
+        tasks = self.task_repository.iter_by_project_id(
+            project_id, fetch_size=self.batch_size
+        )
+        for batch in _batches(tasks, self.batch_size):
+            writer.write(RECORD_TASK, batch)
+            if self.time_repository is not None:
+                records = self.time_repository.find_by_task_ids(
+                    [task.id for task in batch]
+                )
+                writer.write(RECORD_TIME_RECORD, records)
+            done += len(batch)
+            if progress:
+                progress(done, total)
+
+        logger.info(f"Exported project {project_id}: {writer.count} records ({format})")
+        return writer.count
+
+    def import_project(
+        self,
+        stream: TextIO,
+        format: str = FORMAT_JSONL,
+        merge_strategy: str = MERGE_COPY,
+        progress: Optional[ProgressCallback] = None
+    ) -> UUID:
+        """
+        ストリームからプロジェクトをインポート
+
+        プロジェクトのレコードはタスクより前に、時間記録はそのタスクより後に置かれている
+        必要があります（export_project の出力はこの順序です）。
+        依存関係は後ろに現れるタスクへの参照も含めて解決し、"copy" の場合に
+        ファイル内に存在しないタスクへの依存関係とクリティカルチェーンの参照は取り除きます。
+
+        Args:
+            stream: 読み込み元のテキストストリーム
+            format: 入力形式（"jsonl" または "csv"）
+            merge_strategy: マージ戦略（"copy"、"replace" または "merge"）
+            progress: 進捗通知コールバック（処理済みタスク数, 全タスク数（不明な場合は0））
+
+        Returns:
+            UUID: インポートされたプロジェクトID
+
+        Raises:
+            ValueError: 不明な形式・マージ戦略の場合、またはデータを解釈できない場合
+        """
+        if merge_strategy not in MERGE_STRATEGIES:
+            raise ValueError(f"不明なマージ戦略です: {merge_strategy}")
+
+        session = _ImportSession(self, merge_strategy, progress)
+        for record_type, data in iter_records(stream, format):
+            session.add(record_type, data)
+        project_id = session.finish()
+
+        logger.info(
+            f"Imported project {project_id} ({merge_strategy}): "
+            f"{session.task_count} tasks, "
+            f"{session.record_count} time records, {session.skipped_records} skipped"
+        )
+        return project_id
+
+
+class _ImportSession:
+    """
+    1回のインポートの状態（バッファ・ID対応表・未解決の参照）
+    """
+
+    def __init__(
+        self,
+        service: ProjectTransferService,
+        merge_strategy: str,
+        progress: Optional[ProgressCallback]
+    ):
+        """
+        インポート状態の初期化
+
+        Args:
+            service: インポートを実行するサービス
+            merge_strategy: マージ戦略
+            progress: 進捗通知コールバック
+        """
+        self.service = service
+        self.copy = merge_strategy == MERGE_COPY
+        self.merge_strategy = merge_strategy
+        self.progress = progress
+        self.project: Optional[Project] = None
+        self.total = 0
+        self.task_count = 0
+        self.record_count = 0
+        self.skipped_records = 0
+        self._tasks: List[Dict[str, Any]] = []
+        self._records: List[Dict[str, Any]] = []
+        # ファイル内のタスクID → 保存時のタスクID（copy 以外では同じ値）
+        self._ids: Dict[UUID, UUID] = {}
+        # ファイルに現れたタスクID（ファイル内のID）
+        self._seen: Set[UUID] = set()
+        # 保存時点でファイルに現れていなかった依存先を持つタスク（copy のみ）
+        self._pending: Dict[UUID, List[UUID]] = {}
+
+    def add(self, record_type: str, data: Dict[str, Any]) -> None:
+        """
+        レコードを1件取り込む
+
+        Args:
+            record_type: レコード種別
+            data: to_dict 形式の辞書
+
+        Raises:
+            ValueError: プロジェクトより前にタスク・時間記録がある場合、またはプロジェクトが複数ある場合
+        """
+        if record_type == RECORD_HEADER:
+            self.total = int(data.get("task_count", 0))
+            return
+        if record_type == RECORD_PROJECT:
+            if self.project is not None:
+                raise ValueError("1つのストリームに複数のプロジェクトは含められません")
+            self._import_project(data)
+            return
+        if self.project is None:
+            raise ValueError("プロジェクトのレコードがタスク・時間記録より前にありません")
+
+        if record_type == RECORD_TASK:
+            self._tasks.append(data)
+            if len(self._tasks) >= self.service.batch_size:
+                self._flush_tasks()
+        elif (
+            record_type == RECORD_TIME_RECORD
+            and self.service.time_repository is not None
+        ):
+            self._records.append(data)
+            if len(self._records) >= self.service.batch_size:
+                self._flush_tasks()
+                self._flush_records()
+
+    def finish(self) -> UUID:
+        """
+        残りのバッファを保存し、未解決の参照を整理
+
+        Returns:
+            UUID: インポートされたプロジェクトID
+
+        Raises:
+            ValueError: プロジェクトのレコードがない場合
+        """
+        if self.project is None:
+            raise ValueError("プロジェクトのレコードがありません")
+        self._flush_tasks()
+        self._flush_records()
+        if self.copy:
+            self._drop_dangling_references()
+        return self.project.id
+
+    def _current_project(self) -> Project:
+        """
+        取り込み中のプロジェクトを取得
+
+        Returns:
+            Project: 保存済みのプロジェクト
+
+        Raises:
+            ValueError: プロジェクトのレコードをまだ取り込んでいない場合
+        """
+        if self.project is None:
+            raise ValueError("プロジェクトのレコードがタスク・時間記録より前にありません")
+        return self.project
+
+    def _map(self, task_id: UUID) -> UUID:
+        """
+        ファイル内のタスクIDを保存時のタスクIDに変換（初出時に割り当て）
+
+        Args:
+            task_id: ファイル内のタスクID
+
+        Returns:
+            UUID: 保存時のタスクID
+        """
+        if not self.copy:
+            return task_id
+        mapped = self._ids.get(task_id)
+        if mapped is None:
+            mapped = self._ids[task_id] = uuid4()
+        return mapped
+
+    def _import_project(self, data: Dict[str, Any]) -> None:
+        """
+        プロジェクトを保存（タスクの外部キーのため最初に保存）
+
+        Args:
+            data: プロジェクトの辞書
+        """
+        project = PROJECT_CODEC.from_dicts([data])[0]
+        repository = self.service.project_repository
+        if self.copy:
+            project.id = uuid4()
+            project.critical_chain = [
+                self._map(task_id) for task_id in project.critical_chain
+            ]
+            for buffer in project.feeding_buffers:
+                buffer.merge_task_id = self._map(buffer.merge_task_id)
+                buffer.feeding_chain = [
+                    self._map(task_id) for task_id in buffer.feeding_chain
+                ]
+        elif (
+            self.merge_strategy == MERGE_REPLACE
+            and repository.find_by_id(project.id) is not None
+        ):
+            repository.delete(project.id)
+            self.service.task_repository.projects_deleted([project.id])
+        self.project = repository.save(project)
+
+    def _flush_tasks(self) -> None:
+        """バッファ内のタスクを保存"""
+        if not self._tasks:
+            return
+        project = self._current_project()
+        tasks = TASK_CODEC.from_dicts(self._tasks)
+        self._tasks = []
+
+        for task in tasks:
+            self._seen.add(task.id)
+        for task in tasks:
+            task.id = self._map(task.id)
+            task.project_id = project.id
+            if self.copy:
+                unseen = [dep for dep in task.dependencies if dep not in self._seen]
+                if unseen:
+                    self._pending[task.id] = unseen
+                task.dependencies = [self._map(dep) for dep in task.dependencies]
+
+        self.service.task_repository.save_many(tasks)
+        self.task_count += len(tasks)
+        if self.progress:
+            self.progress(self.task_count, self.total)
+
+    def _flush_records(self) -> None:
+        """バッファ内の時間記録を保存（取り込んだタスクに属さないものは読み飛ばす）"""
+        time_repository = self.service.time_repository
+        if not self._records or time_repository is None:
+            return
+        records = TIME_RECORD_CODEC.from_dicts(self._records)
+        self._records = []
+
+        kept = []
+        for record in records:
+            if self.copy:
+                if record.task_id not in self._seen:
+                    self.skipped_records += 1
+                    continue
+                record.id = uuid4()
+                record.task_id = self._map(record.task_id)
+            kept.append(record)
+        time_repository.save_many(kept)
+        self.record_count += len(kept)
+
+    def _drop_dangling_references(self) -> None:
+        """ファイル内に存在しなかったタスクへの依存関係・クリティカルチェーンの参照を取り除く"""
+        dangling = {
+            self._ids[task_id] for task_id in self._ids if task_id not in self._seen
+        }
+        if not dangling:
+            return
+
+        fixed: List[Task] = []
+        for task_id, unseen in self._pending.items():
+            if any(dep not in self._seen for dep in unseen):
+                task = self.service.task_repository.find_by_id(task_id)
+                if task is not None:
+                    task.dependencies = [
+                        dep for dep in task.dependencies if dep not in dangling
+                    ]
+                    fixed.append(task)
+        if fixed:
+            self.service.task_repository.save_many(fixed)
+
+        project = self._current_project()
+        project.critical_chain = [
+            task_id for task_id in project.critical_chain if task_id not in dangling
+        ]
+        project.feeding_buffers = [
+            buffer for buffer in project.feeding_buffers
+            if buffer.merge_task_id not in dangling
+            and not any(task_id in dangling for task_id in buffer.feeding_chain)
+        ]
+        self.service.project_repository.save(project)
+        logger.warning(
+            f"Dropped references to {len(dangling)} tasks missing from the import of "
+            f"project {project.id}"
+        )
+
+
+def _batches(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    """
+    イテレータを一定件数ごとのリストに分割
+
+    Args:
+        items: 分割するイテレータ
+        size: 1バッチの件数
+
+    Returns:
+        Iterator[List[Any]]: バッチのイテレータ
+    """
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
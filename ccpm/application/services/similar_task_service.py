@@ -0,0 +1,108 @@
+"""
+類似タスクの実績参照サービス
+"""
+import logging
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from ccpm.config import SIMILAR_TASK_LIMIT
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.services.similar_task_index import SimilarTaskIndex
+from ccpm.domain.value_objects.similar_task import EstimateSuggestion, SimilarTask
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+
+class SimilarTaskService:
+    """
+    見積り入力中のタスクに類似する過去の完了タスクと、その実績工数の分布を提供するアプリケーションサービス
+
+    検索は転置インデックスだけで行い、タスクの読み込みは類似タスクの詳細が必要な場合に限ります。
+    """
+
+    def __init__(self, task_repository: TaskRepository, index: SimilarTaskIndex):
+        """
+        類似タスクサービスの初期化
+
+        Args:
+            task_repository: タスクリポジトリ
+            index: 類似タスクインデックス（IndexedTaskRepository が更新するもの）
+        """
+        self.task_repository = task_repository
+        self.index = index
+
+    def suggest_estimate(
+        self,
+        name: str,
+        description: str = "",
+        category: str = "",
+        tags: Sequence[str] = (),
+        k: int = SIMILAR_TASK_LIMIT
+    ) -> EstimateSuggestion:
+        """
+        入力中のタスクの項目から類似タスクの実績工数の分布を取得
+
+        Args:
+            name: タスク名
+            description: 説明
+            category: カテゴリ
+            tags: タグリスト
+            k: 参照する類似タスクの最大件数
+
+        Returns:
+            EstimateSuggestion: 実績工数の分布
+        """
+        return self.index.suggest(name, description, category, tags, k)
+
+    def suggest_for_task(
+        self,
+        task_id: UUID,
+        k: int = SIMILAR_TASK_LIMIT
+    ) -> EstimateSuggestion:
+        """
+        登録済みのタスクに類似する（自身を除く）タスクの実績工数の分布を取得
+
+        Args:
+            task_id: タスクID
+            k: 参照する類似タスクの最大件数
+
+        Returns:
+            EstimateSuggestion: 実績工数の分布
+
+        Raises:
+            ValueError: タスクが存在しない場合
+        """
+        task = self.task_repository.find_by_id(task_id)
+        if task is None:
+            raise ValueError(f"タスクが見つかりません: {task_id}")
+        return self.index.suggest(
+            task.name, task.description, task.category, task.tags, k, exclude={task.id}
+        )
+
+    def find_similar(
+        self,
+        name: str,
+        description: str = "",
+        category: str = "",
+        tags: Sequence[str] = (),
+        k: int = SIMILAR_TASK_LIMIT,
+        exclude: Optional[Sequence[UUID]] = None
+    ) -> List[SimilarTask]:
+        """
+        類似する完了タスクを類似度の高い順に取得
+
+        Args:
+            name: タスク名
+            description: 説明
+            category: カテゴリ
+            tags: タグリスト
+            k: 最大件数
+            exclude: 結果から除くタスクID
+
+        Returns:
+            List[SimilarTask]: 類似タスクのリスト
+        """
+        return self.index.search(
+            name, description, category, tags, k, set(exclude or ())
+        )
@@ -13,10 +13,23 @@ ROOT_DIR = Path(__file__).parent.parent.absolute()
 DB_DIR = ROOT_DIR / "data"
 DB_FILE = DB_DIR / "ccpm.db"
 DB_URL = f"sqlite:///{DB_FILE}"
+DB_FETCH_SIZE = 1000  # ストリーミング取得で1回に読み込む行数
+DB_POOL_SIZE = 8  # 接続プールの接続数（非同期リポジトリのスレッド数の既定値）
+
+# リポジトリキャッシュ設定
+ENTITY_CACHE_SIZE = 10000  # セッション間で共有するエンティティキャッシュの最大エントリ数
 
 # バックアップディレクトリ
 BACKUP_DIR = ROOT_DIR / "backups"
 
+# バックアップ設定
+BACKUP_CHUNK_SIZE = 128 * 1024  # 差分判定と圧縮の単位（バイト、ページサイズの倍数）
+BACKUP_COMPRESSION = "zlib"  # 圧縮方式（zlib / bz2 / lzma）
+BACKUP_PAGES_PER_STEP = -1  # バックアップAPIの1ステップのページ数（-1 は一括、WAL では書き込みを妨げない）
+BACKUP_INTERVAL_SECONDS = 3600  # バックグラウンドバックアップの間隔（秒）
+BACKUP_KEEP_LAST = 10  # 保持する最新スナップショット数
+BACKUP_KEEP_DAILY = 14  # 日ごとに1つ保持する日数
+
 # ロギング設定
 LOG_DIR = ROOT_DIR / "logs"
 LOG_FILE = LOG_DIR / "ccpm.log"
@@ -36,6 +49,35 @@ BUFFER_STATUS_THRESHOLDS = {
     "red": 1.0,  # 68-100%: 赤（危険）
 }
 
+# 完了予測設定
+WORKING_HOURS_PER_DAY = 8.0  # 1日あたりの作業時間
+FORECAST_TRIALS = 10000  # モンテカルロ試行回数
+FORECAST_CONFIDENCE = 0.9  # 信頼区間の水準
+
+# 見積り補正設定
+ESTIMATION_MIN_SAMPLES = 5  # 補正係数に使う統計の最小標本数（未満の場合はより広い単位の統計を使用）
+ESTIMATION_SKETCH_ACCURACY = 0.01  # 予実比率の分位点の相対誤差
+
+# 類似タスク検索設定
+SIMILAR_TASK_LIMIT = 10  # 見積りの参考にする類似タスクの最大件数
+SIMILAR_TASK_MAX_DF_RATIO = 0.5  # この割合を超えるタスクに現れる語は検索に使わない
+
+# タスク検索設定
+TASK_SEARCH_PAGE_SIZE = 50  # 検索結果の1ページの件数
+
+# 作業時間記録設定
+WIP_LIMIT = 1  # 担当者ごとに同時に記録中にできるタスク数（CCPM ではマルチタスクを避けるため1）
+
+# ダッシュボード設定
+DASHBOARD_PAGE_SIZE = 50  # 一覧・明細テーブルの1ページの行数
+
+# グラフ描画設定
+CHART_DIR = ROOT_DIR / "cache" / "charts"  # 描画済みグラフのディスクキャッシュ
+CHART_CACHE_SIZE = 128  # メモリに保持する描画済みグラフの最大数
+CHART_DISK_CACHE_BYTES = 256 * 1024 * 1024  # ディスクキャッシュの上限（バイト）
+CHART_WORKERS = 2  # 描画ワーカープロセス数
+CHART_DPI = 100  # 描画解像度
+
 # 必要なディレクトリの作成
 def ensure_directories() -> None:
     """アプリケーションに必要なディレクトリを作成します"""
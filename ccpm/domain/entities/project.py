@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID, uuid4
 
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+
 class Project:
     """
     プロジェクトを表すエンティティクラス
@@ -12,6 +14,22 @@ class Project:
     プロジェクトはタスクの集合体であり、クリティカルチェーンとバッファを管理します。
     """
     
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "start_date",
+        "planned_end_date",
+        "actual_end_date",
+        "status",
+        "buffer_size",
+        "buffer_consumed",
+        "feeding_buffers",
+        "created_at",
+        "updated_at",
+        "_critical_chain",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -22,6 +40,7 @@ class Project:
         status: str = "未着手",
         buffer_size: float = 0.0,
         buffer_consumed: float = 0.0,
+        feeding_buffers: Optional[List[FeedingBuffer]] = None,
         id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
@@ -38,21 +57,24 @@ class Project:
             status: ステータス（未着手/進行中/完了）
             buffer_size: プロジェクトバッファサイズ（時間）
             buffer_consumed: 消費済みバッファ量
+            feeding_buffers: フィーディングバッファのリスト
             id: プロジェクトID（指定しない場合は自動生成）
             created_at: 作成日時
             updated_at: 更新日時
         """
+        now = None if start_date and created_at and updated_at else datetime.now()
         self.id = id if id else uuid4()
         self.name = name
         self.description = description
-        self.start_date = start_date if start_date else datetime.now()
+        self.start_date = start_date if start_date else now
         self.planned_end_date = planned_end_date
         self.actual_end_date = actual_end_date
         self.status = status
         self.buffer_size = buffer_size
         self.buffer_consumed = buffer_consumed
-        self.created_at = created_at if created_at else datetime.now()
-        self.updated_at = updated_at if updated_at else datetime.now()
+        self.feeding_buffers = feeding_buffers if feeding_buffers else []
+        self.created_at = created_at if created_at else now
+        self.updated_at = updated_at if updated_at else now
         self._critical_chain: List[UUID] = []
     
     @property
@@ -81,15 +103,13 @@ class Project:
         """プロジェクトを開始状態に変更"""
         if self.status == "未着手":
             self.status = "進行中"
-            self.start_date = datetime.now()
-            self.updated_at = datetime.now()
+            self.start_date = self.updated_at = datetime.now()
     
     def complete(self) -> None:
         """プロジェクトを完了状態に変更"""
         if self.status != "完了":
             self.status = "完了"
-            self.actual_end_date = datetime.now()
-            self.updated_at = datetime.now()
+            self.actual_end_date = self.updated_at = datetime.now()
     
     def consume_buffer(self, hours: float) -> None:
         """
@@ -129,6 +149,7 @@ class Project:
             "buffer_size": self.buffer_size,
             "buffer_consumed": self.buffer_consumed,
             "buffer_consumption_rate": self.buffer_consumption_rate,
+            "feeding_buffers": [buffer.to_dict() for buffer in self.feeding_buffers],
             "critical_chain": [str(task_id) for task_id in self.critical_chain],
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
@@ -154,6 +175,10 @@ class Project:
             status=data.get("status", "未着手"),
             buffer_size=float(data.get("buffer_size", 0.0)),
             buffer_consumed=float(data.get("buffer_consumed", 0.0)),
+            feeding_buffers=[
+                FeedingBuffer.from_dict(buffer)
+                for buffer in data.get("feeding_buffers", [])
+            ],
             id=UUID(data["id"]) if data.get("id") else None,
             created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
             updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
@@ -12,6 +12,25 @@ class Task:
     タスクはプロジェクト内の作業単位であり、見積り工数と実績工数を管理します。
     """
     
+    __slots__ = (
+        "id",
+        "name",
+        "project_id",
+        "description",
+        "status",
+        "priority",
+        "estimated_hours",
+        "actual_hours",
+        "dependencies",
+        "start_date",
+        "end_date",
+        "category",
+        "tags",
+        "resource",
+        "created_at",
+        "updated_at",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -26,6 +45,7 @@ class Task:
         end_date: Optional[datetime] = None,
         category: str = "",
         tags: Optional[List[str]] = None,
+        resource: str = "",
         id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
@@ -46,6 +66,7 @@ class Task:
             end_date: 終了日
             category: カテゴリ
             tags: タグリスト
+            resource: 担当リソース（作業者）。空文字の場合はリソース制約なし
             id: タスクID（指定しない場合は自動生成）
             created_at: 作成日時
             updated_at: 更新日時
@@ -63,8 +84,10 @@ class Task:
         self.end_date = end_date
         self.category = category
         self.tags = tags if tags else []
-        self.created_at = created_at if created_at else datetime.now()
-        self.updated_at = updated_at if updated_at else datetime.now()
+        self.resource = resource
+        now = None if created_at and updated_at else datetime.now()
+        self.created_at = created_at if created_at else now
+        self.updated_at = updated_at if updated_at else now
     
     @property
     def is_started(self) -> bool:
@@ -102,15 +125,13 @@ class Task:
         """タスクを開始状態に変更"""
         if self.status == "未着手":
             self.status = "進行中"
-            self.start_date = datetime.now()
-            self.updated_at = datetime.now()
+            self.start_date = self.updated_at = datetime.now()
     
     def complete(self) -> None:
         """タスクを完了状態に変更"""
         if self.status != "完了":
             self.status = "完了"
-            self.end_date = datetime.now()
-            self.updated_at = datetime.now()
+            self.end_date = self.updated_at = datetime.now()
     
     def add_dependency(self, task_id: UUID) -> None:
         """
@@ -177,6 +198,7 @@ class Task:
             "end_date": self.end_date.isoformat() if self.end_date else None,
             "category": self.category,
             "tags": self.tags,
+            "resource": self.resource,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "variance": self.variance,
@@ -207,6 +229,7 @@ class Task:
             end_date=datetime.fromisoformat(data["end_date"]) if data.get("end_date") else None,
             category=data.get("category", ""),
             tags=data.get("tags", []),
+            resource=data.get("resource", ""),
             id=UUID(data["id"]) if data.get("id") else None,
             created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
             updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
@@ -0,0 +1,218 @@
+"""
+分析用の列指向タスクテーブルの定義
+"""
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from ccpm.domain.entities.task import Task
+
+# ステータスコード
+STATUS_NOT_STARTED = 0
+STATUS_IN_PROGRESS = 1
+STATUS_COMPLETED = 2
+STATUS_NAMES = ("未着手", "進行中", "完了")
+STATUS_CODES: Dict[str, int] = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
+class TaskTable:
+    """
+    タスク群を列ごとの配列で保持するテーブル
+
+    行番号（0 から始まる密な整数）がタスクを表し、依存関係は行番号の CSR 形式
+    （indices[indptr[i]:indptr[i + 1]] が行 i の依存先）で保持します。
+    Task オブジェクトごとのオーバーヘッドなしに、大量のタスクを分析するためのものです。
+    保持するのは分析に使う項目のみで、説明・優先度・タグ・日付は含みません
+    （Task への変換は分析用の射影で、元のタスクには戻りません）。
+    """
+
+    __slots__ = (
+        "ids",
+        "project_ids",
+        "names",
+        "categories",
+        "resources",
+        "estimated_hours",
+        "actual_hours",
+        "status",
+        "indptr",
+        "indices",
+        "_index",
+    )
+
+    def __init__(
+        self,
+        ids: List[UUID],
+        project_ids: List[UUID],
+        names: List[str],
+        categories: List[str],
+        resources: List[str],
+        estimated_hours: np.ndarray,
+        actual_hours: np.ndarray,
+        status: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray
+    ):
+        """
+        タスクテーブルの初期化
+
+        Args:
+            ids: 行番号 → タスクID
+            project_ids: 行番号 → 所属プロジェクトID
+            names: 行番号 → タスク名
+            categories: 行番号 → カテゴリ
+            resources: 行番号 → 担当リソース
+            estimated_hours: 見積り工数（float64）
+            actual_hours: 実績工数（float64）
+            status: ステータスコード（int8）
+            indptr: 依存関係の CSR 行ポインタ（int32、長さは行数 + 1）
+            indices: 依存先の行番号（int32）
+
+        Raises:
+            ValueError: 列の長さが揃っていない場合
+        """
+        size = len(ids)
+        lengths = {
+            len(project_ids), len(names), len(categories), len(resources),
+            len(estimated_hours), len(actual_hours), len(status),
+        }
+        if lengths - {size} or len(indptr) != size + 1:
+            raise ValueError("タスクテーブルの列の長さが一致しません")
+
+        self.ids = ids
+        self.project_ids = project_ids
+        self.names = names
+        self.categories = categories
+        self.resources = resources
+        self.estimated_hours = np.asarray(estimated_hours, dtype=np.float64)
+        self.actual_hours = np.asarray(actual_hours, dtype=np.float64)
+        self.status = np.asarray(status, dtype=np.int8)
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self._index: Optional[Dict[UUID, int]] = None
+
+    @classmethod
+    def from_tasks(cls, tasks: Sequence[Task]) -> "TaskTable":
+        """
+        タスクリストからテーブルを作成
+
+        テーブル外のタスクへの依存と重複した依存は無視します。
+
+        Args:
+            tasks: タスクリスト
+
+        Returns:
+            TaskTable: 作成されたテーブル
+        """
+        ids = [task.id for task in tasks]
+        index = {task_id: i for i, task_id in enumerate(ids)}
+        indptr = np.zeros(len(ids) + 1, dtype=np.int32)
+        indices: List[int] = []
+        for i, task in enumerate(tasks):
+            if task.dependencies:
+                indices.extend(
+                    j
+                    for j in dict.fromkeys(
+                        index.get(dep_id) for dep_id in task.dependencies
+                    )
+                    if j is not None
+                )
+            indptr[i + 1] = len(indices)
+
+        table = cls(
+            ids=ids,
+            project_ids=[task.project_id for task in tasks],
+            names=[task.name for task in tasks],
+            categories=[task.category for task in tasks],
+            resources=[task.resource for task in tasks],
+            estimated_hours=np.fromiter(
+                (task.estimated_hours for task in tasks),
+                dtype=np.float64,
+                count=len(ids),
+            ),
+            actual_hours=np.fromiter(
+                (task.actual_hours for task in tasks), dtype=np.float64, count=len(ids)
+            ),
+            status=np.fromiter(
+                (STATUS_CODES.get(task.status, STATUS_NOT_STARTED) for task in tasks),
+                dtype=np.int8,
+                count=len(ids),
+            ),
+            indptr=indptr,
+            indices=np.array(indices, dtype=np.int32),
+        )
+        table._index = index
+        return table
+
+    def to_partial_tasks(self) -> List[Task]:
+        """
+        テーブルから分析用の部分的なタスクリストを作成（読み取り専用の射影）
+
+        Task を受け取る既存の分析処理にテーブルを渡すためのものです。テーブルに含まれない
+        項目（説明・優先度・タグ・開始日・終了日）は既定値、作成日時・更新日時は作成時点の
+        時刻になり、テーブル外のタスクへの依存関係は含みません。元のタスクを復元するものでは
+        ないため、作成したタスクをリポジトリに保存しないでください（保存すると失われた項目で
+        上書きされます）。
+
+        Returns:
+            List[Task]: 分析に使う項目のみを設定したタスクリスト
+        """
+        ids = self.ids
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        estimated = self.estimated_hours.tolist()
+        actual = self.actual_hours.tolist()
+        status = self.status.tolist()
+        return [
+            Task(
+                name=self.names[i],
+                project_id=self.project_ids[i],
+                status=STATUS_NAMES[status[i]],
+                estimated_hours=estimated[i],
+                actual_hours=actual[i],
+                dependencies=[ids[j] for j in indices[indptr[i]:indptr[i + 1]]],
+                category=self.categories[i],
+                resource=self.resources[i],
+                id=ids[i],
+            )
+            for i in range(len(ids))
+        ]
+
+    def __len__(self) -> int:
+        """行数"""
+        return len(self.ids)
+
+    @property
+    def index(self) -> Dict[UUID, int]:
+        """タスクID → 行番号"""
+        if self._index is None:
+            self._index = {task_id: i for i, task_id in enumerate(self.ids)}
+        return self._index
+
+    @property
+    def edge_count(self) -> int:
+        """依存関係の数"""
+        return len(self.indices)
+
+    @property
+    def completed(self) -> np.ndarray:
+        """完了済みの行を表す真偽値配列"""
+        return np.equal(self.status, STATUS_COMPLETED)
+
+    @property
+    def in_progress(self) -> np.ndarray:
+        """進行中の行を表す真偽値配列"""
+        return np.equal(self.status, STATUS_IN_PROGRESS)
+
+    def dependencies_of(self, row: int) -> np.ndarray:
+        """
+        行の依存先の行番号を取得
+
+        Args:
+            row: 行番号
+
+        Returns:
+            np.ndarray: 依存先の行番号の配列
+        """
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
@@ -12,6 +12,16 @@ class TimeRecord:
     タスクの作業時間を記録します。
     """
     
+    __slots__ = (
+        "id",
+        "task_id",
+        "start_time",
+        "end_time",
+        "_duration",
+        "description",
+        "created_at",
+    )
+    
     def __init__(
         self,
         task_id: UUID,
@@ -34,13 +44,15 @@ class TimeRecord:
             id: 記録ID（指定しない場合は自動生成）
             created_at: 作成日時
         """
+        # 開始時刻と作成日時の両方が指定された場合は現在時刻を取得しない
+        now = start_time if start_time and created_at else datetime.now()
         self.id = id if id else uuid4()
         self.task_id = task_id
-        self.start_time = start_time if start_time else datetime.now()
+        self.start_time = start_time if start_time else now
         self.end_time = end_time
         self._duration = duration
         self.description = description
-        self.created_at = created_at if created_at else datetime.now()
+        self.created_at = created_at if created_at else now
     
     @property
     def duration(self) -> float:
@@ -73,14 +85,17 @@ class TimeRecord:
         """
         self._duration = hours
     
-    def stop(self) -> None:
+    def stop(self, end_time: Optional[datetime] = None) -> None:
         """
         時間記録を停止
         
-        end_timeを現在時刻に設定し、durationを計算します。
+        end_timeを設定し（省略時は現在時刻）、durationを計算します。
+        
+        Args:
+            end_time: 終了時刻
         """
         if self.end_time is None:
-            self.end_time = datetime.now()
+            self.end_time = end_time if end_time else datetime.now()
             self._duration = None  # durationを再計算させる
     
     def is_active(self) -> bool:
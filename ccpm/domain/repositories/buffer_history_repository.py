@@ -0,0 +1,107 @@
+"""
+バッファ履歴リポジトリのインターフェース定義
+"""
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from ccpm.domain.value_objects.buffer_history import BufferEvent, BufferState
+
+
+class BufferHistoryRepository(ABC):
+    """
+    プロジェクトバッファの変更イベント（追記のみ）と日次スナップショットを扱うリポジトリインターフェース
+    
+    バッファサイズ・消費済みバッファの変更はプロジェクトの保存時に記録されます。
+    """
+    
+    @abstractmethod
+    def record_progress(
+        self,
+        project_id: UUID,
+        completion: float,
+        occurred_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        クリティカルチェーンの完了率の変更を記録
+        
+        Args:
+            project_id: プロジェクトID
+            completion: 完了率（0.0〜1.0）
+            occurred_at: 発生日時（省略時は現在日時）
+            
+        Returns:
+            bool: 記録した場合はTrue、完了率が変わっていない場合はFalse
+            
+        Raises:
+            ValueError: 最後のイベントより前の日時の場合
+        """
+        pass
+    
+    @abstractmethod
+    def find_events(
+        self,
+        project_id: UUID,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[BufferEvent]:
+        """
+        プロジェクトのバッファ変更イベントを発生日時順に取得
+        
+        Args:
+            project_id: プロジェクトID
+            start: 開始日時（省略時は制限なし）
+            end: 終了日時（省略時は制限なし）
+            
+        Returns:
+            List[BufferEvent]: バッファ変更イベントのリスト
+        """
+        pass
+    
+    @abstractmethod
+    def state_as_of(self, project_id: UUID, at: datetime) -> Optional[BufferState]:
+        """
+        指定日時の時点のバッファの状態を取得
+        
+        Args:
+            project_id: プロジェクトID
+            at: 時点
+            
+        Returns:
+            Optional[BufferState]: バッファの状態、その時点までにイベントがない場合はNone
+        """
+        pass
+    
+    @abstractmethod
+    def daily_states(
+        self,
+        project_id: UUID,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> List[BufferState]:
+        """
+        プロジェクトの日ごとの最後の状態を日付順に取得（イベントのあった日のみ）
+        
+        Args:
+            project_id: プロジェクトID
+            start: 開始日（省略時は制限なし）
+            end: 終了日（省略時は制限なし）
+            
+        Returns:
+            List[BufferState]: 日ごとの状態のリスト
+        """
+        pass
+    
+    @abstractmethod
+    def latest_states(self, project_ids: Sequence[UUID]) -> Dict[UUID, BufferState]:
+        """
+        プロジェクトごとの現在のバッファの状態を取得
+        
+        Args:
+            project_ids: 対象のプロジェクトIDのリスト
+            
+        Returns:
+            Dict[UUID, BufferState]: プロジェクトIDごとの状態（イベントのないプロジェクトは含まない）
+        """
+        pass
@@ -0,0 +1,69 @@
+"""
+見積り統計リポジトリのインターフェース定義
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+from ccpm.domain.value_objects.estimation_accuracy import EstimationStats, StatsKey
+
+
+class EstimationStatsRepository(ABC):
+    """
+    完了タスクの予実比率の統計（単位ごとの逐次統計と分位点スケッチ）を取得するリポジトリインターフェース
+    
+    統計はタスクの保存・削除時に差分で更新されるため、取得は履歴の件数によらず一定時間です。
+    """
+    
+    @abstractmethod
+    def find_many(self, keys: Sequence[StatsKey]) -> Dict[StatsKey, EstimationStats]:
+        """
+        指定した単位の統計を取得
+        
+        Args:
+            keys: 統計のキー（単位, 担当者, カテゴリまたはタグ）のリスト
+            
+        Returns:
+            Dict[StatsKey, EstimationStats]: キーごとの統計（標本のない単位は含まない）
+        """
+        pass
+    
+    def find(self, key: StatsKey) -> Optional[EstimationStats]:
+        """
+        指定した単位の統計を取得
+        
+        Args:
+            key: 統計のキー
+            
+        Returns:
+            Optional[EstimationStats]: 統計、標本がない場合はNone
+        """
+        return self.find_many([key]).get(key)
+    
+    @abstractmethod
+    def find_all(
+        self,
+        scope: Optional[str] = None,
+        resource: Optional[str] = None,
+        min_count: int = 0
+    ) -> List[EstimationStats]:
+        """
+        条件に一致する統計を件数の多い順に取得
+        
+        Args:
+            scope: 統計の単位（省略時はすべて）
+            resource: 担当者（省略時はすべて）
+            min_count: 最小件数
+            
+        Returns:
+            List[EstimationStats]: 統計のリスト
+        """
+        pass
+    
+    @abstractmethod
+    def rebuild(self) -> None:
+        """
+        完了タスクから統計を作り直す
+        
+        差分更新で累積した浮動小数点誤差の解消や、スケッチの精度を変えた場合に使います。
+        """
+        pass
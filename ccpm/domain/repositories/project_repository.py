@@ -2,10 +2,11 @@
 プロジェクトリポジトリのインターフェース定義
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from ccpm.domain.entities.project import Project
+from ccpm.domain.repositories.projection import project_columns
 
 class ProjectRepository(ABC):
     """
@@ -25,6 +26,20 @@ class ProjectRepository(ABC):
         """
         pass
     
+    def save_many(self, projects: List[Project]) -> List[Project]:
+        """
+        複数のプロジェクトを一括保存
+        
+        実装クラスで一括書き込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            projects: 保存するプロジェクトのリスト
+            
+        Returns:
+            List[Project]: 保存されたプロジェクトのリスト
+        """
+        return [self.save(project) for project in projects]
+    
     @abstractmethod
     def find_by_id(self, project_id: UUID) -> Optional[Project]:
         """
@@ -61,6 +76,95 @@ class ProjectRepository(ABC):
         """
         pass
     
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Project]:
+        """
+        すべてのプロジェクトを順に取得するイテレータ
+        
+        実装クラスでページ単位の読み込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return iter(self.find_all())
+    
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Project]:
+        """
+        ステータスに一致するプロジェクトを順に取得するイテレータ
+        
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return iter(self.find_by_status(status))
+    
+    def count(self, status: Optional[str] = None) -> int:
+        """
+        プロジェクト数を取得
+        
+        Args:
+            status: 絞り込むステータス（省略時はすべて）
+        
+        Returns:
+            int: プロジェクト数
+        """
+        projects = self.find_all() if status is None else self.find_by_status(status)
+        return len(projects)
+    
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        プロジェクトの指定した項目だけを順に取得するイテレータ
+        
+        Args:
+            columns: 取得する項目名のリスト
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        
+        Raises:
+            ValueError: 存在しない項目名が指定された場合
+        """
+        projects = (
+            self.iter_all(fetch_size)
+            if status is None
+            else self.iter_by_status(status, fetch_size)
+        )
+        return project_columns(projects, columns)
+    
+    def find_revisions(
+        self,
+        project_ids: Optional[Sequence[UUID]] = None
+    ) -> Dict[UUID, int]:
+        """
+        プロジェクトの変更リビジョンを取得
+        
+        リビジョンはプロジェクトまたは所属タスクが保存・削除されるたびに進みます。
+        リビジョンを管理しない実装では空の辞書を返すため、呼び出し側は常に変更ありとして扱います。
+        
+        Args:
+            project_ids: 対象のプロジェクトIDのリスト（省略時はすべて）
+        
+        Returns:
+            Dict[UUID, int]: プロジェクトIDごとのリビジョン
+        """
+        return {}
+    
     @abstractmethod
     def delete(self, project_id: UUID) -> bool:
         """
@@ -72,4 +176,18 @@ class ProjectRepository(ABC):
         Returns:
             bool: 削除に成功した場合はTrue
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def delete_many(self, project_ids: List[UUID]) -> int:
+        """
+        複数のプロジェクトを一括削除
+        
+        実装クラスで一括削除に置き換えることを想定した既定実装です。
+        
+        Args:
+            project_ids: 削除するプロジェクトIDのリスト
+            
+        Returns:
+            int: 削除されたプロジェクト数
+        """
+        return sum(1 for project_id in project_ids if self.delete(project_id))
\ No newline at end of file
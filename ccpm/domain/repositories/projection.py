@@ -0,0 +1,37 @@
+"""
+リポジトリの項目指定取得（プロジェクション）の共通処理
+"""
+from typing import Any, Iterable, Iterator, Sequence, Tuple
+
+
+def project_columns(
+    entities: Iterable[Any],
+    columns: Sequence[str]
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    エンティティのイテレータを指定した項目の値のタプルのイテレータに変換
+
+    Args:
+        entities: エンティティのイテレータ
+        columns: 取得する項目名のリスト
+
+    Returns:
+        Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+
+    Raises:
+        ValueError: 項目名が指定されていない場合、または存在しない項目名が指定された場合
+    """
+    if not columns:
+        raise ValueError("取得する項目を1つ以上指定してください")
+    columns = list(columns)
+
+    def generate() -> Iterator[Tuple[Any, ...]]:
+        for entity in entities:
+            values = []
+            for column in columns:
+                if column.startswith("_") or not hasattr(entity, column):
+                    raise ValueError(f"不明な項目です: {column}")
+                values.append(getattr(entity, column))
+            yield tuple(values)
+
+    return generate()
@@ -2,10 +2,14 @@
 タスクリポジトリのインターフェース定義
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 
+from ccpm.config import TASK_SEARCH_PAGE_SIZE
 from ccpm.domain.entities.task import Task
+from ccpm.domain.repositories.projection import project_columns
+from ccpm.domain.value_objects.pagination import check_page
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria, TaskSearchResult
 
 class TaskRepository(ABC):
     """
@@ -25,6 +29,20 @@ class TaskRepository(ABC):
         """
         pass
     
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        複数のタスクを一括保存
+        
+        実装クラスで一括書き込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            tasks: 保存するタスクのリスト
+            
+        Returns:
+            List[Task]: 保存されたタスクのリスト
+        """
+        return [self.save(task) for task in tasks]
+    
     @abstractmethod
     def find_by_id(self, task_id: UUID) -> Optional[Task]:
         """
@@ -88,6 +106,156 @@ class TaskRepository(ABC):
         """
         pass
     
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Task]:
+        """
+        すべてのタスクを順に取得するイテレータ
+        
+        実装クラスでページ単位の読み込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return iter(self.find_all())
+    
+    def iter_by_project_id(
+        self,
+        project_id: UUID,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        プロジェクトに属するタスクを順に取得するイテレータ
+        
+        Args:
+            project_id: 検索するプロジェクトID
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return iter(self.find_by_project_id(project_id))
+    
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        ステータスに一致するタスクを順に取得するイテレータ
+        
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return iter(self.find_by_status(status))
+    
+    def count(
+        self,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """
+        タスク数を取得
+        
+        Args:
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+        
+        Returns:
+            int: タスク数
+        """
+        return sum(1 for _ in self._iter_filtered(project_id, status, None))
+    
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        タスクの指定した項目だけを順に取得するイテレータ
+        
+        Args:
+            columns: 取得する項目名のリスト（dependencies は指定できません）
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        
+        Raises:
+            ValueError: 存在しない項目名が指定された場合
+        """
+        return project_columns(
+            self._iter_filtered(project_id, status, fetch_size), columns
+        )
+    
+    def search(
+        self,
+        criteria: TaskSearchCriteria,
+        page: int = 0,
+        page_size: int = TASK_SEARCH_PAGE_SIZE
+    ) -> TaskSearchResult:
+        """
+        条件に一致するタスクを1ページ分検索
+        
+        実装クラスで全文検索インデックスを使った検索に置き換えることを想定した既定実装です。
+        既定実装はすべてのタスクを順に照合し、作成日時順に返します（関連度による順位付けはしません）。
+        
+        Args:
+            criteria: 検索条件
+            page: ページ番号（0始まり）
+            page_size: 1ページの件数
+        
+        Returns:
+            TaskSearchResult: 検索結果
+        
+        Raises:
+            ValueError: ページ番号が負、または1ページの件数が1未満の場合
+        """
+        check_page(page, page_size)
+        start = page * page_size
+        found: List[Task] = []
+        total = 0
+        for task in self._iter_filtered(criteria.project_id, None, None):
+            if criteria.matches(task):
+                if start <= total < start + page_size:
+                    found.append(task)
+                total += 1
+        return TaskSearchResult(found, total, page, page_size)
+    
+    def _iter_filtered(
+        self,
+        project_id: Optional[UUID],
+        status: Optional[str],
+        fetch_size: Optional[int]
+    ) -> Iterator[Task]:
+        """
+        プロジェクトIDとステータスで絞り込んだタスクのイテレータ
+        
+        Args:
+            project_id: 絞り込むプロジェクトID
+            status: 絞り込むステータス
+            fetch_size: 1回の読み込み件数
+        
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        if project_id is not None:
+            tasks = self.iter_by_project_id(project_id, fetch_size)
+        elif status is not None:
+            tasks = self.iter_by_status(status, fetch_size)
+        else:
+            tasks = self.iter_all(fetch_size)
+        return (task for task in tasks if status is None or task.status == status)
+    
     @abstractmethod
     def delete(self, task_id: UUID) -> bool:
         """
@@ -99,4 +267,30 @@ class TaskRepository(ABC):
         Returns:
             bool: 削除に成功した場合はTrue
         """
+        pass
+    
+    def delete_many(self, task_ids: List[UUID]) -> int:
+        """
+        複数のタスクを一括削除
+        
+        実装クラスで一括削除に置き換えることを想定した既定実装です。
+        
+        Args:
+            task_ids: 削除するタスクIDのリスト
+            
+        Returns:
+            int: 削除されたタスク数
+        """
+        return sum(1 for task_id in task_ids if self.delete(task_id))
+    
+    def projects_deleted(self, project_ids: List[UUID]) -> None:
+        """
+        プロジェクトの削除で連鎖して削除されたタスクを反映
+        
+        プロジェクトを削除した後に呼び出します。タスク単位の索引などを持つ実装で
+        置き換えることを想定しており、既定では何もしません。
+        
+        Args:
+            project_ids: 削除したプロジェクトIDのリスト
+        """
         pass
\ No newline at end of file
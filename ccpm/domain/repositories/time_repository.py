@@ -2,11 +2,29 @@
 時間記録リポジトリのインターフェース定義
 """
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
 from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.repositories.projection import project_columns
+from ccpm.domain.value_objects.time_rollup import (
+    GRANULARITY_DAY,
+    GRANULARITY_WEEK,
+    SCOPE_TASK,
+    TimeRollup,
+    bucket_start,
+)
 
 class TimeRepository(ABC):
     """
@@ -26,6 +44,20 @@ class TimeRepository(ABC):
         """
         pass
     
+    def save_many(self, time_records: List[TimeRecord]) -> List[TimeRecord]:
+        """
+        複数の時間記録を一括保存
+        
+        実装クラスで一括書き込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            time_records: 保存する時間記録のリスト
+            
+        Returns:
+            List[TimeRecord]: 保存された時間記録のリスト
+        """
+        return [self.save(time_record) for time_record in time_records]
+    
     @abstractmethod
     def find_by_id(self, record_id: UUID) -> Optional[TimeRecord]:
         """
@@ -62,6 +94,22 @@ class TimeRepository(ABC):
         """
         pass
     
+    def find_by_task_ids(self, task_ids: Sequence[UUID]) -> List[TimeRecord]:
+        """
+        複数のタスクIDによる時間記録の一括検索
+        
+        実装クラスで一括読み込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            task_ids: 検索するタスクIDのリスト
+            
+        Returns:
+            List[TimeRecord]: いずれかのタスクに属する時間記録のリスト（タスクごとに開始時刻順）
+        """
+        return [
+            record for task_id in task_ids for record in self.find_by_task_id(task_id)
+        ]
+    
     @abstractmethod
     def find_active_record(self, task_id: UUID) -> Optional[TimeRecord]:
         """
@@ -75,6 +123,20 @@ class TimeRepository(ABC):
         """
         pass
     
+    def find_active_records(self) -> List[TimeRecord]:
+        """
+        すべてのアクティブな（終了していない）時間記録を取得
+        
+        実装クラスで記録中の行だけを読み込む検索に置き換えることを想定した既定実装です。
+        
+        Returns:
+            List[TimeRecord]: アクティブな時間記録のリスト（開始時刻順）
+        """
+        return sorted(
+            (record for record in self.iter_all() if record.is_active()),
+            key=lambda record: record.start_time,
+        )
+    
     @abstractmethod
     def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[TimeRecord]:
         """
@@ -89,6 +151,226 @@ class TimeRepository(ABC):
         """
         pass
     
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[TimeRecord]:
+        """
+        すべての時間記録を開始時刻順に取得するイテレータ
+        
+        実装クラスでページ単位の読み込みに置き換えることを想定した既定実装です。
+        
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return iter(self.find_all())
+    
+    def iter_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[TimeRecord]:
+        """
+        開始時刻が日付範囲内の時間記録を開始時刻順に取得するイテレータ
+        
+        Args:
+            start_date: 検索開始日
+            end_date: 検索終了日
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return iter(self.find_by_date_range(start_date, end_date))
+    
+    def count(
+        self,
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        時間記録数を取得
+        
+        Args:
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 開始時刻の下限（end_date と組で指定）
+            end_date: 開始時刻の上限（start_date と組で指定）
+        
+        Returns:
+            int: 時間記録数
+        """
+        return sum(1 for _ in self._iter_filtered(task_id, start_date, end_date, None))
+    
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        時間記録の指定した項目だけを開始時刻順に取得するイテレータ
+        
+        Args:
+            columns: 取得する項目名のリスト
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 開始時刻の下限（end_date と組で指定）
+            end_date: 開始時刻の上限（start_date と組で指定）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+        
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        
+        Raises:
+            ValueError: 存在しない項目名が指定された場合
+        """
+        records = self._iter_filtered(task_id, start_date, end_date, fetch_size)
+        return project_columns(records, columns)
+    
+    def _iter_filtered(
+        self,
+        task_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        fetch_size: Optional[int]
+    ) -> Iterator[TimeRecord]:
+        """
+        タスクIDと日付範囲で絞り込んだ時間記録のイテレータ
+        
+        Args:
+            task_id: 絞り込むタスクID
+            start_date: 開始時刻の下限
+            end_date: 開始時刻の上限
+            fetch_size: 1回の読み込み件数
+        
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        if start_date is not None and end_date is not None:
+            records = self.iter_by_date_range(start_date, end_date, fetch_size)
+        elif task_id is not None:
+            records = iter(self.find_by_task_id(task_id))
+        else:
+            records = self.iter_all(fetch_size)
+        return (
+            record for record in records
+            if (task_id is None or record.task_id == task_id)
+            and (start_date is None or record.start_time >= start_date)
+            and (end_date is None or record.start_time <= end_date)
+        )
+    
+    def start_record(
+        self,
+        time_record: TimeRecord,
+        resource: str = "",
+        wip_limit: Optional[int] = None,
+        known_active: Collection[UUID] = ()
+    ) -> Tuple[Optional[TimeRecord], List[UUID]]:
+        """
+        記録中の時間記録を、担当者の記録中のタスク数がWIP制限未満の場合だけ保存
+        
+        タスクにすでに記録中の時間記録がある場合は保存せずにそれを返します。
+        実装クラスで記録中の件数の判定と保存を1つのトランザクションで行うことを想定した既定実装で、
+        担当者の記録中のタスクは呼び出し側が把握している known_active で判定します。
+        
+        Args:
+            time_record: 保存する記録中の時間記録
+            resource: タスクの担当者（空文字の場合は制限なし）
+            wip_limit: 担当者ごとに同時に記録中にできるタスク数（None の場合は制限なし）
+            known_active: 呼び出し側が把握している担当者の記録中のタスクID
+            
+        Returns:
+            Tuple[Optional[TimeRecord], List[UUID]]: (記録中の時間記録, 担当者の記録中のタスクID)
+                制限に達して保存しなかった場合は時間記録がNone
+        """
+        active = self.find_active_record(time_record.task_id)
+        if active is not None:
+            return active, []
+        running = sorted(set(known_active), key=str)
+        if wip_limit is not None and resource and len(running) >= wip_limit:
+            return None, running
+        return self.save(time_record), []
+    
+    def stop_record(
+        self,
+        record_id: UUID,
+        end_time: Optional[datetime] = None
+    ) -> Optional[TimeRecord]:
+        """
+        時間記録を停止して保存
+        
+        保存時に作業時間集計にも反映されます。
+        
+        Args:
+            record_id: 停止する記録ID
+            end_time: 終了時刻（省略時は現在時刻）
+            
+        Returns:
+            Optional[TimeRecord]: 停止した時間記録、存在しない場合はNone
+        """
+        time_record = self.find_by_id(record_id)
+        if time_record is None:
+            return None
+        time_record.stop(end_time)
+        return self.save(time_record)
+    
+    def aggregate_hours(
+        self,
+        scope: str,
+        start_date: date,
+        end_date: date,
+        granularity: str = GRANULARITY_DAY,
+        keys: Optional[Sequence[Union[UUID, str]]] = None
+    ) -> List[TimeRollup]:
+        """
+        期間内の作業時間を集計区間ごとに取得
+        
+        時間記録を読み込んで集計する既定実装で、タスク単位の集計のみに対応します。
+        実装クラスで集計テーブルからの読み込みに置き換えることを想定しています。
+        
+        Args:
+            scope: 集計の単位（"task"、"project" または "category"）
+            start_date: 期間の開始日
+            end_date: 期間の終了日
+            granularity: 集計の粒度（"day" または "week"。週は期間と重なる週すべて）
+            keys: 集計対象（タスクID、プロジェクトID またはカテゴリ名。省略時はすべて）
+            
+        Returns:
+            List[TimeRollup]: 集計対象・区間順の作業時間集計
+            
+        Raises:
+            ValueError: 未対応の単位・不明な粒度が指定された場合
+        """
+        if scope != SCOPE_TASK:
+            raise ValueError(f"この実装では集計単位 {scope} に対応していません")
+        first = bucket_start(start_date, granularity)
+        last = bucket_start(end_date, granularity) + timedelta(
+            days=6 if granularity == GRANULARITY_WEEK else 0
+        )
+        wanted = set(keys) if keys is not None else None
+        
+        totals: Dict[Tuple[UUID, date], List[float]] = {}
+        records = self.iter_by_date_range(
+            datetime.combine(first, time.min),
+            datetime.combine(last, time.max)
+        )
+        for record in records:
+            if wanted is not None and record.task_id not in wanted:
+                continue
+            bucket = bucket_start(record.start_time.date(), granularity)
+            total = totals.setdefault((record.task_id, bucket), [0.0, 0])
+            total[0] += record.duration
+            total[1] += 1
+        
+        ordered = sorted(totals.items(), key=lambda item: (item[0][0].hex, item[0][1]))
+        return [
+            TimeRollup(granularity, scope, task_id, bucket, hours, int(count))
+            for (task_id, bucket), (hours, count) in ordered
+        ]
+    
     @abstractmethod
     def delete(self, record_id: UUID) -> bool:
         """
@@ -100,4 +382,18 @@ class TimeRepository(ABC):
         Returns:
             bool: 削除に成功した場合はTrue
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def delete_many(self, record_ids: List[UUID]) -> int:
+        """
+        複数の時間記録を一括削除
+        
+        実装クラスで一括削除に置き換えることを想定した既定実装です。
+        
+        Args:
+            record_ids: 削除する記録IDのリスト
+            
+        Returns:
+            int: 削除された時間記録数
+        """
+        return sum(1 for record_id in record_ids if self.delete(record_id))
\ No newline at end of file
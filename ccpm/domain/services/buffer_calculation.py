@@ -1,25 +1,37 @@
 """
 バッファ計算サービス
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping, Union
+
+import numpy as np
 
 from ccpm.domain.entities.project import Project
 from ccpm.domain.entities.task import Task
-from ccpm.domain.value_objects.buffer_status import BufferStatus
+from ccpm.domain.value_objects.buffer_status import (
+    BufferStatus,
+    BufferStatusBatch,
+    ThresholdProfile,
+)
 
 class BufferCalculationService:
     """
     プロジェクトバッファの計算と管理を担当するドメインサービス
     """
     
-    def __init__(self, buffer_ratio: float = 0.5):
+    def __init__(
+        self,
+        buffer_ratio: float = 0.5,
+        thresholds: Union[ThresholdProfile, Mapping[str, float], None] = None
+    ):
         """
         バッファ計算サービスの初期化
         
         Args:
             buffer_ratio: プロジェクトバッファ比率（デフォルト: 0.5 = クリティカルチェーン長の50%）
+            thresholds: バッファステータスの閾値（省略時は設定ファイルの値）
         """
         self.buffer_ratio = buffer_ratio
+        self.thresholds = ThresholdProfile.of(thresholds)
     
     def calculate_project_buffer(self, critical_chain_tasks: List[Task]) -> float:
         """
@@ -88,7 +100,65 @@ class BufferCalculationService:
             BufferStatus: バッファステータス
         """
         consumption_rate = self.calculate_buffer_consumption_rate(project, completed_percentage)
-        return BufferStatus(consumption_rate)
+        return BufferStatus(consumption_rate, self.thresholds)
+    
+    def calculate_buffer_consumption_rates(
+        self,
+        buffer_sizes: np.ndarray,
+        buffer_consumed: np.ndarray,
+        completed_percentages: np.ndarray
+    ) -> np.ndarray:
+        """
+        複数プロジェクトのバッファ消費率を一括計算
+        
+        calculate_buffer_consumption_rate と同じ計算を配列全体に適用します。
+        
+        Args:
+            buffer_sizes: バッファサイズの配列
+            buffer_consumed: 消費済みバッファの配列
+            completed_percentages: 完了率（0.0〜1.0）の配列
+            
+        Returns:
+            np.ndarray: バッファ消費率の配列（0.0〜1.0）
+        """
+        sizes = np.asarray(buffer_sizes, dtype=np.float64)
+        consumed = np.asarray(buffer_consumed, dtype=np.float64)
+        completion = np.asarray(completed_percentages, dtype=np.float64)
+        
+        # 実際のバッファ消費率（バッファサイズが0以下の場合は0）
+        has_buffer = sizes > 0
+        actual = np.divide(
+            consumed, sizes, out=np.zeros_like(consumed), where=has_buffer
+        )
+        
+        # 完了率が正の場合は理想（完了率）に対する相対的な消費率
+        started = completion > 0
+        rates = np.divide(actual, completion, out=actual.copy(), where=started)
+        np.minimum(rates, 1.0, out=rates)
+        rates[~has_buffer] = 0.0
+        return rates
+    
+    def get_buffer_statuses(
+        self,
+        buffer_sizes: np.ndarray,
+        buffer_consumed: np.ndarray,
+        completed_percentages: np.ndarray
+    ) -> BufferStatusBatch:
+        """
+        複数プロジェクトのバッファステータスを一括判定
+        
+        Args:
+            buffer_sizes: バッファサイズの配列
+            buffer_consumed: 消費済みバッファの配列
+            completed_percentages: 完了率（0.0〜1.0）の配列
+            
+        Returns:
+            BufferStatusBatch: 消費率と色コードの配列
+        """
+        rates = self.calculate_buffer_consumption_rates(
+            buffer_sizes, buffer_consumed, completed_percentages
+        )
+        return BufferStatusBatch(rates, self.thresholds)
     
     def calculate_buffer_impact(self, task: Task) -> float:
         """
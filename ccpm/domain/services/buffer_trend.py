@@ -0,0 +1,93 @@
+"""
+バッファ消費トレンドの分析サービス
+"""
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from ccpm.domain.value_objects.buffer_history import BufferState, BufferTrend
+
+# 1日の秒数
+SECONDS_PER_DAY = 86400.0
+
+
+def _slope(x: np.ndarray, y: np.ndarray) -> Optional[float]:
+    """
+    最小二乗法による回帰直線の傾き
+
+    Args:
+        x: 説明変数
+        y: 目的変数
+
+    Returns:
+        Optional[float]: 傾き、x がすべて同じ値の場合はNone
+    """
+    dx = x - x.mean()
+    denominator = float(np.dot(dx, dx))
+    if denominator <= 0:
+        return None
+    return float(np.dot(dx, y - y.mean()) / denominator)
+
+
+class BufferTrendService:
+    """
+    時点ごとのバッファの状態から消費ペースと完了時点の消費率を推定するドメインサービス
+    """
+
+    def __init__(self, window: Optional[int] = None):
+        """
+        トレンド分析サービスの初期化
+
+        Args:
+            window: 分析に使う直近の状態数（None の場合はすべて）
+        """
+        self.window = window
+
+    def analyze(self, project_id: UUID, states: List[BufferState]) -> BufferTrend:
+        """
+        バッファ消費トレンドを分析
+
+        完了率に対する消費済みバッファの傾き（バーンレート）から、残りの完了率で
+        消費されるバッファを見積もり、完了時点のバッファ消費率を予測します。
+
+        Args:
+            project_id: プロジェクトID
+            states: 時点順のバッファの状態のリスト
+
+        Returns:
+            BufferTrend: 分析結果
+        """
+        if self.window:
+            states = states[-self.window:]
+        if not states:
+            return BufferTrend(project_id, [], None, None, None)
+
+        consumed = np.fromiter(
+            (state.buffer_consumed for state in states),
+            dtype=np.float64,
+            count=len(states),
+        )
+        completion = np.fromiter(
+            (state.completion for state in states), dtype=np.float64, count=len(states)
+        )
+        origin = states[0].at
+        days = np.fromiter(
+            ((state.at - origin).total_seconds() / SECONDS_PER_DAY for state in states),
+            dtype=np.float64,
+            count=len(states),
+        )
+        burn_rate = _slope(completion, consumed)
+        daily_consumption = _slope(days, consumed)
+
+        latest = states[-1]
+        projected = None
+        if latest.buffer_size > 0:
+            if burn_rate is not None:
+                remaining = max(0.0, burn_rate) * (1.0 - latest.completion)
+                projected = (latest.buffer_consumed + remaining) / latest.buffer_size
+            elif latest.completion > 0:
+                projected = (
+                    latest.buffer_consumed / latest.completion / latest.buffer_size
+                )
+        return BufferTrend(project_id, states, burn_rate, daily_consumption, projected)
@@ -0,0 +1,294 @@
+"""
+モンテカルロ法による完了予測サービス
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ccpm.config import FORECAST_CONFIDENCE, FORECAST_TRIALS, WORKING_HOURS_PER_DAY
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.services.task_graph import TaskGraph, TaskSource
+from ccpm.domain.value_objects.completion_forecast import CompletionForecast
+
+# 1チャンクあたりの試行数と (試行数 × タスク数) の上限（float64で約64MB）
+CHUNK_TRIALS = 2000
+MAX_CHUNK_CELLS = 8_000_000
+
+
+class SimulationModel:
+    """
+    プロセス間で受け渡すシミュレーション入力
+
+    Task オブジェクトではなく、トポロジカル順序・依存関係・工数・変動比率の
+    標本を NumPy 配列で保持します。
+    """
+
+    def __init__(
+        self,
+        order: np.ndarray,
+        predecessors: List[np.ndarray],
+        estimated: np.ndarray,
+        actual: np.ndarray,
+        completed: np.ndarray,
+        groups: np.ndarray,
+        pools: List[np.ndarray]
+    ):
+        """
+        シミュレーション入力の初期化
+
+        Args:
+            order: トポロジカル順序（ノード番号）
+            predecessors: ノード番号 → 依存タスクのノード番号配列
+            estimated: 見積り工数
+            actual: 実績工数（進行中タスクの消化済み工数）
+            completed: 完了済みフラグ
+            groups: ノード番号 → 変動比率の標本グループ番号（-1 は標本なし）
+            pools: グループ番号 → 過去タスクの予実比率の標本
+        """
+        self.order = order
+        self.predecessors = predecessors
+        self.estimated = estimated
+        self.actual = actual
+        self.completed = completed
+        self.groups = groups
+        self.pools = pools
+
+    def simulate(self, trials: int, seed: np.random.SeedSequence) -> np.ndarray:
+        """
+        試行ごとの残り所要時間を計算
+
+        所要時間の標本は (試行数 × タスク数) の配列に並べ、トポロジカル順序に沿って
+        全試行分の最長パスを列単位のベクトル演算で伝播します。
+
+        Args:
+            trials: 試行回数
+            seed: 乱数シード
+
+        Returns:
+            np.ndarray: 試行ごとの残り所要時間（時間）
+        """
+        rng = np.random.default_rng(seed)
+        size = len(self.estimated)
+        # 列（タスク）単位で連続するよう Fortran 順に確保
+        durations = np.empty((trials, size), order="F")
+        durations[:] = self.estimated
+
+        for group, pool in enumerate(self.pools):
+            columns = np.flatnonzero(self.groups == group)
+            if len(columns) == 0:
+                continue
+            samples = pool[rng.integers(0, len(pool), size=(trials, len(columns)))]
+            durations[:, columns] *= samples
+
+        durations -= self.actual
+        np.maximum(durations, 0.0, out=durations)
+        durations[:, self.completed] = 0.0
+
+        finish = durations
+        for node in self.order:
+            preds = self.predecessors[node]
+            if len(preds) == 1:
+                finish[:, node] += finish[:, preds[0]]
+            elif len(preds) > 1:
+                finish[:, node] += finish[:, preds].max(axis=1)
+
+        return finish.max(axis=1) if size else np.zeros(trials)
+
+
+def _simulate_chunk(
+    model: SimulationModel,
+    trials: int,
+    seed: np.random.SeedSequence
+) -> np.ndarray:
+    """プロセスプールから呼び出すためのモジュールレベル関数"""
+    return model.simulate(trials, seed)
+
+
+class CompletionForecastService:
+    """
+    過去タスクの予実比率分布に基づくモンテカルロ完了予測を担当するドメインサービス
+    """
+
+    def __init__(
+        self,
+        trials: int = FORECAST_TRIALS,
+        confidence: float = FORECAST_CONFIDENCE,
+        min_category_samples: int = 5,
+        working_hours_per_day: float = WORKING_HOURS_PER_DAY,
+        workers: Optional[int] = None
+    ):
+        """
+        完了予測サービスの初期化
+
+        Args:
+            trials: 試行回数
+            confidence: 信頼区間の水準（デフォルト: 0.9 = 5〜95パーセンタイル）
+            min_category_samples: カテゴリ別の標本を使う最小件数（未満の場合は全体の標本を使用）
+            working_hours_per_day: 1日あたりの作業時間
+            workers: 試行を分割するプロセス数（None または 1 の場合は単一プロセス）
+
+        Raises:
+            ValueError: 試行回数が1未満の場合
+        """
+        if trials < 1:
+            raise ValueError(f"試行回数は1以上である必要があります: {trials}")
+        self.trials = trials
+        self.confidence = confidence
+        self.min_category_samples = min_category_samples
+        self.working_hours_per_day = working_hours_per_day
+        self.workers = workers
+
+    def build_model(self, tasks: TaskSource, history: TaskSource) -> SimulationModel:
+        """
+        タスクと過去タスクからシミュレーション入力を作成
+
+        タスクリストは列指向のタスクテーブルに変換し、入力の各配列を列単位で作成します。
+
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+            history: 予実比率の標本とする過去タスクのリストまたはタスクテーブル（完了済みのもののみ使用）
+
+        Returns:
+            SimulationModel: シミュレーション入力
+
+        Raises:
+            ValueError: 依存関係に循環がある場合
+        """
+        table = tasks if isinstance(tasks, TaskTable) else TaskTable.from_tasks(tasks)
+        if history is tasks:
+            past = table
+        else:
+            past = (
+                history
+                if isinstance(history, TaskTable)
+                else TaskTable.from_tasks(history)
+            )
+        graph = TaskGraph.from_table(table)
+        order = graph.topological_order()
+
+        sampled = past.completed & (past.estimated_hours > 0)
+        ratios = past.actual_hours[sampled] / past.estimated_hours[sampled]
+        sampled_categories = [past.categories[row] for row in np.flatnonzero(sampled)]
+
+        rows_by_category: Dict[str, List[int]] = {}
+        for row, category in enumerate(sampled_categories):
+            rows_by_category.setdefault(category, []).append(row)
+
+        pools: List[np.ndarray] = []
+        pool_index: Dict[str, int] = {}
+        if len(ratios):
+            pools.append(ratios)
+        for category, rows in rows_by_category.items():
+            if len(rows) >= self.min_category_samples:
+                pool_index[category] = len(pools)
+                pools.append(ratios[rows])
+
+        default_group = 0 if len(ratios) else -1
+        groups = np.array(
+            [pool_index.get(category, default_group) for category in table.categories],
+            dtype=np.int64,
+        )
+
+        indptr = table.indptr.astype(np.int64)
+        indices = table.indices.astype(np.int64)
+        return SimulationModel(
+            order=np.array(order, dtype=np.int64),
+            predecessors=[indices[indptr[i]:indptr[i + 1]] for i in range(len(table))],
+            estimated=table.estimated_hours.copy(),
+            actual=np.where(table.in_progress, table.actual_hours, 0.0),
+            completed=table.completed,
+            groups=groups,
+            pools=pools,
+        )
+
+    def simulate(
+        self,
+        model: SimulationModel,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        全試行の残り所要時間を計算
+
+        メモリ使用量を抑えるため試行をチャンクに分割し、workers が指定されている場合は
+        チャンクをプロセスプールに分配します。同じシードであれば分割方法によらず
+        同じ結果になります。
+
+        Args:
+            model: シミュレーション入力
+            seed: 乱数シード
+
+        Returns:
+            np.ndarray: 試行ごとの残り所要時間（時間）
+        """
+        size = max(1, len(model.estimated))
+        chunk_trials = max(1, min(CHUNK_TRIALS, MAX_CHUNK_CELLS // size))
+        chunks = [
+            min(chunk_trials, self.trials - offset)
+            for offset in range(0, self.trials, chunk_trials)
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+        if self.workers and self.workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(
+                    executor.map(_simulate_chunk, [model] * len(chunks), chunks, seeds)
+                )
+        else:
+            results = [
+                model.simulate(trials, chunk_seed)
+                for trials, chunk_seed in zip(chunks, seeds)
+            ]
+
+        return np.concatenate(results)
+
+    def predict_completion(
+        self,
+        project: Project,
+        tasks: TaskSource,
+        history: Optional[TaskSource] = None,
+        base_date: Optional[datetime] = None,
+        seed: Optional[int] = None
+    ) -> CompletionForecast:
+        """
+        プロジェクトの完了を予測
+
+        各タスクの所要時間を過去タスクの予実比率分布（同じカテゴリの標本が十分あれば
+        カテゴリ別、なければ全体）から見積り工数に掛けてサンプリングし、
+        完了までの残り所要時間の分布を求めます。
+
+        Args:
+            project: プロジェクト
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+            history: 予実比率の標本とする過去タスクのリストまたはタスクテーブル（省略時は tasks の完了済みタスク）
+            base_date: 予測の基準日時（省略時は現在時刻とプロジェクト開始日の遅い方）
+            seed: 乱数シード
+
+        Returns:
+            CompletionForecast: 完了予測
+        """
+        model = self.build_model(tasks, history if history is not None else tasks)
+        remaining = self.simulate(model, seed)
+
+        tail = (1.0 - self.confidence) / 2 * 100
+        lower, upper, p50, p85, p95 = np.percentile(
+            remaining, [tail, 100 - tail, 50, 85, 95]
+        )
+        if base_date is None:
+            base_date = datetime.now()
+            if project.start_date is not None:
+                base_date = max(base_date, project.start_date)
+
+        return CompletionForecast(
+            base_date=base_date,
+            trials=len(remaining),
+            mean_hours=float(remaining.mean()),
+            std_hours=float(remaining.std()),
+            percentiles={50: float(p50), 85: float(p85), 95: float(p95)},
+            confidence=self.confidence,
+            lower_hours=float(lower),
+            upper_hours=float(upper),
+            working_hours_per_day=self.working_hours_per_day,
+        )
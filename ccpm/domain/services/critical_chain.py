@@ -1,93 +1,158 @@
 """
 クリティカルチェーン計算サービス
 """
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Sequence, Set, Tuple
 from uuid import UUID
 
-import networkx as nx
+import numpy as np
 
 from ccpm.domain.entities.project import Project
 from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.services.task_graph import TaskGraph, TaskSource
+from ccpm.domain.value_objects.task_schedule import TaskSchedule, clamp_float
 
 class CriticalChainService:
     """
     クリティカルチェーンの識別と管理を担当するドメインサービス
     """
     
-    def identify_critical_chain(self, tasks: List[Task]) -> List[UUID]:
+    def identify_critical_chain(self, tasks: TaskSource) -> List[UUID]:
         """
         タスクリストからクリティカルチェーンを識別
         
         タスクの依存関係からグラフを構築し、最長パス（クリティカルパス）を
-        クリティカルチェーンとして識別します。
+        クリティカルチェーンとして識別します。最長パスはトポロジカル順序に沿った
+        1回の走査で求めるため、計算量は O(V+E) です。
+        同じ長さのパスが複数ある場合は、タスクリストで先に現れるタスクを優先します。
         
         Args:
-            tasks: プロジェクト内のタスクリスト
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
             
         Returns:
             List[UUID]: クリティカルチェーンを構成するタスクIDのリスト
+            
+        Raises:
+            ValueError: 依存関係に循環がある場合
         """
         if not tasks:
             return []
         
-        # タスクIDをキー、タスクを値とする辞書を作成
-        task_dict = {task.id: task for task in tasks}
+        graph = TaskGraph.build(tasks)
+        return [graph.ids[node] for node in graph.heaviest_path()]
+    
+    def calculate_schedule(self, tasks: TaskSource) -> Dict[UUID, TaskSchedule]:
+        """
+        全タスクの最早/最遅開始時刻とフロートを計算
+        
+        フォワードパス（タスクで終わる最長パス長）とバックワードパス（タスクから始まる
+        最長パス長）をそれぞれ1回ずつ実行し、全タスクの日程を O(V+E) で求めます。
+        
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+            
+        Returns:
+            Dict[UUID, TaskSchedule]: タスクIDをキーとするタスクスケジュール
+            
+        Raises:
+            ValueError: 依存関係に循環がある場合
+        """
+        if not tasks:
+            return {}
         
-        # 有向グラフを作成
-        G = nx.DiGraph()
+        graph = TaskGraph.build(tasks)
+        order = graph.topological_order()
+        finish, _ = graph.longest_path_to(order)
+        tail = graph.longest_path_from(order)
+        project_length = max(finish)
         
-        # ノードを追加（タスクID、属性として見積り工数を設定）
-        for task in tasks:
-            G.add_node(task.id, weight=task.estimated_hours)
+        schedules: Dict[UUID, TaskSchedule] = {}
+        for node, task_id in enumerate(graph.ids):
+            weight = graph.weights[node]
+            earliest_finish = finish[node]
+            earliest_start = earliest_finish - weight
+            latest_start = project_length - tail[node]
+            successor_start = min(
+                (finish[succ] - graph.weights[succ] for succ in graph.successors[node]),
+                default=project_length
+            )
+            schedules[task_id] = TaskSchedule(
+                earliest_start=earliest_start,
+                earliest_finish=earliest_finish,
+                latest_start=latest_start,
+                latest_finish=latest_start + weight,
+                total_float=clamp_float(latest_start - earliest_start, project_length),
+                free_float=clamp_float(
+                    successor_start - earliest_finish, project_length
+                ),
+            )
         
-        # エッジを追加（依存関係）
-        for task in tasks:
-            for dep_id in task.dependencies:
-                if dep_id in task_dict:
-                    # 依存タスク → タスク の方向にエッジを追加
-                    G.add_edge(dep_id, task.id)
+        return schedules
+    
+    def find_near_critical_tasks(
+        self,
+        tasks: TaskSource,
+        max_float: float
+    ) -> List[UUID]:
+        """
+        トータルフロートが閾値以下のタスク（あと少しの遅延でクリティカルになるタスク）を取得
         
-        # 閉路がある場合はエラー（依存関係の循環）
-        if not nx.is_directed_acyclic_graph(G):
-            raise ValueError("依存関係に循環があります。クリティカルチェーンを識別できません。")
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+            max_float: トータルフロートの閾値（時間）
+            
+        Returns:
+            List[UUID]: トータルフロートの小さい順に並べたタスクIDのリスト
+        """
+        schedules = self.calculate_schedule(tasks)
+        at_risk = [
+            (schedule.total_float, i, task_id)
+            for i, (task_id, schedule) in enumerate(schedules.items())
+            if schedule.total_float <= max_float
+        ]
+        at_risk.sort()
+        return [task_id for _, _, task_id in at_risk]
+    
+    def find_near_critical_paths(
+        self,
+        tasks: TaskSource,
+        k: int = 5
+    ) -> List[Tuple[float, List[UUID]]]:
+        """
+        長い順に上位k本のパス（クリティカルパスと準クリティカルパス）を取得
         
-        # 開始タスク（入次数が0のノード）と終了タスク（出次数が0のノード）を特定
-        start_tasks = [n for n in G.nodes() if G.in_degree(n) == 0]
-        end_tasks = [n for n in G.nodes() if G.out_degree(n) == 0]
+        全パスを列挙せず、最長パスラベルを上界とした最良優先探索で求めます。
         
-        # 開始タスクまたは終了タスクがない場合は空のリストを返す
-        if not start_tasks or not end_tasks:
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+            k: 取得するパス数
+            
+        Returns:
+            List[Tuple[float, List[UUID]]]: (パス長, タスクIDリスト) のリスト（長い順）
+            
+        Raises:
+            ValueError: 依存関係に循環がある場合
+        """
+        if not tasks:
             return []
         
-        # 最長パス（クリティカルパス）を見つける
-        critical_chain = []
-        max_length = 0
-        
-        for start in start_tasks:
-            for end in end_tasks:
-                try:
-                    # 開始タスクから終了タスクへのすべてのパスを見つける
-                    for path in nx.all_simple_paths(G, start, end):
-                        # パスの長さ（タスクの見積り工数の合計）を計算
-                        path_length = sum(G.nodes[task_id]["weight"] for task_id in path)
-                        
-                        # より長いパスが見つかった場合、クリティカルチェーンを更新
-                        if path_length > max_length:
-                            max_length = path_length
-                            critical_chain = path
-                except nx.NetworkXNoPath:
-                    # パスが存在しない場合は次の組み合わせを試す
-                    continue
-        
-        return list(critical_chain)
+        graph = TaskGraph.build(tasks)
+        return [
+            (length, [graph.ids[node] for node in path])
+            for length, path in graph.k_heaviest_paths(k)
+        ]
     
-    def update_project_critical_chain(self, project: Project, tasks: List[Task]) -> Project:
+    def update_project_critical_chain(
+        self,
+        project: Project,
+        tasks: TaskSource
+    ) -> Project:
         """
         プロジェクトのクリティカルチェーンを更新
         
         Args:
             project: 更新するプロジェクト
-            tasks: プロジェクト内のタスクリスト
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
             
         Returns:
             Project: 更新されたプロジェクト
@@ -96,7 +161,11 @@ class CriticalChainService:
         project.critical_chain = critical_chain
         return project
     
-    def get_critical_chain_tasks(self, project: Project, tasks: List[Task]) -> List[Task]:
+    def get_critical_chain_tasks(
+        self,
+        project: Project,
+        tasks: Sequence[Task]
+    ) -> List[Task]:
         """
         プロジェクトのクリティカルチェーン上のタスクを取得
         
@@ -110,7 +179,11 @@ class CriticalChainService:
         task_dict = {task.id: task for task in tasks}
         return [task_dict[task_id] for task_id in project.critical_chain if task_id in task_dict]
     
-    def calculate_project_completion(self, project: Project, tasks: List[Task]) -> float:
+    def calculate_project_completion(
+        self,
+        project: Project,
+        tasks: TaskSource
+    ) -> float:
         """
         プロジェクトの完了率を計算
         
@@ -119,11 +192,14 @@ class CriticalChainService:
         
         Args:
             project: プロジェクト
-            tasks: プロジェクト内のタスクリスト
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
             
         Returns:
             float: プロジェクトの完了率（0.0〜1.0）
         """
+        if isinstance(tasks, TaskTable):
+            return self._calculate_table_completion(project, tasks)
+        
         critical_chain_tasks = self.get_critical_chain_tasks(project, tasks)
         
         if not critical_chain_tasks:
@@ -150,4 +226,43 @@ class CriticalChainService:
         # 完了率を計算
         completion_rate = (completed_estimated + in_progress_contribution) / total_estimated
         
-        return min(1.0, max(0.0, completion_rate))
\ No newline at end of file
+        return min(1.0, max(0.0, completion_rate))
+    
+    def _calculate_table_completion(self, project: Project, table: TaskTable) -> float:
+        """
+        タスクテーブルからプロジェクトの完了率を計算
+        
+        calculate_project_completion と同じ計算を、クリティカルチェーン上の行の
+        配列演算で行います。
+        
+        Args:
+            project: プロジェクト
+            table: プロジェクト内のタスクテーブル
+            
+        Returns:
+            float: プロジェクトの完了率（0.0〜1.0）
+        """
+        index = table.index
+        rows = np.array(
+            [index[task_id] for task_id in project.critical_chain if task_id in index],
+            dtype=np.int64,
+        )
+        if len(rows) == 0:
+            return 0.0
+        
+        estimated = table.estimated_hours[rows]
+        total_estimated = float(estimated.sum())
+        if total_estimated <= 0:
+            return 0.0
+        
+        completed_estimated = float(estimated[table.completed[rows]].sum())
+        
+        # 進行中のタスクの貢献分（実績時間 / 見積り時間の比率、ただし1.0を超えない）
+        active = table.in_progress[rows] & (estimated > 0)
+        in_progress_contribution = float(
+            np.minimum(table.actual_hours[rows][active], estimated[active]).sum()
+        )
+        
+        completion_rate = (completed_estimated + in_progress_contribution) / total_estimated
+        
+        return min(1.0, max(0.0, completion_rate))
@@ -0,0 +1,133 @@
+"""
+見積り補正サービス
+"""
+from typing import List, Mapping, Optional
+
+from ccpm.config import ESTIMATION_MIN_SAMPLES
+from ccpm.domain.entities.task import Task
+from ccpm.domain.value_objects.estimation_accuracy import (
+    SCOPE_ALL,
+    SCOPE_CATEGORY,
+    SCOPE_RESOURCE,
+    SCOPE_RESOURCE_CATEGORY,
+    EstimationAccuracy,
+    EstimationStats,
+    StatsKey,
+)
+
+
+class EstimationCorrectionService:
+    """
+    予実比率の統計から見積り補正係数と見積り精度を求めるドメインサービス
+
+    担当者×カテゴリ → 担当者 → カテゴリ → 全体 の順に、標本数が足りる最も
+    具体的な単位の統計を使います。
+    """
+
+    def __init__(self, min_samples: int = ESTIMATION_MIN_SAMPLES):
+        """
+        見積り補正サービスの初期化
+
+        Args:
+            min_samples: 統計を使う最小標本数（未満の場合はより広い単位の統計を使用）
+        """
+        self.min_samples = min_samples
+
+    @staticmethod
+    def candidate_keys(resource: str = "", category: str = "") -> List[StatsKey]:
+        """
+        補正に使う統計のキーを具体的な順に列挙
+
+        Args:
+            resource: 担当者（空文字の場合は担当者の単位を使わない）
+            category: カテゴリ（空文字の場合はカテゴリの単位を使わない）
+
+        Returns:
+            List[StatsKey]: 統計のキーのリスト
+        """
+        keys: List[StatsKey] = []
+        if resource and category:
+            keys.append((SCOPE_RESOURCE_CATEGORY, resource, category))
+        if resource:
+            keys.append((SCOPE_RESOURCE, resource, ""))
+        if category:
+            keys.append((SCOPE_CATEGORY, "", category))
+        keys.append((SCOPE_ALL, "", ""))
+        return keys
+
+    def select_baseline(
+        self,
+        stats: Mapping[StatsKey, EstimationStats],
+        resource: str = "",
+        category: str = ""
+    ) -> Optional[EstimationStats]:
+        """
+        補正に使う統計を選択
+
+        Args:
+            stats: キーごとの統計（candidate_keys のキーを含むもの）
+            resource: 担当者
+            category: カテゴリ
+
+        Returns:
+            Optional[EstimationStats]: 標本数が足りる最も具体的な単位の統計、ない場合はNone
+        """
+        for key in self.candidate_keys(resource, category):
+            found = stats.get(key)
+            if found is not None and found.count >= self.min_samples:
+                return found
+        return None
+
+    def correction_factor(
+        self,
+        stats: Mapping[StatsKey, EstimationStats],
+        resource: str = "",
+        category: str = ""
+    ) -> float:
+        """
+        見積り補正係数を計算
+
+        Args:
+            stats: キーごとの統計
+            resource: 担当者
+            category: カテゴリ
+
+        Returns:
+            float: 補正係数（予実比率の中央値、十分な標本がない場合は1.0）
+        """
+        baseline = self.select_baseline(stats, resource, category)
+        return baseline.correction_factor if baseline else 1.0
+
+    @staticmethod
+    def correct_estimate(estimated_hours: float, correction_factor: float) -> float:
+        """
+        見積り工数を補正
+
+        Args:
+            estimated_hours: 見積り工数
+            correction_factor: 補正係数
+
+        Returns:
+            float: 補正後の見積り工数
+        """
+        return estimated_hours * correction_factor
+
+    def evaluate(
+        self,
+        task: Task,
+        stats: Mapping[StatsKey, EstimationStats]
+    ) -> Optional[EstimationAccuracy]:
+        """
+        タスクの見積り精度を評価
+
+        Args:
+            task: タスク
+            stats: キーごとの統計
+
+        Returns:
+            Optional[EstimationAccuracy]: 見積り精度、十分な標本の統計がない場合はNone
+        """
+        baseline = self.select_baseline(stats, task.resource, task.category)
+        if baseline is None:
+            return None
+        return EstimationAccuracy(task.id, task.variance_ratio, baseline)
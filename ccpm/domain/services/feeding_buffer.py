@@ -0,0 +1,162 @@
+"""
+フィーディングバッファ計算サービス
+"""
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.services.buffer_calculation import BufferCalculationService
+from ccpm.domain.services.task_graph import TaskGraph, TaskSource, select_predecessor
+from ccpm.domain.value_objects.buffer_status import BufferStatus
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+
+
+class FeedingBufferService:
+    """
+    フィーディングチェーンの識別とフィーディングバッファの計算を担当するドメインサービス
+    """
+
+    def __init__(self, buffer_ratio: float = 0.5):
+        """
+        フィーディングバッファ計算サービスの初期化
+
+        Args:
+            buffer_ratio: バッファ比率（デフォルト: 0.5 = フィーディングチェーン長の50%）
+        """
+        self.buffer_calculation = BufferCalculationService(buffer_ratio)
+
+    def identify_feeding_buffers(
+        self,
+        tasks: TaskSource,
+        critical_chain: List[UUID]
+    ) -> List[FeedingBuffer]:
+        """
+        クリティカルチェーンに合流するすべてのフィーディングチェーンとバッファを計算
+
+        クリティカルチェーン外のタスクだけを通る最長パスラベルをトポロジカル順序に沿った
+        1回の走査で求め、クリティカルチェーンへの合流エッジごとにラベルを遡って
+        フィーディングチェーンを復元します。バッファサイズはプロジェクトバッファと同じく
+        チェーン長 × バッファ比率です。
+
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+            critical_chain: クリティカルチェーンを構成するタスクIDのリスト
+
+        Returns:
+            List[FeedingBuffer]: フィーディングバッファのリスト（合流先タスクの順）
+
+        Raises:
+            ValueError: 依存関係に循環がある場合
+        """
+        if not tasks or not critical_chain:
+            return []
+
+        graph = TaskGraph.build(tasks)
+        order = graph.topological_order()
+        on_chain = [False] * len(graph)
+        for task_id in critical_chain:
+            node = graph.index.get(task_id)
+            if node is not None:
+                on_chain[node] = True
+
+        # クリティカルチェーン外のタスクのみを通る最長パスラベル
+        dist = [0.0] * len(graph)
+        best_pred = [-1] * len(graph)
+        for node in order:
+            if on_chain[node]:
+                continue
+            feeders = [pred for pred in graph.predecessors[node] if not on_chain[pred]]
+            best, best_length = select_predecessor(feeders, dist)
+            dist[node] = best_length + graph.weights[node]
+            best_pred[node] = best
+
+        buffers: List[FeedingBuffer] = []
+        for task_id in critical_chain:
+            merge = graph.index.get(task_id)
+            if merge is None:
+                continue
+            for feeder in graph.predecessors[merge]:
+                if on_chain[feeder]:
+                    continue
+                chain: List[int] = []
+                node = feeder
+                while node >= 0:
+                    chain.append(node)
+                    node = best_pred[node]
+                chain.reverse()
+                size = (
+                    sum(graph.weights[node] for node in chain)
+                    * self.buffer_calculation.buffer_ratio
+                )
+                buffers.append(
+                    FeedingBuffer(
+                        merge_task_id=task_id,
+                        feeding_chain=[graph.ids[node] for node in chain],
+                        size=size,
+                    )
+                )
+
+        return buffers
+
+    def update_project_feeding_buffers(
+        self,
+        project: Project,
+        tasks: TaskSource
+    ) -> Project:
+        """
+        プロジェクトのフィーディングバッファを再計算して保存
+
+        同じ合流地点（フィーディングチェーン末尾と合流先の組）のバッファ消費量は引き継ぎます。
+
+        Args:
+            project: 更新するプロジェクト（クリティカルチェーン設定済み）
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+
+        Returns:
+            Project: 更新されたプロジェクト
+        """
+        consumed: Dict[Tuple[UUID, UUID], float] = {
+            (buffer.feeding_task_id, buffer.merge_task_id): buffer.consumed
+            for buffer in project.feeding_buffers
+        }
+        buffers = self.identify_feeding_buffers(tasks, project.critical_chain)
+        for buffer in buffers:
+            buffer.consumed = consumed.get(
+                (buffer.feeding_task_id, buffer.merge_task_id), 0.0
+            )
+        project.feeding_buffers = buffers
+        return project
+
+    def find_feeding_buffer(
+        self,
+        project: Project,
+        task_id: UUID
+    ) -> Optional[FeedingBuffer]:
+        """
+        タスクを含むフィーディングチェーンのバッファを取得
+
+        Args:
+            project: プロジェクト
+            task_id: タスクID
+
+        Returns:
+            Optional[FeedingBuffer]: 見つかったフィーディングバッファ、存在しない場合はNone
+        """
+        for buffer in project.feeding_buffers:
+            if task_id in buffer.feeding_chain:
+                return buffer
+        return None
+
+    def get_feeding_buffer_statuses(self, project: Project) -> List[BufferStatus]:
+        """
+        保存済みのフィーディングバッファのステータスを取得
+
+        Args:
+            project: プロジェクト
+
+        Returns:
+            List[BufferStatus]: project.feeding_buffers と同じ順序のバッファステータス
+        """
+        return [
+            BufferStatus(buffer.consumption_rate) for buffer in project.feeding_buffers
+        ]
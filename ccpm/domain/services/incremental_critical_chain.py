@@ -0,0 +1,256 @@
+"""
+クリティカルチェーンの差分更新
+"""
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.online_topological_order import OnlineTopologicalOrder
+from ccpm.domain.services.task_graph import (
+    TaskGraph,
+    select_predecessor,
+    trace_heaviest_path,
+)
+
+
+class IncrementalCriticalChain:
+    """
+    プロジェクト単位でクリティカルチェーンを差分更新する構造
+
+    各タスクについて「そのタスクで終わる最長パス長」と「そのタスクから始まる最長パス長」を
+    保持し、見積り工数や依存関係の変更時には影響を受ける下流/上流の範囲だけを
+    トポロジカル順序に沿って再計算します。トポロジカル順序は依存関係の追加ごとに差分更新し
+    （OnlineTopologicalOrder）、循環を作る依存関係はタスクに追加する前に拒否します。
+    同点時の選択規則は CriticalChainService.identify_critical_chain と同じです。
+    """
+
+    def __init__(self, tasks: List[Task]):
+        """
+        差分更新構造の初期化
+
+        Args:
+            tasks: プロジェクト内のタスクリスト
+
+        Raises:
+            CycleError: 依存関係に循環がある場合
+        """
+        self._tasks: Dict[UUID, Task] = {task.id: task for task in tasks}
+        self._graph = TaskGraph.from_tasks(tasks)
+        self._topology = OnlineTopologicalOrder(self._graph)
+        # 順序と位置は OnlineTopologicalOrder がその場で更新するリストを共有する
+        self._order = self._topology.order
+        self._position = self._topology.position
+        self._to, self._best_pred = self._graph.longest_path_to(self._order)
+        self._from = self._graph.longest_path_from(self._order)
+        self._chain: Optional[List[UUID]] = None
+
+    @property
+    def critical_chain(self) -> List[UUID]:
+        """
+        現在のクリティカルチェーン
+
+        Returns:
+            List[UUID]: クリティカルチェーンを構成するタスクIDのリスト
+        """
+        if self._chain is None:
+            graph = self._graph
+            path = trace_heaviest_path(self._to, self._best_pred, graph.sinks())
+            self._chain = [graph.ids[node] for node in path]
+        return list(self._chain)
+
+    @property
+    def topological_order(self) -> List[UUID]:
+        """
+        現在のトポロジカル順序（依存タスクが先）
+
+        Returns:
+            List[UUID]: タスクIDのリスト
+        """
+        return self._topology.order_ids()
+
+    @property
+    def chain_length(self) -> float:
+        """
+        クリティカルチェーン長（見積り工数の合計）
+
+        Returns:
+            float: クリティカルチェーン長（時間）
+        """
+        return max(self._from, default=0.0)
+
+    def longest_path_to(self, task_id: UUID) -> float:
+        """
+        タスクで終わる最長パス長（タスク自身を含む）
+
+        Args:
+            task_id: タスクID
+
+        Returns:
+            float: 最長パス長（時間）
+        """
+        return self._to[self._graph.index[task_id]]
+
+    def longest_path_from(self, task_id: UUID) -> float:
+        """
+        タスクから始まる最長パス長（タスク自身を含む）
+
+        Args:
+            task_id: タスクID
+
+        Returns:
+            float: 最長パス長（時間）
+        """
+        return self._from[self._graph.index[task_id]]
+
+    def apply_to(self, project: Project) -> Project:
+        """
+        プロジェクトのクリティカルチェーンを更新
+
+        Args:
+            project: 更新するプロジェクト
+
+        Returns:
+            Project: 更新されたプロジェクト
+        """
+        project.critical_chain = self.critical_chain
+        return project
+
+    def set_estimate(self, task_id: UUID, hours: float) -> None:
+        """
+        タスクの見積り工数を変更し、影響範囲のみ再計算
+
+        Args:
+            task_id: タスクID
+            hours: 新しい見積り工数
+        """
+        task = self._tasks[task_id]
+        if task.estimated_hours != hours:
+            task.estimated_hours = hours
+            task.updated_at = datetime.now()
+        self.notify_estimate_changed(task_id)
+
+    def notify_estimate_changed(self, task_id: UUID) -> None:
+        """
+        タスクの見積り工数が直接変更されたことを通知
+
+        Args:
+            task_id: 見積り工数が変更されたタスクID
+        """
+        node = self._graph.index[task_id]
+        hours = self._tasks[task_id].estimated_hours
+        if self._graph.weights[node] == hours:
+            return
+        self._graph.weights[node] = hours
+        self._propagate_forward([node])
+        self._propagate_backward([node])
+
+    def add_dependency(self, task_id: UUID, dependency_id: UUID) -> None:
+        """
+        依存関係を追加し、影響範囲のみ再計算
+
+        Args:
+            task_id: タスクID
+            dependency_id: 依存タスクのID
+
+        Raises:
+            CycleError: 依存関係の追加により循環が発生する場合（タスクの依存関係は変更されません）
+        """
+        task = self._tasks[task_id]
+        graph = self._graph
+        dep = graph.index.get(dependency_id)
+        node = graph.index[task_id]
+        if dep is None or dep in graph.predecessors[node]:
+            task.add_dependency(dependency_id)
+            return
+
+        # 現在の順序に逆らうエッジは影響範囲だけ並べ替え、循環を作る場合はここで拒否される
+        self._topology.add_edge(dep, node)
+        task.add_dependency(dependency_id)
+        self._propagate_forward([node])
+        self._propagate_backward([dep])
+
+    def remove_dependency(self, task_id: UUID, dependency_id: UUID) -> None:
+        """
+        依存関係を削除し、影響範囲のみ再計算
+
+        Args:
+            task_id: タスクID
+            dependency_id: 削除する依存タスクのID
+        """
+        self._tasks[task_id].remove_dependency(dependency_id)
+
+        graph = self._graph
+        dep = graph.index.get(dependency_id)
+        node = graph.index[task_id]
+        if dep is None or dep not in graph.predecessors[node]:
+            return
+
+        self._topology.remove_edge(dep, node)
+        self._propagate_forward([node])
+        self._propagate_backward([dep])
+
+    def _propagate_forward(self, seeds: Iterable[int]) -> None:
+        """
+        「ノードで終わる最長パス長」を下流方向に再計算
+
+        トポロジカル順序の位置が小さい順に処理し、値が変化したノードの後続のみを
+        再計算対象に加えます。
+
+        Args:
+            seeds: 再計算を開始するノード
+        """
+        graph = self._graph
+        position = self._position
+        to = self._to
+        heap = [(position[node], node) for node in seeds]
+        heapq.heapify(heap)
+        queued = {node for _, node in heap}
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            best, best_length = select_predecessor(graph.predecessors[node], to)
+            length = best_length + graph.weights[node]
+            self._best_pred[node] = best
+            self._chain = None
+            if length == to[node]:
+                continue
+            to[node] = length
+            for succ in graph.successors[node]:
+                if succ not in queued:
+                    queued.add(succ)
+                    heapq.heappush(heap, (position[succ], succ))
+
+    def _propagate_backward(self, seeds: Iterable[int]) -> None:
+        """
+        「ノードから始まる最長パス長」を上流方向に再計算
+
+        トポロジカル順序の位置が大きい順に処理し、値が変化したノードの依存先のみを
+        再計算対象に加えます。
+
+        Args:
+            seeds: 再計算を開始するノード
+        """
+        graph = self._graph
+        position = self._position
+        from_ = self._from
+        heap = [(-position[node], node) for node in seeds]
+        heapq.heapify(heap)
+        queued = {node for _, node in heap}
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            length = graph.weights[node] + max(
+                (from_[succ] for succ in graph.successors[node]), default=0.0
+            )
+            if length == from_[node]:
+                continue
+            from_[node] = length
+            for pred in graph.predecessors[node]:
+                if pred not in queued:
+                    queued.add(pred)
+                    heapq.heappush(heap, (-position[pred], pred))
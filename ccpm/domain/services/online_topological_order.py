@@ -0,0 +1,183 @@
+"""
+依存関係の追加時に循環を検出するトポロジカル順序の差分更新
+"""
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ccpm.domain.services.task_graph import CycleError, TaskGraph
+
+
+class OnlineTopologicalOrder:
+    """
+    タスクグラフのトポロジカル順序を保持し、エッジの追加ごとに差分更新する構造（Pearce–Kelly）
+
+    追加するエッジ「source → target」が現在の順序に沿っていれば何もしません。逆らう場合は、
+    順序上の位置が target 以上 source 以下の範囲だけを探索し、target から前方にたどれるノードと
+    source から後方にたどれるノードをその範囲内の位置に並べ替えます。前方探索で source に
+    到達した場合はエッジが循環を作るため、グラフと順序を変更せずに CycleError を送出します。
+    エッジの削除は順序を崩さないため、隣接リストの更新のみです。
+    """
+
+    def __init__(self, graph: TaskGraph, order: Optional[List[int]] = None):
+        """
+        差分更新構造の初期化
+
+        Args:
+            graph: タスクグラフ（エッジの追加・削除はこの構造を通して行います）
+            order: 計算済みのトポロジカル順序（省略時は計算）
+
+        Raises:
+            CycleError: 依存関係に循環がある場合
+        """
+        self.graph = graph
+        self.order = order if order is not None else graph.topological_order()
+        self.position = [0] * len(graph)
+        for position, node in enumerate(self.order):
+            self.position[node] = position
+
+    def add_edge(self, source: int, target: int) -> bool:
+        """
+        エッジ「source → target」（source が target の依存ノード）を追加し、順序を更新
+
+        Args:
+            source: 依存ノード
+            target: 依存するノード
+
+        Returns:
+            bool: 順序を並べ替えた場合はTrue
+
+        Raises:
+            CycleError: エッジの追加により循環が発生する場合（グラフと順序は変更されません）
+        """
+        graph = self.graph
+        if source in graph.predecessors[target]:
+            return False
+
+        reordered = False
+        lower = self.position[target]
+        upper = self.position[source]
+        if lower <= upper:
+            forward = self._search_forward(target, source, upper)
+            backward = self._search_backward(source, lower)
+            self._reorder(backward, forward)
+            reordered = True
+
+        graph.predecessors[target].append(source)
+        graph.successors[source].append(target)
+        return reordered
+
+    def remove_edge(self, source: int, target: int) -> None:
+        """
+        エッジ「source → target」を削除（順序はそのままで有効）
+
+        Args:
+            source: 依存ノード
+            target: 依存するノード
+        """
+        graph = self.graph
+        if source in graph.predecessors[target]:
+            graph.predecessors[target].remove(source)
+            graph.successors[source].remove(target)
+
+    def _search_forward(self, start: int, source: int, upper: int) -> List[int]:
+        """
+        start から後続ノードをたどり、位置が upper 以下のノードを集める
+
+        Args:
+            start: 探索を開始するノード（追加するエッジの target）
+            source: 追加するエッジの source（到達した場合は循環）
+            upper: 探索する位置の上限（source の位置）
+
+        Returns:
+            List[int]: 到達したノード
+
+        Raises:
+            CycleError: source に到達した場合
+        """
+        position = self.position
+        successors = self.graph.successors
+        parents: Dict[int, int] = {start: -1}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == source:
+                raise CycleError(self._cycle(parents, source))
+            for succ in successors[node]:
+                if succ not in parents and position[succ] <= upper:
+                    parents[succ] = node
+                    stack.append(succ)
+        return list(parents)
+
+    def _search_backward(self, start: int, lower: int) -> List[int]:
+        """
+        start から依存ノードをたどり、位置が lower 以上のノードを集める
+
+        Args:
+            start: 探索を開始するノード（追加するエッジの source）
+            lower: 探索する位置の下限（target の位置）
+
+        Returns:
+            List[int]: 到達したノード
+        """
+        position = self.position
+        predecessors = self.graph.predecessors
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for pred in predecessors[node]:
+                if pred not in visited and position[pred] >= lower:
+                    visited.add(pred)
+                    stack.append(pred)
+        return list(visited)
+
+    def _reorder(self, backward: List[int], forward: List[int]) -> None:
+        """
+        後方探索のノードを前方探索のノードより前になるよう、両者が占めていた位置に並べ直す
+
+        それぞれの中では元の相対順序を保つため、範囲外のノードとの前後関係も崩れません。
+
+        Args:
+            backward: source から後方にたどったノード
+            forward: target から前方にたどったノード
+        """
+        position = self.position
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        nodes = backward + forward
+        slots = sorted(position[node] for node in nodes)
+        for node, slot in zip(nodes, slots):
+            self.order[slot] = node
+            position[node] = slot
+
+    def _cycle(self, parents: Dict[int, int], source: int) -> List[UUID]:
+        """
+        前方探索の親ノードから循環を復元
+
+        Args:
+            parents: 探索で到達したノード → 直前のノード（開始ノードは-1）
+            source: 追加しようとしたエッジの source
+
+        Returns:
+            List[UUID]: 循環を構成するタスクID（source から依存の向きの順）
+        """
+        path: List[int] = []
+        node = source
+        while node >= 0:
+            path.append(node)
+            node = parents[node]
+        # path は source ← ... ← target の順のため、逆順にすると target → ... → source になる
+        path.reverse()
+        ids = self.graph.ids
+        return [ids[source]] + [ids[node] for node in path[:-1]]
+
+    def order_ids(self) -> List[UUID]:
+        """
+        現在のトポロジカル順序をタスクIDで取得
+
+        Returns:
+            List[UUID]: タスクIDのリスト
+        """
+        ids = self.graph.ids
+        return [ids[node] for node in self.order]
+
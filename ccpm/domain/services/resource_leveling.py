@@ -0,0 +1,184 @@
+"""
+リソース平準化サービス
+"""
+import heapq
+from itertools import count
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task_table import TaskTable
+from ccpm.domain.services.task_graph import TaskGraph, TaskSource
+from ccpm.domain.value_objects.resource_schedule import ResourceSchedule
+
+
+class ResourceLevelingService:
+    """
+    リソース競合を解消したスケジュールとクリティカルチェーンを求めるドメインサービス
+
+    各リソース（担当者）は同時に1つのタスクのみ実行できるものとし、イベント駆動の
+    リストスケジューラで割り付けます。同じリソースで実行可能なタスクが複数ある場合は、
+    後続の最長パスが長い（最遅開始時刻が早い）タスクを優先します。
+    各タスクはヒープに高々一度ずつ出入りするため、計算量は O((V+E) log V) です。
+    """
+
+    def schedule(self, tasks: TaskSource) -> ResourceSchedule:
+        """
+        リソース平準化済みスケジュールを作成
+
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+
+        Returns:
+            ResourceSchedule: リソース平準化済みスケジュール
+
+        Raises:
+            ValueError: 依存関係に循環がある場合
+        """
+        if not tasks:
+            return ResourceSchedule({}, {}, [])
+
+        graph = TaskGraph.build(tasks)
+        order = graph.topological_order()
+        tail = graph.longest_path_from(order)
+        weights = graph.weights
+        resources = (
+            tasks.resources
+            if isinstance(tasks, TaskTable)
+            else [task.resource for task in tasks]
+        )
+        size = len(graph)
+
+        remaining = [len(preds) for preds in graph.predecessors]
+        ready_time = [0.0] * size
+        start = [0.0] * size
+        finish = [0.0] * size
+        # クリティカルチェーンを辿るための「開始を決めた直前タスク」
+        binding = [-1] * size
+
+        queues: Dict[str, List[Tuple[float, int]]] = {}
+        busy: Set[str] = set()
+        last_on_resource: Dict[str, int] = {}
+        dirty: Set[str] = set()
+        events: List[Tuple[float, int, int]] = []
+        sequence = count()
+
+        def release(node: int, now: float) -> None:
+            resource = resources[node]
+            if not resource:
+                dispatch(node, now)
+                return
+            heapq.heappush(queues.setdefault(resource, []), (-tail[node], node))
+            dirty.add(resource)
+
+        def dispatch(node: int, now: float) -> None:
+            start[node] = now
+            finish[node] = now + weights[node]
+            if now > ready_time[node]:
+                binding[node] = last_on_resource[resources[node]]
+            else:
+                binding[node] = _latest_predecessor(graph.predecessors[node], finish)
+            heapq.heappush(events, (finish[node], next(sequence), node))
+
+        for node in range(size):
+            if remaining[node] == 0:
+                release(node, 0.0)
+
+        now = 0.0
+        while True:
+            for resource in dirty:
+                if resource not in busy and queues[resource]:
+                    _, node = heapq.heappop(queues[resource])
+                    busy.add(resource)
+                    dispatch(node, now)
+            dirty.clear()
+
+            if not events:
+                break
+
+            now = events[0][0]
+            while events and events[0][0] == now:
+                _, _, node = heapq.heappop(events)
+                resource = resources[node]
+                if resource:
+                    busy.discard(resource)
+                    last_on_resource[resource] = node
+                    dirty.add(resource)
+                for succ in graph.successors[node]:
+                    if finish[node] > ready_time[succ]:
+                        ready_time[succ] = finish[node]
+                    remaining[succ] -= 1
+                    if remaining[succ] == 0:
+                        release(succ, now)
+
+        end = max(range(size), key=lambda node: (finish[node], -node))
+        chain: List[int] = []
+        while end >= 0:
+            chain.append(end)
+            end = binding[end]
+        chain.reverse()
+
+        return ResourceSchedule(
+            start_times={
+                task_id: start[node] for node, task_id in enumerate(graph.ids)
+            },
+            finish_times={
+                task_id: finish[node] for node, task_id in enumerate(graph.ids)
+            },
+            critical_chain=[graph.ids[node] for node in chain],
+        )
+
+    def identify_critical_chain(self, tasks: TaskSource) -> List[UUID]:
+        """
+        リソース競合を考慮したクリティカルチェーンを識別
+
+        依存関係による待ちとリソースの空き待ちのうち、タスクの開始を決めた側を
+        最終タスクから遡ってクリティカルチェーンとします。
+
+        Args:
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+
+        Returns:
+            List[UUID]: クリティカルチェーンを構成するタスクIDのリスト
+        """
+        return self.schedule(tasks).critical_chain
+
+    def update_project_critical_chain(
+        self,
+        project: Project,
+        tasks: TaskSource
+    ) -> Project:
+        """
+        プロジェクトのクリティカルチェーンをリソース考慮版で更新
+
+        Args:
+            project: 更新するプロジェクト
+            tasks: プロジェクト内のタスクリストまたはタスクテーブル
+
+        Returns:
+            Project: 更新されたプロジェクト
+        """
+        project.critical_chain = self.identify_critical_chain(tasks)
+        return project
+
+
+def _latest_predecessor(predecessors: List[int], finish: List[float]) -> int:
+    """
+    最も遅く終了した依存タスクを取得（同時刻の場合はノード番号の小さい方）
+
+    Args:
+        predecessors: 依存タスクのノード番号
+        finish: ノード番号 → 終了時刻
+
+    Returns:
+        int: 依存タスクのノード番号（依存タスクがない場合は-1）
+    """
+    best = -1
+    for pred in predecessors:
+        if (
+            best < 0
+            or finish[pred] > finish[best]
+            or (finish[pred] == finish[best] and pred < best)
+        ):
+            best = pred
+    return best
@@ -0,0 +1,424 @@
+"""
+類似タスク検索の転置インデックス
+"""
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from ccpm.config import SIMILAR_TASK_LIMIT, SIMILAR_TASK_MAX_DF_RATIO
+from ccpm.domain.entities.task import Task
+from ccpm.domain.value_objects.similar_task import EstimateSuggestion, SimilarTask
+
+# 項目ごとの重み
+FIELD_WEIGHTS = {"name": 1.0, "description": 0.3, "category": 2.0, "tag": 1.5}
+
+# インデックスの構築に使うタスクの項目（iter_columns の列名）
+INDEX_COLUMNS = (
+    "id",
+    "project_id",
+    "name",
+    "description",
+    "category",
+    "tags",
+    "status",
+    "estimated_hours",
+    "actual_hours",
+)
+
+# 英数字の単語、またはかな・カナ・漢字の連続
+_RUN = re.compile(r"[0-9a-z]+|[぀-ヿ㐀-鿿豈-﫿]+")
+_ASCII = re.compile(r"[0-9a-z]+")
+
+# 削除済みの枠がこの割合を超えたらインデックスを詰め直す
+COMPACT_RATIO = 0.5
+
+# 頻出語を検索から除くのはタスク数がこれ以上の場合のみ（少ない場合は走査の負担がない）
+MIN_TASKS_FOR_DF_CUTOFF = 1000
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    テキストを検索語に分割
+
+    NFKC 正規化と小文字化のあと、英数字は単語単位、日本語（かな・カナ・漢字）は
+    文字の2-gram（1文字だけの場合はその文字）に分割します。
+
+    Args:
+        text: テキスト
+
+    Returns:
+        List[str]: 検索語のリスト（重複を含む）
+    """
+    tokens: List[str] = []
+    for run in _RUN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if _ASCII.fullmatch(run) or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def document_terms(
+    name: str,
+    description: str = "",
+    category: str = "",
+    tags: Sequence[str] = ()
+) -> Dict[str, float]:
+    """
+    タスクの項目から検索語ごとの重みを計算
+
+    カテゴリとタグは完全一致のみを対象とするため、接頭辞付きの1語として扱います。
+
+    Args:
+        name: タスク名
+        description: 説明
+        category: カテゴリ
+        tags: タグリスト
+
+    Returns:
+        Dict[str, float]: 検索語ごとの重み（項目の重み × 出現回数）
+    """
+    terms: Dict[str, float] = {}
+    for field, text in (("name", name), ("description", description)):
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text or ""):
+            terms[token] = terms.get(token, 0.0) + weight
+    if category:
+        terms["c:" + unicodedata.normalize("NFKC", category).lower()] = FIELD_WEIGHTS[
+            "category"
+        ]
+    for tag in tags or ():
+        if tag:
+            terms["t:" + unicodedata.normalize("NFKC", tag).lower()] = FIELD_WEIGHTS[
+                "tag"
+            ]
+    return terms
+
+
+class SimilarTaskIndex:
+    """
+    完了タスクの名前・説明・カテゴリ・タグの転置インデックス
+
+    検索語ごとにタスクの枠番号と重みの配列（ポスティング）を持ち、検索時は
+    クエリの検索語のポスティングを NumPy でまとめて加算して上位 k 件を選びます。
+    タスクの更新・削除は枠を無効にして新しい枠に追加し、無効な枠が増えたら詰め直します。
+    完了していないタスクと見積りのないタスクは実績の参考にならないため登録しません。
+    """
+
+    def __init__(self, max_df_ratio: float = SIMILAR_TASK_MAX_DF_RATIO):
+        """
+        インデックスの初期化
+
+        Args:
+            max_df_ratio: この割合を超えるタスクに現れる検索語は検索に使わない（0〜1）
+        """
+        self.max_df_ratio = max_df_ratio
+        self._lock = threading.RLock()
+        self._slots: Dict[UUID, int] = {}
+        self._ids: List[Optional[UUID]] = []
+        self._projects: List[Optional[UUID]] = []
+        self._estimated = array("d")
+        self._actual = array("d")
+        self._inverse_norm = array("d")  # 無効な枠は0
+        self._terms: List[Optional[Tuple[str, ...]]] = []
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._df: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """登録されている（有効な）タスク数"""
+        return len(self._slots)
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[Tuple[Any, ...]],
+        **kwargs: Any
+    ) -> "SimilarTaskIndex":
+        """
+        INDEX_COLUMNS の順の値のタプルからインデックスを構築
+
+        Args:
+            rows: タスクの値のタプル（TaskRepository.iter_columns(INDEX_COLUMNS) の結果など）
+            **kwargs: コンストラクタの引数
+
+        Returns:
+            SimilarTaskIndex: 構築したインデックス
+        """
+        index = cls(**kwargs)
+        with index._lock:
+            for row in rows:
+                (
+                    task_id, project_id, name, description, category, tags, status,
+                    estimated, actual,
+                ) = row
+                if status == "完了" and estimated > 0:
+                    terms = document_terms(name, description, category, tags)
+                    index._add(task_id, project_id, terms, estimated, actual)
+        return index
+
+    def update(self, tasks: Iterable[Task]) -> None:
+        """
+        保存したタスクをインデックスに反映
+
+        Args:
+            tasks: 保存したタスク（完了していないタスクはインデックスから除かれます）
+        """
+        with self._lock:
+            for task in tasks:
+                self._remove(task.id)
+                if task.is_completed and task.estimated_hours > 0:
+                    terms = document_terms(
+                        task.name, task.description, task.category, task.tags
+                    )
+                    self._add(
+                        task.id,
+                        task.project_id,
+                        terms,
+                        task.estimated_hours,
+                        task.actual_hours,
+                    )
+            self._compact_if_needed()
+
+    def remove(self, task_ids: Iterable[UUID]) -> None:
+        """
+        削除したタスクをインデックスから除く
+
+        Args:
+            task_ids: 削除したタスクIDのリスト
+        """
+        with self._lock:
+            for task_id in task_ids:
+                self._remove(task_id)
+            self._compact_if_needed()
+
+    def remove_projects(self, project_ids: Iterable[UUID]) -> None:
+        """
+        削除したプロジェクトに属するタスクをインデックスから除く
+
+        Args:
+            project_ids: 削除したプロジェクトIDのリスト
+        """
+        targets = set(project_ids)
+        with self._lock:
+            for slot, project_id in enumerate(self._projects):
+                task_id = self._ids[slot]
+                if task_id is not None and project_id in targets:
+                    self._remove(task_id)
+            self._compact_if_needed()
+
+    def _add(
+        self,
+        task_id: UUID,
+        project_id: UUID,
+        terms: Dict[str, float],
+        estimated: float,
+        actual: float
+    ) -> None:
+        """
+        新しい枠にタスクを追加
+
+        Args:
+            task_id: タスクID
+            project_id: 所属プロジェクトID
+            terms: 検索語ごとの重み
+            estimated: 見積り工数
+            actual: 実績工数
+        """
+        slot = len(self._ids)
+        self._slots[task_id] = slot
+        self._ids.append(task_id)
+        self._projects.append(project_id)
+        self._estimated.append(estimated)
+        self._actual.append(actual)
+        norm = math.sqrt(sum(weight * weight for weight in terms.values()))
+        self._inverse_norm.append(1.0 / norm if norm > 0 else 0.0)
+        self._terms.append(tuple(terms))
+        for term, weight in terms.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array("i"), array("f"))
+            posting[0].append(slot)
+            posting[1].append(weight)
+            self._df[term] = self._df.get(term, 0) + 1
+
+    def _remove(self, task_id: UUID) -> None:
+        """
+        タスクの枠を無効にする（ポスティングは詰め直すまで残る）
+
+        Args:
+            task_id: タスクID
+        """
+        slot = self._slots.pop(task_id, None)
+        if slot is None:
+            return
+        self._ids[slot] = None
+        self._projects[slot] = None
+        self._inverse_norm[slot] = 0.0
+        for term in self._terms[slot] or ():
+            remaining = self._df[term] - 1
+            if remaining:
+                self._df[term] = remaining
+            else:
+                del self._df[term]
+        self._terms[slot] = None
+
+    def _compact_if_needed(self) -> None:
+        """無効な枠の割合が COMPACT_RATIO を超えたら詰め直す"""
+        dead = len(self._ids) - len(self._slots)
+        if dead > 1000 and dead > len(self._ids) * COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        無効な枠とそのポスティングを取り除き、枠番号を詰め直す
+        """
+        with self._lock:
+            alive = np.array([task_id is not None for task_id in self._ids], dtype=bool)
+            mapping = np.cumsum(alive) - 1
+            postings: Dict[str, Tuple[array, array]] = {}
+            for term, (slots, weights) in self._postings.items():
+                slot_array = np.frombuffer(slots, dtype=np.int32)
+                keep = alive[slot_array]
+                if keep.any():
+                    postings[term] = (
+                        array(
+                            "i", mapping[slot_array[keep]].astype(np.int32).tobytes()
+                        ),
+                        array(
+                            "f",
+                            np.frombuffer(weights, dtype=np.float32)[keep].tobytes(),
+                        ),
+                    )
+                del slot_array
+            self._postings = postings
+
+            kept = np.flatnonzero(alive).tolist()
+            self._ids = [self._ids[slot] for slot in kept]
+            self._projects = [self._projects[slot] for slot in kept]
+            self._terms = [self._terms[slot] for slot in kept]
+            self._estimated = array("d", [self._estimated[slot] for slot in kept])
+            self._actual = array("d", [self._actual[slot] for slot in kept])
+            self._inverse_norm = array("d", [self._inverse_norm[slot] for slot in kept])
+            self._slots = {
+                task_id: slot
+                for slot, task_id in enumerate(self._ids)
+                if task_id is not None
+            }
+
+    def search(
+        self,
+        name: str,
+        description: str = "",
+        category: str = "",
+        tags: Sequence[str] = (),
+        k: int = SIMILAR_TASK_LIMIT,
+        exclude: Optional[Set[UUID]] = None
+    ) -> List[SimilarTask]:
+        """
+        類似する完了タスクを類似度の高い順に検索
+
+        類似度は検索語ごとの idf × クエリの重み × タスクの重み の合計を、
+        タスクの重みベクトルの長さで割った値です。
+
+        Args:
+            name: タスク名
+            description: 説明
+            category: カテゴリ
+            tags: タグリスト
+            k: 最大件数
+            exclude: 結果から除くタスクID
+
+        Returns:
+            List[SimilarTask]: 類似タスクのリスト
+        """
+        if k <= 0:
+            return []
+        query = document_terms(name, description, category, tags)
+        with self._lock:
+            total = len(self._slots)
+            if not total or not query:
+                return []
+            terms = [term for term in query if term in self._df]
+            if total >= MIN_TASKS_FOR_DF_CUTOFF:
+                # 頻出語は順位への寄与が小さくポスティングが長いため、他の語がある場合は使わない
+                selective = [
+                    term
+                    for term in terms
+                    if self._df[term] <= total * self.max_df_ratio
+                ]
+                terms = selective or terms
+            if not terms:
+                return []
+
+            slot_arrays = []
+            weight_arrays = []
+            for term in terms:
+                df = self._df[term]
+                idf = math.log(1.0 + (total - df + 0.5) / (df + 0.5))
+                slots, weights = self._postings[term]
+                slot_arrays.append(np.frombuffer(slots, dtype=np.int32))
+                weight_arrays.append(
+                    np.frombuffer(weights, dtype=np.float32) * (idf * query[term])
+                )
+            scores = np.bincount(
+                np.concatenate(slot_arrays),
+                weights=np.concatenate(weight_arrays),
+                minlength=len(self._ids),
+            )
+            del slot_arrays
+            scores *= np.frombuffer(self._inverse_norm, dtype=np.float64)
+            if exclude:
+                for task_id in exclude:
+                    slot = self._slots.get(task_id)
+                    if slot is not None:
+                        scores[slot] = 0.0
+
+            # 0以外の枠を抜き出すより全体を部分ソートする方が1回の走査で済む
+            if len(scores) > k:
+                candidates = np.argpartition(scores, -k)[-k:]
+            else:
+                candidates = np.arange(len(scores))
+            candidates = candidates[scores[candidates] > 0]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+            return [
+                SimilarTask(
+                    self._ids[slot],
+                    float(scores[slot]),
+                    self._estimated[slot],
+                    self._actual[slot],
+                )
+                for slot in candidates.tolist()
+            ]
+
+    def suggest(
+        self,
+        name: str,
+        description: str = "",
+        category: str = "",
+        tags: Sequence[str] = (),
+        k: int = SIMILAR_TASK_LIMIT,
+        exclude: Optional[Set[UUID]] = None
+    ) -> EstimateSuggestion:
+        """
+        類似する完了タスクの実績工数の分布を取得
+
+        Args:
+            name: タスク名
+            description: 説明
+            category: カテゴリ
+            tags: タグリスト
+            k: 参照する類似タスクの最大件数
+            exclude: 結果から除くタスクID
+
+        Returns:
+            EstimateSuggestion: 実績工数の分布
+        """
+        return EstimateSuggestion(
+            self.search(name, description, category, tags, k, exclude)
+        )
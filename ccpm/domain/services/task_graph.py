@@ -0,0 +1,412 @@
+"""
+タスク依存関係グラフと最長パス計算
+"""
+import heapq
+from collections import deque
+from itertools import count
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.task_table import TaskTable
+
+CYCLE_ERROR_MESSAGE = "依存関係に循環があります。クリティカルチェーンを識別できません。"
+
+# ドメインサービスが受け付けるタスク群（タスクリストまたは列指向テーブル）
+TaskSource = Union[Sequence[Task], TaskTable]
+
+
+class CycleError(ValueError):
+    """
+    依存関係の循環を表す例外
+
+    cycle には循環を構成するタスクIDが依存の向きに並びます（各タスクは次のタスクの依存タスクで、
+    最後のタスクは先頭のタスクの依存タスク）。
+    """
+
+    def __init__(self, cycle: List[UUID]):
+        """
+        例外の初期化
+
+        Args:
+            cycle: 循環を構成するタスクIDのリスト
+        """
+        super().__init__(CYCLE_ERROR_MESSAGE)
+        self.cycle = cycle
+
+
+class TaskGraph:
+    """
+    タスク依存関係を密な整数インデックスで表現した有向グラフ
+
+    ノード番号はタスクリストの並び順と一致し、同点時の選択はこの順序で
+    決定的に行われます。エッジは「依存タスク → タスク」の向きです。
+    """
+
+    __slots__ = ("ids", "index", "weights", "predecessors", "successors")
+
+    def __init__(
+        self,
+        ids: List[UUID],
+        weights: List[float],
+        predecessors: List[List[int]],
+        successors: List[List[int]]
+    ):
+        """
+        タスクグラフの初期化
+
+        Args:
+            ids: ノード番号 → タスクID
+            weights: ノード番号 → 見積り工数
+            predecessors: ノード番号 → 依存タスクのノード番号リスト
+            successors: ノード番号 → 後続タスクのノード番号リスト
+        """
+        self.ids = ids
+        self.index: Dict[UUID, int] = {task_id: i for i, task_id in enumerate(ids)}
+        self.weights = weights
+        self.predecessors = predecessors
+        self.successors = successors
+
+    @classmethod
+    def from_tasks(cls, tasks: Sequence[Task]) -> "TaskGraph":
+        """
+        タスクリストからグラフを構築
+
+        プロジェクト外のタスクへの依存と重複した依存は無視します。
+
+        Args:
+            tasks: タスクリスト
+
+        Returns:
+            TaskGraph: 構築されたグラフ
+        """
+        ids = [task.id for task in tasks]
+        index = {task_id: i for i, task_id in enumerate(ids)}
+        weights = [task.estimated_hours for task in tasks]
+        predecessors: List[List[int]] = [[] for _ in ids]
+        successors: List[List[int]] = [[] for _ in ids]
+
+        for i, task in enumerate(tasks):
+            if not task.dependencies:
+                continue
+            preds = [
+                j
+                for j in dict.fromkeys(
+                    index.get(dep_id) for dep_id in task.dependencies
+                )
+                if j is not None
+            ]
+            predecessors[i] = preds
+            for j in preds:
+                successors[j].append(i)
+
+        return cls(ids, weights, predecessors, successors)
+
+    @classmethod
+    def from_table(cls, table: TaskTable) -> "TaskGraph":
+        """
+        タスクテーブルからグラフを構築
+
+        テーブルの依存関係（CSR 形式）は重複除去済みのため、そのまま隣接リストに展開します。
+
+        Args:
+            table: タスクテーブル
+
+        Returns:
+            TaskGraph: 構築されたグラフ
+        """
+        indptr = table.indptr.tolist()
+        indices = table.indices.tolist()
+        predecessors = [indices[indptr[i]:indptr[i + 1]] for i in range(len(table))]
+        successors: List[List[int]] = [[] for _ in predecessors]
+        for node, preds in enumerate(predecessors):
+            for pred in preds:
+                successors[pred].append(node)
+
+        graph = cls.__new__(cls)
+        graph.ids = table.ids
+        graph.index = table.index
+        graph.weights = table.estimated_hours.tolist()
+        graph.predecessors = predecessors
+        graph.successors = successors
+        return graph
+
+    @classmethod
+    def build(cls, tasks: TaskSource) -> "TaskGraph":
+        """
+        タスクリストまたはタスクテーブルからグラフを構築
+
+        Args:
+            tasks: タスクリストまたはタスクテーブル
+
+        Returns:
+            TaskGraph: 構築されたグラフ
+        """
+        if isinstance(tasks, TaskTable):
+            return cls.from_table(tasks)
+        return cls.from_tasks(tasks)
+
+    def __len__(self) -> int:
+        """ノード数"""
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        """エッジ数"""
+        return sum(len(preds) for preds in self.predecessors)
+
+    def topological_order(self) -> List[int]:
+        """
+        トポロジカル順序を計算（Kahnのアルゴリズム、O(V+E)）
+
+        Returns:
+            List[int]: ノード番号のトポロジカル順序
+
+        Raises:
+            CycleError: 依存関係に循環がある場合
+        """
+        in_degree = [len(preds) for preds in self.predecessors]
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order: List[int] = []
+        successors = self.successors
+
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for succ in successors[node]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
+
+        if len(order) != len(in_degree):
+            raise CycleError(
+                [self.ids[node] for node in self._remaining_cycle(in_degree)]
+            )
+        return order
+
+    def _remaining_cycle(self, in_degree: List[int]) -> List[int]:
+        """
+        Kahnのアルゴリズムで取り出せなかったノードから循環を1つ取り出す
+
+        取り出せなかったノードには必ず取り出せなかった依存ノードがあるため、
+        依存ノードを同じノードに戻るまでたどると循環が得られます。
+
+        Args:
+            in_degree: Kahnのアルゴリズム終了時の残りの入次数
+
+        Returns:
+            List[int]: 循環を構成するノード番号（依存の向きの順）
+        """
+        node = next(i for i, degree in enumerate(in_degree) if degree > 0)
+        steps: Dict[int, int] = {}
+        path: List[int] = []
+        while node not in steps:
+            steps[node] = len(path)
+            path.append(node)
+            node = next(pred for pred in self.predecessors[node] if in_degree[pred] > 0)
+        cycle = path[steps[node]:]
+        cycle.reverse()
+        return cycle
+
+    def longest_path_to(
+        self,
+        order: Optional[List[int]] = None
+    ) -> Tuple[List[float], List[int]]:
+        """
+        各ノードで終わる最長パス長を1回のトポロジカル走査で計算
+
+        Args:
+            order: 計算済みのトポロジカル順序（省略時は計算）
+
+        Returns:
+            Tuple[List[float], List[int]]: (ノードで終わる最長パス長（自身を含む）,
+                最長パス上の直前ノード（なければ-1）)
+        """
+        if order is None:
+            order = self.topological_order()
+
+        weights = self.weights
+        predecessors = self.predecessors
+        dist = [0.0] * len(weights)
+        best_pred = [-1] * len(weights)
+
+        for node in order:
+            best, best_length = select_predecessor(predecessors[node], dist)
+            dist[node] = best_length + weights[node]
+            best_pred[node] = best
+
+        return dist, best_pred
+
+    def longest_path_from(
+        self,
+        order: Optional[List[int]] = None
+    ) -> List[float]:
+        """
+        各ノードから始まる最長パス長を1回の逆トポロジカル走査で計算
+
+        Args:
+            order: 計算済みのトポロジカル順序（省略時は計算）
+
+        Returns:
+            List[float]: ノードから始まる最長パス長（自身を含む）
+        """
+        if order is None:
+            order = self.topological_order()
+
+        weights = self.weights
+        successors = self.successors
+        dist = [0.0] * len(weights)
+
+        for node in reversed(order):
+            best_length = 0.0
+            for succ in successors[node]:
+                if dist[succ] > best_length:
+                    best_length = dist[succ]
+            dist[node] = best_length + weights[node]
+
+        return dist
+
+    def heaviest_path(self, order: Optional[List[int]] = None) -> List[int]:
+        """
+        重み合計が最大のパスを O(V+E) で計算
+
+        同じ長さのパスが複数ある場合は、タスクリストで先に現れる終端タスクと
+        直前タスクを優先します。
+
+        Args:
+            order: 計算済みのトポロジカル順序（省略時は計算）
+
+        Returns:
+            List[int]: 最長パスを構成するノード番号（開始 → 終了の順）。
+                パス長が0以下の場合は空リスト
+        """
+        if not self.ids:
+            return []
+        dist, best_pred = self.longest_path_to(order)
+        return trace_heaviest_path(dist, best_pred, self.sinks())
+
+    def k_heaviest_paths(
+        self,
+        k: int,
+        order: Optional[List[int]] = None
+    ) -> List[Tuple[float, List[int]]]:
+        """
+        重み合計が大きい順に上位k本の開始→終了パスを計算
+
+        「ノードから始まる最長パス長」を正確な上界として使う最良優先探索のため、
+        全パスを列挙せず、取り出したパスは常に長い順に確定します。
+        計算量はおおよそ O(V+E + k・L・d・log) です（L: パスのノード数, d: 出次数）。
+
+        Args:
+            k: 取得するパス数
+            order: 計算済みのトポロジカル順序（省略時は計算）
+
+        Returns:
+            List[Tuple[float, List[int]]]: (パス長, ノード番号リスト) のリスト（長い順）
+        """
+        if k <= 0 or not self.ids:
+            return []
+
+        from_ = self.longest_path_from(order)
+        weights = self.weights
+        successors = self.successors
+        sequence = count()
+
+        # (-上界, -パスのノード数, 挿入順, ノード, 累積長, 直前までのパス(連結リスト))
+        # 上界が同じ場合は長いパスを先に取り出す（深さ優先）ため、同じ長さのパスが多数あっても
+        # 取り出した上界のパスを終了ノードまで確定してから兄弟を展開します
+        heap: List[Tuple[float, int, int, int, float, Optional[tuple]]] = [
+            (-from_[node], -1, next(sequence), node, weights[node], None)
+            for node, preds in enumerate(self.predecessors) if not preds
+        ]
+        heapq.heapify(heap)
+        paths: List[Tuple[float, List[int]]] = []
+
+        while heap and len(paths) < k:
+            _, depth, _, node, length, parent = heapq.heappop(heap)
+            prefix = (node, parent)
+            succs = successors[node]
+            if not succs:
+                path: List[int] = []
+                link: Optional[tuple] = prefix
+                while link is not None:
+                    path.append(link[0])
+                    link = link[1]
+                path.reverse()
+                paths.append((length, path))
+                continue
+            for succ in succs:
+                heapq.heappush(
+                    heap,
+                    (
+                        -(length + from_[succ]),
+                        depth - 1,
+                        next(sequence),
+                        succ,
+                        length + weights[succ],
+                        prefix,
+                    )
+                )
+
+        return paths
+
+    def sinks(self) -> List[int]:
+        """後続タスクを持たないノード番号のリスト（タスクリスト順）"""
+        return [node for node, succs in enumerate(self.successors) if not succs]
+
+
+def select_predecessor(
+    predecessors: Sequence[int],
+    dist: Sequence[float]
+) -> Tuple[int, float]:
+    """
+    最長パス上の直前ノードを選択
+
+    パス長が同じ場合はノード番号の小さい（タスクリストで先に現れる）ノードを優先します。
+
+    Args:
+        predecessors: 直前ノード候補
+        dist: ノードで終わる最長パス長
+
+    Returns:
+        Tuple[int, float]: (選択されたノード（なければ-1）, そのノードで終わる最長パス長)
+    """
+    best = -1
+    best_length = 0.0
+    for pred in predecessors:
+        length = dist[pred]
+        if best < 0 or length > best_length or (length == best_length and pred < best):
+            best = pred
+            best_length = length
+    return best, best_length
+
+
+def trace_heaviest_path(
+    dist: Sequence[float],
+    best_pred: Sequence[int],
+    ends: Sequence[int]
+) -> List[int]:
+    """
+    最長パスラベルからパスを復元
+
+    Args:
+        dist: ノードで終わる最長パス長
+        best_pred: 最長パス上の直前ノード（なければ-1）
+        ends: 終端候補のノード番号（同点時は先頭を優先）
+
+    Returns:
+        List[int]: 最長パスのノード番号（開始 → 終了の順）。パス長が0以下の場合は空リスト
+    """
+    end = -1
+    max_length = 0.0
+    for node in ends:
+        if dist[node] > max_length:
+            end = node
+            max_length = dist[node]
+
+    path: List[int] = []
+    while end >= 0:
+        path.append(end)
+        end = best_pred[end]
+    path.reverse()
+    return path
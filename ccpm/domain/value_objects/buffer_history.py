@@ -0,0 +1,239 @@
+"""
+バッファ履歴（変更イベントと時点ごとの状態）の値オブジェクト
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+# イベントの種類
+EVENT_CONSUME = "consume"  # バッファ消費
+EVENT_RELEASE = "release"  # バッファ解放
+EVENT_RESIZE = "resize"  # バッファサイズの変更
+EVENT_PROGRESS = "progress"  # 完了率の変更
+EVENT_KINDS = (EVENT_CONSUME, EVENT_RELEASE, EVENT_RESIZE, EVENT_PROGRESS)
+
+
+class BufferState:
+    """
+    ある時点のプロジェクトバッファの状態を表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        project_id: UUID,
+        at: datetime,
+        buffer_size: float,
+        buffer_consumed: float,
+        completion: float
+    ):
+        """
+        バッファの状態の初期化
+
+        Args:
+            project_id: プロジェクトID
+            at: 時点
+            buffer_size: バッファサイズ（時間）
+            buffer_consumed: 消費済みバッファ（時間）
+            completion: クリティカルチェーンの完了率（0.0〜1.0）
+        """
+        self.project_id = project_id
+        self.at = at
+        self.buffer_size = buffer_size
+        self.buffer_consumed = buffer_consumed
+        self.completion = completion
+
+    @property
+    def consumption_rate(self) -> float:
+        """バッファ消費率（0.0〜1.0、Project.buffer_consumption_rate と同じ計算）"""
+        if self.buffer_size <= 0:
+            return 0.0
+        return min(1.0, self.buffer_consumed / self.buffer_size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: バッファの状態の辞書表現
+        """
+        return {
+            "project_id": str(self.project_id),
+            "at": self.at.isoformat(),
+            "buffer_size": self.buffer_size,
+            "buffer_consumed": self.buffer_consumed,
+            "completion": self.completion,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BufferState":
+        """
+        辞書からバッファの状態を作成
+
+        Args:
+            data: バッファの状態の辞書
+
+        Returns:
+            BufferState: 作成されたバッファの状態
+        """
+        return cls(
+            project_id=UUID(data["project_id"]),
+            at=datetime.fromisoformat(data["at"]),
+            buffer_size=float(data["buffer_size"]),
+            buffer_consumed=float(data["buffer_consumed"]),
+            completion=float(data["completion"]),
+        )
+
+
+class BufferEvent:
+    """
+    プロジェクトバッファの変更イベントを表す値オブジェクト
+
+    変更量に加えて変更後の状態を持つため、イベントを再生せずに時点ごとの状態を参照できます。
+    """
+
+    def __init__(
+        self,
+        project_id: UUID,
+        kind: str,
+        occurred_at: datetime,
+        size_delta: float,
+        consumed_delta: float,
+        buffer_size: float,
+        buffer_consumed: float,
+        completion: float,
+        id: Optional[int] = None
+    ):
+        """
+        バッファ変更イベントの初期化
+
+        Args:
+            project_id: プロジェクトID
+            kind: イベントの種類（consume/release/resize/progress）
+            occurred_at: 発生日時
+            size_delta: バッファサイズの変更量（時間）
+            consumed_delta: 消費済みバッファの変更量（時間）
+            buffer_size: 変更後のバッファサイズ（時間）
+            buffer_consumed: 変更後の消費済みバッファ（時間）
+            completion: 変更後の完了率（0.0〜1.0）
+            id: イベントの通し番号（保存前はNone）
+        """
+        self.id = id
+        self.project_id = project_id
+        self.kind = kind
+        self.occurred_at = occurred_at
+        self.size_delta = size_delta
+        self.consumed_delta = consumed_delta
+        self.buffer_size = buffer_size
+        self.buffer_consumed = buffer_consumed
+        self.completion = completion
+
+    @property
+    def state(self) -> BufferState:
+        """イベント直後のバッファの状態"""
+        return BufferState(
+            self.project_id,
+            self.occurred_at,
+            self.buffer_size,
+            self.buffer_consumed,
+            self.completion,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: バッファ変更イベントの辞書表現
+        """
+        return {
+            "id": self.id,
+            "project_id": str(self.project_id),
+            "kind": self.kind,
+            "occurred_at": self.occurred_at.isoformat(),
+            "size_delta": self.size_delta,
+            "consumed_delta": self.consumed_delta,
+            "buffer_size": self.buffer_size,
+            "buffer_consumed": self.buffer_consumed,
+            "completion": self.completion,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BufferEvent":
+        """
+        辞書からバッファ変更イベントを作成
+
+        Args:
+            data: バッファ変更イベントの辞書
+
+        Returns:
+            BufferEvent: 作成されたバッファ変更イベント
+        """
+        return cls(
+            id=data.get("id"),
+            project_id=UUID(data["project_id"]),
+            kind=data["kind"],
+            occurred_at=datetime.fromisoformat(data["occurred_at"]),
+            size_delta=float(data["size_delta"]),
+            consumed_delta=float(data["consumed_delta"]),
+            buffer_size=float(data["buffer_size"]),
+            buffer_consumed=float(data["buffer_consumed"]),
+            completion=float(data["completion"]),
+        )
+
+
+class BufferTrend:
+    """
+    バッファ消費トレンドの分析結果を表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        project_id: UUID,
+        states: List[BufferState],
+        burn_rate: Optional[float],
+        daily_consumption: Optional[float],
+        projected_consumption: Optional[float]
+    ):
+        """
+        バッファ消費トレンドの初期化
+
+        Args:
+            project_id: プロジェクトID
+            states: 分析に使った時点ごとの状態
+            burn_rate: 完了率1.0あたりのバッファ消費量（時間、算出できない場合はNone）
+            daily_consumption: 1日あたりのバッファ消費量（時間、算出できない場合はNone）
+            projected_consumption: 完了時点の予測バッファ消費率（1.0 を超える場合はバッファ超過）
+        """
+        self.project_id = project_id
+        self.states = states
+        self.burn_rate = burn_rate
+        self.daily_consumption = daily_consumption
+        self.projected_consumption = projected_consumption
+
+    @property
+    def latest(self) -> Optional[BufferState]:
+        """最新の状態"""
+        return self.states[-1] if self.states else None
+
+    @property
+    def will_overrun(self) -> bool:
+        """現在のペースでは完了前にバッファを使い切る見込みかどうか"""
+        return (
+            self.projected_consumption is not None and self.projected_consumption > 1.0
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: バッファ消費トレンドの辞書表現
+        """
+        return {
+            "project_id": str(self.project_id),
+            "states": [state.to_dict() for state in self.states],
+            "burn_rate": self.burn_rate,
+            "daily_consumption": self.daily_consumption,
+            "projected_consumption": self.projected_consumption,
+            "will_overrun": self.will_overrun,
+        }
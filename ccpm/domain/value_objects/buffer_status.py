@@ -2,7 +2,12 @@
 バッファステータスの値オブジェクト
 """
 from enum import Enum
-from typing import Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple, Union
+
+import numpy as np
+
+from ccpm.config import BUFFER_STATUS_THRESHOLDS
 
 class BufferStatusColor(Enum):
     """バッファステータスの色を表す列挙型"""
@@ -10,46 +15,218 @@ class BufferStatusColor(Enum):
     YELLOW = "yellow" # 注意
     RED = "red"       # 危険
 
+# 色コード（一括判定の結果の値）→ 色
+COLOR_CODE_GREEN = 0
+COLOR_CODE_YELLOW = 1
+COLOR_CODE_RED = 2
+COLOR_BY_CODE = (
+    BufferStatusColor.GREEN,
+    BufferStatusColor.YELLOW,
+    BufferStatusColor.RED,
+)
+
+# 色 → HEX値
+COLOR_HEX = MappingProxyType({
+    BufferStatusColor.GREEN: "#28a745",  # 緑
+    BufferStatusColor.YELLOW: "#ffc107", # 黄
+    BufferStatusColor.RED: "#dc3545"     # 赤
+})
+
+# 色 → 説明テキスト
+COLOR_DESCRIPTIONS = MappingProxyType({
+    BufferStatusColor.GREEN: "安全: バッファ消費は計画内です",
+    BufferStatusColor.YELLOW: "注意: バッファ消費が増加しています",
+    BufferStatusColor.RED: "危険: バッファ消費が計画を超過しています"
+})
+
+class ThresholdProfile:
+    """
+    バッファステータスの閾値を表す不変の値オブジェクト
+    
+    同じ閾値のプロファイルは of で1つのインスタンスを共有します。
+    """
+    
+    __slots__ = ("green", "yellow", "red", "_mapping", "_bounds")
+    
+    green: float
+    yellow: float
+    red: float
+    _mapping: Mapping[str, float]
+    _bounds: np.ndarray
+    
+    # 閾値 → 共有インスタンス
+    _profiles: Dict[Tuple[float, float, float], "ThresholdProfile"] = {}
+    
+    def __init__(self, green: float, yellow: float, red: float = 1.0):
+        """
+        閾値プロファイルの初期化
+        
+        Args:
+            green: 緑（安全）とする消費率の上限
+            yellow: 黄（注意）とする消費率の上限
+            red: 赤（危険）とする消費率の上限
+            
+        Raises:
+            ValueError: 閾値が green <= yellow <= red の順でない場合
+        """
+        if not green <= yellow <= red:
+            raise ValueError(
+                f"閾値は green <= yellow <= red である必要があります: {green}, {yellow}, {red}"
+            )
+        object.__setattr__(self, "green", float(green))
+        object.__setattr__(self, "yellow", float(yellow))
+        object.__setattr__(self, "red", float(red))
+        object.__setattr__(
+            self,
+            "_mapping",
+            MappingProxyType(
+                {"green": self.green, "yellow": self.yellow, "red": self.red}
+            ),
+        )
+        bounds = np.array([self.green, self.yellow], dtype=np.float64)
+        bounds.flags.writeable = False
+        object.__setattr__(self, "_bounds", bounds)
+    
+    @classmethod
+    def of(
+        cls,
+        thresholds: Union["ThresholdProfile", Mapping[str, float], None] = None
+    ) -> "ThresholdProfile":
+        """
+        閾値から共有の閾値プロファイルを取得
+        
+        Args:
+            thresholds: 閾値プロファイル、閾値の辞書、または None（設定ファイルの値）
+            
+        Returns:
+            ThresholdProfile: 閾値プロファイル
+        """
+        if isinstance(thresholds, ThresholdProfile):
+            return thresholds
+        if thresholds is None:
+            thresholds = BUFFER_STATUS_THRESHOLDS
+        key = (
+            float(thresholds["green"]),
+            float(thresholds["yellow"]),
+            float(thresholds.get("red", 1.0)),
+        )
+        profile = cls._profiles.get(key)
+        if profile is None:
+            profile = cls._profiles.setdefault(key, cls(*key))
+        return profile
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """閾値プロファイルは変更できません"""
+        raise AttributeError("ThresholdProfile は変更できません")
+    
+    @property
+    def mapping(self) -> Mapping[str, float]:
+        """読み取り専用の閾値の辞書（{"green", "yellow", "red"}）"""
+        return self._mapping
+    
+    def classify(self, consumption_rate: float) -> BufferStatusColor:
+        """
+        消費率の色を判定
+        
+        Args:
+            consumption_rate: バッファ消費率
+            
+        Returns:
+            BufferStatusColor: バッファステータスの色
+        """
+        if consumption_rate <= self.green:
+            return BufferStatusColor.GREEN
+        elif consumption_rate <= self.yellow:
+            return BufferStatusColor.YELLOW
+        else:
+            return BufferStatusColor.RED
+    
+    def classify_many(self, consumption_rates: np.ndarray) -> np.ndarray:
+        """
+        消費率の配列の色コードを一括判定
+        
+        Args:
+            consumption_rates: バッファ消費率の配列
+            
+        Returns:
+            np.ndarray: 色コードの配列（COLOR_CODE_GREEN/YELLOW/RED、int8）
+        """
+        return np.searchsorted(self._bounds, consumption_rates, side="left").astype(
+            np.int8
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        """
+        等価性の比較
+        
+        Args:
+            other: 比較対象
+            
+        Returns:
+            bool: 等しい場合はTrue
+        """
+        if not isinstance(other, ThresholdProfile):
+            return False
+        return (self.green, self.yellow, self.red) == (
+            other.green,
+            other.yellow,
+            other.red,
+        )
+    
+    def __hash__(self) -> int:
+        """ハッシュ値"""
+        return hash((self.green, self.yellow, self.red))
+    
+    def __repr__(self) -> str:
+        """
+        文字列表現
+        
+        Returns:
+            str: 閾値プロファイルの文字列表現
+        """
+        return (
+            f"ThresholdProfile(green={self.green}, yellow={self.yellow}, "
+            f"red={self.red})"
+        )
+
+# 設定ファイルの閾値のプロファイル
+DEFAULT_THRESHOLD_PROFILE = ThresholdProfile.of(BUFFER_STATUS_THRESHOLDS)
+
 class BufferStatus:
     """
     バッファの状態を表す値オブジェクト
     
     バッファの消費率に基づいて、状態（緑/黄/赤）を判定します。
+    閾値は共有の ThresholdProfile を参照し、色は生成時に一度だけ判定するため、
+    多数のプロジェクトに対して生成しても辞書の確保や再判定は発生しません。
     """
     
+    __slots__ = ("consumption_rate", "profile", "color")
+    
     def __init__(
         self,
         consumption_rate: float,
-        thresholds: Dict[str, float] = None
+        thresholds: Union[ThresholdProfile, Mapping[str, float], None] = None
     ):
         """
         バッファステータスの初期化
         
         Args:
             consumption_rate: バッファ消費率（0.0〜1.0）
-            thresholds: 閾値設定（デフォルト: {"green": 0.33, "yellow": 0.67, "red": 1.0}）
+            thresholds: 閾値プロファイルまたは閾値の辞書（デフォルト: 設定ファイルの BUFFER_STATUS_THRESHOLDS）
         """
         self.consumption_rate = max(0.0, min(1.0, consumption_rate))
-        self.thresholds = thresholds or {
-            "green": 0.33,
-            "yellow": 0.67,
-            "red": 1.0
-        }
+        self.profile = (
+            DEFAULT_THRESHOLD_PROFILE
+            if thresholds is None
+            else ThresholdProfile.of(thresholds)
+        )
+        self.color = self.profile.classify(self.consumption_rate)
     
     @property
-    def color(self) -> BufferStatusColor:
-        """
-        バッファステータスの色を判定
-        
-        Returns:
-            BufferStatusColor: バッファステータスの色
-        """
-        if self.consumption_rate <= self.thresholds["green"]:
-            return BufferStatusColor.GREEN
-        elif self.consumption_rate <= self.thresholds["yellow"]:
-            return BufferStatusColor.YELLOW
-        else:
-            return BufferStatusColor.RED
+    def thresholds(self) -> Mapping[str, float]:
+        """読み取り専用の閾値の辞書"""
+        return self.profile.mapping
     
     @property
     def is_safe(self) -> bool:
@@ -73,12 +250,7 @@ class BufferStatus:
         Returns:
             str: 色のHEX値
         """
-        color_map = {
-            BufferStatusColor.GREEN: "#28a745",  # 緑
-            BufferStatusColor.YELLOW: "#ffc107", # 黄
-            BufferStatusColor.RED: "#dc3545"     # 赤
-        }
-        return color_map[self.color]
+        return COLOR_HEX[self.color]
     
     def get_display_info(self) -> Tuple[str, str, str]:
         """
@@ -87,17 +259,7 @@ class BufferStatus:
         Returns:
             Tuple[str, str, str]: (色名, 色のHEX値, 説明テキスト)
         """
-        color_name = self.color.value
-        color_hex = self.get_color_hex()
-        
-        descriptions = {
-            BufferStatusColor.GREEN: "安全: バッファ消費は計画内です",
-            BufferStatusColor.YELLOW: "注意: バッファ消費が増加しています",
-            BufferStatusColor.RED: "危険: バッファ消費が計画を超過しています"
-        }
-        
-        description = descriptions[self.color]
-        return (color_name, color_hex, description)
+        return (self.color.value, COLOR_HEX[self.color], COLOR_DESCRIPTIONS[self.color])
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -131,7 +293,7 @@ class BufferStatus:
             return False
         return (
             self.consumption_rate == other.consumption_rate and
-            self.thresholds == other.thresholds
+            self.profile == other.profile
         )
     
     def __str__(self) -> str:
@@ -142,4 +304,71 @@ class BufferStatus:
             str: バッファステータスの文字列表現
         """
         color_name, _, description = self.get_display_info()
-        return f"BufferStatus({self.consumption_rate:.2f}, {color_name}, '{description}')"
\ No newline at end of file
+        return f"BufferStatus({self.consumption_rate:.2f}, {color_name}, '{description}')"
+
+class BufferStatusBatch:
+    """
+    多数のプロジェクトのバッファステータスを配列で保持する値オブジェクト
+    
+    消費率と色コードは NumPy 配列で一括判定し、個別の BufferStatus は
+    参照されたときだけ共有の閾値プロファイルから生成します。
+    """
+    
+    __slots__ = ("consumption_rates", "codes", "profile")
+    
+    def __init__(
+        self,
+        consumption_rates: np.ndarray,
+        thresholds: Union[ThresholdProfile, Mapping[str, float], None] = None
+    ):
+        """
+        バッファステータスの一括判定
+        
+        Args:
+            consumption_rates: バッファ消費率の配列（0.0〜1.0 に丸めて保持）
+            thresholds: 閾値プロファイルまたは閾値の辞書（デフォルト: 設定ファイルの BUFFER_STATUS_THRESHOLDS）
+        """
+        self.profile = (
+            DEFAULT_THRESHOLD_PROFILE
+            if thresholds is None
+            else ThresholdProfile.of(thresholds)
+        )
+        self.consumption_rates = np.clip(
+            np.asarray(consumption_rates, dtype=np.float64), 0.0, 1.0
+        )
+        self.codes = self.profile.classify_many(self.consumption_rates)
+    
+    def __len__(self) -> int:
+        """プロジェクト数"""
+        return len(self.codes)
+    
+    def __getitem__(self, index: int) -> BufferStatus:
+        """
+        1件分のバッファステータスを取得
+        
+        Args:
+            index: 位置
+            
+        Returns:
+            BufferStatus: バッファステータス
+        """
+        return BufferStatus(float(self.consumption_rates[index]), self.profile)
+    
+    def colors(self) -> List[BufferStatusColor]:
+        """
+        色のリストを取得
+        
+        Returns:
+            List[BufferStatusColor]: 色のリスト
+        """
+        return [COLOR_BY_CODE[code] for code in self.codes.tolist()]
+    
+    def counts(self) -> Dict[BufferStatusColor, int]:
+        """
+        色ごとの件数を集計
+        
+        Returns:
+            Dict[BufferStatusColor, int]: 色ごとの件数
+        """
+        counts = np.bincount(self.codes, minlength=len(COLOR_BY_CODE))
+        return {color: int(counts[code]) for code, color in enumerate(COLOR_BY_CODE)}
@@ -0,0 +1,115 @@
+"""
+完了予測の値オブジェクト
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Any
+
+
+class CompletionForecast:
+    """
+    モンテカルロシミュレーションによるプロジェクト完了予測を表す値オブジェクト
+
+    残り所要時間はすべて基準日時からの作業時間（時間単位）です。
+    """
+
+    def __init__(
+        self,
+        base_date: datetime,
+        trials: int,
+        mean_hours: float,
+        std_hours: float,
+        percentiles: Dict[int, float],
+        confidence: float,
+        lower_hours: float,
+        upper_hours: float,
+        working_hours_per_day: float = 8.0
+    ):
+        """
+        完了予測の初期化
+
+        Args:
+            base_date: 予測の基準日時
+            trials: 試行回数
+            mean_hours: 残り所要時間の平均
+            std_hours: 残り所要時間の標準偏差
+            percentiles: パーセンタイル（例: 50, 85, 95）→ 残り所要時間
+            confidence: 信頼区間の水準（0.0〜1.0）
+            lower_hours: 信頼区間の下限
+            upper_hours: 信頼区間の上限
+            working_hours_per_day: 1日あたりの作業時間
+        """
+        self.base_date = base_date
+        self.trials = trials
+        self.mean_hours = mean_hours
+        self.std_hours = std_hours
+        self.percentiles = percentiles
+        self.confidence = confidence
+        self.lower_hours = lower_hours
+        self.upper_hours = upper_hours
+        self.working_hours_per_day = working_hours_per_day
+
+    def to_date(self, hours: float) -> datetime:
+        """
+        残り所要時間を日付に変換
+
+        Args:
+            hours: 残り所要時間（時間）
+
+        Returns:
+            datetime: 基準日時に作業日数を加えた日時
+        """
+        return self.base_date + timedelta(days=hours / self.working_hours_per_day)
+
+    @property
+    def median_hours(self) -> float:
+        """残り所要時間の中央値"""
+        return self.percentiles[50]
+
+    @property
+    def predicted_date(self) -> datetime:
+        """予測完了日（中央値）"""
+        return self.to_date(self.median_hours)
+
+    @property
+    def lower_date(self) -> datetime:
+        """信頼区間の下限日"""
+        return self.to_date(self.lower_hours)
+
+    @property
+    def upper_date(self) -> datetime:
+        """信頼区間の上限日"""
+        return self.to_date(self.upper_hours)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 完了予測の辞書表現
+        """
+        return {
+            "base_date": self.base_date.isoformat(),
+            "trials": self.trials,
+            "mean_hours": self.mean_hours,
+            "std_hours": self.std_hours,
+            "percentiles": {str(p): hours for p, hours in self.percentiles.items()},
+            "confidence": self.confidence,
+            "lower_hours": self.lower_hours,
+            "upper_hours": self.upper_hours,
+            "predicted_date": self.predicted_date.isoformat(),
+            "lower_date": self.lower_date.isoformat(),
+            "upper_date": self.upper_date.isoformat(),
+        }
+
+    def __str__(self) -> str:
+        """
+        文字列表現
+
+        Returns:
+            str: 完了予測の文字列表現
+        """
+        return (
+            f"CompletionForecast({self.predicted_date:%Y-%m-%d}, "
+            f"{self.confidence:.0%} CI [{self.lower_date:%Y-%m-%d}, "
+            f"{self.upper_date:%Y-%m-%d}])"
+        )
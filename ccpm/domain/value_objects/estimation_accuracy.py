@@ -0,0 +1,558 @@
+"""
+見積り精度の統計（予実比率の逐次統計と分位点スケッチ）の値オブジェクト
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ccpm.config import ESTIMATION_SKETCH_ACCURACY
+
+# 統計の単位
+SCOPE_ALL = "all"  # すべての完了タスク
+SCOPE_RESOURCE = "resource"  # 担当者ごと
+SCOPE_CATEGORY = "category"  # カテゴリごと
+SCOPE_TAG = "tag"  # タグごと
+SCOPE_RESOURCE_CATEGORY = "resource_category"  # 担当者×カテゴリごと
+SCOPES = (SCOPE_ALL, SCOPE_RESOURCE, SCOPE_CATEGORY, SCOPE_TAG, SCOPE_RESOURCE_CATEGORY)
+
+# 統計のキー: (単位, 担当者, カテゴリまたはタグ)
+StatsKey = Tuple[str, str, str]
+
+
+def stats_keys(resource: str, category: str, tags: Sequence[str]) -> List[StatsKey]:
+    """
+    完了タスク1件が寄与する統計のキーを列挙
+
+    担当者・カテゴリが空のタスクは、それぞれの単位の統計に寄与しません。
+
+    Args:
+        resource: 担当者
+        category: カテゴリ
+        tags: タグリスト
+
+    Returns:
+        List[StatsKey]: 統計のキーのリスト
+    """
+    keys: List[StatsKey] = [(SCOPE_ALL, "", "")]
+    if resource:
+        keys.append((SCOPE_RESOURCE, resource, ""))
+    if category:
+        keys.append((SCOPE_CATEGORY, "", category))
+    if resource and category:
+        keys.append((SCOPE_RESOURCE_CATEGORY, resource, category))
+    keys.extend((SCOPE_TAG, "", tag) for tag in dict.fromkeys(tags) if tag)
+    return keys
+
+
+class RunningStats:
+    """
+    Welford 法による件数・平均・分散の逐次統計
+
+    値の追加と取り消しはどちらも O(1) で、全標本を保持しません。
+    """
+
+    def __init__(
+        self,
+        count: int = 0,
+        mean: float = 0.0,
+        m2: float = 0.0,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None
+    ):
+        """
+        逐次統計の初期化
+
+        Args:
+            count: 件数
+            mean: 平均
+            m2: 平均からの偏差平方和
+            minimum: 最小値（取り消し後は過去の最小値のまま）
+            maximum: 最大値（取り消し後は過去の最大値のまま）
+        """
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def add(self, value: float) -> None:
+        """
+        値を追加
+
+        Args:
+            value: 追加する値
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def remove(self, value: float) -> None:
+        """
+        追加済みの値を取り消し（add の逆演算）
+
+        Args:
+            value: 取り消す値
+
+        Raises:
+            ValueError: 件数が0の場合
+        """
+        if self.count <= 0:
+            raise ValueError("件数が0の統計から値を取り消すことはできません")
+        if self.count == 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            self.minimum = self.maximum = None
+            return
+        previous_mean = (self.count * self.mean - value) / (self.count - 1)
+        self.m2 = max(0.0, self.m2 - (value - previous_mean) * (value - self.mean))
+        self.mean = previous_mean
+        self.count -= 1
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        別の逐次統計を合算（Chan らの並列アルゴリズム）
+
+        Args:
+            other: 合算する逐次統計
+        """
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        for bound in (other.minimum, other.maximum):
+            if bound is None:
+                continue
+            self.minimum = bound if self.minimum is None else min(self.minimum, bound)
+            self.maximum = bound if self.maximum is None else max(self.maximum, bound)
+
+    @property
+    def variance(self) -> float:
+        """不偏分散（件数が2未満の場合は0.0）"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """標準偏差"""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 逐次統計の辞書表現
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningStats":
+        """
+        辞書から逐次統計を作成
+
+        Args:
+            data: 逐次統計の辞書
+
+        Returns:
+            RunningStats: 作成された逐次統計
+        """
+        return cls(
+            count=int(data["count"]),
+            mean=float(data["mean"]),
+            m2=float(data["m2"]),
+            minimum=data.get("minimum"),
+            maximum=data.get("maximum"),
+        )
+
+
+class QuantileSketch:
+    """
+    対数幅のバケットによる分位点スケッチ（DDSketch と同じ相対誤差保証）
+
+    正の値は相対誤差 relative_accuracy 以内で分位点を返します。0以下の値は
+    専用のバケットに数えます。追加・取り消しは O(1)、バケット数は値の範囲の
+    対数に比例します（予実比率 0.01〜100 で約460個）。
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = ESTIMATION_SKETCH_ACCURACY,
+        bins: Optional[Dict[int, int]] = None,
+        zero_count: int = 0
+    ):
+        """
+        分位点スケッチの初期化
+
+        Args:
+            relative_accuracy: 分位点の相対誤差（0〜1）
+            bins: バケット番号ごとの件数
+            zero_count: 0以下の値の件数
+
+        Raises:
+            ValueError: 相対誤差が 0〜1 の範囲外の場合
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"相対誤差は0より大きく1未満である必要があります: {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = dict(bins) if bins else {}
+        self.zero_count = zero_count
+
+    @property
+    def count(self) -> int:
+        """件数"""
+        return self.zero_count + sum(self.bins.values())
+
+    def _index(self, value: float) -> int:
+        """値のバケット番号"""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        """バケットの代表値（相対誤差が最小になる値）"""
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float) -> None:
+        """
+        値を追加
+
+        Args:
+            value: 追加する値
+        """
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = self._index(value)
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def contains(self, value: float) -> bool:
+        """
+        値のバケットに件数があるかどうか（remove で取り消せるかどうか）
+
+        Args:
+            value: 確認する値
+
+        Returns:
+            bool: 取り消せる場合はTrue
+        """
+        if value <= 0:
+            return self.zero_count > 0
+        return self.bins.get(self._index(value), 0) > 0
+
+    def remove(self, value: float) -> None:
+        """
+        追加済みの値を取り消し
+
+        Args:
+            value: 取り消す値
+
+        Raises:
+            ValueError: 値が追加されていない場合
+        """
+        if value <= 0:
+            if self.zero_count <= 0:
+                raise ValueError(f"スケッチに含まれない値です: {value}")
+            self.zero_count -= 1
+            return
+        index = self._index(value)
+        remaining = self.bins.get(index, 0) - 1
+        if remaining < 0:
+            raise ValueError(f"スケッチに含まれない値です: {value}")
+        if remaining:
+            self.bins[index] = remaining
+        else:
+            del self.bins[index]
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        別のスケッチを合算
+
+        Args:
+            other: 合算するスケッチ（相対誤差が同じであること）
+
+        Raises:
+            ValueError: 相対誤差が異なる場合
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("相対誤差が異なるスケッチは合算できません")
+        self.zero_count += other.zero_count
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        分位点を取得
+
+        Args:
+            q: 分位（0.0〜1.0、0.5 で中央値）
+
+        Returns:
+            Optional[float]: 分位点、件数が0の場合はNone
+
+        Raises:
+            ValueError: 分位が 0〜1 の範囲外の場合
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"分位は0〜1である必要があります: {q}")
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return self._value(index)
+        return self._value(max(self.bins))
+
+    def rank(self, value: float) -> float:
+        """
+        値以下の標本の割合（パーセンタイル順位）を取得
+
+        Args:
+            value: 値
+
+        Returns:
+            float: 値以下の標本の割合（0.0〜1.0、件数が0の場合は0.0）
+        """
+        total = self.count
+        if total == 0:
+            return 0.0
+        if value <= 0:
+            return self.zero_count / total
+        limit = self._index(value)
+        below = self.zero_count + sum(
+            count for index, count in self.bins.items() if index <= limit
+        )
+        return below / total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: スケッチの辞書表現（バケット番号は文字列）
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zero_count": self.zero_count,
+            "bins": {str(index): count for index, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """
+        辞書からスケッチを作成
+
+        Args:
+            data: スケッチの辞書
+
+        Returns:
+            QuantileSketch: 作成されたスケッチ
+        """
+        return cls(
+            relative_accuracy=float(data["relative_accuracy"]),
+            bins={
+                int(index): int(count) for index, count in data.get("bins", {}).items()
+            },
+            zero_count=int(data.get("zero_count", 0)),
+        )
+
+
+class EstimationStats:
+    """
+    統計の単位ごとの予実比率（実績工数 / 見積り工数）の統計を表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        resource: str,
+        key: str,
+        stats: Optional[RunningStats] = None,
+        sketch: Optional[QuantileSketch] = None
+    ):
+        """
+        見積り統計の初期化
+
+        Args:
+            scope: 統計の単位（all/resource/category/tag/resource_category）
+            resource: 担当者（単位に担当者を含まない場合は空文字）
+            key: カテゴリまたはタグ（単位に含まない場合は空文字）
+            stats: 予実比率の逐次統計
+            sketch: 予実比率の分位点スケッチ
+        """
+        self.scope = scope
+        self.resource = resource
+        self.key = key
+        self.stats = stats or RunningStats()
+        self.sketch = sketch or QuantileSketch()
+
+    @property
+    def stats_key(self) -> StatsKey:
+        """統計のキー"""
+        return (self.scope, self.resource, self.key)
+
+    @property
+    def count(self) -> int:
+        """完了タスク数"""
+        return self.stats.count
+
+    @property
+    def correction_factor(self) -> float:
+        """
+        見積り補正係数（予実比率の中央値、標本がない場合は1.0）
+
+        平均より外れ値の影響を受けにくい中央値を使います。
+        """
+        median = self.sketch.quantile(0.5)
+        return 1.0 if median is None else median
+
+    def add(self, ratio: float) -> None:
+        """
+        完了タスクの予実比率を追加
+
+        Args:
+            ratio: 予実比率
+        """
+        self.stats.add(ratio)
+        self.sketch.add(ratio)
+
+    def can_remove(self, ratio: float) -> bool:
+        """
+        予実比率を取り消せるかどうか（件数が1以上で、スケッチに値が含まれる場合）
+
+        Args:
+            ratio: 予実比率
+
+        Returns:
+            bool: 取り消せる場合はTrue
+        """
+        return self.stats.count > 0 and self.sketch.contains(ratio)
+
+    def remove(self, ratio: float) -> None:
+        """
+        完了タスクの予実比率を取り消し
+
+        Args:
+            ratio: 予実比率
+        """
+        self.stats.remove(ratio)
+        self.sketch.remove(ratio)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 見積り統計の辞書表現
+        """
+        return {
+            "scope": self.scope,
+            "resource": self.resource,
+            "key": self.key,
+            "stats": self.stats.to_dict(),
+            "sketch": self.sketch.to_dict(),
+            "correction_factor": self.correction_factor,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EstimationStats":
+        """
+        辞書から見積り統計を作成
+
+        Args:
+            data: 見積り統計の辞書
+
+        Returns:
+            EstimationStats: 作成された見積り統計
+        """
+        return cls(
+            scope=data["scope"],
+            resource=data.get("resource", ""),
+            key=data.get("key", ""),
+            stats=RunningStats.from_dict(data["stats"]),
+            sketch=QuantileSketch.from_dict(data["sketch"]),
+        )
+
+
+class EstimationAccuracy:
+    """
+    1タスクの見積り精度を、比較対象の統計に対して評価した結果を表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        task_id: UUID,
+        variance_ratio: float,
+        baseline: EstimationStats
+    ):
+        """
+        見積り精度の初期化
+
+        Args:
+            task_id: タスクID
+            variance_ratio: タスクの予実比率
+            baseline: 比較対象の統計
+        """
+        self.task_id = task_id
+        self.variance_ratio = variance_ratio
+        self.baseline = baseline
+
+    @property
+    def expected_ratio(self) -> float:
+        """比較対象の予実比率の平均"""
+        return self.baseline.stats.mean if self.baseline.count else 1.0
+
+    @property
+    def z_score(self) -> Optional[float]:
+        """比較対象の分布に対する標準得点（標準偏差が0の場合はNone）"""
+        stddev = self.baseline.stats.stddev
+        if stddev <= 0:
+            return None
+        return (self.variance_ratio - self.baseline.stats.mean) / stddev
+
+    @property
+    def percentile(self) -> float:
+        """比較対象の中での予実比率のパーセンタイル順位（0.0〜1.0）"""
+        return self.baseline.sketch.rank(self.variance_ratio)
+
+    @property
+    def error(self) -> float:
+        """見積りの相対誤差（|予実比率 - 1|）"""
+        return abs(self.variance_ratio - 1.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 見積り精度の辞書表現
+        """
+        return {
+            "task_id": str(self.task_id),
+            "variance_ratio": self.variance_ratio,
+            "error": self.error,
+            "expected_ratio": self.expected_ratio,
+            "z_score": self.z_score,
+            "percentile": self.percentile,
+            "baseline": {
+                "scope": self.baseline.scope,
+                "resource": self.baseline.resource,
+                "key": self.baseline.key,
+                "count": self.baseline.count,
+                "correction_factor": self.baseline.correction_factor,
+            },
+        }
@@ -0,0 +1,95 @@
+"""
+フィーディングバッファの値オブジェクト
+"""
+from typing import Dict, Any, List
+from uuid import UUID
+
+
+class FeedingBuffer:
+    """
+    フィーディングチェーンがクリティカルチェーンに合流する地点に置くバッファを表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        merge_task_id: UUID,
+        feeding_chain: List[UUID],
+        size: float,
+        consumed: float = 0.0
+    ):
+        """
+        フィーディングバッファの初期化
+
+        Args:
+            merge_task_id: 合流先のクリティカルチェーン上のタスクID
+            feeding_chain: フィーディングチェーンを構成するタスクIDのリスト（開始 → 合流直前の順）
+            size: バッファサイズ（時間）
+            consumed: 消費済みバッファ量
+        """
+        self.merge_task_id = merge_task_id
+        self.feeding_chain = feeding_chain
+        self.size = size
+        self.consumed = consumed
+
+    @property
+    def feeding_task_id(self) -> UUID:
+        """合流直前（フィーディングチェーン末尾）のタスクID"""
+        return self.feeding_chain[-1]
+
+    @property
+    def consumption_rate(self) -> float:
+        """
+        バッファ消費率を計算
+
+        Returns:
+            float: バッファ消費率（0.0〜1.0）
+        """
+        if self.size <= 0:
+            return 0.0
+        return min(1.0, self.consumed / self.size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: フィーディングバッファの辞書表現
+        """
+        return {
+            "merge_task_id": str(self.merge_task_id),
+            "feeding_chain": [str(task_id) for task_id in self.feeding_chain],
+            "size": self.size,
+            "consumed": self.consumed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeedingBuffer":
+        """
+        辞書からフィーディングバッファを作成
+
+        Args:
+            data: フィーディングバッファデータの辞書
+
+        Returns:
+            FeedingBuffer: 作成されたフィーディングバッファ
+        """
+        return cls(
+            merge_task_id=UUID(data["merge_task_id"]),
+            feeding_chain=[UUID(task_id) for task_id in data["feeding_chain"]],
+            size=float(data["size"]),
+            consumed=float(data.get("consumed", 0.0)),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        等価性の比較
+
+        Args:
+            other: 比較対象
+
+        Returns:
+            bool: 等しい場合はTrue
+        """
+        if not isinstance(other, FeedingBuffer):
+            return False
+        return self.to_dict() == other.to_dict()
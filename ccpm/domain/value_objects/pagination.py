@@ -0,0 +1,52 @@
+"""
+一覧の1ページ分を表す値オブジェクトとページ指定の検証
+"""
+from typing import Any, List
+
+
+class Page:
+    """
+    一覧の1ページ分の要素とページ位置を表す値オブジェクト
+    """
+
+    def __init__(self, items: List[Any], total: int, page: int, page_size: int):
+        """
+        ページの初期化
+
+        Args:
+            items: ページ内の要素
+            total: 全体の件数
+            page: ページ番号（0始まり）
+            page_size: 1ページの件数
+        """
+        self.items = items
+        self.total = total
+        self.page = page
+        self.page_size = page_size
+
+    @property
+    def page_count(self) -> int:
+        """全体のページ数"""
+        return max(1, -(-self.total // self.page_size))
+
+    @property
+    def has_next(self) -> bool:
+        """次のページがあるかどうか"""
+        return self.page + 1 < self.page_count
+
+
+def check_page(page: int, page_size: int) -> None:
+    """
+    ページ指定を検証
+
+    Args:
+        page: ページ番号（0始まり）
+        page_size: 1ページの件数
+
+    Raises:
+        ValueError: ページ番号が負、または1ページの件数が1未満の場合
+    """
+    if page < 0:
+        raise ValueError("ページ番号は0以上である必要があります")
+    if page_size < 1:
+        raise ValueError("1ページの件数は1以上である必要があります")
@@ -0,0 +1,59 @@
+"""
+リソース平準化済みスケジュールの値オブジェクト
+"""
+from typing import Dict, Any, List
+from uuid import UUID
+
+
+class ResourceSchedule:
+    """
+    リソース競合を解消したスケジュールを表す値オブジェクト
+
+    時刻はすべてプロジェクト開始からの経過時間（見積り工数ベース、時間単位）です。
+    """
+
+    def __init__(
+        self,
+        start_times: Dict[UUID, float],
+        finish_times: Dict[UUID, float],
+        critical_chain: List[UUID]
+    ):
+        """
+        リソーススケジュールの初期化
+
+        Args:
+            start_times: タスクIDをキーとする開始時刻
+            finish_times: タスクIDをキーとする終了時刻
+            critical_chain: 依存関係とリソース競合を考慮したクリティカルチェーン
+        """
+        self.start_times = start_times
+        self.finish_times = finish_times
+        self.critical_chain = critical_chain
+
+    @property
+    def makespan(self) -> float:
+        """
+        プロジェクト全体の所要時間
+
+        Returns:
+            float: 最も遅いタスクの終了時刻（時間）
+        """
+        return max(self.finish_times.values(), default=0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: リソーススケジュールの辞書表現
+        """
+        return {
+            "start_times": {
+                str(task_id): start for task_id, start in self.start_times.items()
+            },
+            "finish_times": {
+                str(task_id): finish for task_id, finish in self.finish_times.items()
+            },
+            "critical_chain": [str(task_id) for task_id in self.critical_chain],
+            "makespan": self.makespan,
+        }
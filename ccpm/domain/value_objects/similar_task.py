@@ -0,0 +1,134 @@
+"""
+類似タスクと実績に基づく見積り参考値の値オブジェクト
+"""
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import numpy as np
+
+
+class SimilarTask:
+    """
+    類似度で順位付けされた過去の完了タスクを表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        task_id: UUID,
+        score: float,
+        estimated_hours: float,
+        actual_hours: float
+    ):
+        """
+        類似タスクの初期化
+
+        Args:
+            task_id: タスクID
+            score: 類似度スコア（大きいほど類似）
+            estimated_hours: 見積り工数
+            actual_hours: 実績工数
+        """
+        self.task_id = task_id
+        self.score = score
+        self.estimated_hours = estimated_hours
+        self.actual_hours = actual_hours
+
+    @property
+    def variance_ratio(self) -> float:
+        """予実比率（見積りが0の場合は1.0、Task.variance_ratio と同じ計算）"""
+        if self.estimated_hours <= 0:
+            return 1.0
+        return self.actual_hours / self.estimated_hours
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 類似タスクの辞書表現
+        """
+        return {
+            "task_id": str(self.task_id),
+            "score": self.score,
+            "estimated_hours": self.estimated_hours,
+            "actual_hours": self.actual_hours,
+            "variance_ratio": self.variance_ratio,
+        }
+
+
+class EstimateSuggestion:
+    """
+    類似タスクの実績工数の分布を表す値オブジェクト
+    """
+
+    def __init__(self, matches: List[SimilarTask]):
+        """
+        見積り参考値の初期化
+
+        Args:
+            matches: 類似度順の類似タスクのリスト
+        """
+        self.matches = matches
+        self._actual = np.array(
+            [match.actual_hours for match in matches], dtype=np.float64
+        )
+        self._scores = np.array([match.score for match in matches], dtype=np.float64)
+
+    @property
+    def count(self) -> int:
+        """類似タスク数"""
+        return len(self.matches)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        実績工数の分位点
+
+        Args:
+            q: 分位（0.0〜1.0）
+
+        Returns:
+            Optional[float]: 分位点、類似タスクがない場合はNone
+        """
+        if not self.matches:
+            return None
+        return float(np.quantile(self._actual, q))
+
+    @property
+    def weighted_mean(self) -> Optional[float]:
+        """類似度で重み付けした実績工数の平均（類似タスクがない場合はNone）"""
+        if not self.matches:
+            return None
+        total = float(self._scores.sum())
+        if total <= 0:
+            return float(self._actual.mean())
+        return float(np.dot(self._actual, self._scores) / total)
+
+    @property
+    def median_variance_ratio(self) -> Optional[float]:
+        """類似タスクの予実比率の中央値（類似タスクがない場合はNone）"""
+        if not self.matches:
+            return None
+        return float(np.median([match.variance_ratio for match in self.matches]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 見積り参考値の辞書表現
+        """
+        empty = not self.matches
+        return {
+            "count": self.count,
+            "actual_hours": {
+                "mean": None if empty else float(self._actual.mean()),
+                "weighted_mean": self.weighted_mean,
+                "min": None if empty else float(self._actual.min()),
+                "p10": self.quantile(0.1),
+                "median": self.quantile(0.5),
+                "p90": self.quantile(0.9),
+                "max": None if empty else float(self._actual.max()),
+            },
+            "median_variance_ratio": self.median_variance_ratio,
+            "matches": [match.to_dict() for match in self.matches],
+        }
@@ -0,0 +1,115 @@
+"""
+タスクスケジュール（フロート）の値オブジェクト
+"""
+from typing import Dict, Any
+
+# フロートを0とみなす許容誤差（スケジュールの長さに対する相対値）
+FLOAT_TOLERANCE = 1e-9
+
+
+def clamp_float(value: float, scale: float = 1.0) -> float:
+    """
+    浮動小数点の加算誤差程度のフロートを0に丸める
+
+    Args:
+        value: フロート（時間）
+        scale: 誤差の基準とする長さ（プロジェクト全体の長さなど）
+
+    Returns:
+        float: 許容誤差以下の場合は0.0、それ以外はそのままの値
+    """
+    if value <= FLOAT_TOLERANCE * max(1.0, abs(scale)):
+        return 0.0
+    return value
+
+
+class TaskSchedule:
+    """
+    フォワード/バックワードパスで求めたタスクの日程とフロートを表す値オブジェクト
+
+    時刻はすべてプロジェクト開始からの経過時間（見積り工数ベース、時間単位）です。
+    """
+
+    __slots__ = (
+        "earliest_start",
+        "earliest_finish",
+        "latest_start",
+        "latest_finish",
+        "total_float",
+        "free_float",
+    )
+
+    def __init__(
+        self,
+        earliest_start: float,
+        earliest_finish: float,
+        latest_start: float,
+        latest_finish: float,
+        total_float: float,
+        free_float: float
+    ):
+        """
+        タスクスケジュールの初期化
+
+        Args:
+            earliest_start: 最早開始時刻
+            earliest_finish: 最早終了時刻
+            latest_start: 最遅開始時刻
+            latest_finish: 最遅終了時刻
+            total_float: トータルフロート（プロジェクト完了を遅らせずに遅延できる時間）
+            free_float: フリーフロート（後続タスクの最早開始を遅らせずに遅延できる時間）
+        """
+        self.earliest_start = earliest_start
+        self.earliest_finish = earliest_finish
+        self.latest_start = latest_start
+        self.latest_finish = latest_finish
+        self.total_float = total_float
+        self.free_float = free_float
+
+    @property
+    def is_critical(self) -> bool:
+        """トータルフロートがない（クリティカルパス上の）タスクかどうか（誤差は0とみなす）"""
+        return self.total_float <= FLOAT_TOLERANCE * max(1.0, abs(self.latest_finish))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: タスクスケジュールの辞書表現
+        """
+        return {
+            "earliest_start": self.earliest_start,
+            "earliest_finish": self.earliest_finish,
+            "latest_start": self.latest_start,
+            "latest_finish": self.latest_finish,
+            "total_float": self.total_float,
+            "free_float": self.free_float,
+            "is_critical": self.is_critical,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """
+        等価性の比較
+
+        Args:
+            other: 比較対象
+
+        Returns:
+            bool: 等しい場合はTrue
+        """
+        if not isinstance(other, TaskSchedule):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def __str__(self) -> str:
+        """
+        文字列表現
+
+        Returns:
+            str: タスクスケジュールの文字列表現
+        """
+        return (
+            f"TaskSchedule(ES={self.earliest_start:.2f}, LS={self.latest_start:.2f}, "
+            f"TF={self.total_float:.2f}, FF={self.free_float:.2f})"
+        )
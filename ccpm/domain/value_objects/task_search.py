@@ -0,0 +1,193 @@
+"""
+タスク検索の条件と結果の値オブジェクト
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.value_objects.pagination import Page
+
+
+class TaskSearchCriteria:
+    """
+    タスクの全文検索と絞り込みの条件を表す値オブジェクト
+
+    指定した条件はすべて満たす必要があります（AND）。複数の値を指定できる項目は、
+    ステータス・優先度・カテゴリはいずれかに一致（OR）、タグはすべてを持つ（AND）ものが対象です。
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        project_id: Optional[UUID] = None,
+        statuses: Sequence[str] = (),
+        priorities: Sequence[int] = (),
+        categories: Sequence[str] = (),
+        tags: Sequence[str] = (),
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        end_from: Optional[datetime] = None,
+        end_to: Optional[datetime] = None
+    ):
+        """
+        検索条件の初期化
+
+        Args:
+            text: タスク名・説明に対する検索語（空白区切りの語をすべて含むものが対象）
+            project_id: プロジェクトID
+            statuses: ステータスのリスト
+            priorities: 優先度のリスト
+            categories: カテゴリのリスト
+            tags: タグのリスト
+            start_from: 開始日の下限（この日時を含む）
+            start_to: 開始日の上限（この日時を含む）
+            end_from: 終了日の下限（この日時を含む）
+            end_to: 終了日の上限（この日時を含む）
+
+        Raises:
+            ValueError: 日付範囲の下限が上限より後の場合
+        """
+        for lower, upper, label in (
+            (start_from, start_to, "開始日"),
+            (end_from, end_to, "終了日"),
+        ):
+            if lower is not None and upper is not None and lower > upper:
+                raise ValueError(f"{label}の範囲の下限が上限より後です")
+        self.text = text.strip()
+        self.project_id = project_id
+        self.statuses = tuple(dict.fromkeys(statuses))
+        self.priorities = tuple(dict.fromkeys(priorities))
+        self.categories = tuple(dict.fromkeys(categories))
+        self.tags = tuple(dict.fromkeys(tags))
+        self.start_from = start_from
+        self.start_to = start_to
+        self.end_from = end_from
+        self.end_to = end_to
+
+    @property
+    def terms(self) -> List[str]:
+        """検索語のリスト（重複を除く）"""
+        return list(dict.fromkeys(self.text.split()))
+
+    def matches(self, task: Task) -> bool:
+        """
+        タスクが条件を満たすかどうか
+
+        検索語は大文字・小文字を区別せずにタスク名・説明の部分文字列として照合します。
+
+        Args:
+            task: タスク
+
+        Returns:
+            bool: 条件を満たす場合はTrue
+        """
+        if self.project_id is not None and task.project_id != self.project_id:
+            return False
+        if self.statuses and task.status not in self.statuses:
+            return False
+        if self.priorities and task.priority not in self.priorities:
+            return False
+        if self.categories and task.category not in self.categories:
+            return False
+        if self.tags and not set(self.tags).issubset(task.tags):
+            return False
+        if not _in_range(task.start_date, self.start_from, self.start_to):
+            return False
+        if not _in_range(task.end_date, self.end_from, self.end_to):
+            return False
+        if self.terms:
+            text = f"{task.name}\n{task.description}".casefold()
+            return all(term.casefold() in text for term in self.terms)
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 検索条件の辞書表現
+        """
+        return {
+            "text": self.text,
+            "project_id": str(self.project_id) if self.project_id else None,
+            "statuses": list(self.statuses),
+            "priorities": list(self.priorities),
+            "categories": list(self.categories),
+            "tags": list(self.tags),
+            "start_from": self.start_from.isoformat() if self.start_from else None,
+            "start_to": self.start_to.isoformat() if self.start_to else None,
+            "end_from": self.end_from.isoformat() if self.end_from else None,
+            "end_to": self.end_to.isoformat() if self.end_to else None,
+        }
+
+
+def _in_range(
+    value: Optional[datetime],
+    lower: Optional[datetime],
+    upper: Optional[datetime]
+) -> bool:
+    """
+    日時が範囲内にあるかどうか（範囲の指定がある場合、日時のないタスクは範囲外）
+
+    Args:
+        value: 日時
+        lower: 下限（None の場合は制限なし）
+        upper: 上限（None の場合は制限なし）
+
+    Returns:
+        bool: 範囲内の場合はTrue
+    """
+    if lower is None and upper is None:
+        return True
+    if value is None:
+        return False
+    return (lower is None or value >= lower) and (upper is None or value <= upper)
+
+
+class TaskSearchResult(Page):
+    """
+    タスク検索結果の1ページ分を表す値オブジェクト
+    """
+
+    def __init__(
+        self,
+        tasks: List[Task],
+        total: int,
+        page: int,
+        page_size: int,
+        scores: Optional[List[float]] = None
+    ):
+        """
+        検索結果の初期化
+
+        Args:
+            tasks: ページ内のタスク（関連度の高い順、検索語がない場合は作成日時順）
+            total: 条件に一致するタスクの総数
+            page: ページ番号（0始まり）
+            page_size: 1ページの件数
+            scores: タスクごとの関連度（大きいほど関連が強い。全文検索で順位付けしなかった場合はNone）
+        """
+        super().__init__(tasks, total, page, page_size)
+        self.scores = scores
+
+    @property
+    def tasks(self) -> List[Task]:
+        """ページ内のタスク"""
+        return self.items
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 検索結果の辞書表現
+        """
+        return {
+            "tasks": [task.to_dict() for task in self.tasks],
+            "total": self.total,
+            "page": self.page,
+            "page_size": self.page_size,
+            "page_count": self.page_count,
+            "scores": self.scores,
+        }
@@ -0,0 +1,122 @@
+"""
+作業時間集計（ロールアップ）の値オブジェクト
+"""
+from datetime import date, timedelta
+from typing import Dict, Any, Union
+from uuid import UUID
+
+# 集計の粒度
+GRANULARITY_DAY = "day"
+GRANULARITY_WEEK = "week"
+GRANULARITIES = (GRANULARITY_DAY, GRANULARITY_WEEK)
+
+# 集計の単位
+SCOPE_TASK = "task"
+SCOPE_PROJECT = "project"
+SCOPE_CATEGORY = "category"
+SCOPES = (SCOPE_TASK, SCOPE_PROJECT, SCOPE_CATEGORY)
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    """
+    日付が属する集計区間の開始日を取得
+
+    Args:
+        day: 日付
+        granularity: 集計の粒度（"day" または "week"。週は月曜始まり）
+
+    Returns:
+        date: 集計区間の開始日
+
+    Raises:
+        ValueError: 不明な粒度が指定された場合
+    """
+    if granularity == GRANULARITY_DAY:
+        return day
+    if granularity == GRANULARITY_WEEK:
+        return day - timedelta(days=day.weekday())
+    raise ValueError(f"不明な集計粒度です: {granularity}")
+
+
+class TimeRollup:
+    """
+    集計区間ごとの作業時間の合計を表す値オブジェクト
+
+    時間記録は開始時刻の日付の区間に計上します。
+    """
+
+    def __init__(
+        self,
+        granularity: str,
+        scope: str,
+        key: Union[UUID, str],
+        bucket: date,
+        hours: float,
+        record_count: int
+    ):
+        """
+        作業時間集計の初期化
+
+        Args:
+            granularity: 集計の粒度（"day" または "week"）
+            scope: 集計の単位（"task"、"project" または "category"）
+            key: 集計対象（タスクID、プロジェクトID またはカテゴリ名）
+            bucket: 集計区間の開始日
+            hours: 作業時間の合計（時間）
+            record_count: 時間記録の件数
+        """
+        self.granularity = granularity
+        self.scope = scope
+        self.key = key
+        self.bucket = bucket
+        self.hours = hours
+        self.record_count = record_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: 作業時間集計の辞書表現
+        """
+        return {
+            "granularity": self.granularity,
+            "scope": self.scope,
+            "key": str(self.key),
+            "bucket": self.bucket.isoformat(),
+            "hours": self.hours,
+            "record_count": self.record_count,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """
+        等価性の比較
+
+        Args:
+            other: 比較対象
+
+        Returns:
+            bool: 等しい場合はTrue
+        """
+        if not isinstance(other, TimeRollup):
+            return False
+        return (
+            self.granularity == other.granularity
+            and self.scope == other.scope
+            and self.key == other.key
+            and self.bucket == other.bucket
+            and abs(self.hours - other.hours) < 1e-9
+            and self.record_count == other.record_count
+        )
+
+    def __str__(self) -> str:
+        """
+        文字列表現
+
+        Returns:
+            str: 作業時間集計の文字列表現
+        """
+        return (
+            f"{self.scope} {self.key} {self.bucket.isoformat()} ({self.granularity}): "
+            f"{self.hours:.2f}時間"
+        )
@@ -0,0 +1,701 @@
+"""
+SQLiteデータベースの差分・圧縮バックアップ
+"""
+import bz2
+import hashlib
+import json
+import logging
+import lzma
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from ccpm.config import (
+    BACKUP_CHUNK_SIZE,
+    BACKUP_COMPRESSION,
+    BACKUP_DIR,
+    BACKUP_INTERVAL_SECONDS,
+    BACKUP_KEEP_DAILY,
+    BACKUP_KEEP_LAST,
+    BACKUP_PAGES_PER_STEP,
+)
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.cached_repositories import shared_entity_cache
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 圧縮方式 → (圧縮関数, 展開関数)。いずれも標準ライブラリで、圧縮中は GIL を解放します
+COMPRESSIONS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "bz2": (lambda data: bz2.compress(data, 9), bz2.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=1), lzma.decompress),
+}
+
+# チャンクのダイジェスト長（バイト）
+DIGEST_SIZE = 20
+
+SNAPSHOT_ID_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+def chunk_digest(data: bytes) -> str:
+    """
+    チャンクの内容から格納名となるダイジェストを計算
+
+    Args:
+        data: チャンクの内容（圧縮前）
+
+    Returns:
+        str: 16進数のダイジェスト
+    """
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+class BackupSnapshot:
+    """
+    1回のバックアップ（スナップショット）のマニフェスト
+
+    データベースファイルを固定長のチャンクに分け、チャンクの内容ダイジェストの並びとして
+    記録します。内容が同じチャンクは以前のスナップショットと共有されます。
+    """
+
+    def __init__(
+        self,
+        id: str,
+        created_at: datetime,
+        database_size: int,
+        page_size: int,
+        chunk_size: int,
+        compression: str,
+        chunks: List[str],
+        new_chunks: int = 0,
+        stored_bytes: int = 0,
+        elapsed_seconds: float = 0.0
+    ):
+        """
+        スナップショットの初期化
+
+        Args:
+            id: スナップショットID（作成日時から生成）
+            created_at: 作成日時
+            database_size: データベースファイルのサイズ（バイト）
+            page_size: SQLiteのページサイズ（バイト）
+            chunk_size: チャンクサイズ（バイト）
+            compression: 圧縮方式
+            chunks: チャンクのダイジェストのリスト（ファイル先頭から順）
+            new_chunks: このスナップショットで新たに格納したチャンク数
+            stored_bytes: このスナップショットで新たに格納した圧縮後のバイト数
+            elapsed_seconds: 作成の所要時間（秒）
+        """
+        self.id = id
+        self.created_at = created_at
+        self.database_size = database_size
+        self.page_size = page_size
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.chunks = chunks
+        self.new_chunks = new_chunks
+        self.stored_bytes = stored_bytes
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def reused_chunks(self) -> int:
+        """以前のスナップショットと共有したチャンク数"""
+        return len(self.chunks) - self.new_chunks
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書形式に変換
+
+        Returns:
+            Dict[str, Any]: スナップショットの辞書表現
+        """
+        return {
+            "id": self.id,
+            "created_at": self.created_at.isoformat(),
+            "database_size": self.database_size,
+            "page_size": self.page_size,
+            "chunk_size": self.chunk_size,
+            "compression": self.compression,
+            "chunks": self.chunks,
+            "new_chunks": self.new_chunks,
+            "stored_bytes": self.stored_bytes,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BackupSnapshot":
+        """
+        辞書からスナップショットを作成
+
+        Args:
+            data: スナップショットデータの辞書
+
+        Returns:
+            BackupSnapshot: 作成されたスナップショット
+        """
+        return cls(
+            id=data["id"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            database_size=int(data["database_size"]),
+            page_size=int(data["page_size"]),
+            chunk_size=int(data["chunk_size"]),
+            compression=data["compression"],
+            chunks=list(data["chunks"]),
+            new_chunks=int(data.get("new_chunks", 0)),
+            stored_bytes=int(data.get("stored_bytes", 0)),
+            elapsed_seconds=float(data.get("elapsed_seconds", 0.0)),
+        )
+
+
+class RetentionPolicy:
+    """
+    スナップショットの保持方針
+
+    最新の keep_last 件と、直近 keep_daily 日（スナップショットのある日）それぞれの
+    最後のスナップショットを保持します。
+    """
+
+    def __init__(
+        self,
+        keep_last: int = BACKUP_KEEP_LAST,
+        keep_daily: int = BACKUP_KEEP_DAILY
+    ):
+        """
+        保持方針の初期化
+
+        Args:
+            keep_last: 保持する最新スナップショット数
+            keep_daily: 日ごとに1つ保持する日数
+
+        Raises:
+            ValueError: 保持数が負の場合、またはどのスナップショットも保持しない設定の場合
+        """
+        if keep_last < 0 or keep_daily < 0 or keep_last + keep_daily == 0:
+            raise ValueError("保持するスナップショット数は1以上である必要があります")
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+
+    def select(self, snapshots: List[BackupSnapshot]) -> Set[str]:
+        """
+        保持するスナップショットを選択
+
+        Args:
+            snapshots: スナップショットのリスト（作成日時順）
+
+        Returns:
+            Set[str]: 保持するスナップショットIDの集合
+        """
+        newest_first = sorted(
+            snapshots, key=lambda snapshot: snapshot.created_at, reverse=True
+        )
+        keep = {snapshot.id for snapshot in newest_first[:self.keep_last]}
+        days: Set[date] = set()
+        for snapshot in newest_first:
+            day = snapshot.created_at.date()
+            if day in days:
+                continue
+            if len(days) >= self.keep_daily:
+                break
+            days.add(day)
+            keep.add(snapshot.id)
+        return keep
+
+
+@contextmanager
+def _sqlite_connection(db: DatabaseManager) -> Iterator[sqlite3.Connection]:
+    """
+    バックアップAPIに渡す sqlite3 接続を取得
+
+    ファイルの場合は専用の接続を開き、メモリ上のデータベースの場合は
+    エンジンの接続プールの接続をそのまま使います。
+
+    Args:
+        db: データベース管理
+
+    Returns:
+        Iterator[sqlite3.Connection]: sqlite3 接続
+
+    Raises:
+        ValueError: SQLite 以外のデータベースの場合
+    """
+    if not db.is_sqlite:
+        raise ValueError("バックアップは SQLite データベースのみ対応しています")
+    if db.database_path is not None:
+        conn = sqlite3.connect(str(db.database_path), timeout=30)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+    pooled = db.engine.raw_connection()
+    try:
+        connection = pooled.driver_connection
+        if not isinstance(connection, sqlite3.Connection):
+            raise ValueError("sqlite3 の接続を取得できません")
+        yield connection
+    finally:
+        pooled.close()
+
+
+class BackupManager:
+    """
+    SQLiteのオンラインバックアップを差分・圧縮して保存するクラス
+
+    バックアップAPIで一貫したスナップショットを一時ファイルに取得し、固定長のチャンクに
+    分割します。チャンクは内容ダイジェストを名前として一度だけ圧縮・格納するため、
+    2回目以降は変更されたページを含むチャンクだけが書き込まれます。
+    WAL モードではバックアップ中もアプリケーションの書き込みは妨げられません。
+
+    保存先の構成:
+        snapshots/<スナップショットID>.json  マニフェスト
+        chunks/<先頭2文字>/<ダイジェスト>    圧縮済みチャンク
+        tmp/                                 作業用の一時ファイル
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        backup_dir: Optional[Path] = None,
+        chunk_size: int = BACKUP_CHUNK_SIZE,
+        compression: str = BACKUP_COMPRESSION,
+        pages_per_step: int = BACKUP_PAGES_PER_STEP,
+        workers: Optional[int] = None,
+        on_restore: Optional[List[Callable[[], None]]] = None
+    ):
+        """
+        バックアップ管理の初期化
+
+        Args:
+            db: バックアップ対象のデータベース管理
+            backup_dir: 保存先ディレクトリ（省略時は設定ファイルの値）
+            chunk_size: チャンクサイズ（バイト、ページサイズの倍数を推奨）
+            compression: 圧縮方式（"zlib"、"bz2" または "lzma"）
+            pages_per_step: バックアップAPIの1ステップのページ数（-1 は一括）
+            workers: 圧縮に使うスレッド数（省略時は CPU 数に応じて決定）
+            on_restore: 稼働中のデータベースへ復元した後に呼ぶ関数のリスト
+                （読み取りモデルの invalidate など。共有エンティティキャッシュは常に破棄）
+
+        Raises:
+            ValueError: 不明な圧縮方式の場合、またはチャンクサイズが0以下の場合
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"不明な圧縮方式です: {compression}")
+        if chunk_size <= 0:
+            raise ValueError("チャンクサイズは1以上である必要があります")
+
+        self.db = db
+        self.backup_dir = Path(backup_dir) if backup_dir else BACKUP_DIR
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.pages_per_step = pages_per_step
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.on_restore = list(on_restore or [])
+        self.snapshot_dir = self.backup_dir / "snapshots"
+        self.chunk_dir = self.backup_dir / "chunks"
+        self.tmp_dir = self.backup_dir / "tmp"
+        for directory in (self.snapshot_dir, self.chunk_dir, self.tmp_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        # スナップショット作成・復元と不要チャンクの削除を同時に行わないためのロック
+        self._lock = threading.Lock()
+
+    def create_snapshot(self) -> BackupSnapshot:
+        """
+        データベースのスナップショットを作成
+
+        Returns:
+            BackupSnapshot: 作成されたスナップショット
+
+        Raises:
+            ValueError: SQLite 以外のデータベースの場合
+        """
+        with self._lock:
+            started = time.perf_counter()
+            created_at = datetime.now()
+            snapshot_id = created_at.strftime(SNAPSHOT_ID_FORMAT)
+            work_path = self.tmp_dir / f"{snapshot_id}.db"
+            try:
+                page_size = self._copy_database(work_path)
+                chunks, new_chunks, stored_bytes = self._store_chunks(work_path)
+                snapshot = BackupSnapshot(
+                    id=snapshot_id,
+                    created_at=created_at,
+                    database_size=work_path.stat().st_size,
+                    page_size=page_size,
+                    chunk_size=self.chunk_size,
+                    compression=self.compression,
+                    chunks=chunks,
+                    new_chunks=new_chunks,
+                    stored_bytes=stored_bytes,
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+                # マニフェストは全チャンクの格納後に書くため、中断時に不完全なスナップショットは残らない
+                _write_atomic(
+                    self.snapshot_dir / f"{snapshot_id}.json",
+                    json.dumps(snapshot.to_dict()).encode("utf-8"),
+                )
+            finally:
+                work_path.unlink(missing_ok=True)
+
+        logger.info(
+            f"Created backup {snapshot.id}: {snapshot.database_size} bytes, "
+            f"{snapshot.new_chunks}/{len(snapshot.chunks)} new chunks, "
+            f"{snapshot.stored_bytes} bytes stored in {snapshot.elapsed_seconds:.2f}s"
+        )
+        return snapshot
+
+    def _copy_database(self, work_path: Path) -> int:
+        """
+        バックアップAPIでデータベースを一時ファイルに複製
+
+        Args:
+            work_path: 複製先のパス
+
+        Returns:
+            int: ページサイズ（バイト）
+        """
+        destination = sqlite3.connect(str(work_path))
+        try:
+            with _sqlite_connection(self.db) as source:
+                source.backup(destination, pages=self.pages_per_step)
+            return int(destination.execute("PRAGMA page_size").fetchone()[0])
+        finally:
+            destination.close()
+
+    def _store_chunks(self, work_path: Path) -> Tuple[List[str], int, int]:
+        """
+        ファイルをチャンクに分割し、未格納のチャンクを圧縮して格納
+
+        Args:
+            work_path: 分割するファイルのパス
+
+        Returns:
+            Tuple[List[str], int, int]: (チャンクのダイジェストのリスト, 新規チャンク数, 新規格納バイト数)
+        """
+        compress = COMPRESSIONS[self.compression][0]
+        digests: List[str] = []
+        scheduled: Set[str] = set()
+        pending: Deque[Future] = deque()
+        stored_bytes = 0
+
+        def store(digest: str, data: bytes) -> int:
+            payload = compress(data)
+            _write_atomic(self._chunk_path(digest), payload)
+            return len(payload)
+
+        with (
+            open(work_path, "rb") as source,
+            ThreadPoolExecutor(max_workers=self.workers) as executor,
+        ):
+            while True:
+                data = source.read(self.chunk_size)
+                if not data:
+                    break
+                digest = chunk_digest(data)
+                digests.append(digest)
+                if digest in scheduled or self._chunk_path(digest).exists():
+                    continue
+                scheduled.add(digest)
+                pending.append(executor.submit(store, digest, data))
+                # 読み込みが圧縮を追い越してメモリを使い切らないよう、未完了の件数を制限
+                while len(pending) > self.workers * 2:
+                    stored_bytes += pending.popleft().result()
+            while pending:
+                stored_bytes += pending.popleft().result()
+
+        return digests, len(scheduled), stored_bytes
+
+    def _chunk_path(self, digest: str) -> Path:
+        """
+        チャンクの格納パス
+
+        Args:
+            digest: チャンクのダイジェスト
+
+        Returns:
+            Path: 格納パス
+        """
+        return self.chunk_dir / digest[:2] / digest
+
+    def list_snapshots(self) -> List[BackupSnapshot]:
+        """
+        保存済みのスナップショットを取得
+
+        Returns:
+            List[BackupSnapshot]: 作成日時順のスナップショットのリスト
+        """
+        snapshots = [
+            BackupSnapshot.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            for path in self.snapshot_dir.glob("*.json")
+        ]
+        snapshots.sort(key=lambda snapshot: snapshot.created_at)
+        return snapshots
+
+    def find_snapshot(self, at: Optional[datetime] = None) -> Optional[BackupSnapshot]:
+        """
+        指定日時の時点で最新のスナップショットを取得
+
+        Args:
+            at: 基準日時（省略時は最新）
+
+        Returns:
+            Optional[BackupSnapshot]: 見つかったスナップショット、存在しない場合はNone
+        """
+        candidates = [
+            snapshot for snapshot in self.list_snapshots()
+            if at is None or snapshot.created_at <= at
+        ]
+        return candidates[-1] if candidates else None
+
+    def restore(
+        self,
+        at: Optional[datetime] = None,
+        target_path: Optional[Path] = None
+    ) -> BackupSnapshot:
+        """
+        スナップショットからデータベースを復元（ポイントインタイムリストア）
+
+        指定日時の時点で最新のスナップショットを一時ファイルに展開し、チャンクの
+        ダイジェストと SQLite の整合性チェックで検証してから復元します。
+        target_path を指定した場合はそのパスにファイルとして書き出し、省略した場合は
+        バックアップAPIで稼働中のデータベースに書き戻します。
+        稼働中のデータベースへ復元した場合は共有エンティティキャッシュを破棄し、
+        on_restore に登録した関数（読み取りモデルの invalidate など）を呼び出します。
+        個別に生成した EntityCache を使っている場合は on_restore に clear を登録してください。
+
+        Args:
+            at: 復元する時点（省略時は最新のスナップショット）
+            target_path: 復元先のファイルパス（省略時は稼働中のデータベース）
+
+        Returns:
+            BackupSnapshot: 復元に使ったスナップショット
+
+        Raises:
+            ValueError: 該当するスナップショットがない場合、またはバックアップが破損している場合
+        """
+        snapshot = self.find_snapshot(at)
+        if snapshot is None:
+            raise ValueError(f"{at} 以前のスナップショットがありません" if at else "スナップショットがありません")
+
+        started = time.perf_counter()
+        work_path = self.tmp_dir / f"restore-{snapshot.id}.db"
+        with self._lock:
+            try:
+                self._assemble(snapshot, work_path)
+                restored = sqlite3.connect(str(work_path))
+                try:
+                    result = restored.execute("PRAGMA quick_check").fetchone()[0]
+                    if result != "ok":
+                        raise ValueError(
+                            f"復元したデータベースの整合性チェックに失敗しました: {result}"
+                        )
+                    if target_path is None:
+                        with _sqlite_connection(self.db) as live:
+                            restored.backup(live, pages=self.pages_per_step)
+                finally:
+                    restored.close()
+                if target_path is not None:
+                    Path(target_path).parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(work_path, target_path)
+            finally:
+                work_path.unlink(missing_ok=True)
+
+        if target_path is None:
+            # リポジトリを経由せずに内容が置き換わるため、キャッシュを破棄する
+            shared_entity_cache.clear()
+            for callback in self.on_restore:
+                callback()
+
+        logger.info(
+            f"Restored backup {snapshot.id} to {target_path or self.db.db_url} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return snapshot
+
+    def _assemble(self, snapshot: BackupSnapshot, path: Path) -> None:
+        """
+        スナップショットのチャンクを展開してファイルを組み立て
+
+        Args:
+            snapshot: 組み立てるスナップショット
+            path: 書き込み先のパス
+
+        Raises:
+            ValueError: チャンクが存在しない、または内容がダイジェストと一致しない場合
+        """
+        decompress = COMPRESSIONS[snapshot.compression][1]
+
+        def load(digest: str) -> bytes:
+            try:
+                data = decompress(self._chunk_path(digest).read_bytes())
+            except (OSError, ValueError, zlib.error, lzma.LZMAError) as e:
+                raise ValueError(f"バックアップのチャンクを読み込めません: {digest}") from e
+            if chunk_digest(data) != digest:
+                raise ValueError(f"バックアップのチャンクが破損しています: {digest}")
+            return data
+
+        with (
+            open(path, "wb") as target,
+            ThreadPoolExecutor(max_workers=self.workers) as executor,
+        ):
+            pending: Deque[Future] = deque()
+            for digest in snapshot.chunks:
+                pending.append(executor.submit(load, digest))
+                while len(pending) > self.workers * 2:
+                    target.write(pending.popleft().result())
+            while pending:
+                target.write(pending.popleft().result())
+
+    def apply_retention(
+        self,
+        policy: Optional[RetentionPolicy] = None
+    ) -> Tuple[int, int]:
+        """
+        保持方針に沿って古いスナップショットと参照されなくなったチャンクを削除
+
+        Args:
+            policy: 保持方針（省略時は設定ファイルの値）
+
+        Returns:
+            Tuple[int, int]: (削除したスナップショット数, 削除したチャンク数)
+        """
+        policy = policy or RetentionPolicy()
+        with self._lock:
+            snapshots = self.list_snapshots()
+            keep = policy.select(snapshots)
+            removed = [snapshot for snapshot in snapshots if snapshot.id not in keep]
+            for snapshot in removed:
+                (self.snapshot_dir / f"{snapshot.id}.json").unlink(missing_ok=True)
+
+            referenced = {
+                digest
+                for snapshot in snapshots
+                if snapshot.id in keep
+                for digest in snapshot.chunks
+            }
+            removed_chunks = 0
+            for path in self.chunk_dir.glob("*/*"):
+                if path.name not in referenced:
+                    path.unlink(missing_ok=True)
+                    removed_chunks += 1
+
+        if removed or removed_chunks:
+            logger.info(
+                f"Removed {len(removed)} backups and "
+                f"{removed_chunks} unreferenced chunks"
+            )
+        return len(removed), removed_chunks
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    一時ファイルに書いてから置き換えることで、途中までのファイルを残さずに書き込み
+
+    Args:
+        path: 書き込み先のパス
+        data: 書き込む内容
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+class BackupScheduler:
+    """
+    バックグラウンドスレッドで定期的にバックアップと保持方針の適用を行うスケジューラ
+
+    GUI のイベントループとは別のデーモンスレッドで動作します。
+    """
+
+    def __init__(
+        self,
+        manager: BackupManager,
+        interval_seconds: float = BACKUP_INTERVAL_SECONDS,
+        policy: Optional[RetentionPolicy] = None
+    ):
+        """
+        スケジューラの初期化
+
+        Args:
+            manager: バックアップ管理
+            interval_seconds: バックアップの間隔（秒）
+            policy: 保持方針（省略時は設定ファイルの値）
+        """
+        self.manager = manager
+        self.interval_seconds = interval_seconds
+        self.policy = policy or RetentionPolicy()
+        self.last_snapshot: Optional[BackupSnapshot] = None
+        self.last_error: Optional[str] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """スケジューラが動作中かどうか"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """バックグラウンドスレッドを開始（動作中の場合は何もしない）"""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ccpm-backup", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        バックグラウンドスレッドを停止（実行中のバックアップは完了を待つ）
+
+        Args:
+            timeout: 停止を待つ最大秒数
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def trigger(self) -> None:
+        """次の間隔を待たずにバックアップを実行させる"""
+        self._wake.set()
+
+    def run_once(self) -> Optional[BackupSnapshot]:
+        """
+        バックアップと保持方針の適用を1回実行
+
+        失敗してもスケジューラは止めず、エラーを last_error に記録します。
+
+        Returns:
+            Optional[BackupSnapshot]: 作成されたスナップショット（失敗した場合はNone）
+        """
+        try:
+            snapshot = self.manager.create_snapshot()
+            self.manager.apply_retention(self.policy)
+        except Exception as e:
+            self.last_error = str(e)
+            logger.exception("Background backup failed")
+            return None
+        self.last_snapshot = snapshot
+        self.last_error = None
+        return snapshot
+
+    def _run(self) -> None:
+        """バックグラウンドスレッドの処理"""
+        while not self._stop.is_set():
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.run_once()
@@ -0,0 +1,396 @@
+"""
+バッファ変更イベントの追記と日次スナップショットの差分更新・検索
+"""
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Connection, Row, and_, func, select
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.domain.value_objects.buffer_history import (
+    EVENT_CONSUME,
+    EVENT_KINDS,
+    EVENT_RELEASE,
+    EVENT_RESIZE,
+    BufferEvent,
+    BufferState,
+)
+from ccpm.infrastructure.db.db_manager import chunked, execute_many
+from ccpm.infrastructure.db.schema import buffer_events, buffer_snapshots, projects
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# バッファの変更: (プロジェクトID, 種類, 発生日時, サイズの変更量, 消費量の変更量, 変更後の完了率（変更なしはNone）)
+BufferChange = Tuple[UUID, str, datetime, float, float, Optional[float]]
+
+# プロジェクトの現在の状態: [バッファサイズ, 消費済みバッファ, 完了率, 最後のイベントの発生日時]
+_Current = List
+
+
+def append_buffer_changes(
+    conn: Connection,
+    changes: Sequence[BufferChange],
+    clamp_time: bool = False,
+    baselines: Optional[Dict[UUID, Tuple[float, float]]] = None
+) -> int:
+    """
+    バッファの変更をイベントとして追記し、日次スナップショットに反映
+
+    変更量が0で完了率も変わらない変更は記録しません。
+    スナップショットのまだないプロジェクト（履歴の記録を始める前から存在するプロジェクトなど）は、
+    baselines の値、省略時は保存済みのプロジェクトの行の値を変更前の状態として扱います。
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+        changes: バッファの変更のリスト（プロジェクトごとに発生日時順）
+        clamp_time: 最後のイベントより前の日時の変更を、エラーにせず最後のイベントの日時で記録するかどうか
+        baselines: プロジェクトIDごとの変更前の（バッファサイズ, 消費済みバッファ）
+            （含まれないプロジェクトは新規として0から記録）
+
+    Returns:
+        int: 追記したイベント数
+
+    Raises:
+        ValueError: 不明なイベントの種類の場合、または最後のイベントより前の日時の変更の場合（clamp_time が False のとき）
+    """
+    if not changes:
+        return 0
+
+    project_ids = list({change[0] for change in changes})
+    current = _load_current(conn, project_ids)
+    if baselines is None:
+        baselines = load_project_buffers(
+            conn,
+            [project_id for project_id in project_ids if project_id not in current],
+        )
+    events: List[Dict[str, Any]] = []
+    snapshots: Dict[Tuple[UUID, date], Dict[str, Any]] = {}
+    for (
+        project_id,
+        kind,
+        occurred_at,
+        size_delta,
+        consumed_delta,
+        completion,
+    ) in changes:
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"不明なバッファイベントの種類です: {kind}")
+        if project_id not in current:
+            size, consumed = baselines.get(project_id, (0.0, 0.0))
+            current[project_id] = [size, consumed, 0.0, None]
+        state = current[project_id]
+        if state[3] is not None and occurred_at < state[3]:
+            if not clamp_time:
+                raise ValueError(
+                    f"バッファイベントは発生日時順に記録する必要があります: {occurred_at} < {state[3]}"
+                )
+            occurred_at = state[3]
+        if (
+            not size_delta
+            and not consumed_delta
+            and (completion is None or completion == state[2])
+        ):
+            continue
+
+        state[0] += size_delta
+        state[1] += consumed_delta
+        if completion is not None:
+            state[2] = completion
+        state[3] = occurred_at
+        events.append({
+            "id": None,  # INTEGER PRIMARY KEY に NULL を渡して採番させる
+            "project_id": project_id,
+            "occurred_at": occurred_at,
+            "kind": kind,
+            "size_delta": size_delta,
+            "consumed_delta": consumed_delta,
+            "buffer_size": state[0],
+            "buffer_consumed": state[1],
+            "completion": state[2],
+        })
+
+        key = (project_id, occurred_at.date())
+        previous = snapshots.get(key)
+        snapshots[key] = {
+            "project_id": project_id,
+            "day": key[1],
+            "buffer_size": state[0],
+            "buffer_consumed": state[1],
+            "completion": state[2],
+            "last_occurred_at": occurred_at,
+            "event_count": (previous["event_count"] if previous else 0) + 1,
+        }
+
+    if not events:
+        return 0
+
+    execute_many(conn, insert(buffer_events), events)
+    statement = insert(buffer_snapshots)
+    statement = statement.on_conflict_do_update(
+        index_elements=[buffer_snapshots.c.project_id, buffer_snapshots.c.day],
+        set_={
+            "buffer_size": statement.excluded.buffer_size,
+            "buffer_consumed": statement.excluded.buffer_consumed,
+            "completion": statement.excluded.completion,
+            "last_occurred_at": statement.excluded.last_occurred_at,
+            "event_count": buffer_snapshots.c.event_count
+            + statement.excluded.event_count,
+        },
+    )
+    execute_many(conn, statement, list(snapshots.values()))
+    return len(events)
+
+
+def project_buffer_changes(
+    old: Dict[UUID, Tuple[float, float]],
+    new: Dict[UUID, Tuple[float, float]],
+    occurred_at: datetime
+) -> List[BufferChange]:
+    """
+    プロジェクトの保存前後のバッファサイズ・消費量の差分からバッファの変更を作成
+
+    Args:
+        old: プロジェクトIDごとの保存前の（バッファサイズ, 消費済みバッファ）（新規は含まない）
+        new: プロジェクトIDごとの保存後の（バッファサイズ, 消費済みバッファ）
+        occurred_at: 発生日時
+
+    Returns:
+        List[BufferChange]: バッファの変更のリスト
+    """
+    changes: List[BufferChange] = []
+    for project_id, (size, consumed) in new.items():
+        old_size, old_consumed = old.get(project_id, (0.0, 0.0))
+        if size != old_size:
+            changes.append(
+                (project_id, EVENT_RESIZE, occurred_at, size - old_size, 0.0, None)
+            )
+        if consumed != old_consumed:
+            kind = EVENT_CONSUME if consumed > old_consumed else EVENT_RELEASE
+            changes.append(
+                (project_id, kind, occurred_at, 0.0, consumed - old_consumed, None)
+            )
+    return changes
+
+
+def load_project_buffers(
+    conn: Connection,
+    project_ids: Sequence[UUID]
+) -> Dict[UUID, Tuple[float, float]]:
+    """
+    保存済みのプロジェクトのバッファサイズと消費済みバッファを読み込み
+
+    Args:
+        conn: データベース接続
+        project_ids: 対象のプロジェクトIDのリスト
+
+    Returns:
+        Dict[UUID, Tuple[float, float]]: プロジェクトIDごとの（バッファサイズ, 消費済みバッファ）
+    """
+    buffers: Dict[UUID, Tuple[float, float]] = {}
+    for chunk in chunked(list(project_ids)):
+        rows = conn.execute(
+            select(projects.c.id, projects.c.buffer_size, projects.c.buffer_consumed)
+            .where(projects.c.id.in_(chunk))
+        )
+        for project_id, size, consumed in rows:
+            buffers[project_id] = (size, consumed)
+    return buffers
+
+
+def _latest_snapshot_rows(conn: Connection, project_ids: Sequence[UUID]) -> List[Row]:
+    """
+    プロジェクトごとの最新の日次スナップショットの行を読み込み
+
+    Args:
+        conn: データベース接続
+        project_ids: 対象のプロジェクトIDのリスト
+
+    Returns:
+        List[Row]: スナップショットの行のリスト
+    """
+    rows: List[Row] = []
+    for chunk in chunked(list(project_ids)):
+        latest = (
+            select(
+                buffer_snapshots.c.project_id,
+                func.max(buffer_snapshots.c.day).label("day"),
+            )
+            .where(buffer_snapshots.c.project_id.in_(chunk))
+            .group_by(buffer_snapshots.c.project_id)
+            .subquery()
+        )
+        rows.extend(conn.execute(
+            select(buffer_snapshots).join(
+                latest,
+                and_(
+                    buffer_snapshots.c.project_id == latest.c.project_id,
+                    buffer_snapshots.c.day == latest.c.day,
+                ),
+            )
+        ))
+    return rows
+
+
+def _load_current(
+    conn: Connection,
+    project_ids: Sequence[UUID]
+) -> Dict[UUID, _Current]:
+    """
+    プロジェクトごとの現在の状態を最新の日次スナップショットから読み込み
+
+    Args:
+        conn: データベース接続
+        project_ids: 対象のプロジェクトIDのリスト
+
+    Returns:
+        Dict[UUID, _Current]: プロジェクトIDごとの現在の状態
+    """
+    return {
+        row.project_id: [
+            row.buffer_size,
+            row.buffer_consumed,
+            row.completion,
+            row.last_occurred_at,
+        ]
+        for row in _latest_snapshot_rows(conn, project_ids)
+    }
+
+
+def load_latest_states(
+    conn: Connection,
+    project_ids: Sequence[UUID]
+) -> Dict[UUID, BufferState]:
+    """
+    プロジェクトごとの現在のバッファの状態を読み込み
+
+    Args:
+        conn: データベース接続
+        project_ids: 対象のプロジェクトIDのリスト
+
+    Returns:
+        Dict[UUID, BufferState]: プロジェクトIDごとの状態（イベントのないプロジェクトは含まない）
+    """
+    return {
+        row.project_id: _snapshot_state(row)
+        for row in _latest_snapshot_rows(conn, project_ids)
+    }
+
+
+def load_state_as_of(
+    conn: Connection,
+    project_id: UUID,
+    at: datetime
+) -> Optional[BufferState]:
+    """
+    指定日時の時点のバッファの状態を読み込み（その時点までの最後のイベント後の状態）
+
+    Args:
+        conn: データベース接続
+        project_id: プロジェクトID
+        at: 時点
+
+    Returns:
+        Optional[BufferState]: バッファの状態、その時点までにイベントがない場合はNone
+    """
+    row = conn.execute(
+        select(buffer_events)
+        .where(
+            buffer_events.c.project_id == project_id, buffer_events.c.occurred_at <= at
+        )
+        .order_by(buffer_events.c.occurred_at.desc(), buffer_events.c.id.desc())
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
+    return BufferState(
+        row.project_id, at, row.buffer_size, row.buffer_consumed, row.completion
+    )
+
+
+def load_events(
+    conn: Connection,
+    project_id: UUID,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> List[BufferEvent]:
+    """
+    プロジェクトのバッファ変更イベントを発生日時順に読み込み
+
+    Args:
+        conn: データベース接続
+        project_id: プロジェクトID
+        start: 開始日時（省略時は制限なし）
+        end: 終了日時（省略時は制限なし）
+
+    Returns:
+        List[BufferEvent]: バッファ変更イベントのリスト
+    """
+    query = select(buffer_events).where(buffer_events.c.project_id == project_id)
+    if start is not None:
+        query = query.where(buffer_events.c.occurred_at >= start)
+    if end is not None:
+        query = query.where(buffer_events.c.occurred_at <= end)
+    rows = conn.execute(query.order_by(buffer_events.c.occurred_at, buffer_events.c.id))
+    return [
+        BufferEvent(
+            id=row.id,
+            project_id=row.project_id,
+            kind=row.kind,
+            occurred_at=row.occurred_at,
+            size_delta=row.size_delta,
+            consumed_delta=row.consumed_delta,
+            buffer_size=row.buffer_size,
+            buffer_consumed=row.buffer_consumed,
+            completion=row.completion,
+        )
+        for row in rows
+    ]
+
+
+def load_daily_states(
+    conn: Connection,
+    project_id: UUID,
+    start: Optional[date] = None,
+    end: Optional[date] = None
+) -> List[BufferState]:
+    """
+    プロジェクトの日次スナップショットを日付順に読み込み（イベントのあった日のみ）
+
+    Args:
+        conn: データベース接続
+        project_id: プロジェクトID
+        start: 開始日（省略時は制限なし）
+        end: 終了日（省略時は制限なし）
+
+    Returns:
+        List[BufferState]: 日ごとの最後の状態のリスト
+    """
+    query = select(buffer_snapshots).where(buffer_snapshots.c.project_id == project_id)
+    if start is not None:
+        query = query.where(buffer_snapshots.c.day >= start)
+    if end is not None:
+        query = query.where(buffer_snapshots.c.day <= end)
+    rows = conn.execute(query.order_by(buffer_snapshots.c.day))
+    return [_snapshot_state(row) for row in rows]
+
+
+def _snapshot_state(row: Row) -> BufferState:
+    """
+    日次スナップショットの行からバッファの状態を作成
+
+    Args:
+        row: スナップショットの行
+
+    Returns:
+        BufferState: その日の最後のイベント後の状態
+    """
+    return BufferState(
+        row.project_id,
+        row.last_occurred_at,
+        row.buffer_size,
+        row.buffer_consumed,
+        row.completion,
+    )
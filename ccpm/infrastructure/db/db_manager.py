@@ -0,0 +1,292 @@
+"""
+データベース接続管理
+"""
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Connection,
+    Engine,
+    Insert,
+    Row,
+    Select,
+    Table,
+    create_engine,
+    event,
+    inspect,
+    literal,
+    tuple_,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+from ccpm.config import DB_FETCH_SIZE, DB_POOL_SIZE, DB_URL
+from ccpm.infrastructure.db.schema import estimation_stats, metadata
+from ccpm.infrastructure.db.task_search import create_search_index
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# IN句に渡すパラメータ数の上限（SQLiteの変数上限より十分小さい値）
+IN_CLAUSE_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
+
+def chunked(
+    items: Sequence[T],
+    size: int = IN_CLAUSE_CHUNK_SIZE
+) -> Iterator[Sequence[T]]:
+    """
+    シーケンスを一定サイズごとに分割
+
+    Args:
+        items: 分割するシーケンス
+        size: 1チャンクの要素数
+
+    Returns:
+        Iterator[Sequence[T]]: チャンクのイテレータ
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def execute_many(
+    conn: Connection,
+    statement: Insert,
+    rows: List[Dict[str, Any]]
+) -> None:
+    """
+    INSERT/UPSERT 文を一度だけコンパイルし、DBAPI の executemany で一括実行
+
+    行ごとのパラメータ構築を省くため、型変換は列のバインド処理を直接適用します。
+
+    Args:
+        conn: データベース接続
+        statement: 実行する INSERT 文（対象テーブルの列をキーとする行で実行）
+        rows: テーブル行のリスト
+    """
+    if not rows:
+        return
+    compiled = statement.compile(dialect=conn.dialect)
+    names = compiled.positiontup or []
+    columns = statement.table.columns
+    processors = [
+        columns[name].type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+        for name in names
+    ]
+    plan = list(zip(names, processors))
+    parameters = [
+        tuple(process(row[name]) if process else row[name] for name, process in plan)
+        for row in rows
+    ]
+    conn.exec_driver_sql(str(compiled), parameters)
+
+
+def select_columns(table: Table, columns: Sequence[str]) -> List[Column[Any]]:
+    """
+    項目名のリストをテーブルの列に変換
+
+    Args:
+        table: 対象テーブル
+        columns: 取得する項目名のリスト
+
+    Returns:
+        List[Column[Any]]: テーブルの列のリスト
+
+    Raises:
+        ValueError: 項目名が指定されていない場合、または存在しない項目名が指定された場合
+    """
+    if not columns:
+        raise ValueError("取得する項目を1つ以上指定してください")
+    unknown = [column for column in columns if column not in table.c]
+    if unknown:
+        raise ValueError(f"不明な項目です: {', '.join(unknown)}")
+    return [table.c[column] for column in columns]
+
+
+def iter_keyset(
+    engine: Engine,
+    statement: Select,
+    keys: Sequence[ColumnElement[Any]],
+    load: Callable[[Connection, Sequence[Row]], List[T]],
+    fetch_size: Optional[int] = None
+) -> Iterator[T]:
+    """
+    キーセットページネーションで検索結果を一定件数ずつ取得するイテレータ
+
+    OFFSET を使わず「前ページ最後の行のキーより後」を条件に次のページを読むため、
+    ページが進んでも1ページあたりのコストは一定です。接続はページごとに開閉し、
+    呼び出し側が要素を処理している間は保持しません。
+
+    Args:
+        engine: データベースエンジン
+        statement: 検索条件を含む SELECT 文（ORDER BY と LIMIT は付けない）
+        keys: 並び順を一意に決めるキー列（最後の列は一意である必要があります）
+        load: 接続とページの行から要素のリストを作る関数
+        fetch_size: 1ページの行数（省略時は設定ファイルの値）
+
+    Returns:
+        Iterator[T]: 要素のイテレータ
+
+    Raises:
+        ValueError: fetch_size が0以下の場合
+    """
+    fetch_size = fetch_size or DB_FETCH_SIZE
+    if fetch_size <= 0:
+        raise ValueError("取得件数は1以上である必要があります")
+
+    labels = [f"_keyset_{position}" for position in range(len(keys))]
+    page = (
+        statement.add_columns(*(key.label(label) for key, label in zip(keys, labels)))
+        .order_by(*keys)
+        .limit(fetch_size)
+    )
+
+    def generate() -> Iterator[T]:
+        last: Optional[Sequence[Any]] = None
+        while True:
+            current = page
+            if last is not None:
+                current = page.where(
+                    tuple_(*keys)
+                    > tuple_(
+                        *(literal(value, key.type) for key, value in zip(keys, last))
+                    )
+                )
+            with engine.connect() as conn:
+                rows = conn.execute(current).all()
+                items = load(conn, rows)
+            yield from items
+            if len(rows) < fetch_size:
+                return
+            last = [rows[-1]._mapping[label] for label in labels]
+
+    return generate()
+
+
+class DatabaseManager:
+    """
+    SQLAlchemyエンジンの作成とスキーマ初期化を担当するクラス
+
+    SQLiteファイルの場合はWALモードを有効にし、読み込みと書き込みが互いをブロックしないようにします。
+    また pysqlite の暗黙のトランザクション開始（最初の INSERT/UPDATE/DELETE で BEGIN）を無効にし、
+    トランザクションの開始時に BEGIN IMMEDIATE を発行します。保存前の行を読んで差分を反映する
+    処理の読み込みも書き込みと同じトランザクションに含まれるため、同時に保存しても差分が
+    古い値に対して計算されることはありません。
+    """
+
+    def __init__(
+        self,
+        db_url: Optional[str] = None,
+        echo: bool = False,
+        pool_size: int = DB_POOL_SIZE
+    ):
+        """
+        データベース管理の初期化
+
+        Args:
+            db_url: データベースURL（省略時は設定ファイルの値）
+            echo: 実行SQLをログ出力するかどうか
+            pool_size: 接続プールの接続数（メモリ上の SQLite では常に1）
+        """
+        self.db_url = db_url or DB_URL
+        url = make_url(self.db_url)
+        self.is_sqlite = url.get_backend_name() == "sqlite"
+
+        # SQLiteファイルのパス（メモリ上のデータベースや SQLite 以外の場合は None）
+        self.database_path: Optional[Path] = None
+        if self.is_sqlite and url.database and url.database != ":memory:":
+            self.database_path = Path(url.database)
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.is_sqlite and self.database_path is None:
+            # メモリ上のデータベースは接続ごとに別物になるため、すべてのスレッドで1つの接続を共有
+            self.pool_size = 1
+            self.engine: Engine = create_engine(
+                self.db_url,
+                echo=echo,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+        else:
+            self.pool_size = pool_size
+            self.engine = create_engine(self.db_url, echo=echo, pool_size=pool_size)
+        if self.is_sqlite:
+            event.listen(self.engine, "connect", self._configure_sqlite_connection)
+        if self.database_path is not None:
+            # メモリ上のデータベースは1つの接続を共有するため、明示的な BEGIN は発行しない
+            event.listen(self.engine, "connect", self._disable_implicit_transactions)
+            event.listen(self.engine, "begin", self._begin_immediate)
+
+    @staticmethod
+    def _configure_sqlite_connection(
+        dbapi_connection: Any,
+        connection_record: Any
+    ) -> None:
+        """
+        SQLite接続ごとのPRAGMA設定
+
+        Args:
+            dbapi_connection: DBAPI接続
+            connection_record: 接続プールのレコード
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    @staticmethod
+    def _disable_implicit_transactions(
+        dbapi_connection: Any,
+        connection_record: Any
+    ) -> None:
+        """
+        pysqlite による暗黙の BEGIN を無効化（トランザクションは begin イベントで開始）
+
+        Args:
+            dbapi_connection: DBAPI接続
+            connection_record: 接続プールのレコード
+        """
+        dbapi_connection.isolation_level = None
+
+    @staticmethod
+    def _begin_immediate(conn: Connection) -> None:
+        """
+        トランザクションの開始時に書き込みロックを取る
+
+        Args:
+            conn: トランザクションを開始する接続
+        """
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    def init_schema(self) -> None:
+        """
+        テーブルとインデックスを作成（既存のものはそのまま。SQLite ではタスクの全文検索索引も作成）
+
+        予実比率の統計テーブルを新しく作成した場合は、既存の完了タスクから統計を作り直します。
+        """
+        # 循環インポートを避けるため、統計テーブルの更新処理はここで読み込む
+        from ccpm.infrastructure.db.estimation_stats import rebuild_estimation_stats
+
+        backfill_stats = not inspect(self.engine).has_table(estimation_stats.name)
+        metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            # create_all は既存のテーブルに後から追加したインデックスを作成しないため、個別に作成する
+            for table in metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+            if self.is_sqlite:
+                create_search_index(conn)
+            if backfill_stats:
+                rebuild_estimation_stats(conn)
+        logger.info(f"Database schema initialized: {self.db_url}")
+
+    def dispose(self) -> None:
+        """接続プールを破棄"""
+        self.engine.dispose()
@@ -0,0 +1,333 @@
+"""
+予実比率の統計テーブルの差分更新と検索
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Connection, Row, delete, select, tuple_
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.domain.entities.task_table import STATUS_COMPLETED, STATUS_NAMES
+from ccpm.domain.value_objects.estimation_accuracy import (
+    EstimationStats,
+    QuantileSketch,
+    RunningStats,
+    StatsKey,
+    stats_keys,
+)
+from ccpm.infrastructure.db.db_manager import chunked, execute_many
+from ccpm.infrastructure.db.schema import estimation_stats, tasks
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 完了ステータスの名前（tasks.status に保存される値）
+COMPLETED = STATUS_NAMES[STATUS_COMPLETED]
+
+# 完了タスク1件分の標本: (担当者, カテゴリ, タグ, 予実比率)
+Sample = Tuple[str, str, Tuple[str, ...], float]
+
+
+def task_sample(
+    status: str,
+    estimated_hours: float,
+    actual_hours: float,
+    resource: str,
+    category: str,
+    tags: Sequence[str]
+) -> Optional[Sample]:
+    """
+    タスクの値から統計の標本を作成
+
+    見積りのない（0以下の）タスクは予実比率を定義できないため対象外です。
+
+    Args:
+        status: ステータス
+        estimated_hours: 見積り工数
+        actual_hours: 実績工数
+        resource: 担当者
+        category: カテゴリ
+        tags: タグリスト
+
+    Returns:
+        Optional[Sample]: 標本、完了していないか見積りがない場合はNone
+    """
+    if status != COMPLETED or estimated_hours <= 0:
+        return None
+    return (resource, category, tuple(tags), actual_hours / estimated_hours)
+
+
+def load_samples(conn: Connection, task_ids: Sequence[UUID]) -> Dict[UUID, Sample]:
+    """
+    保存済みのタスクの標本を読み込み
+
+    Args:
+        conn: データベース接続
+        task_ids: 対象のタスクIDのリスト
+
+    Returns:
+        Dict[UUID, Sample]: タスクIDごとの標本（標本にならないタスクは含まない）
+    """
+    samples: Dict[UUID, Sample] = {}
+    for chunk in chunked(list(task_ids)):
+        rows = conn.execute(
+            select(
+                tasks.c.id,
+                tasks.c.status,
+                tasks.c.estimated_hours,
+                tasks.c.actual_hours,
+                tasks.c.resource,
+                tasks.c.category,
+                tasks.c.tags,
+            )
+            .where(tasks.c.id.in_(chunk), tasks.c.status == COMPLETED)
+        )
+        for task_id, *values in rows:
+            sample = task_sample(*values)
+            if sample is not None:
+                samples[task_id] = sample
+    return samples
+
+
+def apply_sample_changes(
+    conn: Connection,
+    removed: Iterable[Sample],
+    added: Iterable[Sample]
+) -> bool:
+    """
+    標本の取り消しと追加を統計テーブルに反映
+
+    影響する単位の行だけを読み込み、逐次統計とスケッチを更新して書き戻します。
+    件数が0になった行は削除します。
+    取り消す標本が統計にない場合（統計テーブルを作る前に完了したタスクの行がない、または
+    スケッチに値が含まれないなど）は、その取り消しを飛ばして警告を記録し、False を返します。呼び出し側はトランザクションの確定後に
+    rebuild_estimation_stats で作り直してください。
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+        removed: 取り消す標本
+        added: 追加する標本
+
+    Returns:
+        bool: 統計テーブルと標本が整合している場合はTrue（作り直しが必要な場合はFalse）
+    """
+    changes: Dict[StatsKey, List[Tuple[int, float]]] = {}
+    for sign, samples in ((-1, removed), (1, added)):
+        for resource, category, tags, ratio in samples:
+            for key in stats_keys(resource, category, tags):
+                changes.setdefault(key, []).append((sign, ratio))
+    if not changes:
+        return True
+
+    current = load_estimation_stats(conn, list(changes))
+    upserts = []
+    emptied = []
+    consistent = True
+    for key, entries in changes.items():
+        stats = current.get(key) or EstimationStats(*key)
+        # 取り消しを先に適用する（同じ標本の付け替えで件数が一時的に負にならないように）
+        for sign, ratio in sorted(entries):
+            if sign > 0:
+                stats.add(ratio)
+            elif stats.can_remove(ratio):
+                stats.remove(ratio)
+            else:
+                if consistent:
+                    logger.warning(
+                        f"Estimation stats {key} has no sample {ratio} to remove; "
+                        "scheduling a rebuild"
+                    )
+                consistent = False
+        if stats.count == 0:
+            emptied.append(key)
+        else:
+            upserts.append(_to_row(stats))
+
+    for chunk in chunked(emptied):
+        conn.execute(
+            delete(estimation_stats).where(
+                tuple_(
+                    estimation_stats.c.scope,
+                    estimation_stats.c.resource,
+                    estimation_stats.c.key,
+                ).in_(chunk)
+            )
+        )
+    if upserts:
+        statement = insert(estimation_stats)
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                estimation_stats.c.scope,
+                estimation_stats.c.resource,
+                estimation_stats.c.key,
+            ],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in estimation_stats.columns
+                if not column.primary_key
+            },
+        )
+        execute_many(conn, statement, upserts)
+    return consistent
+
+
+def move_task_samples(
+    conn: Connection,
+    old: Dict[UUID, Sample],
+    new: Dict[UUID, Sample]
+) -> bool:
+    """
+    保存・削除前後のタスクの標本の差分を統計テーブルに反映
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+        old: タスクIDごとの変更前の標本
+        new: タスクIDごとの変更後の標本
+
+    Returns:
+        bool: 統計テーブルと標本が整合している場合はTrue（作り直しが必要な場合はFalse）
+    """
+    removed = [sample for task_id, sample in old.items() if new.get(task_id) != sample]
+    added = [sample for task_id, sample in new.items() if old.get(task_id) != sample]
+    return apply_sample_changes(conn, removed, added)
+
+
+def rebuild_estimation_stats(conn: Connection) -> None:
+    """
+    完了タスクから統計テーブルを作り直す
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+    """
+    conn.execute(delete(estimation_stats))
+    rows = conn.execute(
+        select(
+            tasks.c.status,
+            tasks.c.estimated_hours,
+            tasks.c.actual_hours,
+            tasks.c.resource,
+            tasks.c.category,
+            tasks.c.tags,
+        )
+        .where(tasks.c.status == COMPLETED)
+    )
+    samples = [
+        sample for sample in (task_sample(*row) for row in rows) if sample is not None
+    ]
+    apply_sample_changes(conn, [], samples)
+    logger.info(f"Rebuilt estimation stats from {len(samples)} completed tasks")
+
+
+def load_estimation_stats(
+    conn: Connection,
+    keys: Sequence[StatsKey]
+) -> Dict[StatsKey, EstimationStats]:
+    """
+    指定した単位の統計を読み込み
+
+    Args:
+        conn: データベース接続
+        keys: 統計のキーのリスト
+
+    Returns:
+        Dict[StatsKey, EstimationStats]: キーごとの統計（標本のない単位は含まない）
+    """
+    loaded: Dict[StatsKey, EstimationStats] = {}
+    for chunk in chunked(list(keys)):
+        rows = conn.execute(
+            select(estimation_stats).where(
+                tuple_(
+                    estimation_stats.c.scope,
+                    estimation_stats.c.resource,
+                    estimation_stats.c.key,
+                ).in_(chunk)
+            )
+        )
+        for row in rows:
+            stats = _to_stats(row)
+            loaded[stats.stats_key] = stats
+    return loaded
+
+
+def query_estimation_stats(
+    conn: Connection,
+    scope: Optional[str] = None,
+    resource: Optional[str] = None,
+    min_count: int = 0
+) -> List[EstimationStats]:
+    """
+    条件に一致する統計を件数の多い順に読み込み
+
+    Args:
+        conn: データベース接続
+        scope: 統計の単位（省略時はすべて）
+        resource: 担当者（省略時はすべて）
+        min_count: 最小件数
+
+    Returns:
+        List[EstimationStats]: 統計のリスト
+    """
+    query = select(estimation_stats).where(estimation_stats.c.count >= min_count)
+    if scope is not None:
+        query = query.where(estimation_stats.c.scope == scope)
+    if resource is not None:
+        query = query.where(estimation_stats.c.resource == resource)
+    rows = conn.execute(
+        query.order_by(
+            estimation_stats.c.count.desc(),
+            estimation_stats.c.scope,
+            estimation_stats.c.key,
+        )
+    )
+    return [_to_stats(row) for row in rows]
+
+
+def _to_row(stats: EstimationStats) -> Dict[str, object]:
+    """
+    統計をテーブル行に変換
+
+    Args:
+        stats: 統計
+
+    Returns:
+        Dict[str, object]: テーブル行
+    """
+    return {
+        "scope": stats.scope,
+        "resource": stats.resource,
+        "key": stats.key,
+        "count": stats.stats.count,
+        "mean": stats.stats.mean,
+        "m2": stats.stats.m2,
+        "minimum": stats.stats.minimum,
+        "maximum": stats.stats.maximum,
+        "sketch": stats.sketch.to_dict(),
+    }
+
+
+def _to_stats(row: Row) -> EstimationStats:
+    """
+    テーブル行を統計に変換
+
+    Args:
+        row: テーブル行
+
+    Returns:
+        EstimationStats: 統計
+    """
+    # count は Row（タプル）のメソッド名と重なるため、列はマッピングから取得する
+    values = row._mapping
+    return EstimationStats(
+        scope=values["scope"],
+        resource=values["resource"],
+        key=values["key"],
+        stats=RunningStats(
+            values["count"],
+            values["mean"],
+            values["m2"],
+            values["minimum"],
+            values["maximum"],
+        ),
+        sketch=QuantileSketch.from_dict(values["sketch"]),
+    )
@@ -0,0 +1,57 @@
+"""
+プロジェクトの変更リビジョンの更新と読み込み
+"""
+from typing import Dict, Iterable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Connection, literal_column, select
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.infrastructure.db.db_manager import chunked, execute_many
+from ccpm.infrastructure.db.schema import project_revisions
+
+
+def bump_project_revisions(conn: Connection, project_ids: Iterable[UUID]) -> None:
+    """
+    プロジェクトの変更リビジョンを1つ進める
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+        project_ids: 変更されたプロジェクトIDのリスト
+    """
+    rows = [
+        {"project_id": project_id, "revision": 1} for project_id in set(project_ids)
+    ]
+    if not rows:
+        return
+    statement = insert(project_revisions)
+    statement = statement.on_conflict_do_update(
+        index_elements=[project_revisions.c.project_id],
+        set_={"revision": project_revisions.c.revision + literal_column("1")},
+    )
+    execute_many(conn, statement, rows)
+
+
+def load_project_revisions(
+    conn: Connection,
+    project_ids: Optional[Sequence[UUID]] = None
+) -> Dict[UUID, int]:
+    """
+    プロジェクトの変更リビジョンを読み込み
+
+    Args:
+        conn: データベース接続
+        project_ids: 対象のプロジェクトIDのリスト（省略時はすべて）
+
+    Returns:
+        Dict[UUID, int]: プロジェクトIDごとのリビジョン
+    """
+    query = select(project_revisions.c.project_id, project_revisions.c.revision)
+    if project_ids is None:
+        return {project_id: revision for project_id, revision in conn.execute(query)}
+
+    revisions: Dict[UUID, int] = {}
+    for chunk in chunked(list(project_ids)):
+        rows = conn.execute(query.where(project_revisions.c.project_id.in_(chunk)))
+        revisions.update({project_id: revision for project_id, revision in rows})
+    return revisions
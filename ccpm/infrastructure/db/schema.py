@@ -0,0 +1,200 @@
+"""
+データベーススキーマ定義
+"""
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    Uuid,
+    text,
+)
+
+metadata = MetaData()
+
+projects = Table(
+    "projects",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("description", Text, nullable=False, default=""),
+    Column("start_date", DateTime, nullable=False),
+    Column("planned_end_date", DateTime),
+    Column("actual_end_date", DateTime),
+    Column("status", String(16), nullable=False),
+    Column("buffer_size", Float, nullable=False, default=0.0),
+    Column("buffer_consumed", Float, nullable=False, default=0.0),
+    Column("critical_chain", JSON, nullable=False, default=list),
+    Column("feeding_buffers", JSON, nullable=False, default=list),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_projects_name", "name"),
+    Index("ix_projects_status", "status"),
+)
+
+tasks = Table(
+    "tasks",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column(
+        "project_id",
+        Uuid,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("name", String(255), nullable=False),
+    Column("description", Text, nullable=False, default=""),
+    Column("status", String(16), nullable=False),
+    Column("priority", Integer, nullable=False, default=3),
+    Column("estimated_hours", Float, nullable=False, default=0.0),
+    Column("actual_hours", Float, nullable=False, default=0.0),
+    Column("start_date", DateTime),
+    Column("end_date", DateTime),
+    Column("category", String(255), nullable=False, default=""),
+    Column("tags", JSON, nullable=False, default=list),
+    Column("resource", String(255), nullable=False, default=""),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_tasks_project_id_status", "project_id", "status"),
+    Index("ix_tasks_status", "status"),
+    Index("ix_tasks_name", "name"),
+    Index("ix_tasks_priority", "priority"),
+    Index("ix_tasks_category", "category"),
+    Index("ix_tasks_start_date", "start_date"),
+    Index("ix_tasks_end_date", "end_date"),
+)
+
+# タスクのタグ（Task.tags の正規化。タグによる絞り込みに使用）
+task_tags = Table(
+    "task_tags",
+    metadata,
+    Column(
+        "task_id", Uuid, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    ),
+    Column("tag", String(255), primary_key=True),
+    Index("ix_task_tags_tag", "tag"),
+)
+
+# タスクの依存関係（position は Task.dependencies 内の並び順）
+task_dependencies = Table(
+    "task_dependencies",
+    metadata,
+    Column(
+        "task_id", Uuid, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    ),
+    Column("depends_on_id", Uuid, primary_key=True),
+    Column("position", Integer, nullable=False),
+    Index("ix_task_dependencies_depends_on_id", "depends_on_id"),
+)
+
+time_records = Table(
+    "time_records",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("task_id", Uuid, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False),
+    Column("start_time", DateTime, nullable=False),
+    Column("end_time", DateTime),
+    # 開始時刻の日付（集計区間の単位）
+    Column("bucket_day", Date, nullable=False),
+    Column("duration", Float, nullable=False, default=0.0),
+    Column("description", Text, nullable=False, default=""),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_time_records_task_id", "task_id"),
+    Index("ix_time_records_start_time", "start_time"),
+    Index("ix_time_records_bucket_day", "bucket_day"),
+    # 記録中（終了していない）の行だけの部分インデックス（記録中のタイマーを開始時刻順に読み込む）
+    Index(
+        "ix_time_records_active_start_time",
+        "start_time",
+        sqlite_where=text("end_time IS NULL"),
+    ),
+)
+
+# 日次・週次の作業時間集計（時間記録の保存・削除時に差分で更新）
+# scope_key はタスク・プロジェクトのIDの16進文字列、またはカテゴリ名
+time_rollups = Table(
+    "time_rollups",
+    metadata,
+    Column("granularity", String(8), primary_key=True),
+    Column("scope", String(16), primary_key=True),
+    Column("scope_key", String(255), primary_key=True),
+    Column("bucket", Date, primary_key=True),
+    Column("hours", Float, nullable=False, default=0.0),
+    Column("record_count", Integer, nullable=False, default=0),
+    Index("ix_time_rollups_granularity_scope_bucket", "granularity", "scope", "bucket"),
+)
+
+# プロジェクトごとの変更リビジョン（プロジェクトまたは所属タスクの保存・削除時に加算）
+project_revisions = Table(
+    "project_revisions",
+    metadata,
+    Column(
+        "project_id",
+        Uuid,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("revision", Integer, nullable=False, default=0),
+)
+
+# プロジェクトバッファの変更イベント（追記のみ。変更量と変更後の状態を持つ）
+buffer_events = Table(
+    "buffer_events",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column(
+        "project_id",
+        Uuid,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("occurred_at", DateTime, nullable=False),
+    Column("kind", String(16), nullable=False),
+    Column("size_delta", Float, nullable=False, default=0.0),
+    Column("consumed_delta", Float, nullable=False, default=0.0),
+    Column("buffer_size", Float, nullable=False),
+    Column("buffer_consumed", Float, nullable=False),
+    Column("completion", Float, nullable=False),
+    Index("ix_buffer_events_project_id_occurred_at", "project_id", "occurred_at"),
+)
+
+# プロジェクトバッファの日次スナップショット（その日の最後のイベント後の状態。イベント追記時に更新）
+buffer_snapshots = Table(
+    "buffer_snapshots",
+    metadata,
+    Column(
+        "project_id",
+        Uuid,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("day", Date, primary_key=True),
+    Column("buffer_size", Float, nullable=False),
+    Column("buffer_consumed", Float, nullable=False),
+    Column("completion", Float, nullable=False),
+    Column("last_occurred_at", DateTime, nullable=False),
+    Column("event_count", Integer, nullable=False, default=0),
+)
+
+# 完了タスクの予実比率の統計（単位ごとの逐次統計と分位点スケッチ。タスクの保存・削除時に更新）
+estimation_stats = Table(
+    "estimation_stats",
+    metadata,
+    Column("scope", String(32), primary_key=True),
+    Column("resource", String(255), primary_key=True),
+    Column("key", String(255), primary_key=True),
+    Column("count", Integer, nullable=False, default=0),
+    Column("mean", Float, nullable=False, default=0.0),
+    Column("m2", Float, nullable=False, default=0.0),
+    Column("minimum", Float),
+    Column("maximum", Float),
+    Column("sketch", JSON, nullable=False),
+)
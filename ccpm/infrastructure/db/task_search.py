@@ -0,0 +1,211 @@
+"""
+タスクの全文検索インデックス（SQLite FTS5）と検索条件の組み立て
+"""
+import logging
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    FromClause,
+    and_,
+    column,
+    delete,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    true,
+)
+
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria
+from ccpm.infrastructure.db.schema import task_tags, tasks
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 全文検索の仮想テーブル名（tasks を外部コンテンツとし、tasks.rowid で対応付ける）
+TASKS_FTS = "tasks_fts"
+
+# trigram トークナイザは3文字単位で索引するため、これより短い語は索引を使わずに照合する
+MIN_INDEXED_TERM_LENGTH = 3
+
+# 関連度（bm25）の列ごとの重み（タスク名, 説明）
+RANK_WEIGHTS = (2.0, 1.0)
+
+tasks_fts = table(TASKS_FTS, column("rowid"), column(TASKS_FTS))
+
+# 仮想テーブルとトリガーは metadata.create_all で作成できないため、DDL を直接実行する。
+# トリガーで同期するため、UPSERT による更新やプロジェクト削除の連鎖削除も索引に反映される
+TASK_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TASKS_FTS} USING fts5("
+    f"name, description, content='tasks', content_rowid='rowid', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {TASKS_FTS}_insert AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS} (rowid, name, description) "
+    f"VALUES (new.rowid, new.name, new.description); "
+    f"END",
+    f"CREATE TRIGGER IF NOT EXISTS {TASKS_FTS}_delete AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS} ({TASKS_FTS}, rowid, name, description) "
+    f"VALUES ('delete', old.rowid, old.name, old.description); "
+    f"END",
+    f"CREATE TRIGGER IF NOT EXISTS {TASKS_FTS}_update "
+    f"AFTER UPDATE OF name, description ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS} ({TASKS_FTS}, rowid, name, description) "
+    f"VALUES ('delete', old.rowid, old.name, old.description); "
+    f"INSERT INTO {TASKS_FTS} (rowid, name, description) "
+    f"VALUES (new.rowid, new.name, new.description); "
+    f"END",
+)
+
+
+def create_search_index(conn: Connection) -> bool:
+    """
+    全文検索の仮想テーブルと同期用のトリガーを作成（既存のものはそのまま）
+
+    仮想テーブルを新たに作成した場合は、既存のタスクから索引とタグテーブルを作り直します。
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+
+    Returns:
+        bool: 仮想テーブルを新たに作成した場合はTrue
+    """
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (TASKS_FTS,)
+    ).first()
+    for statement in TASK_SEARCH_DDL:
+        conn.exec_driver_sql(statement)
+    if exists:
+        return False
+    rebuild_search_index(conn)
+    return True
+
+
+def rebuild_search_index(conn: Connection) -> None:
+    """
+    tasks テーブルから全文検索の索引とタグテーブルを作り直す
+
+    索引は tasks.rowid でタスクと対応付けるため、VACUUM などで rowid が変わった後にも実行してください。
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+    """
+    conn.exec_driver_sql(f"INSERT INTO {TASKS_FTS} ({TASKS_FTS}) VALUES ('rebuild')")
+    conn.execute(delete(task_tags))
+    conn.exec_driver_sql(
+        "INSERT OR IGNORE INTO task_tags (task_id, tag) "
+        "SELECT tasks.id, json_each.value FROM tasks, json_each(tasks.tags) "
+        "WHERE json_each.type = 'text'"
+    )
+    logger.info("Rebuilt task search index")
+
+
+def match_expression(terms: List[str]) -> Optional[str]:
+    """
+    索引で照合できる検索語から FTS5 の MATCH 式を作成
+
+    各語は演算子として解釈されないようフレーズとして引用し、すべてを含む（AND）条件にします。
+
+    Args:
+        terms: 検索語のリスト
+
+    Returns:
+        Optional[str]: MATCH 式、索引で照合できる語がない場合はNone
+    """
+    phrases = [
+        '"' + term.replace('"', '""') + '"'
+        for term in terms
+        if len(term) >= MIN_INDEXED_TERM_LENGTH
+    ]
+    return " AND ".join(phrases) or None
+
+
+def filter_condition(criteria: TaskSearchCriteria) -> ColumnElement[bool]:
+    """
+    検索条件のうち tasks テーブルの列で判定する部分の条件を作成
+
+    索引で照合できない短い検索語は、タスク名・説明の部分一致（LIKE）で判定します。
+
+    Args:
+        criteria: 検索条件
+
+    Returns:
+        ColumnElement[bool]: tasks テーブルに対する条件
+    """
+    conditions: List[ColumnElement[bool]] = []
+    if criteria.project_id is not None:
+        conditions.append(tasks.c.project_id == criteria.project_id)
+    if criteria.statuses:
+        conditions.append(tasks.c.status.in_(criteria.statuses))
+    if criteria.priorities:
+        conditions.append(tasks.c.priority.in_(criteria.priorities))
+    if criteria.categories:
+        conditions.append(tasks.c.category.in_(criteria.categories))
+    for date_column, lower, upper in (
+        (tasks.c.start_date, criteria.start_from, criteria.start_to),
+        (tasks.c.end_date, criteria.end_from, criteria.end_to),
+    ):
+        if lower is not None:
+            conditions.append(date_column >= lower)
+        if upper is not None:
+            conditions.append(date_column <= upper)
+    # 他の条件で行が絞り込まれる場合は、その行ごとに主キーで存在を確認する方が
+    # タグの付いたタスクをすべて列挙するより安い。タグだけで絞り込む場合は最初のタグから列挙する
+    narrowed = bool(conditions) or match_expression(criteria.terms) is not None
+    for position, tag in enumerate(criteria.tags):
+        if position == 0 and not narrowed:
+            conditions.append(
+                tasks.c.id.in_(
+                    select(task_tags.c.task_id).where(task_tags.c.tag == tag)
+                )
+            )
+        else:
+            conditions.append(
+                exists().where(
+                    task_tags.c.task_id == tasks.c.id, task_tags.c.tag == tag
+                )
+            )
+    for term in criteria.terms:
+        if len(term) < MIN_INDEXED_TERM_LENGTH:
+            conditions.append(
+                or_(
+                    tasks.c.name.contains(term, autoescape=True),
+                    tasks.c.description.contains(term, autoescape=True),
+                )
+            )
+    return and_(true(), *conditions)
+
+
+def search_source(
+    criteria: TaskSearchCriteria,
+    ranked: bool = True
+) -> Tuple[FromClause, ColumnElement[bool], Optional[ColumnElement[float]]]:
+    """
+    検索クエリの FROM 句・WHERE 条件・関連度の式を作成
+
+    Args:
+        criteria: 検索条件
+        ranked: 関連度を計算するかどうか（件数だけを数える場合は計算を省く）
+
+    Returns:
+        Tuple[FromClause, ColumnElement[bool], Optional[ColumnElement[float]]]:
+            FROM 句、条件、関連度（bm25。小さいほど関連が強い。全文検索しないか ranked が False の場合はNone）
+    """
+    condition = filter_condition(criteria)
+    match = match_expression(criteria.terms)
+    if match is None:
+        return tasks, condition, None
+    # 他の条件の索引からタスクを走査すると行ごとに MATCH を評価するため、
+    # 一致する行を先に求めてから tasks と結合する
+    matched = select(tasks_fts.c.rowid).where(tasks_fts.c[TASKS_FTS].op("MATCH")(match))
+    if ranked:
+        matched = matched.add_columns(
+            func.bm25(literal_column(TASKS_FTS), *RANK_WEIGHTS).label("rank")
+        )
+    matched_rows = matched.cte("matched").prefix_with("MATERIALIZED")
+    source = matched_rows.join(
+        tasks, literal_column("tasks.rowid") == matched_rows.c.rowid
+    )
+    return source, condition, matched_rows.c.rank if ranked else None
@@ -0,0 +1,362 @@
+"""
+作業時間集計テーブルの差分更新と検索
+"""
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import Connection, and_, bindparam, delete, select
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.domain.value_objects.time_rollup import (
+    GRANULARITIES,
+    SCOPE_CATEGORY,
+    SCOPE_PROJECT,
+    SCOPE_TASK,
+    SCOPES,
+    TimeRollup,
+    bucket_start,
+)
+from ccpm.infrastructure.db.db_manager import chunked, execute_many
+from ccpm.infrastructure.db.schema import tasks, time_records, time_rollups
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# (タスクID, 開始日) ごとの作業時間と件数の増減
+Contributions = Dict[Tuple[UUID, date], List[float]]
+
+# (粒度, 単位, 集計対象キー, 区間開始日) ごとの作業時間と件数の増減
+RollupDeltas = Dict[Tuple[str, str, str, date], List[float]]
+
+# タスクの所属（プロジェクトID, カテゴリ）
+Placement = Tuple[UUID, str]
+
+
+def add_contribution(
+    contributions: Contributions,
+    task_id: UUID,
+    day: date,
+    hours: float,
+    count: int
+) -> None:
+    """
+    時間記録1件分の増減を加算
+
+    Args:
+        contributions: 加算先
+        task_id: タスクID
+        day: 時間記録の開始日
+        hours: 作業時間の増減
+        count: 件数の増減（追加は1、削除は-1）
+    """
+    entry = contributions.setdefault((task_id, day), [0.0, 0])
+    entry[0] += hours
+    entry[1] += count
+
+
+def _add_delta(
+    deltas: RollupDeltas,
+    key: Tuple[str, str, str, date],
+    hours: float,
+    count: float
+) -> None:
+    """
+    集計行の増減を加算
+
+    Args:
+        deltas: 加算先
+        key: 集計行のキー
+        hours: 作業時間の増減
+        count: 件数の増減
+    """
+    entry = deltas.setdefault(key, [0.0, 0])
+    entry[0] += hours
+    entry[1] += count
+
+
+def _add_placement(
+    deltas: RollupDeltas,
+    granularity: str,
+    bucket: date,
+    placement: Placement,
+    hours: float,
+    count: float
+) -> None:
+    """
+    プロジェクト単位とカテゴリ単位の集計行に増減を加算
+
+    Args:
+        deltas: 加算先
+        granularity: 集計の粒度
+        bucket: 区間開始日
+        placement: タスクの所属（プロジェクトID, カテゴリ）
+        hours: 作業時間の増減
+        count: 件数の増減
+    """
+    project_id, category = placement
+    _add_delta(
+        deltas, (granularity, SCOPE_PROJECT, project_id.hex, bucket), hours, count
+    )
+    _add_delta(deltas, (granularity, SCOPE_CATEGORY, category, bucket), hours, count)
+
+
+def load_placements(
+    conn: Connection,
+    task_ids: Optional[Sequence[UUID]] = None,
+    project_ids: Optional[Sequence[UUID]] = None
+) -> Dict[UUID, Placement]:
+    """
+    保存済みのタスクの所属を読み込み
+
+    Args:
+        conn: データベース接続
+        task_ids: 対象のタスクIDのリスト
+        project_ids: 対象のプロジェクトIDのリスト（task_ids を省略した場合に使用）
+
+    Returns:
+        Dict[UUID, Placement]: タスクIDごとの所属
+    """
+    column = tasks.c.id if task_ids is not None else tasks.c.project_id
+    values = list(task_ids if task_ids is not None else project_ids or [])
+    placements: Dict[UUID, Placement] = {}
+    for chunk in chunked(values):
+        rows = conn.execute(
+            select(tasks.c.id, tasks.c.project_id, tasks.c.category).where(
+                column.in_(chunk)
+            )
+        )
+        for task_id, project_id, category in rows:
+            placements[task_id] = (project_id, category)
+    return placements
+
+
+def apply_record_contributions(conn: Connection, contributions: Contributions) -> None:
+    """
+    時間記録の増減を日次・週次のタスク・プロジェクト・カテゴリ集計に反映
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+        contributions: (タスクID, 開始日) ごとの作業時間と件数の増減
+    """
+    changed = {
+        key: value for key, value in contributions.items() if value[0] or value[1]
+    }
+    if not changed:
+        return
+
+    placements = load_placements(conn, list({task_id for task_id, _ in changed}))
+    deltas: RollupDeltas = {}
+    for (task_id, day), (hours, count) in changed.items():
+        placement = placements.get(task_id)
+        if placement is None:
+            continue
+        for granularity in GRANULARITIES:
+            bucket = bucket_start(day, granularity)
+            _add_delta(
+                deltas, (granularity, SCOPE_TASK, task_id.hex, bucket), hours, count
+            )
+            _add_placement(deltas, granularity, bucket, placement, hours, count)
+    _apply_deltas(conn, deltas)
+
+
+def move_task_contributions(
+    conn: Connection,
+    moves: Dict[UUID, Tuple[Placement, Optional[Placement]]]
+) -> None:
+    """
+    タスクの所属変更・削除に合わせてプロジェクト・カテゴリ集計を付け替え
+
+    タスク単位の集計行をそのタスクの寄与分として、旧所属から差し引き新所属に加えます。
+    新所属が None の場合（タスク削除）はタスク単位の集計行も取り除きます。
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+        moves: タスクIDごとの（旧所属, 新所属）
+    """
+    if not moves:
+        return
+
+    by_hex = {task_id.hex: move for task_id, move in moves.items()}
+    deltas: RollupDeltas = {}
+    for chunk in chunked(list(by_hex)):
+        rows = conn.execute(
+            select(
+                time_rollups.c.granularity,
+                time_rollups.c.scope_key,
+                time_rollups.c.bucket,
+                time_rollups.c.hours,
+                time_rollups.c.record_count,
+            ).where(
+                time_rollups.c.scope == SCOPE_TASK, time_rollups.c.scope_key.in_(chunk)
+            )
+        )
+        for granularity, task_hex, bucket, hours, count in rows:
+            old, new = by_hex[task_hex]
+            _add_placement(deltas, granularity, bucket, old, -hours, -count)
+            if new is None:
+                _add_delta(
+                    deltas, (granularity, SCOPE_TASK, task_hex, bucket), -hours, -count
+                )
+            else:
+                _add_placement(deltas, granularity, bucket, new, hours, count)
+    _apply_deltas(conn, deltas)
+
+
+def _apply_deltas(conn: Connection, deltas: RollupDeltas) -> None:
+    """
+    集計行に増減を加算し、件数が0になった行を削除
+
+    Args:
+        conn: データベース接続
+        deltas: 集計行ごとの増減
+    """
+    rows: List[Dict[str, Any]] = [
+        {
+            "granularity": granularity,
+            "scope": scope,
+            "scope_key": scope_key,
+            "bucket": bucket,
+            "hours": hours,
+            "record_count": int(count),
+        }
+        for (granularity, scope, scope_key, bucket), (hours, count) in deltas.items()
+        if hours or count
+    ]
+    if not rows:
+        return
+
+    statement = insert(time_rollups)
+    statement = statement.on_conflict_do_update(
+        index_elements=[
+            time_rollups.c.granularity,
+            time_rollups.c.scope,
+            time_rollups.c.scope_key,
+            time_rollups.c.bucket,
+        ],
+        set_={
+            "hours": time_rollups.c.hours + statement.excluded.hours,
+            "record_count": time_rollups.c.record_count
+            + statement.excluded.record_count,
+        },
+    )
+    execute_many(conn, statement, rows)
+
+    # 件数が減った行だけが空になり得る
+    emptied = [
+        {
+            "g": row["granularity"],
+            "s": row["scope"],
+            "k": row["scope_key"],
+            "b": row["bucket"],
+        }
+        for row in rows
+        if row["record_count"] < 0
+    ]
+    if emptied:
+        conn.execute(
+            delete(time_rollups).where(
+                and_(
+                    time_rollups.c.granularity == bindparam("g"),
+                    time_rollups.c.scope == bindparam("s"),
+                    time_rollups.c.scope_key == bindparam("k"),
+                    time_rollups.c.bucket == bindparam("b"),
+                    time_rollups.c.record_count <= 0,
+                )
+            ),
+            emptied,
+        )
+
+
+def rebuild_rollups(conn: Connection) -> None:
+    """
+    時間記録から集計テーブルを作り直す
+
+    Args:
+        conn: データベース接続（呼び出し側のトランザクション内）
+    """
+    conn.execute(delete(time_rollups))
+    contributions: Contributions = {}
+    rows = conn.execute(
+        select(
+            time_records.c.task_id,
+            time_records.c.bucket_day,
+            time_records.c.duration,
+        )
+    )
+    for task_id, day, duration in rows:
+        add_contribution(contributions, task_id, day, duration, 1)
+    apply_record_contributions(conn, contributions)
+    logger.info(
+        "Rebuilt time rollups from "
+        f"{sum(int(c) for _, c in contributions.values())} records"
+    )
+
+
+def query_rollups(
+    conn: Connection,
+    scope: str,
+    start_date: date,
+    end_date: date,
+    granularity: str,
+    keys: Optional[Sequence[Union[UUID, str]]] = None
+) -> List[TimeRollup]:
+    """
+    期間内の作業時間集計を取得
+
+    Args:
+        conn: データベース接続
+        scope: 集計の単位（"task"、"project" または "category"）
+        start_date: 期間の開始日
+        end_date: 期間の終了日
+        granularity: 集計の粒度（"day" または "week"）
+        keys: 集計対象（タスクID、プロジェクトID またはカテゴリ名。省略時はすべて）
+
+    Returns:
+        List[TimeRollup]: 集計対象・区間順の作業時間集計
+
+    Raises:
+        ValueError: 不明な単位・粒度が指定された場合
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"不明な集計単位です: {scope}")
+    first = bucket_start(start_date, granularity)
+    last = bucket_start(end_date, granularity)
+
+    statement = (
+        select(
+            time_rollups.c.scope_key,
+            time_rollups.c.bucket,
+            time_rollups.c.hours,
+            time_rollups.c.record_count,
+        )
+        .where(
+            time_rollups.c.granularity == granularity,
+            time_rollups.c.scope == scope,
+            time_rollups.c.bucket.between(first, last),
+        )
+        .order_by(time_rollups.c.scope_key, time_rollups.c.bucket)
+    )
+    if keys is None:
+        rows = list(conn.execute(statement))
+    else:
+        scope_keys = [key.hex if isinstance(key, UUID) else key for key in keys]
+        rows = []
+        for chunk in chunked(scope_keys):
+            rows.extend(
+                conn.execute(statement.where(time_rollups.c.scope_key.in_(chunk)))
+            )
+        rows.sort(key=lambda row: (row.scope_key, row.bucket))
+
+    return [
+        TimeRollup(
+            granularity=granularity,
+            scope=scope,
+            key=scope_key if scope == SCOPE_CATEGORY else UUID(scope_key),
+            bucket=bucket,
+            hours=hours,
+            record_count=record_count,
+        )
+        for scope_key, bucket, hours, record_count in rows
+    ]
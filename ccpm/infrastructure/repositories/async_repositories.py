@@ -0,0 +1,423 @@
+"""
+asyncio から利用するリポジトリのラッパー
+"""
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+from ccpm.config import DB_POOL_SIZE, TASK_SEARCH_PAGE_SIZE
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.repositories.time_repository import TimeRepository
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria, TaskSearchResult
+from ccpm.domain.value_objects.time_rollup import GRANULARITY_DAY, TimeRollup
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RepositoryExecutor:
+    """
+    リポジトリの同期メソッドを有界スレッドプールで実行する実行器
+
+    スレッド数を接続プールの接続数に合わせることで、イベントループを止めずに
+    接続待ちを起こさない範囲でクエリを並行実行します。
+    """
+
+    def __init__(self, max_workers: int = DB_POOL_SIZE):
+        """
+        実行器の初期化
+
+        Args:
+            max_workers: 同時に実行するクエリの最大数
+
+        Raises:
+            ValueError: max_workers が1未満の場合
+        """
+        if max_workers < 1:
+            raise ValueError("同時実行数は1以上である必要があります")
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ccpm-repository"
+        )
+
+    @classmethod
+    def for_database(cls, db: DatabaseManager) -> "RepositoryExecutor":
+        """
+        データベースの接続プールに合わせた実行器を作成
+
+        Args:
+            db: データベース管理
+
+        Returns:
+            RepositoryExecutor: 接続プールの接続数と同じスレッド数の実行器
+        """
+        return cls(max_workers=db.pool_size)
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        同期関数をスレッドプールで実行して結果を待つ
+
+        Args:
+            function: 実行する関数
+            *args: 位置引数
+            **kwargs: キーワード引数
+
+        Returns:
+            T: 関数の戻り値
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        スレッドプールを停止
+
+        Args:
+            wait: 実行中のクエリの完了を待つかどうか
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class AsyncProjectRepository:
+    """
+    ProjectRepository の各メソッドを実行器で実行する非同期版リポジトリ
+    """
+
+    def __init__(self, inner: ProjectRepository, executor: RepositoryExecutor):
+        """
+        非同期リポジトリの初期化
+
+        Args:
+            inner: 実際の読み書きを行う同期リポジトリ
+            executor: クエリを実行する実行器
+        """
+        self.inner = inner
+        self.executor = executor
+
+    async def save(self, project: Project) -> Project:
+        """プロジェクトを保存（ProjectRepository.save を参照）"""
+        return await self.executor.run(self.inner.save, project)
+
+    async def save_many(self, projects: List[Project]) -> List[Project]:
+        """複数のプロジェクトを一括保存（ProjectRepository.save_many を参照）"""
+        return await self.executor.run(self.inner.save_many, projects)
+
+    async def find_by_id(self, project_id: UUID) -> Optional[Project]:
+        """IDによるプロジェクトの検索（ProjectRepository.find_by_id を参照）"""
+        return await self.executor.run(self.inner.find_by_id, project_id)
+
+    async def find_all(self) -> List[Project]:
+        """すべてのプロジェクトを取得（ProjectRepository.find_all を参照）"""
+        return await self.executor.run(self.inner.find_all)
+
+    async def find_by_status(self, status: str) -> List[Project]:
+        """ステータスによるプロジェクトの検索（ProjectRepository.find_by_status を参照）"""
+        return await self.executor.run(self.inner.find_by_status, status)
+
+    async def count(self, status: Optional[str] = None) -> int:
+        """プロジェクト数を取得（ProjectRepository.count を参照）"""
+        return await self.executor.run(self.inner.count, status)
+
+    async def find_columns(
+        self,
+        columns: Sequence[str],
+        status: Optional[str] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        プロジェクトの指定した項目だけを取得
+
+        ProjectRepository.iter_columns の結果をワーカースレッド内でリストにまとめて返します。
+
+        Args:
+            columns: 取得する項目名のリスト
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            List[Tuple[Any, ...]]: 指定した項目の値のタプルのリスト
+
+        Raises:
+            ValueError: 存在しない項目名が指定された場合
+        """
+        return await self.executor.run(
+            lambda: list(self.inner.iter_columns(columns, status))
+        )
+
+    async def find_revisions(
+        self,
+        project_ids: Optional[Sequence[UUID]] = None
+    ) -> Dict[UUID, int]:
+        """プロジェクトの変更リビジョンを取得（ProjectRepository.find_revisions を参照）"""
+        return await self.executor.run(self.inner.find_revisions, project_ids)
+
+    async def delete(self, project_id: UUID) -> bool:
+        """プロジェクトの削除（ProjectRepository.delete を参照）"""
+        return await self.executor.run(self.inner.delete, project_id)
+
+    async def delete_many(self, project_ids: List[UUID]) -> int:
+        """複数のプロジェクトを一括削除（ProjectRepository.delete_many を参照）"""
+        return await self.executor.run(self.inner.delete_many, project_ids)
+
+
+class AsyncTaskRepository:
+    """
+    TaskRepository の各メソッドを実行器で実行する非同期版リポジトリ
+    """
+
+    def __init__(self, inner: TaskRepository, executor: RepositoryExecutor):
+        """
+        非同期リポジトリの初期化
+
+        Args:
+            inner: 実際の読み書きを行う同期リポジトリ
+            executor: クエリを実行する実行器
+        """
+        self.inner = inner
+        self.executor = executor
+
+    async def save(self, task: Task) -> Task:
+        """タスクを保存（TaskRepository.save を参照）"""
+        return await self.executor.run(self.inner.save, task)
+
+    async def save_many(self, tasks: List[Task]) -> List[Task]:
+        """複数のタスクを一括保存（TaskRepository.save_many を参照）"""
+        return await self.executor.run(self.inner.save_many, tasks)
+
+    async def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        """IDによるタスクの検索（TaskRepository.find_by_id を参照）"""
+        return await self.executor.run(self.inner.find_by_id, task_id)
+
+    async def find_all(self) -> List[Task]:
+        """すべてのタスクを取得（TaskRepository.find_all を参照）"""
+        return await self.executor.run(self.inner.find_all)
+
+    async def find_by_project_id(self, project_id: UUID) -> List[Task]:
+        """プロジェクトIDによるタスクの検索（TaskRepository.find_by_project_id を参照）"""
+        return await self.executor.run(self.inner.find_by_project_id, project_id)
+
+    async def find_by_status(self, status: str) -> List[Task]:
+        """ステータスによるタスクの検索（TaskRepository.find_by_status を参照）"""
+        return await self.executor.run(self.inner.find_by_status, status)
+
+    async def find_by_project_and_status(
+        self,
+        project_id: UUID,
+        status: str
+    ) -> List[Task]:
+        """プロジェクトIDとステータスによるタスクの検索（TaskRepository.find_by_project_and_status を参照）"""
+        return await self.executor.run(
+            self.inner.find_by_project_and_status, project_id, status
+        )
+
+    async def count(
+        self,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """タスク数を取得（TaskRepository.count を参照）"""
+        return await self.executor.run(self.inner.count, project_id, status)
+
+    async def find_columns(
+        self,
+        columns: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        タスクの指定した項目だけを取得
+
+        TaskRepository.iter_columns の結果をワーカースレッド内でリストにまとめて返します。
+
+        Args:
+            columns: 取得する項目名のリスト（dependencies は指定できません）
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            List[Tuple[Any, ...]]: 指定した項目の値のタプルのリスト
+
+        Raises:
+            ValueError: 存在しない項目名が指定された場合
+        """
+        return await self.executor.run(
+            lambda: list(self.inner.iter_columns(columns, project_id, status))
+        )
+
+    async def search(
+        self,
+        criteria: TaskSearchCriteria,
+        page: int = 0,
+        page_size: int = TASK_SEARCH_PAGE_SIZE
+    ) -> TaskSearchResult:
+        """条件に一致するタスクを1ページ分検索（TaskRepository.search を参照）"""
+        return await self.executor.run(self.inner.search, criteria, page, page_size)
+
+    async def delete(self, task_id: UUID) -> bool:
+        """タスクの削除（TaskRepository.delete を参照）"""
+        return await self.executor.run(self.inner.delete, task_id)
+
+    async def delete_many(self, task_ids: List[UUID]) -> int:
+        """複数のタスクを一括削除（TaskRepository.delete_many を参照）"""
+        return await self.executor.run(self.inner.delete_many, task_ids)
+
+
+class AsyncTimeRepository:
+    """
+    TimeRepository の各メソッドを実行器で実行する非同期版リポジトリ
+    """
+
+    def __init__(self, inner: TimeRepository, executor: RepositoryExecutor):
+        """
+        非同期リポジトリの初期化
+
+        Args:
+            inner: 実際の読み書きを行う同期リポジトリ
+            executor: クエリを実行する実行器
+        """
+        self.inner = inner
+        self.executor = executor
+
+    async def save(self, time_record: TimeRecord) -> TimeRecord:
+        """時間記録を保存（TimeRepository.save を参照）"""
+        return await self.executor.run(self.inner.save, time_record)
+
+    async def save_many(self, time_records: List[TimeRecord]) -> List[TimeRecord]:
+        """複数の時間記録を一括保存（TimeRepository.save_many を参照）"""
+        return await self.executor.run(self.inner.save_many, time_records)
+
+    async def find_by_id(self, record_id: UUID) -> Optional[TimeRecord]:
+        """IDによる時間記録の検索（TimeRepository.find_by_id を参照）"""
+        return await self.executor.run(self.inner.find_by_id, record_id)
+
+    async def find_all(self) -> List[TimeRecord]:
+        """すべての時間記録を取得（TimeRepository.find_all を参照）"""
+        return await self.executor.run(self.inner.find_all)
+
+    async def find_by_task_id(self, task_id: UUID) -> List[TimeRecord]:
+        """タスクIDによる時間記録の検索（TimeRepository.find_by_task_id を参照）"""
+        return await self.executor.run(self.inner.find_by_task_id, task_id)
+
+    async def find_by_task_ids(self, task_ids: Sequence[UUID]) -> List[TimeRecord]:
+        """複数のタスクIDによる時間記録の検索（TimeRepository.find_by_task_ids を参照）"""
+        return await self.executor.run(self.inner.find_by_task_ids, task_ids)
+
+    async def find_active_record(self, task_id: UUID) -> Optional[TimeRecord]:
+        """タスクの記録中の時間記録を取得（TimeRepository.find_active_record を参照）"""
+        return await self.executor.run(self.inner.find_active_record, task_id)
+
+    async def find_active_records(self) -> List[TimeRecord]:
+        """すべての記録中の時間記録を取得（TimeRepository.find_active_records を参照）"""
+        return await self.executor.run(self.inner.find_active_records)
+
+    async def find_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[TimeRecord]:
+        """日付範囲による時間記録の検索（TimeRepository.find_by_date_range を参照）"""
+        return await self.executor.run(
+            self.inner.find_by_date_range, start_date, end_date
+        )
+
+    async def count(
+        self,
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """時間記録数を取得（TimeRepository.count を参照）"""
+        return await self.executor.run(self.inner.count, task_id, start_date, end_date)
+
+    async def find_columns(
+        self,
+        columns: Sequence[str],
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        時間記録の指定した項目だけを取得
+
+        TimeRepository.iter_columns の結果をワーカースレッド内でリストにまとめて返します。
+
+        Args:
+            columns: 取得する項目名のリスト
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 検索開始日（省略時は制限なし）
+            end_date: 検索終了日（省略時は制限なし）
+
+        Returns:
+            List[Tuple[Any, ...]]: 指定した項目の値のタプルのリスト
+
+        Raises:
+            ValueError: 存在しない項目名が指定された場合
+        """
+        return await self.executor.run(
+            lambda: list(
+                self.inner.iter_columns(columns, task_id, start_date, end_date)
+            )
+        )
+
+    async def start_record(
+        self,
+        time_record: TimeRecord,
+        resource: str = "",
+        wip_limit: Optional[int] = None,
+        known_active: Collection[UUID] = ()
+    ) -> Tuple[Optional[TimeRecord], List[UUID]]:
+        """WIP制限の範囲で記録中の時間記録を保存（TimeRepository.start_record を参照）"""
+        return await self.executor.run(
+            self.inner.start_record, time_record, resource, wip_limit, known_active
+        )
+
+    async def stop_record(
+        self,
+        record_id: UUID,
+        end_time: Optional[datetime] = None
+    ) -> Optional[TimeRecord]:
+        """時間記録を停止して保存（TimeRepository.stop_record を参照）"""
+        return await self.executor.run(self.inner.stop_record, record_id, end_time)
+
+    async def aggregate_hours(
+        self,
+        scope: str,
+        start_date: date,
+        end_date: date,
+        granularity: str = GRANULARITY_DAY,
+        keys: Optional[Sequence[Union[UUID, str]]] = None
+    ) -> List[TimeRollup]:
+        """作業時間の集計を取得（TimeRepository.aggregate_hours を参照）"""
+        return await self.executor.run(
+            self.inner.aggregate_hours, scope, start_date, end_date, granularity, keys
+        )
+
+    async def delete(self, record_id: UUID) -> bool:
+        """時間記録の削除（TimeRepository.delete を参照）"""
+        return await self.executor.run(self.inner.delete, record_id)
+
+    async def delete_many(self, record_ids: List[UUID]) -> int:
+        """複数の時間記録を一括削除（TimeRepository.delete_many を参照）"""
+        return await self.executor.run(self.inner.delete_many, record_ids)
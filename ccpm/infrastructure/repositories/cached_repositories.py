@@ -0,0 +1,1475 @@
+"""
+キャッシュ付きリポジトリ（アイデンティティマップと共有LRUキャッシュ）
+"""
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+from ccpm.config import ENTITY_CACHE_SIZE, TASK_SEARCH_PAGE_SIZE
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.repositories.time_repository import TimeRepository
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria, TaskSearchResult
+from ccpm.domain.value_objects.time_rollup import GRANULARITY_DAY, TimeRollup
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 共有キャッシュの名前空間
+PROJECT = "project"
+PROJECT_LIST = "project_list"
+TASK = "task"
+PROJECT_TASKS = "project_tasks"
+TIME_RECORD = "time_record"
+
+
+class _Entity(Protocol):
+    """アイデンティティマップで扱うエンティティ（IDを持つ）"""
+
+    id: UUID
+
+
+E = TypeVar("E", bound=_Entity)
+
+
+def _clone_project(project: Project) -> Project:
+    """
+    プロジェクトの複製を作成（リストとフィーディングバッファは共有しない）
+
+    Args:
+        project: 複製元のプロジェクト
+
+    Returns:
+        Project: 複製されたプロジェクト
+    """
+    clone = copy.copy(project)
+    clone.critical_chain = list(project.critical_chain)
+    clone.feeding_buffers = []
+    for buffer in project.feeding_buffers:
+        buffer_clone = copy.copy(buffer)
+        buffer_clone.feeding_chain = list(buffer.feeding_chain)
+        clone.feeding_buffers.append(buffer_clone)
+    return clone
+
+
+def _clone_task(task: Task) -> Task:
+    """
+    タスクの複製を作成（依存関係とタグのリストは共有しない）
+
+    Args:
+        task: 複製元のタスク
+
+    Returns:
+        Task: 複製されたタスク
+    """
+    clone = copy.copy(task)
+    clone.dependencies = list(task.dependencies)
+    clone.tags = list(task.tags)
+    return clone
+
+
+def _clone_time_record(time_record: TimeRecord) -> TimeRecord:
+    """
+    時間記録の複製を作成
+
+    Args:
+        time_record: 複製元の時間記録
+
+    Returns:
+        TimeRecord: 複製された時間記録
+    """
+    return copy.copy(time_record)
+
+
+class EntityCache:
+    """
+    複数のセッションで共有する上限付きLRUキャッシュ
+
+    エントリは (名前空間, キー) で管理し、値にはどのセッションからも変更されない
+    エンティティのスナップショット（またはスナップショットのタプル）を保持します。
+    上限はエントリ数で数えるため、プロジェクト単位のタスク一覧も1エントリです。
+
+    書き込み（put・write・update・破棄）ごとに版を進め、キーごとに最後に書き込んだ版を
+    記録します。リポジトリの読み込み・保存の前に current_version で版を取得しておき、
+    読み込んだ結果は fill、保存した結果は write・update に渡します。途中で同じキーへの
+    書き込みがあった場合、読み込んだ結果は古いものとして登録せず、保存した結果は
+    保存の前後関係が分からないためエントリを破棄します（次の読み込みで最新を読み直す）。
+    """
+
+    def __init__(self, max_entries: int = ENTITY_CACHE_SIZE):
+        """
+        キャッシュの初期化
+
+        Args:
+            max_entries: 保持する最大エントリ数
+        """
+        if max_entries <= 0:
+            raise ValueError("キャッシュの最大エントリ数は1以上である必要があります")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        # キー・名前空間ごとに最後に書き込んだ版（キーの記録は新しい順に max_entries 件まで）
+        self._written: "OrderedDict[Tuple[str, Hashable], int]" = OrderedDict()
+        self._namespace_written: Dict[str, int] = {}
+        # 記録から外したキーの版の最大値（これより前に始めた読み込みは登録しない）
+        self._floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def lock(self) -> threading.Lock:
+        """キャッシュの操作を排他するロック（アイデンティティマップと共有）"""
+        return self._lock
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """
+        エントリを取得し、最近使用したものとして記録
+
+        Args:
+            namespace: 名前空間
+            key: キー
+
+        Returns:
+            Optional[Any]: キャッシュされた値、存在しない場合はNone
+        """
+        with self._lock:
+            value = self._entries.get((namespace, key))
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((namespace, key))
+            self.hits += 1
+            return value
+
+    def peek(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """
+        LRU順序とヒット数を変えずにエントリを参照
+
+        Args:
+            namespace: 名前空間
+            key: キー
+
+        Returns:
+            Optional[Any]: キャッシュされた値、存在しない場合はNone
+        """
+        with self._lock:
+            return self._entries.get((namespace, key))
+
+    def put(self, namespace: str, key: Hashable, value: Any) -> None:
+        """
+        エントリを追加または更新し、上限を超えた分を古い順に破棄
+
+        並行する保存との前後関係を考慮しない書き込みです。リポジトリの保存結果は write、
+        読み込んだ結果は fill で登録します。
+
+        Args:
+            namespace: 名前空間
+            key: キー
+            value: キャッシュする値
+        """
+        with self._lock:
+            self._record_write((namespace, key))
+            self._store((namespace, key), value)
+
+    def write(self, namespace: str, key: Hashable, value: Any, version: int) -> bool:
+        """
+        保存したエンティティを書き込み
+
+        保存の開始後に同じキーへの書き込みがあった場合は、どちらの保存が後か分からないため
+        値を書き込まずにエントリを破棄します。
+
+        Args:
+            namespace: 名前空間
+            key: キー
+            value: キャッシュする値
+            version: 保存前に current_version で取得した版
+
+        Returns:
+            bool: 書き込んだ場合はTrue（破棄した場合はFalse）
+        """
+        with self._lock:
+            cache_key = (namespace, key)
+            stale = self._written_since(cache_key, version)
+            self._record_write(cache_key)
+            if stale:
+                self._entries.pop(cache_key, None)
+                return False
+            self._store(cache_key, value)
+            return True
+
+    def update(
+        self,
+        namespace: str,
+        key: Hashable,
+        func: Callable[[Any], Optional[Any]],
+        version: int
+    ) -> None:
+        """
+        既存のエントリを保存したエンティティで関数により書き換え（存在しない場合は記録のみ）
+
+        参照と書き換えを1つのロックの中で行うため、同時に保存しても更新が失われません。
+        エントリがない場合も書き込みとして記録するため、並行する読み込みの結果は登録されません。
+        保存の開始後に同じキーへの書き込みがあった場合は write と同じくエントリを破棄します。
+
+        Args:
+            namespace: 名前空間
+            key: キー
+            func: 現在の値から新しい値を作る関数（None を返した場合はエントリを破棄）
+            version: 保存前に current_version で取得した版
+        """
+        with self._lock:
+            cache_key = (namespace, key)
+            stale = self._written_since(cache_key, version)
+            self._record_write(cache_key)
+            current = self._entries.get(cache_key)
+            if current is None:
+                return
+            value = None if stale else func(current)
+            if value is None:
+                del self._entries[cache_key]
+            else:
+                self._entries[cache_key] = value
+
+    def current_version(self) -> int:
+        """
+        リポジトリの読み込み・保存の前に現在の版を取得
+
+        Returns:
+            int: fill・write・update に渡す版
+        """
+        with self._lock:
+            return self._version
+
+    def fill(self, namespace: str, key: Hashable, value: Any, version: int) -> bool:
+        """
+        読み込んだ結果を、読み込み開始後に同じキーへの書き込みがなかった場合のみ登録
+
+        Args:
+            namespace: 名前空間
+            key: キー
+            value: キャッシュする値
+            version: 読み込み前に current_version で取得した版
+
+        Returns:
+            bool: 登録した場合はTrue
+        """
+        with self._lock:
+            cache_key = (namespace, key)
+            if self._written_since(cache_key, version):
+                return False
+            self._store(cache_key, value)
+            return True
+
+    def _written_since(self, cache_key: Tuple[str, Hashable], version: int) -> bool:
+        """
+        版より後にキーへの書き込みがあったかどうか（ロック内で呼び出す）
+
+        記録から外したキーは、外した記録の最大の版に書き込まれたものとみなします。
+
+        Args:
+            cache_key: (名前空間, キー)
+            version: 比較する版
+
+        Returns:
+            bool: 書き込みがあった（または分からない）場合はTrue
+        """
+        written = self._written.get(cache_key)
+        if written is None:
+            written = self._floor
+        return max(written, self._namespace_written.get(cache_key[0], 0)) > version
+
+    def _record_write(self, cache_key: Tuple[str, Hashable]) -> None:
+        """
+        キーへの書き込みを新しい版として記録（ロック内で呼び出す）
+
+        Args:
+            cache_key: (名前空間, キー)
+        """
+        self._version += 1
+        self._written[cache_key] = self._version
+        self._written.move_to_end(cache_key)
+        while len(self._written) > self.max_entries:
+            _, written = self._written.popitem(last=False)
+            self._floor = max(self._floor, written)
+
+    def _store(self, cache_key: Tuple[str, Hashable], value: Any) -> None:
+        """
+        エントリを追加し、上限を超えた分を古い順に破棄（ロック内で呼び出す）
+
+        Args:
+            cache_key: (名前空間, キー)
+            value: キャッシュする値
+        """
+        self._entries[cache_key] = value
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, namespace: str, key: Hashable) -> None:
+        """
+        エントリを破棄
+
+        Args:
+            namespace: 名前空間
+            key: キー
+        """
+        with self._lock:
+            self._record_write((namespace, key))
+            self._entries.pop((namespace, key), None)
+
+    def invalidate_listings_containing(
+        self,
+        namespace: str,
+        owners: Dict[Hashable, Hashable]
+    ) -> None:
+        """
+        名前空間内の一覧エントリのうち、要素の現在の所属と異なるキーの一覧を破棄
+
+        一覧の要素は id 属性を持つスナップショットであることを前提とします。
+        要素の以前の所属が分からない場合に、古い所属の一覧を探して破棄するために使います。
+
+        Args:
+            namespace: 一覧エントリの名前空間
+            owners: 要素IDごとの現在の所属（一覧のキー）
+        """
+        if not owners:
+            return
+        with self._lock:
+            stale = [
+                cache_key
+                for cache_key, listing in self._entries.items()
+                if cache_key[0] == namespace
+                and any(
+                    item.id in owners and owners[item.id] != cache_key[1]
+                    for item in listing
+                )
+            ]
+            for cache_key in stale:
+                self._record_write(cache_key)
+                del self._entries[cache_key]
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """
+        名前空間内のすべてのエントリを破棄
+
+        Args:
+            namespace: 名前空間
+        """
+        with self._lock:
+            self._version += 1
+            self._namespace_written[namespace] = self._version
+            for cache_key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        """すべてのエントリを破棄（統計値はそのまま）"""
+        with self._lock:
+            self._version += 1
+            self._floor = self._version
+            self._written.clear()
+            self._namespace_written.clear()
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率（0.0〜1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        キャッシュの統計情報を取得
+
+        Returns:
+            Dict[str, Any]: エントリ数、ヒット数、ミス数、破棄数、ヒット率
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# アプリケーション全体で共有する既定のキャッシュ
+shared_entity_cache = EntityCache()
+
+
+class IdentityMap(Generic[E]):
+    """
+    1セッション内で同じIDのエンティティを同じオブジェクトとして扱うためのマップ
+
+    非同期リポジトリからは複数のスレッドで同時に使われるため、操作はロックの中で行います。
+    """
+
+    def __init__(self, clone: Callable[[E], E], lock: Optional[threading.Lock] = None):
+        """
+        アイデンティティマップの初期化
+
+        Args:
+            clone: 共有キャッシュのスナップショットからセッション用の複製を作る関数
+            lock: 操作を排他するロック（省略時は専用のロック）
+        """
+        self._clone = clone
+        self._lock = lock if lock is not None else threading.Lock()
+        self._entities: Dict[UUID, E] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get(self, entity_id: UUID) -> Optional[E]:
+        """
+        セッション内のエンティティを取得
+
+        Args:
+            entity_id: エンティティID
+
+        Returns:
+            Optional[E]: セッション内のエンティティ、存在しない場合はNone
+        """
+        with self._lock:
+            entity = self._entities.get(entity_id)
+            if entity is not None:
+                self.hits += 1
+            return entity
+
+    def adopt(self, entity: E) -> E:
+        """
+        読み込んだエンティティをセッションに登録
+
+        既に同じIDのエンティティがある場合は、そちらを返します。
+
+        Args:
+            entity: 読み込んだエンティティ
+
+        Returns:
+            E: セッション内のエンティティ
+        """
+        with self._lock:
+            return self._entities.setdefault(entity.id, entity)
+
+    def adopt_snapshot(self, snapshot: E) -> E:
+        """
+        共有キャッシュのスナップショットをセッションに登録
+
+        Args:
+            snapshot: 共有キャッシュのスナップショット
+
+        Returns:
+            E: セッション内のエンティティ（未登録の場合はスナップショットの複製）
+        """
+        with self._lock:
+            entity = self._entities.get(snapshot.id)
+            if entity is None:
+                entity = self._entities[snapshot.id] = self._clone(snapshot)
+            return entity
+
+    def register(self, entity: E) -> None:
+        """
+        保存したエンティティをセッション内の正として登録
+
+        Args:
+            entity: 保存したエンティティ
+        """
+        with self._lock:
+            self._entities[entity.id] = entity
+
+    def discard(self, entity_id: UUID) -> Optional[E]:
+        """
+        エンティティをセッションから外す
+
+        Args:
+            entity_id: エンティティID
+
+        Returns:
+            Optional[E]: 外したエンティティ
+        """
+        with self._lock:
+            return self._entities.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """セッション内のエンティティをすべて外す"""
+        with self._lock:
+            self._entities.clear()
+
+
+def _merge_listing(
+    listing: Tuple[Any, ...],
+    snapshots: Dict[UUID, Any]
+) -> Optional[Tuple[Any, ...]]:
+    """
+    一覧スナップショットの要素を同じIDの新しいスナップショットで置き換え
+
+    Args:
+        listing: 一覧スナップショット
+        snapshots: IDごとの新しいスナップショット
+
+    Returns:
+        Optional[Tuple[Any, ...]]: 置き換え後の一覧、一覧にないIDが含まれる場合はNone
+    """
+    merged = tuple(snapshots.get(item.id, item) for item in listing)
+    replaced = sum(1 for item in listing if item.id in snapshots)
+    return merged if replaced == len(snapshots) else None
+
+
+class CachedProjectRepository(ProjectRepository):
+    """
+    プロジェクトリポジトリのキャッシュ付きデコレータ
+
+    インスタンスごとにアイデンティティマップを持つため、画面描画やリクエストなどの
+    セッション単位で生成して使います。共有キャッシュには find_by_id と find_all の結果を
+    保持し、保存時はキャッシュを書き換え、削除時は関連するエントリを破棄します。
+    """
+
+    def __init__(self, inner: ProjectRepository, cache: Optional[EntityCache] = None):
+        """
+        リポジトリの初期化
+
+        Args:
+            inner: 実際に永続化を行うリポジトリ
+            cache: 共有キャッシュ（省略時はアプリケーション既定のキャッシュ）
+        """
+        self.inner = inner
+        self.cache = cache if cache is not None else shared_entity_cache
+        self.identity_map = IdentityMap(_clone_project, self.cache.lock)
+
+    def save(self, project: Project) -> Project:
+        """
+        プロジェクトを保存
+
+        Args:
+            project: 保存するプロジェクト
+
+        Returns:
+            Project: 保存されたプロジェクト
+        """
+        version = self.cache.current_version()
+        saved = self.inner.save(project)
+        self._write_through([saved], version)
+        return saved
+
+    def save_many(self, projects: List[Project]) -> List[Project]:
+        """
+        複数のプロジェクトを一括保存
+
+        Args:
+            projects: 保存するプロジェクトのリスト
+
+        Returns:
+            List[Project]: 保存されたプロジェクトのリスト
+        """
+        version = self.cache.current_version()
+        saved = self.inner.save_many(projects)
+        self._write_through(saved, version)
+        return saved
+
+    def _write_through(self, projects: List[Project], version: int) -> None:
+        """
+        保存したプロジェクトを共有キャッシュとセッションに反映
+
+        Args:
+            projects: 保存したプロジェクトのリスト
+            version: 保存前のキャッシュの版
+        """
+        snapshots: Dict[UUID, Project] = {}
+        for project in projects:
+            snapshot = snapshots[project.id] = _clone_project(project)
+            self.cache.write(PROJECT, project.id, snapshot, version)
+            self.identity_map.register(project)
+
+        self.cache.update(
+            PROJECT_LIST, None, partial(_merge_listing, snapshots=snapshots), version
+        )
+
+    def find_by_id(self, project_id: UUID) -> Optional[Project]:
+        """
+        IDによるプロジェクトの検索
+
+        Args:
+            project_id: 検索するプロジェクトID
+
+        Returns:
+            Optional[Project]: 見つかったプロジェクト、存在しない場合はNone
+        """
+        project = self.identity_map.get(project_id)
+        if project is not None:
+            return project
+
+        snapshot = self.cache.get(PROJECT, project_id)
+        if snapshot is not None:
+            return self.identity_map.adopt_snapshot(snapshot)
+
+        version = self.cache.current_version()
+        project = self.inner.find_by_id(project_id)
+        if project is None:
+            return None
+        self.cache.fill(PROJECT, project_id, _clone_project(project), version)
+        return self.identity_map.adopt(project)
+
+    def find_all(self) -> List[Project]:
+        """
+        すべてのプロジェクトを取得
+
+        Returns:
+            List[Project]: プロジェクトのリスト
+        """
+        listing = self.cache.get(PROJECT_LIST, None)
+        if listing is not None:
+            return [self.identity_map.adopt_snapshot(snapshot) for snapshot in listing]
+
+        version = self.cache.current_version()
+        projects = self.inner.find_all()
+        snapshots = tuple(_clone_project(project) for project in projects)
+        self.cache.fill(PROJECT_LIST, None, snapshots, version)
+        for snapshot in snapshots:
+            self.cache.fill(PROJECT, snapshot.id, snapshot, version)
+        return [self.identity_map.adopt(project) for project in projects]
+
+    def find_by_status(self, status: str) -> List[Project]:
+        """
+        ステータスによるプロジェクトの検索（キャッシュせずに委譲）
+
+        Args:
+            status: 検索するステータス
+
+        Returns:
+            List[Project]: 条件に一致するプロジェクトのリスト
+        """
+        return [
+            self.identity_map.adopt(project)
+            for project in self.inner.find_by_status(status)
+        ]
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Project]:
+        """
+        すべてのプロジェクトを順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return self.inner.iter_all(fetch_size)
+
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Project]:
+        """
+        ステータスに一致するプロジェクトを順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return self.inner.iter_by_status(status, fetch_size)
+
+    def count(self, status: Optional[str] = None) -> int:
+        """
+        プロジェクト数を取得（委譲）
+
+        Args:
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            int: プロジェクト数
+        """
+        return self.inner.count(status)
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        プロジェクトの指定した項目だけを順に取得するイテレータ（委譲）
+
+        Args:
+            columns: 取得する項目名のリスト
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        """
+        return self.inner.iter_columns(columns, status, fetch_size)
+
+    def find_revisions(
+        self,
+        project_ids: Optional[Sequence[UUID]] = None
+    ) -> Dict[UUID, int]:
+        """
+        プロジェクトの変更リビジョンを取得（委譲）
+
+        Args:
+            project_ids: 対象のプロジェクトIDのリスト（省略時はすべて）
+
+        Returns:
+            Dict[UUID, int]: プロジェクトIDごとのリビジョン
+        """
+        return self.inner.find_revisions(project_ids)
+
+    def delete(self, project_id: UUID) -> bool:
+        """
+        プロジェクトの削除
+
+        Args:
+            project_id: 削除するプロジェクトID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        deleted = self.inner.delete(project_id)
+        self._invalidate([project_id])
+        return deleted
+
+    def delete_many(self, project_ids: List[UUID]) -> int:
+        """
+        複数のプロジェクトを一括削除
+
+        Args:
+            project_ids: 削除するプロジェクトIDのリスト
+
+        Returns:
+            int: 削除されたプロジェクト数
+        """
+        deleted = self.inner.delete_many(project_ids)
+        self._invalidate(project_ids)
+        return deleted
+
+    def _invalidate(self, project_ids: List[UUID]) -> None:
+        """
+        削除したプロジェクトに関するエントリを破棄
+
+        所属タスクと時間記録も連鎖して削除されるため、それらの名前空間も破棄します。
+
+        Args:
+            project_ids: 削除したプロジェクトIDのリスト
+        """
+        for project_id in project_ids:
+            self.cache.invalidate(PROJECT, project_id)
+            self.cache.invalidate(PROJECT_TASKS, project_id)
+            self.identity_map.discard(project_id)
+        self.cache.invalidate(PROJECT_LIST, None)
+        self.cache.invalidate_namespace(TASK)
+        self.cache.invalidate_namespace(TIME_RECORD)
+
+
+class CachedTaskRepository(TaskRepository):
+    """
+    タスクリポジトリのキャッシュ付きデコレータ
+
+    共有キャッシュには find_by_id と find_by_project_id の結果を保持します（一覧の各タスクは
+    ID のエントリにも登録します）。保存時は同じプロジェクトのタスク一覧を書き換え
+    （所属プロジェクトが変わった場合は以前のプロジェクトの一覧を破棄）、
+    削除時は関連するエントリを破棄します。
+    """
+
+    def __init__(self, inner: TaskRepository, cache: Optional[EntityCache] = None):
+        """
+        リポジトリの初期化
+
+        Args:
+            inner: 実際に永続化を行うリポジトリ
+            cache: 共有キャッシュ（省略時はアプリケーション既定のキャッシュ）
+        """
+        self.inner = inner
+        self.cache = cache if cache is not None else shared_entity_cache
+        self.identity_map = IdentityMap(_clone_task, self.cache.lock)
+
+    def save(self, task: Task) -> Task:
+        """
+        タスクを保存
+
+        Args:
+            task: 保存するタスク
+
+        Returns:
+            Task: 保存されたタスク
+        """
+        version = self.cache.current_version()
+        saved = self.inner.save(task)
+        self._write_through([saved], version)
+        return saved
+
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        複数のタスクを一括保存
+
+        Args:
+            tasks: 保存するタスクのリスト
+
+        Returns:
+            List[Task]: 保存されたタスクのリスト
+        """
+        version = self.cache.current_version()
+        saved = self.inner.save_many(tasks)
+        self._write_through(saved, version)
+        return saved
+
+    def _write_through(self, tasks: List[Task], version: int) -> None:
+        """
+        保存したタスクを共有キャッシュとセッションに反映
+
+        Args:
+            tasks: 保存したタスクのリスト
+            version: 保存前のキャッシュの版
+        """
+        moved: Set[UUID] = set()
+        # 以前の所属が分からない（キャッシュにない）タスクの現在の所属
+        unknown: Dict[Hashable, Hashable] = {}
+        by_project: Dict[UUID, Dict[UUID, Task]] = {}
+        for task in tasks:
+            previous = self.cache.peek(TASK, task.id)
+            if previous is None:
+                unknown[task.id] = task.project_id
+            elif previous.project_id != task.project_id:
+                moved.add(previous.project_id)
+            snapshot = _clone_task(task)
+            by_project.setdefault(task.project_id, {})[task.id] = snapshot
+            self.cache.write(TASK, task.id, snapshot, version)
+            self.identity_map.register(task)
+
+        for project_id, snapshots in by_project.items():
+            self.cache.update(
+                PROJECT_TASKS,
+                project_id,
+                partial(_merge_listing, snapshots=snapshots),
+                version,
+            )
+        for project_id in moved:
+            self.cache.invalidate(PROJECT_TASKS, project_id)
+        # ID のエントリが破棄された後も、以前のプロジェクトの一覧に残っている場合がある
+        self.cache.invalidate_listings_containing(PROJECT_TASKS, unknown)
+
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        """
+        IDによるタスクの検索
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            Optional[Task]: 見つかったタスク、存在しない場合はNone
+        """
+        task = self.identity_map.get(task_id)
+        if task is not None:
+            return task
+
+        snapshot = self.cache.get(TASK, task_id)
+        if snapshot is not None:
+            return self.identity_map.adopt_snapshot(snapshot)
+
+        version = self.cache.current_version()
+        task = self.inner.find_by_id(task_id)
+        if task is None:
+            return None
+        self.cache.fill(TASK, task_id, _clone_task(task), version)
+        return self.identity_map.adopt(task)
+
+    def find_all(self) -> List[Task]:
+        """
+        すべてのタスクを取得（キャッシュせずに委譲）
+
+        Returns:
+            List[Task]: タスクのリスト
+        """
+        return [self.identity_map.adopt(task) for task in self.inner.find_all()]
+
+    def find_by_project_id(self, project_id: UUID) -> List[Task]:
+        """
+        プロジェクトIDによるタスクの検索
+
+        Args:
+            project_id: 検索するプロジェクトID
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        listing = self.cache.get(PROJECT_TASKS, project_id)
+        if listing is not None:
+            return [self.identity_map.adopt_snapshot(snapshot) for snapshot in listing]
+
+        version = self.cache.current_version()
+        tasks = self.inner.find_by_project_id(project_id)
+        snapshots = tuple(_clone_task(task) for task in tasks)
+        if self.cache.fill(PROJECT_TASKS, project_id, snapshots, version):
+            # 保存時に以前の所属プロジェクトを判定できるよう、ID のエントリも登録する
+            for snapshot in snapshots:
+                self.cache.fill(TASK, snapshot.id, snapshot, version)
+        return [self.identity_map.adopt(task) for task in tasks]
+
+    def find_by_status(self, status: str) -> List[Task]:
+        """
+        ステータスによるタスクの検索（キャッシュせずに委譲）
+
+        Args:
+            status: 検索するステータス
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        return [
+            self.identity_map.adopt(task) for task in self.inner.find_by_status(status)
+        ]
+
+    def find_by_project_and_status(self, project_id: UUID, status: str) -> List[Task]:
+        """
+        プロジェクトIDとステータスによるタスクの検索（キャッシュせずに委譲）
+
+        Args:
+            project_id: 検索するプロジェクトID
+            status: 検索するステータス
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        return [
+            self.identity_map.adopt(task)
+            for task in self.inner.find_by_project_and_status(project_id, status)
+        ]
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Task]:
+        """
+        すべてのタスクを順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self.inner.iter_all(fetch_size)
+
+    def iter_by_project_id(
+        self,
+        project_id: UUID,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        プロジェクトに属するタスクを順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            project_id: 検索するプロジェクトID
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self.inner.iter_by_project_id(project_id, fetch_size)
+
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        ステータスに一致するタスクを順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self.inner.iter_by_status(status, fetch_size)
+
+    def count(
+        self,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """
+        タスク数を取得（委譲）
+
+        Args:
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            int: タスク数
+        """
+        return self.inner.count(project_id, status)
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        タスクの指定した項目だけを順に取得するイテレータ（委譲）
+
+        Args:
+            columns: 取得する項目名のリスト
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        """
+        return self.inner.iter_columns(columns, project_id, status, fetch_size)
+
+    def search(
+        self,
+        criteria: TaskSearchCriteria,
+        page: int = 0,
+        page_size: int = TASK_SEARCH_PAGE_SIZE
+    ) -> TaskSearchResult:
+        """
+        条件に一致するタスクを1ページ分検索（キャッシュを通さずに委譲）
+
+        Args:
+            criteria: 検索条件
+            page: ページ番号（0始まり）
+            page_size: 1ページの件数
+
+        Returns:
+            TaskSearchResult: 検索結果
+        """
+        return self.inner.search(criteria, page, page_size)
+
+    def delete(self, task_id: UUID) -> bool:
+        """
+        タスクの削除
+
+        Args:
+            task_id: 削除するタスクID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        deleted = self.inner.delete(task_id)
+        self._invalidate([task_id])
+        return deleted
+
+    def delete_many(self, task_ids: List[UUID]) -> int:
+        """
+        複数のタスクを一括削除
+
+        Args:
+            task_ids: 削除するタスクIDのリスト
+
+        Returns:
+            int: 削除されたタスク数
+        """
+        deleted = self.inner.delete_many(task_ids)
+        self._invalidate(task_ids)
+        return deleted
+
+    def projects_deleted(self, project_ids: List[UUID]) -> None:
+        """
+        プロジェクトの削除で連鎖して削除されたタスクを反映（委譲）
+
+        キャッシュのエントリは CachedProjectRepository の削除で破棄されます。
+
+        Args:
+            project_ids: 削除したプロジェクトIDのリスト
+        """
+        self.inner.projects_deleted(project_ids)
+
+    def _invalidate(self, task_ids: List[UUID]) -> None:
+        """
+        削除したタスクに関するエントリを破棄
+
+        所属プロジェクトが分からないタスクがある場合はタスク一覧をすべて破棄します。
+        時間記録も連鎖して削除されるため、時間記録の名前空間も破棄します。
+
+        Args:
+            task_ids: 削除したタスクIDのリスト
+        """
+        unknown_project = False
+        for task_id in task_ids:
+            known = self.identity_map.discard(task_id) or self.cache.peek(TASK, task_id)
+            self.cache.invalidate(TASK, task_id)
+            if known is None:
+                unknown_project = True
+            else:
+                self.cache.invalidate(PROJECT_TASKS, known.project_id)
+        if unknown_project:
+            self.cache.invalidate_namespace(PROJECT_TASKS)
+        self.cache.invalidate_namespace(TIME_RECORD)
+
+
+class CachedTimeRepository(TimeRepository):
+    """
+    時間記録リポジトリのキャッシュ付きデコレータ
+
+    共有キャッシュには find_by_id の結果のみを保持し、それ以外の検索は委譲します。
+    """
+
+    def __init__(self, inner: TimeRepository, cache: Optional[EntityCache] = None):
+        """
+        リポジトリの初期化
+
+        Args:
+            inner: 実際に永続化を行うリポジトリ
+            cache: 共有キャッシュ（省略時はアプリケーション既定のキャッシュ）
+        """
+        self.inner = inner
+        self.cache = cache if cache is not None else shared_entity_cache
+        self.identity_map = IdentityMap(_clone_time_record, self.cache.lock)
+
+    def save(self, time_record: TimeRecord) -> TimeRecord:
+        """
+        時間記録を保存
+
+        Args:
+            time_record: 保存する時間記録
+
+        Returns:
+            TimeRecord: 保存された時間記録
+        """
+        version = self.cache.current_version()
+        saved = self.inner.save(time_record)
+        self._write_through([saved], version)
+        return saved
+
+    def save_many(self, time_records: List[TimeRecord]) -> List[TimeRecord]:
+        """
+        複数の時間記録を一括保存
+
+        Args:
+            time_records: 保存する時間記録のリスト
+
+        Returns:
+            List[TimeRecord]: 保存された時間記録のリスト
+        """
+        version = self.cache.current_version()
+        saved = self.inner.save_many(time_records)
+        self._write_through(saved, version)
+        return saved
+
+    def start_record(
+        self,
+        time_record: TimeRecord,
+        resource: str = "",
+        wip_limit: Optional[int] = None,
+        known_active: Collection[UUID] = ()
+    ) -> Tuple[Optional[TimeRecord], List[UUID]]:
+        """
+        WIP制限の範囲で記録中の時間記録を保存（委譲し、保存した場合はキャッシュに反映）
+
+        Args:
+            time_record: 保存する記録中の時間記録
+            resource: タスクの担当者（空文字の場合は制限なし）
+            wip_limit: 担当者ごとに同時に記録中にできるタスク数（None の場合は制限なし）
+            known_active: 呼び出し側が把握している担当者の記録中のタスクID
+
+        Returns:
+            Tuple[Optional[TimeRecord], List[UUID]]: (記録中の時間記録, 担当者の記録中のタスクID)
+        """
+        version = self.cache.current_version()
+        record, running = self.inner.start_record(
+            time_record, resource, wip_limit, known_active
+        )
+        if record is time_record:
+            self._write_through([record], version)
+        elif record is not None:
+            record = self.identity_map.adopt(record)
+        return record, running
+
+    def _write_through(self, time_records: List[TimeRecord], version: int) -> None:
+        """
+        保存した時間記録を共有キャッシュとセッションに反映
+
+        Args:
+            time_records: 保存した時間記録のリスト
+            version: 保存前のキャッシュの版
+        """
+        for time_record in time_records:
+            snapshot = _clone_time_record(time_record)
+            self.cache.write(TIME_RECORD, time_record.id, snapshot, version)
+            self.identity_map.register(time_record)
+
+    def find_by_id(self, record_id: UUID) -> Optional[TimeRecord]:
+        """
+        IDによる時間記録の検索
+
+        Args:
+            record_id: 検索する記録ID
+
+        Returns:
+            Optional[TimeRecord]: 見つかった時間記録、存在しない場合はNone
+        """
+        time_record = self.identity_map.get(record_id)
+        if time_record is not None:
+            return time_record
+
+        snapshot = self.cache.get(TIME_RECORD, record_id)
+        if snapshot is not None:
+            return self.identity_map.adopt_snapshot(snapshot)
+
+        version = self.cache.current_version()
+        time_record = self.inner.find_by_id(record_id)
+        if time_record is None:
+            return None
+        self.cache.fill(
+            TIME_RECORD, record_id, _clone_time_record(time_record), version
+        )
+        return self.identity_map.adopt(time_record)
+
+    def find_all(self) -> List[TimeRecord]:
+        """
+        すべての時間記録を取得（キャッシュせずに委譲）
+
+        Returns:
+            List[TimeRecord]: 時間記録のリスト
+        """
+        return [self.identity_map.adopt(record) for record in self.inner.find_all()]
+
+    def find_by_task_id(self, task_id: UUID) -> List[TimeRecord]:
+        """
+        タスクIDによる時間記録の検索（キャッシュせずに委譲）
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            List[TimeRecord]: 条件に一致する時間記録のリスト
+        """
+        return [
+            self.identity_map.adopt(record)
+            for record in self.inner.find_by_task_id(task_id)
+        ]
+
+    def find_by_task_ids(self, task_ids: Sequence[UUID]) -> List[TimeRecord]:
+        """
+        複数のタスクIDによる時間記録の一括検索（キャッシュせずに委譲）
+
+        Args:
+            task_ids: 検索するタスクIDのリスト
+
+        Returns:
+            List[TimeRecord]: いずれかのタスクに属する時間記録のリスト
+        """
+        return [
+            self.identity_map.adopt(record)
+            for record in self.inner.find_by_task_ids(task_ids)
+        ]
+
+    def find_active_record(self, task_id: UUID) -> Optional[TimeRecord]:
+        """
+        タスクIDによるアクティブな時間記録の検索（キャッシュせずに委譲）
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            Optional[TimeRecord]: 見つかったアクティブな時間記録、存在しない場合はNone
+        """
+        time_record = self.inner.find_active_record(task_id)
+        return self.identity_map.adopt(time_record) if time_record else None
+
+    def find_active_records(self) -> List[TimeRecord]:
+        """
+        すべてのアクティブな時間記録を取得（キャッシュせずに委譲）
+
+        Returns:
+            List[TimeRecord]: アクティブな時間記録のリスト（開始時刻順）
+        """
+        return [
+            self.identity_map.adopt(record)
+            for record in self.inner.find_active_records()
+        ]
+
+    def find_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[TimeRecord]:
+        """
+        日付範囲による時間記録の検索（キャッシュせずに委譲）
+
+        Args:
+            start_date: 検索開始日
+            end_date: 検索終了日
+
+        Returns:
+            List[TimeRecord]: 条件に一致する時間記録のリスト
+        """
+        return [
+            self.identity_map.adopt(record)
+            for record in self.inner.find_by_date_range(start_date, end_date)
+        ]
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[TimeRecord]:
+        """
+        すべての時間記録を順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return self.inner.iter_all(fetch_size)
+
+    def iter_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[TimeRecord]:
+        """
+        開始時刻が日付範囲内の時間記録を順に取得するイテレータ（キャッシュを通さずに委譲）
+
+        Args:
+            start_date: 検索開始日
+            end_date: 検索終了日
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return self.inner.iter_by_date_range(start_date, end_date, fetch_size)
+
+    def count(
+        self,
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        時間記録数を取得（委譲）
+
+        Args:
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 開始時刻の下限（省略時は制限なし）
+            end_date: 開始時刻の上限（省略時は制限なし）
+
+        Returns:
+            int: 時間記録数
+        """
+        return self.inner.count(task_id, start_date, end_date)
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        時間記録の指定した項目だけを順に取得するイテレータ（委譲）
+
+        Args:
+            columns: 取得する項目名のリスト
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 開始時刻の下限（省略時は制限なし）
+            end_date: 開始時刻の上限（省略時は制限なし）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        """
+        return self.inner.iter_columns(
+            columns, task_id, start_date, end_date, fetch_size
+        )
+
+    def aggregate_hours(
+        self,
+        scope: str,
+        start_date: date,
+        end_date: date,
+        granularity: str = GRANULARITY_DAY,
+        keys: Optional[Sequence[Union[UUID, str]]] = None
+    ) -> List[TimeRollup]:
+        """
+        期間内の作業時間を集計区間ごとに取得（委譲）
+
+        Args:
+            scope: 集計の単位（"task"、"project" または "category"）
+            start_date: 期間の開始日
+            end_date: 期間の終了日
+            granularity: 集計の粒度（"day" または "week"）
+            keys: 集計対象（省略時はすべて）
+
+        Returns:
+            List[TimeRollup]: 集計対象・区間順の作業時間集計
+        """
+        return self.inner.aggregate_hours(
+            scope, start_date, end_date, granularity, keys
+        )
+
+    def delete(self, record_id: UUID) -> bool:
+        """
+        時間記録の削除
+
+        Args:
+            record_id: 削除する記録ID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        deleted = self.inner.delete(record_id)
+        self._invalidate([record_id])
+        return deleted
+
+    def delete_many(self, record_ids: List[UUID]) -> int:
+        """
+        複数の時間記録を一括削除
+
+        Args:
+            record_ids: 削除する記録IDのリスト
+
+        Returns:
+            int: 削除された時間記録数
+        """
+        deleted = self.inner.delete_many(record_ids)
+        self._invalidate(record_ids)
+        return deleted
+
+    def _invalidate(self, record_ids: List[UUID]) -> None:
+        """
+        削除した時間記録のエントリを破棄
+
+        Args:
+            record_ids: 削除した記録IDのリスト
+        """
+        for record_id in record_ids:
+            self.cache.invalidate(TIME_RECORD, record_id)
+            self.identity_map.discard(record_id)
@@ -0,0 +1,274 @@
+"""
+類似タスクインデックスを更新するタスクリポジトリのデコレータ
+"""
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ccpm.config import TASK_SEARCH_PAGE_SIZE
+from ccpm.domain.entities.task import Task
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.services.similar_task_index import INDEX_COLUMNS, SimilarTaskIndex
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria, TaskSearchResult
+
+
+class IndexedTaskRepository(TaskRepository):
+    """
+    タスクの保存・削除を類似タスクインデックスに反映するタスクリポジトリのデコレータ
+
+    保存・削除が成功した後に、対象のタスクだけをインデックスに反映します。
+    プロジェクトの削除で連鎖して削除されたタスクは、projects_deleted を呼び出すと
+    インデックスの枠ごとに記録した所属プロジェクトから取り除かれます。
+    """
+
+    def __init__(self, inner: TaskRepository, index: Optional[SimilarTaskIndex] = None):
+        """
+        リポジトリの初期化
+
+        Args:
+            inner: 実際に永続化を行うリポジトリ
+            index: 類似タスクインデックス（省略時は inner の完了タスクから構築）
+        """
+        self.inner = inner
+        self.index = index if index is not None else self._build_index()
+
+    def _build_index(self) -> SimilarTaskIndex:
+        """
+        完了タスクを順に読み込んでインデックスを構築
+
+        Returns:
+            SimilarTaskIndex: 構築したインデックス
+        """
+        return SimilarTaskIndex.build(
+            self.inner.iter_columns(INDEX_COLUMNS, status="完了")
+        )
+
+    def rebuild_index(self) -> None:
+        """完了タスクからインデックスを作り直す"""
+        self.index = self._build_index()
+
+    def save(self, task: Task) -> Task:
+        """
+        タスクを保存
+
+        Args:
+            task: 保存するタスク
+
+        Returns:
+            Task: 保存されたタスク
+        """
+        saved = self.inner.save(task)
+        self.index.update([saved])
+        return saved
+
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        複数のタスクを一括保存
+
+        Args:
+            tasks: 保存するタスクのリスト
+
+        Returns:
+            List[Task]: 保存されたタスクのリスト
+        """
+        saved = self.inner.save_many(tasks)
+        self.index.update(saved)
+        return saved
+
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        """
+        IDによるタスクの検索（委譲）
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            Optional[Task]: 見つかったタスク、存在しない場合はNone
+        """
+        return self.inner.find_by_id(task_id)
+
+    def find_all(self) -> List[Task]:
+        """
+        すべてのタスクを取得（委譲）
+
+        Returns:
+            List[Task]: タスクのリスト
+        """
+        return self.inner.find_all()
+
+    def find_by_project_id(self, project_id: UUID) -> List[Task]:
+        """
+        プロジェクトIDによるタスクの検索（委譲）
+
+        Args:
+            project_id: 検索するプロジェクトID
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        return self.inner.find_by_project_id(project_id)
+
+    def find_by_status(self, status: str) -> List[Task]:
+        """
+        ステータスによるタスクの検索（委譲）
+
+        Args:
+            status: 検索するステータス
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        return self.inner.find_by_status(status)
+
+    def find_by_project_and_status(self, project_id: UUID, status: str) -> List[Task]:
+        """
+        プロジェクトIDとステータスによるタスクの検索（委譲）
+
+        Args:
+            project_id: 検索するプロジェクトID
+            status: 検索するステータス
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        return self.inner.find_by_project_and_status(project_id, status)
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Task]:
+        """
+        すべてのタスクを順に取得するイテレータ（委譲）
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self.inner.iter_all(fetch_size)
+
+    def iter_by_project_id(
+        self,
+        project_id: UUID,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        プロジェクトに属するタスクを順に取得するイテレータ（委譲）
+
+        Args:
+            project_id: 検索するプロジェクトID
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self.inner.iter_by_project_id(project_id, fetch_size)
+
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        ステータスに一致するタスクを順に取得するイテレータ（委譲）
+
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self.inner.iter_by_status(status, fetch_size)
+
+    def count(
+        self,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """
+        タスク数を取得（委譲）
+
+        Args:
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            int: タスク数
+        """
+        return self.inner.count(project_id, status)
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        タスクの指定した項目だけを順に取得するイテレータ（委譲）
+
+        Args:
+            columns: 取得する項目名のリスト
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した項目の値のタプルのイテレータ
+        """
+        return self.inner.iter_columns(columns, project_id, status, fetch_size)
+
+    def search(
+        self,
+        criteria: TaskSearchCriteria,
+        page: int = 0,
+        page_size: int = TASK_SEARCH_PAGE_SIZE
+    ) -> TaskSearchResult:
+        """
+        条件に一致するタスクを1ページ分検索（委譲）
+
+        Args:
+            criteria: 検索条件
+            page: ページ番号（0始まり）
+            page_size: 1ページの件数
+
+        Returns:
+            TaskSearchResult: 検索結果
+        """
+        return self.inner.search(criteria, page, page_size)
+
+    def delete(self, task_id: UUID) -> bool:
+        """
+        タスクの削除
+
+        Args:
+            task_id: 削除するタスクID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        deleted = self.inner.delete(task_id)
+        self.index.remove([task_id])
+        return deleted
+
+    def delete_many(self, task_ids: List[UUID]) -> int:
+        """
+        複数のタスクを一括削除
+
+        Args:
+            task_ids: 削除するタスクIDのリスト
+
+        Returns:
+            int: 削除されたタスク数
+        """
+        deleted = self.inner.delete_many(task_ids)
+        self.index.remove(task_ids)
+        return deleted
+
+    def projects_deleted(self, project_ids: List[UUID]) -> None:
+        """
+        プロジェクトの削除で連鎖して削除されたタスクをインデックスから除く
+
+        Args:
+            project_ids: 削除したプロジェクトIDのリスト
+        """
+        self.inner.projects_deleted(project_ids)
+        self.index.remove_projects(project_ids)
@@ -0,0 +1,134 @@
+"""
+SQLAlchemyによるバッファ履歴リポジトリの実装
+"""
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from ccpm.domain.repositories.buffer_history_repository import BufferHistoryRepository
+from ccpm.domain.value_objects.buffer_history import (
+    EVENT_PROGRESS,
+    BufferEvent,
+    BufferState,
+)
+from ccpm.infrastructure.db.buffer_history import (
+    append_buffer_changes,
+    load_daily_states,
+    load_events,
+    load_latest_states,
+    load_state_as_of,
+)
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+
+
+class SqliteBufferHistoryRepository(BufferHistoryRepository):
+    """
+    SQLiteにバッファ変更イベントと日次スナップショットを永続化するリポジトリ
+    """
+
+    def __init__(self, db: DatabaseManager):
+        """
+        リポジトリの初期化
+
+        Args:
+            db: データベース管理
+        """
+        self.db = db
+
+    def record_progress(
+        self,
+        project_id: UUID,
+        completion: float,
+        occurred_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        クリティカルチェーンの完了率の変更を記録
+
+        Args:
+            project_id: プロジェクトID
+            completion: 完了率（0.0〜1.0）
+            occurred_at: 発生日時（省略時は現在日時）
+
+        Returns:
+            bool: 記録した場合はTrue、完了率が変わっていない場合はFalse
+
+        Raises:
+            ValueError: 最後のイベントより前の日時の場合
+        """
+        change = (
+            project_id,
+            EVENT_PROGRESS,
+            occurred_at or datetime.now(),
+            0.0,
+            0.0,
+            completion,
+        )
+        with self.db.engine.begin() as conn:
+            return append_buffer_changes(conn, [change]) > 0
+
+    def find_events(
+        self,
+        project_id: UUID,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[BufferEvent]:
+        """
+        プロジェクトのバッファ変更イベントを発生日時順に取得
+
+        Args:
+            project_id: プロジェクトID
+            start: 開始日時（省略時は制限なし）
+            end: 終了日時（省略時は制限なし）
+
+        Returns:
+            List[BufferEvent]: バッファ変更イベントのリスト
+        """
+        with self.db.engine.connect() as conn:
+            return load_events(conn, project_id, start, end)
+
+    def state_as_of(self, project_id: UUID, at: datetime) -> Optional[BufferState]:
+        """
+        指定日時の時点のバッファの状態を取得（インデックスによる1行の検索）
+
+        Args:
+            project_id: プロジェクトID
+            at: 時点
+
+        Returns:
+            Optional[BufferState]: バッファの状態、その時点までにイベントがない場合はNone
+        """
+        with self.db.engine.connect() as conn:
+            return load_state_as_of(conn, project_id, at)
+
+    def daily_states(
+        self,
+        project_id: UUID,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> List[BufferState]:
+        """
+        プロジェクトの日ごとの最後の状態を日次スナップショットから取得
+
+        Args:
+            project_id: プロジェクトID
+            start: 開始日（省略時は制限なし）
+            end: 終了日（省略時は制限なし）
+
+        Returns:
+            List[BufferState]: 日ごとの状態のリスト
+        """
+        with self.db.engine.connect() as conn:
+            return load_daily_states(conn, project_id, start, end)
+
+    def latest_states(self, project_ids: Sequence[UUID]) -> Dict[UUID, BufferState]:
+        """
+        プロジェクトごとの現在のバッファの状態を最新の日次スナップショットから取得
+
+        Args:
+            project_ids: 対象のプロジェクトIDのリスト
+
+        Returns:
+            Dict[UUID, BufferState]: プロジェクトIDごとの状態（イベントのないプロジェクトは含まない）
+        """
+        with self.db.engine.connect() as conn:
+            return load_latest_states(conn, project_ids)
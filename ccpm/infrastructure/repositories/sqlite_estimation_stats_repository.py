@@ -0,0 +1,70 @@
+"""
+SQLAlchemyによる見積り統計リポジトリの実装
+"""
+from typing import Dict, List, Optional, Sequence
+
+from ccpm.domain.repositories.estimation_stats_repository import (
+    EstimationStatsRepository,
+)
+from ccpm.domain.value_objects.estimation_accuracy import EstimationStats, StatsKey
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.db.estimation_stats import (
+    load_estimation_stats,
+    query_estimation_stats,
+    rebuild_estimation_stats,
+)
+
+
+class SqliteEstimationStatsRepository(EstimationStatsRepository):
+    """
+    SQLiteの統計テーブルから予実比率の統計を取得するリポジトリ
+    """
+
+    def __init__(self, db: DatabaseManager):
+        """
+        リポジトリの初期化
+
+        Args:
+            db: データベース管理
+        """
+        self.db = db
+
+    def find_many(self, keys: Sequence[StatsKey]) -> Dict[StatsKey, EstimationStats]:
+        """
+        指定した単位の統計を取得
+
+        Args:
+            keys: 統計のキー（単位, 担当者, カテゴリまたはタグ）のリスト
+
+        Returns:
+            Dict[StatsKey, EstimationStats]: キーごとの統計（標本のない単位は含まない）
+        """
+        with self.db.engine.connect() as conn:
+            return load_estimation_stats(conn, keys)
+
+    def find_all(
+        self,
+        scope: Optional[str] = None,
+        resource: Optional[str] = None,
+        min_count: int = 0
+    ) -> List[EstimationStats]:
+        """
+        条件に一致する統計を件数の多い順に取得
+
+        Args:
+            scope: 統計の単位（省略時はすべて）
+            resource: 担当者（省略時はすべて）
+            min_count: 最小件数
+
+        Returns:
+            List[EstimationStats]: 統計のリスト
+        """
+        with self.db.engine.connect() as conn:
+            return query_estimation_stats(conn, scope, resource, min_count)
+
+    def rebuild(self) -> None:
+        """
+        完了タスクから統計を作り直す
+        """
+        with self.db.engine.begin() as conn:
+            rebuild_estimation_stats(conn)
@@ -0,0 +1,386 @@
+"""
+SQLAlchemyによるプロジェクトリポジトリの実装
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Row, delete, func, literal_column, select, true
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.repositories.project_repository import ProjectRepository
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+from ccpm.infrastructure.db.buffer_history import (
+    append_buffer_changes,
+    load_project_buffers,
+    project_buffer_changes,
+)
+from ccpm.infrastructure.db.db_manager import (
+    DatabaseManager,
+    chunked,
+    execute_many,
+    iter_keyset,
+    select_columns,
+)
+from ccpm.infrastructure.db.estimation_stats import (
+    load_samples,
+    move_task_samples,
+    rebuild_estimation_stats,
+)
+from ccpm.infrastructure.db.project_revision import (
+    bump_project_revisions,
+    load_project_revisions,
+)
+from ccpm.infrastructure.db.schema import projects
+from ccpm.infrastructure.db.time_rollup import load_placements, move_task_contributions
+
+
+class SqliteProjectRepository(ProjectRepository):
+    """
+    SQLiteにプロジェクトを永続化するリポジトリ
+    """
+
+    def __init__(self, db: DatabaseManager):
+        """
+        リポジトリの初期化
+
+        Args:
+            db: データベース管理
+        """
+        self.db = db
+
+    @staticmethod
+    def _to_row(project: Project) -> Dict[str, Any]:
+        """
+        プロジェクトをテーブル行に変換
+
+        Args:
+            project: プロジェクト
+
+        Returns:
+            Dict[str, Any]: テーブル行
+        """
+        return {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "start_date": project.start_date,
+            "planned_end_date": project.planned_end_date,
+            "actual_end_date": project.actual_end_date,
+            "status": project.status,
+            "buffer_size": project.buffer_size,
+            "buffer_consumed": project.buffer_consumed,
+            "critical_chain": [str(task_id) for task_id in project.critical_chain],
+            "feeding_buffers": [buffer.to_dict() for buffer in project.feeding_buffers],
+            "created_at": project.created_at,
+            "updated_at": project.updated_at,
+        }
+
+    @staticmethod
+    def _to_entity(row: Row) -> Project:
+        """
+        テーブル行をプロジェクトに変換
+
+        Args:
+            row: テーブル行
+
+        Returns:
+            Project: プロジェクト
+        """
+        project = Project(
+            name=row.name,
+            description=row.description,
+            start_date=row.start_date,
+            planned_end_date=row.planned_end_date,
+            actual_end_date=row.actual_end_date,
+            status=row.status,
+            buffer_size=row.buffer_size,
+            buffer_consumed=row.buffer_consumed,
+            feeding_buffers=[
+                FeedingBuffer.from_dict(buffer) for buffer in row.feeding_buffers
+            ],
+            id=row.id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        project.critical_chain = [UUID(task_id) for task_id in row.critical_chain]
+        return project
+
+    def save(self, project: Project) -> Project:
+        """
+        プロジェクトを保存
+
+        Args:
+            project: 保存するプロジェクト
+
+        Returns:
+            Project: 保存されたプロジェクト
+        """
+        self.save_many([project])
+        return project
+
+    def save_many(self, projects_to_save: List[Project]) -> List[Project]:
+        """
+        複数のプロジェクトを1トランザクションで一括保存（UPSERT）
+
+        バッファサイズ・消費済みバッファが変わったプロジェクトは、同じトランザクションで
+        バッファ変更イベントを記録します。
+
+        Args:
+            projects_to_save: 保存するプロジェクトのリスト
+
+        Returns:
+            List[Project]: 保存されたプロジェクトのリスト
+        """
+        if not projects_to_save:
+            return []
+
+        statement = insert(projects)
+        statement = statement.on_conflict_do_update(
+            index_elements=[projects.c.id],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in projects.columns if column.name != "id"
+            },
+        )
+        project_ids = [project.id for project in projects_to_save]
+        with self.db.engine.begin() as conn:
+            old_buffers = load_project_buffers(conn, project_ids)
+            execute_many(
+                conn, statement, [self._to_row(project) for project in projects_to_save]
+            )
+            bump_project_revisions(conn, project_ids)
+            append_buffer_changes(
+                conn,
+                project_buffer_changes(
+                    old_buffers,
+                    {
+                        project.id: (project.buffer_size, project.buffer_consumed)
+                        for project in projects_to_save
+                    },
+                    datetime.now(),
+                ),
+                clamp_time=True,
+                baselines=old_buffers,
+            )
+        return projects_to_save
+
+    def find_by_id(self, project_id: UUID) -> Optional[Project]:
+        """
+        IDによるプロジェクトの検索
+
+        Args:
+            project_id: 検索するプロジェクトID
+
+        Returns:
+            Optional[Project]: 見つかったプロジェクト、存在しない場合はNone
+        """
+        with self.db.engine.connect() as conn:
+            row = conn.execute(
+                select(projects).where(projects.c.id == project_id)
+            ).first()
+        return self._to_entity(row) if row else None
+
+    def find_all(self) -> List[Project]:
+        """
+        すべてのプロジェクトを取得
+
+        Returns:
+            List[Project]: プロジェクトのリスト
+        """
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(select(projects).order_by(projects.c.created_at)).all()
+        return [self._to_entity(row) for row in rows]
+
+    def find_by_status(self, status: str) -> List[Project]:
+        """
+        ステータスによるプロジェクトの検索
+
+        Args:
+            status: 検索するステータス
+
+        Returns:
+            List[Project]: 条件に一致するプロジェクトのリスト
+        """
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(
+                select(projects)
+                .where(projects.c.status == status)
+                .order_by(projects.c.created_at)
+            ).all()
+        return [self._to_entity(row) for row in rows]
+
+    @staticmethod
+    def _condition(status: Optional[str]) -> ColumnElement[bool]:
+        """
+        ステータスによる絞り込み条件を作成
+
+        Args:
+            status: 絞り込むステータス（None の場合は条件なし）
+
+        Returns:
+            ColumnElement[bool]: 検索条件
+        """
+        return true() if status is None else projects.c.status == status
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Project]:
+        """
+        すべてのプロジェクトを作成日時順に取得するイテレータ
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return self._iter(self._condition(None), fetch_size)
+
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Project]:
+        """
+        ステータスに一致するプロジェクトを作成日時順に取得するイテレータ
+
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return self._iter(self._condition(status), fetch_size)
+
+    def _iter(
+        self,
+        condition: ColumnElement[bool],
+        fetch_size: Optional[int]
+    ) -> Iterator[Project]:
+        """
+        条件に一致するプロジェクトをキーセットページネーションで取得
+
+        Args:
+            condition: 検索条件
+            fetch_size: 1回の読み込み件数
+
+        Returns:
+            Iterator[Project]: プロジェクトのイテレータ
+        """
+        return iter_keyset(
+            self.db.engine,
+            select(projects).where(condition),
+            [projects.c.created_at, literal_column("projects.rowid")],
+            lambda conn, rows: [self._to_entity(row) for row in rows],
+            fetch_size,
+        )
+
+    def count(self, status: Optional[str] = None) -> int:
+        """
+        プロジェクト数を取得
+
+        Args:
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            int: プロジェクト数
+        """
+        with self.db.engine.connect() as conn:
+            return conn.execute(
+                select(func.count())
+                .select_from(projects)
+                .where(self._condition(status))
+            ).scalar_one()
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        プロジェクトの指定した列だけを作成日時順に取得するイテレータ
+
+        critical_chain と feeding_buffers はJSONの値（文字列・辞書のリスト）のまま返します。
+
+        Args:
+            columns: 取得する列名のリスト
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した列の値のタプルのイテレータ
+
+        Raises:
+            ValueError: 存在しない列名が指定された場合
+        """
+        selected = select_columns(projects, columns)
+        width = len(selected)
+        return iter_keyset(
+            self.db.engine,
+            select(*selected).where(self._condition(status)),
+            [projects.c.created_at, literal_column("projects.rowid")],
+            lambda conn, rows: [tuple(row[:width]) for row in rows],
+            fetch_size,
+        )
+
+    def find_revisions(
+        self,
+        project_ids: Optional[Sequence[UUID]] = None
+    ) -> Dict[UUID, int]:
+        """
+        プロジェクトの変更リビジョンを取得
+
+        Args:
+            project_ids: 対象のプロジェクトIDのリスト（省略時はすべて）
+
+        Returns:
+            Dict[UUID, int]: プロジェクトIDごとのリビジョン
+        """
+        with self.db.engine.connect() as conn:
+            return load_project_revisions(conn, project_ids)
+
+    def delete(self, project_id: UUID) -> bool:
+        """
+        プロジェクトの削除（所属タスクも削除されます）
+
+        Args:
+            project_id: 削除するプロジェクトID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        return self.delete_many([project_id]) > 0
+
+    def delete_many(self, project_ids: List[UUID]) -> int:
+        """
+        複数のプロジェクトを1トランザクションで一括削除
+
+        Args:
+            project_ids: 削除するプロジェクトIDのリスト
+
+        Returns:
+            int: 削除されたプロジェクト数
+        """
+        deleted = 0
+        with self.db.engine.begin() as conn:
+            placements = load_placements(conn, project_ids=project_ids)
+            move_task_contributions(
+                conn,
+                {
+                    task_id: (placement, None)
+                    for task_id, placement in placements.items()
+                },
+            )
+            # 所属タスクはカスケード削除されるため、予実比率の統計から先に取り消す
+            stats_consistent = move_task_samples(
+                conn, load_samples(conn, list(placements)), {}
+            )
+            for chunk in chunked(project_ids):
+                result = conn.execute(delete(projects).where(projects.c.id.in_(chunk)))
+                deleted += result.rowcount
+        if not stats_consistent:
+            with self.db.engine.begin() as conn:
+                rebuild_estimation_stats(conn)
+        return deleted
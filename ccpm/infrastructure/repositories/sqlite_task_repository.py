@@ -0,0 +1,644 @@
+"""
+SQLAlchemyによるタスクリポジトリの実装
+"""
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Row,
+    Select,
+    String,
+    delete,
+    func,
+    literal_column,
+    select,
+    true,
+    type_coerce,
+)
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.config import TASK_SEARCH_PAGE_SIZE
+from ccpm.domain.entities.task import Task
+from ccpm.domain.repositories.task_repository import TaskRepository
+from ccpm.domain.value_objects.pagination import check_page
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria, TaskSearchResult
+from ccpm.infrastructure.db.db_manager import (
+    DatabaseManager,
+    chunked,
+    execute_many,
+    iter_keyset,
+    select_columns,
+)
+from ccpm.infrastructure.db.estimation_stats import (
+    Sample,
+    load_samples,
+    move_task_samples,
+    rebuild_estimation_stats,
+    task_sample,
+)
+from ccpm.infrastructure.db.project_revision import bump_project_revisions
+from ccpm.infrastructure.db.schema import task_dependencies, task_tags, tasks
+from ccpm.infrastructure.db.task_search import search_source
+from ccpm.infrastructure.db.time_rollup import (
+    Placement,
+    load_placements,
+    move_task_contributions,
+)
+
+
+class SqliteTaskRepository(TaskRepository):
+    """
+    SQLiteにタスクを永続化するリポジトリ
+
+    依存関係は task_dependencies 結合テーブルに Task.dependencies の並び順付きで保存します。
+    タグは tasks.tags に加えて、絞り込み用に task_tags テーブルにも保存します。
+    """
+
+    def __init__(self, db: DatabaseManager):
+        """
+        リポジトリの初期化
+
+        Args:
+            db: データベース管理
+        """
+        self.db = db
+
+    @staticmethod
+    def _to_row(task: Task) -> Dict[str, Any]:
+        """
+        タスクをテーブル行に変換
+
+        Args:
+            task: タスク
+
+        Returns:
+            Dict[str, Any]: テーブル行
+        """
+        return {
+            "id": task.id,
+            "project_id": task.project_id,
+            "name": task.name,
+            "description": task.description,
+            "status": task.status,
+            "priority": task.priority,
+            "estimated_hours": task.estimated_hours,
+            "actual_hours": task.actual_hours,
+            "start_date": task.start_date,
+            "end_date": task.end_date,
+            "category": task.category,
+            "tags": task.tags,
+            "resource": task.resource,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+
+    @staticmethod
+    def _to_entity(row: Row, dependencies: List[UUID]) -> Task:
+        """
+        テーブル行をタスクに変換
+
+        Args:
+            row: テーブル行
+            dependencies: 依存タスクIDのリスト
+
+        Returns:
+            Task: タスク
+        """
+        return Task(
+            name=row.name,
+            project_id=row.project_id,
+            description=row.description,
+            status=row.status,
+            priority=row.priority,
+            estimated_hours=row.estimated_hours,
+            actual_hours=row.actual_hours,
+            dependencies=dependencies,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            category=row.category,
+            tags=row.tags,
+            resource=row.resource,
+            id=row.id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def _load(self, conn: Connection, condition: ColumnElement[bool]) -> List[Task]:
+        """
+        条件に一致するタスクを依存関係とともに読み込み
+
+        タスク行と依存関係行をそれぞれ1回のクエリで取得し、Python側で結合します。
+
+        Args:
+            conn: データベース接続
+            condition: tasks テーブルに対する検索条件
+
+        Returns:
+            List[Task]: 作成日時順のタスクリスト
+        """
+        rows = conn.execute(
+            select(tasks)
+            .where(condition)
+            .order_by(tasks.c.created_at, literal_column("tasks.rowid"))
+        ).all()
+        if not rows:
+            return []
+
+        dependency_rows = conn.execute(
+            self._dependency_query(
+                task_dependencies.c.task_id.in_(select(tasks.c.id).where(condition))
+            )
+        ).all()
+        return self._to_entities(rows, dependency_rows)
+
+    def _load_page(self, conn: Connection, rows: Sequence[Row]) -> List[Task]:
+        """
+        読み込み済みのタスク行に依存関係を結合してタスクに変換
+
+        Args:
+            conn: データベース接続
+            rows: タスク行のリスト
+
+        Returns:
+            List[Task]: タスクリスト
+        """
+        dependency_rows: List[Row] = []
+        for chunk in chunked([row.id for row in rows]):
+            dependency_rows.extend(
+                conn.execute(
+                    self._dependency_query(task_dependencies.c.task_id.in_(chunk))
+                ).all()
+            )
+        return self._to_entities(rows, dependency_rows)
+
+    @staticmethod
+    def _dependency_query(condition: ColumnElement[bool]) -> Select:
+        """
+        依存関係行を取得するクエリを作成
+
+        IDは文字列のまま取得し、UUIDへの変換を読み込み済みタスクと共有できるようにします。
+
+        Args:
+            condition: task_dependencies テーブルに対する検索条件
+
+        Returns:
+            Select: 依存関係行（タスクID, 依存先タスクID）を並び順どおりに返すクエリ
+        """
+        return (
+            select(
+                type_coerce(task_dependencies.c.task_id, String),
+                type_coerce(task_dependencies.c.depends_on_id, String),
+            )
+            .where(condition)
+            .order_by(task_dependencies.c.task_id, task_dependencies.c.position)
+        )
+
+    def _to_entities(
+        self,
+        rows: Sequence[Row],
+        dependency_rows: Sequence[Row]
+    ) -> List[Task]:
+        """
+        タスク行と依存関係行をタスクに変換
+
+        Args:
+            rows: タスク行のリスト
+            dependency_rows: 依存関係行のリスト
+
+        Returns:
+            List[Task]: タスクリスト
+        """
+        # 依存先が読み込み済みのタスクであれば、そのUUIDを使い回す
+        known = {row.id.hex: row.id for row in rows}
+        dependencies: Dict[str, List[UUID]] = {}
+        for task_hex, depends_on_hex in dependency_rows:
+            depends_on_id = known.get(depends_on_hex)
+            if depends_on_id is None:
+                depends_on_id = known[depends_on_hex] = UUID(depends_on_hex)
+            dependencies.setdefault(task_hex, []).append(depends_on_id)
+
+        return [self._to_entity(row, dependencies.get(row.id.hex, [])) for row in rows]
+
+    @staticmethod
+    def _samples(tasks_to_save: List[Task]) -> Dict[UUID, Sample]:
+        """
+        保存するタスクのうち予実比率の統計に寄与するものの標本を作成
+
+        Args:
+            tasks_to_save: 保存するタスクのリスト
+
+        Returns:
+            Dict[UUID, Sample]: タスクIDごとの標本
+        """
+        samples: Dict[UUID, Sample] = {}
+        for task in tasks_to_save:
+            sample = task_sample(
+                task.status,
+                task.estimated_hours,
+                task.actual_hours,
+                task.resource,
+                task.category,
+                task.tags,
+            )
+            if sample is not None:
+                samples[task.id] = sample
+        return samples
+
+    def save(self, task: Task) -> Task:
+        """
+        タスクを保存
+
+        Args:
+            task: 保存するタスク
+
+        Returns:
+            Task: 保存されたタスク
+        """
+        self.save_many([task])
+        return task
+
+    def save_many(self, tasks_to_save: List[Task]) -> List[Task]:
+        """
+        複数のタスクを1トランザクションで一括保存（UPSERT）
+
+        タスク行と依存関係行はそれぞれ executemany でまとめて書き込みます。
+        完了状態・工数・担当者などが変わったタスクは予実比率の統計を同じトランザクションで更新します。
+
+        Args:
+            tasks_to_save: 保存するタスクのリスト
+
+        Returns:
+            List[Task]: 保存されたタスクのリスト
+        """
+        if not tasks_to_save:
+            return []
+
+        statement = insert(tasks)
+        statement = statement.on_conflict_do_update(
+            index_elements=[tasks.c.id],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in tasks.columns if column.name != "id"
+            },
+        )
+        dependency_rows = [
+            {"task_id": task.id, "depends_on_id": dep_id, "position": position}
+            for task in tasks_to_save
+            for position, dep_id in enumerate(dict.fromkeys(task.dependencies))
+        ]
+        tag_rows = [
+            {"task_id": task.id, "tag": tag}
+            for task in tasks_to_save
+            for tag in dict.fromkeys(task.tags)
+        ]
+
+        with self.db.engine.begin() as conn:
+            # プロジェクトやカテゴリが変わったタスクは作業時間集計を付け替える
+            placements = load_placements(conn, [task.id for task in tasks_to_save])
+            old_samples = load_samples(conn, [task.id for task in tasks_to_save])
+            moves: Dict[UUID, Tuple[Placement, Optional[Placement]]] = {
+                task.id: (placements[task.id], (task.project_id, task.category))
+                for task in tasks_to_save
+                if task.id in placements
+                and placements[task.id] != (task.project_id, task.category)
+            }
+            execute_many(
+                conn, statement, [self._to_row(task) for task in tasks_to_save]
+            )
+            for chunk in chunked([task.id for task in tasks_to_save]):
+                conn.execute(
+                    delete(task_dependencies).where(
+                        task_dependencies.c.task_id.in_(chunk)
+                    )
+                )
+                conn.execute(delete(task_tags).where(task_tags.c.task_id.in_(chunk)))
+            if dependency_rows:
+                execute_many(conn, insert(task_dependencies), dependency_rows)
+            if tag_rows:
+                execute_many(conn, insert(task_tags), tag_rows)
+            move_task_contributions(conn, moves)
+            stats_consistent = move_task_samples(
+                conn, old_samples, self._samples(tasks_to_save)
+            )
+            bump_project_revisions(
+                conn,
+                [task.project_id for task in tasks_to_save]
+                + [old[0] for old, _ in moves.values()],
+            )
+        if not stats_consistent:
+            self._rebuild_estimation_stats()
+        return tasks_to_save
+
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        """
+        IDによるタスクの検索
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            Optional[Task]: 見つかったタスク、存在しない場合はNone
+        """
+        with self.db.engine.connect() as conn:
+            found = self._load(conn, tasks.c.id == task_id)
+        return found[0] if found else None
+
+    def find_all(self) -> List[Task]:
+        """
+        すべてのタスクを取得
+
+        Returns:
+            List[Task]: タスクのリスト
+        """
+        with self.db.engine.connect() as conn:
+            return self._load(conn, true())
+
+    def find_by_project_id(self, project_id: UUID) -> List[Task]:
+        """
+        プロジェクトIDによるタスクの検索
+
+        Args:
+            project_id: 検索するプロジェクトID
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        with self.db.engine.connect() as conn:
+            return self._load(conn, tasks.c.project_id == project_id)
+
+    def find_by_status(self, status: str) -> List[Task]:
+        """
+        ステータスによるタスクの検索
+
+        Args:
+            status: 検索するステータス
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        with self.db.engine.connect() as conn:
+            return self._load(conn, tasks.c.status == status)
+
+    def find_by_project_and_status(self, project_id: UUID, status: str) -> List[Task]:
+        """
+        プロジェクトIDとステータスによるタスクの検索
+
+        Args:
+            project_id: 検索するプロジェクトID
+            status: 検索するステータス
+
+        Returns:
+            List[Task]: 条件に一致するタスクのリスト
+        """
+        with self.db.engine.connect() as conn:
+            return self._load(
+                conn, (tasks.c.project_id == project_id) & (tasks.c.status == status)
+            )
+
+    @staticmethod
+    def _condition(
+        project_id: Optional[UUID],
+        status: Optional[str]
+    ) -> ColumnElement[bool]:
+        """
+        プロジェクトIDとステータスによる絞り込み条件を作成
+
+        Args:
+            project_id: 絞り込むプロジェクトID（None の場合は条件なし）
+            status: 絞り込むステータス（None の場合は条件なし）
+
+        Returns:
+            ColumnElement[bool]: 検索条件
+        """
+        condition: ColumnElement[bool] = true()
+        if project_id is not None:
+            condition = condition & (tasks.c.project_id == project_id)
+        if status is not None:
+            condition = condition & (tasks.c.status == status)
+        return condition
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[Task]:
+        """
+        すべてのタスクを作成日時順に取得するイテレータ
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self._iter(self._condition(None, None), fetch_size)
+
+    def iter_by_project_id(
+        self,
+        project_id: UUID,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        プロジェクトに属するタスクを作成日時順に取得するイテレータ
+
+        Args:
+            project_id: 検索するプロジェクトID
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self._iter(self._condition(project_id, None), fetch_size)
+
+    def iter_by_status(
+        self,
+        status: str,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        ステータスに一致するタスクを作成日時順に取得するイテレータ
+
+        Args:
+            status: 検索するステータス
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return self._iter(self._condition(None, status), fetch_size)
+
+    def _iter(
+        self,
+        condition: ColumnElement[bool],
+        fetch_size: Optional[int]
+    ) -> Iterator[Task]:
+        """
+        条件に一致するタスクをキーセットページネーションで依存関係とともに取得
+
+        Args:
+            condition: 検索条件
+            fetch_size: 1回の読み込み件数
+
+        Returns:
+            Iterator[Task]: タスクのイテレータ
+        """
+        return iter_keyset(
+            self.db.engine,
+            select(tasks).where(condition),
+            [tasks.c.created_at, literal_column("tasks.rowid")],
+            self._load_page,
+            fetch_size,
+        )
+
+    def count(
+        self,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """
+        タスク数を取得
+
+        Args:
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+
+        Returns:
+            int: タスク数
+        """
+        with self.db.engine.connect() as conn:
+            return conn.execute(
+                select(func.count())
+                .select_from(tasks)
+                .where(self._condition(project_id, status))
+            ).scalar_one()
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        タスクの指定した列だけを作成日時順に取得するイテレータ
+
+        依存関係は結合テーブルにあるため指定できません。
+
+        Args:
+            columns: 取得する列名のリスト
+            project_id: 絞り込むプロジェクトID（省略時はすべて）
+            status: 絞り込むステータス（省略時はすべて）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した列の値のタプルのイテレータ
+
+        Raises:
+            ValueError: 存在しない列名が指定された場合
+        """
+        selected = select_columns(tasks, columns)
+        width = len(selected)
+        return iter_keyset(
+            self.db.engine,
+            select(*selected).where(self._condition(project_id, status)),
+            [tasks.c.created_at, literal_column("tasks.rowid")],
+            lambda conn, rows: [tuple(row[:width]) for row in rows],
+            fetch_size,
+        )
+
+    def search(
+        self,
+        criteria: TaskSearchCriteria,
+        page: int = 0,
+        page_size: int = TASK_SEARCH_PAGE_SIZE
+    ) -> TaskSearchResult:
+        """
+        条件に一致するタスクを1ページ分検索
+
+        検索語はタスク名・説明の全文検索索引（FTS5 trigram）で照合し、関連度（bm25）の高い順に返します。
+        3文字未満の語は部分一致で照合します。索引で照合する語がない場合は作成日時順です。
+        総数とページ内の行だけを SQL で取得し、ページ内のタスクだけを読み込みます。
+
+        Args:
+            criteria: 検索条件
+            page: ページ番号（0始まり）
+            page_size: 1ページの件数
+
+        Returns:
+            TaskSearchResult: 検索結果
+
+        Raises:
+            ValueError: ページ番号が負、または1ページの件数が1未満の場合
+        """
+        check_page(page, page_size)
+        count_source, count_condition, _ = search_source(criteria, ranked=False)
+        source, condition, rank = search_source(criteria)
+        order = [tasks.c.created_at, literal_column("tasks.rowid")]
+        query = select(tasks).select_from(source).where(condition)
+        if rank is not None:
+            query = query.add_columns(rank.label("_rank"))
+            order.insert(0, literal_column("_rank"))
+
+        with self.db.engine.connect() as conn:
+            total = conn.execute(
+                select(func.count()).select_from(count_source).where(count_condition)
+            ).scalar_one()
+            rows: Sequence[Row] = []
+            if total > page * page_size:
+                rows = conn.execute(
+                    query.order_by(*order).limit(page_size).offset(page * page_size)
+                ).all()
+            found = self._load_page(conn, rows) if rows else []
+        # bm25 は関連が強いほど小さい（負の）値のため、符号を反転して関連度とする
+        scores = [-row._mapping["_rank"] for row in rows] if rank is not None else None
+        return TaskSearchResult(found, total, page, page_size, scores)
+
+    def delete(self, task_id: UUID) -> bool:
+        """
+        タスクの削除
+
+        Args:
+            task_id: 削除するタスクID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        return self.delete_many([task_id]) > 0
+
+    def delete_many(self, task_ids: List[UUID]) -> int:
+        """
+        複数のタスクを1トランザクションで一括削除（依存関係行と時間記録も削除されます）
+
+        Args:
+            task_ids: 削除するタスクIDのリスト
+
+        Returns:
+            int: 削除されたタスク数
+        """
+        deleted = 0
+        with self.db.engine.begin() as conn:
+            placements = load_placements(conn, task_ids)
+            move_task_contributions(
+                conn,
+                {
+                    task_id: (placement, None)
+                    for task_id, placement in placements.items()
+                },
+            )
+            stats_consistent = move_task_samples(conn, load_samples(conn, task_ids), {})
+            bump_project_revisions(
+                conn, [project_id for project_id, _ in placements.values()]
+            )
+            for chunk in chunked(task_ids):
+                result = conn.execute(delete(tasks).where(tasks.c.id.in_(chunk)))
+                deleted += result.rowcount
+        if not stats_consistent:
+            self._rebuild_estimation_stats()
+        return deleted
+
+    def _rebuild_estimation_stats(self) -> None:
+        """
+        予実比率の統計テーブルを完了タスクから作り直す
+
+        統計テーブルと保存済みの標本がずれていた場合に、保存を確定した後で呼び出します。
+        """
+        with self.db.engine.begin() as conn:
+            rebuild_estimation_stats(conn)
@@ -0,0 +1,578 @@
+"""
+SQLAlchemyによる時間記録リポジトリの実装
+"""
+from datetime import date, datetime
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Row,
+    delete,
+    func,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.dialects.sqlite import insert
+
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.repositories.time_repository import TimeRepository
+from ccpm.domain.value_objects.time_rollup import GRANULARITY_DAY, TimeRollup
+from ccpm.infrastructure.db.db_manager import (
+    DatabaseManager,
+    chunked,
+    execute_many,
+    iter_keyset,
+    select_columns,
+)
+from ccpm.infrastructure.db.schema import tasks, time_records
+from ccpm.infrastructure.db.time_rollup import (
+    Contributions,
+    add_contribution,
+    apply_record_contributions,
+    query_rollups,
+    rebuild_rollups,
+)
+
+
+class SqliteTimeRepository(TimeRepository):
+    """
+    SQLiteに時間記録を永続化するリポジトリ
+    """
+
+    def __init__(self, db: DatabaseManager):
+        """
+        リポジトリの初期化
+
+        Args:
+            db: データベース管理
+        """
+        self.db = db
+
+    @staticmethod
+    def _to_row(time_record: TimeRecord) -> Dict[str, Any]:
+        """
+        時間記録をテーブル行に変換
+
+        Args:
+            time_record: 時間記録
+
+        Returns:
+            Dict[str, Any]: テーブル行
+        """
+        return {
+            "id": time_record.id,
+            "task_id": time_record.task_id,
+            "start_time": time_record.start_time,
+            "end_time": time_record.end_time,
+            "bucket_day": time_record.start_time.date(),
+            "duration": time_record.duration,
+            "description": time_record.description,
+            "created_at": time_record.created_at,
+        }
+
+    @staticmethod
+    def _to_entity(row: Row) -> TimeRecord:
+        """
+        テーブル行を時間記録に変換
+
+        Args:
+            row: テーブル行
+
+        Returns:
+            TimeRecord: 時間記録
+        """
+        return TimeRecord(
+            task_id=row.task_id,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            duration=row.duration,
+            description=row.description,
+            id=row.id,
+            created_at=row.created_at,
+        )
+
+    def save(self, time_record: TimeRecord) -> TimeRecord:
+        """
+        時間記録を保存
+
+        Args:
+            time_record: 保存する時間記録
+
+        Returns:
+            TimeRecord: 保存された時間記録
+        """
+        self.save_many([time_record])
+        return time_record
+
+    def save_many(self, records: List[TimeRecord]) -> List[TimeRecord]:
+        """
+        複数の時間記録を1トランザクションで一括保存（UPSERT）
+
+        保存前の行との差分を日次・週次の作業時間集計に反映します。
+
+        Args:
+            records: 保存する時間記録のリスト
+
+        Returns:
+            List[TimeRecord]: 保存された時間記録のリスト
+        """
+        if not records:
+            return []
+
+        with self.db.engine.begin() as conn:
+            self._write(conn, records)
+        return records
+
+    def _write(self, conn: Connection, records: List[TimeRecord]) -> None:
+        """
+        時間記録を UPSERT し、保存前の行との差分を作業時間集計に反映
+
+        Args:
+            conn: データベース接続（呼び出し側のトランザクション内）
+            records: 保存する時間記録のリスト
+        """
+        statement = insert(time_records)
+        statement = statement.on_conflict_do_update(
+            index_elements=[time_records.c.id],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in time_records.columns if column.name != "id"
+            },
+        )
+        rows = [self._to_row(record) for record in records]
+        contributions = self._stored_contributions(conn, [row["id"] for row in rows])
+        for row in rows:
+            add_contribution(
+                contributions, row["task_id"], row["bucket_day"], row["duration"], 1
+            )
+        execute_many(conn, statement, rows)
+        apply_record_contributions(conn, contributions)
+
+    def start_record(
+        self,
+        time_record: TimeRecord,
+        resource: str = "",
+        wip_limit: Optional[int] = None,
+        known_active: Collection[UUID] = ()
+    ) -> Tuple[Optional[TimeRecord], List[UUID]]:
+        """
+        記録中の時間記録を、担当者の記録中のタスク数がWIP制限未満の場合だけ保存
+
+        SQLite ファイルではトランザクションの開始時（BEGIN IMMEDIATE）に書き込みロックを取り、
+        記録中の行だけの部分インデックスで担当者の記録中のタスクを数えて保存するため、複数の
+        プロセスから同時に開始しても制限を超えません。known_active は使いません。
+
+        Args:
+            time_record: 保存する記録中の時間記録
+            resource: タスクの担当者（空文字の場合は制限なし）
+            wip_limit: 担当者ごとに同時に記録中にできるタスク数（None の場合は制限なし）
+            known_active: 呼び出し側が把握している担当者の記録中のタスクID（使用しない）
+
+        Returns:
+            Tuple[Optional[TimeRecord], List[UUID]]: (記録中の時間記録, 担当者の記録中のタスクID)
+                制限に達して保存しなかった場合は時間記録がNone
+        """
+        with self.db.engine.connect() as conn:
+            active = conn.execute(
+                select(time_records)
+                .where(
+                    time_records.c.task_id == time_record.task_id,
+                    time_records.c.end_time.is_(None),
+                )
+                .order_by(time_records.c.start_time.desc())
+                .limit(1)
+            ).first()
+            if active is not None:
+                conn.rollback()
+                return self._to_entity(active), []
+            if wip_limit is not None and resource:
+                running = conn.execute(
+                    select(time_records.c.task_id)
+                    .distinct()
+                    .join(tasks, tasks.c.id == time_records.c.task_id)
+                    .where(
+                        time_records.c.end_time.is_(None),
+                        tasks.c.resource == resource,
+                    )
+                ).scalars().all()
+                if len(running) >= wip_limit:
+                    conn.rollback()
+                    return None, sorted(running, key=str)
+            self._write(conn, [time_record])
+            conn.commit()
+        return time_record, []
+
+    @staticmethod
+    def _stored_contributions(
+        conn: Connection,
+        record_ids: List[UUID]
+    ) -> Contributions:
+        """
+        保存済みの時間記録の寄与分を差し引く増減を作成
+
+        Args:
+            conn: データベース接続
+            record_ids: 時間記録IDのリスト
+
+        Returns:
+            Contributions: 保存済みの行を取り消す増減
+        """
+        contributions: Contributions = {}
+        for chunk in chunked(record_ids):
+            rows = conn.execute(
+                select(
+                    time_records.c.task_id,
+                    time_records.c.bucket_day,
+                    time_records.c.duration,
+                ).where(time_records.c.id.in_(chunk))
+            )
+            for task_id, day, duration in rows:
+                add_contribution(contributions, task_id, day, -duration, -1)
+        return contributions
+
+    def find_by_id(self, record_id: UUID) -> Optional[TimeRecord]:
+        """
+        IDによる時間記録の検索
+
+        Args:
+            record_id: 検索する記録ID
+
+        Returns:
+            Optional[TimeRecord]: 見つかった時間記録、存在しない場合はNone
+        """
+        with self.db.engine.connect() as conn:
+            row = conn.execute(
+                select(time_records).where(time_records.c.id == record_id)
+            ).first()
+        return self._to_entity(row) if row else None
+
+    def find_all(self) -> List[TimeRecord]:
+        """
+        すべての時間記録を取得
+
+        Returns:
+            List[TimeRecord]: 時間記録のリスト
+        """
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(
+                select(time_records).order_by(time_records.c.start_time)
+            ).all()
+        return [self._to_entity(row) for row in rows]
+
+    def find_by_task_id(self, task_id: UUID) -> List[TimeRecord]:
+        """
+        タスクIDによる時間記録の検索
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            List[TimeRecord]: 条件に一致する時間記録のリスト
+        """
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(
+                select(time_records)
+                .where(time_records.c.task_id == task_id)
+                .order_by(time_records.c.start_time)
+            ).all()
+        return [self._to_entity(row) for row in rows]
+
+    def find_by_task_ids(self, task_ids: Sequence[UUID]) -> List[TimeRecord]:
+        """
+        複数のタスクIDによる時間記録の一括検索
+
+        IN句の上限に収まるようにタスクIDを分割して読み込みます。
+
+        Args:
+            task_ids: 検索するタスクIDのリスト
+
+        Returns:
+            List[TimeRecord]: いずれかのタスクに属する時間記録のリスト（タスクごとに開始時刻順）
+        """
+        records: List[TimeRecord] = []
+        with self.db.engine.connect() as conn:
+            for chunk in chunked(list(task_ids)):
+                rows = conn.execute(
+                    select(time_records)
+                    .where(time_records.c.task_id.in_(chunk))
+                    .order_by(time_records.c.task_id, time_records.c.start_time)
+                )
+                records.extend(self._to_entity(row) for row in rows)
+        return records
+
+    def find_active_record(self, task_id: UUID) -> Optional[TimeRecord]:
+        """
+        タスクIDによるアクティブな（終了していない）時間記録の検索
+
+        Args:
+            task_id: 検索するタスクID
+
+        Returns:
+            Optional[TimeRecord]: 見つかったアクティブな時間記録、存在しない場合はNone
+        """
+        with self.db.engine.connect() as conn:
+            row = conn.execute(
+                select(time_records)
+                .where(
+                    time_records.c.task_id == task_id, time_records.c.end_time.is_(None)
+                )
+                .order_by(time_records.c.start_time.desc())
+                .limit(1)
+            ).first()
+        return self._to_entity(row) if row else None
+
+    def find_active_records(self) -> List[TimeRecord]:
+        """
+        すべてのアクティブな（終了していない）時間記録を取得
+
+        記録中の行だけの部分インデックスを走査するため、終了済みの記録の件数に依存しません。
+
+        Returns:
+            List[TimeRecord]: アクティブな時間記録のリスト（開始時刻順）
+        """
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(
+                select(time_records)
+                .where(time_records.c.end_time.is_(None))
+                .order_by(time_records.c.start_time)
+            ).all()
+        return [self._to_entity(row) for row in rows]
+
+    def find_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[TimeRecord]:
+        """
+        日付範囲による時間記録の検索（開始時刻が範囲内の記録）
+
+        Args:
+            start_date: 検索開始日
+            end_date: 検索終了日
+
+        Returns:
+            List[TimeRecord]: 条件に一致する時間記録のリスト
+        """
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(
+                select(time_records)
+                .where(time_records.c.start_time.between(start_date, end_date))
+                .order_by(time_records.c.start_time)
+            ).all()
+        return [self._to_entity(row) for row in rows]
+
+    @staticmethod
+    def _condition(
+        task_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> ColumnElement[bool]:
+        """
+        タスクIDと開始時刻の範囲による絞り込み条件を作成
+
+        Args:
+            task_id: 絞り込むタスクID（None の場合は条件なし）
+            start_date: 開始時刻の下限（None の場合は条件なし）
+            end_date: 開始時刻の上限（None の場合は条件なし）
+
+        Returns:
+            ColumnElement[bool]: 検索条件
+        """
+        condition: ColumnElement[bool] = true()
+        if task_id is not None:
+            condition = condition & (time_records.c.task_id == task_id)
+        if start_date is not None:
+            condition = condition & (time_records.c.start_time >= start_date)
+        if end_date is not None:
+            condition = condition & (time_records.c.start_time <= end_date)
+        return condition
+
+    def iter_all(self, fetch_size: Optional[int] = None) -> Iterator[TimeRecord]:
+        """
+        すべての時間記録を開始時刻順に取得するイテレータ
+
+        Args:
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return self._iter(self._condition(None, None, None), fetch_size)
+
+    def iter_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[TimeRecord]:
+        """
+        開始時刻が日付範囲内の時間記録を開始時刻順に取得するイテレータ
+
+        Args:
+            start_date: 検索開始日
+            end_date: 検索終了日
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return self._iter(self._condition(None, start_date, end_date), fetch_size)
+
+    def _iter(
+        self,
+        condition: ColumnElement[bool],
+        fetch_size: Optional[int]
+    ) -> Iterator[TimeRecord]:
+        """
+        条件に一致する時間記録をキーセットページネーションで取得
+
+        Args:
+            condition: 検索条件
+            fetch_size: 1回の読み込み件数
+
+        Returns:
+            Iterator[TimeRecord]: 時間記録のイテレータ
+        """
+        return iter_keyset(
+            self.db.engine,
+            select(time_records).where(condition),
+            [time_records.c.start_time, literal_column("time_records.rowid")],
+            lambda conn, rows: [self._to_entity(row) for row in rows],
+            fetch_size,
+        )
+
+    def count(
+        self,
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        時間記録数を取得
+
+        Args:
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 開始時刻の下限（省略時は制限なし）
+            end_date: 開始時刻の上限（省略時は制限なし）
+
+        Returns:
+            int: 時間記録数
+        """
+        with self.db.engine.connect() as conn:
+            return conn.execute(
+                select(func.count())
+                .select_from(time_records)
+                .where(self._condition(task_id, start_date, end_date))
+            ).scalar_one()
+
+    def iter_columns(
+        self,
+        columns: Sequence[str],
+        task_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fetch_size: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        時間記録の指定した列だけを開始時刻順に取得するイテレータ
+
+        Args:
+            columns: 取得する列名のリスト
+            task_id: 絞り込むタスクID（省略時はすべて）
+            start_date: 開始時刻の下限（省略時は制限なし）
+            end_date: 開始時刻の上限（省略時は制限なし）
+            fetch_size: 1回の読み込み件数（省略時は設定ファイルの値）
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: 指定した列の値のタプルのイテレータ
+
+        Raises:
+            ValueError: 存在しない列名が指定された場合
+        """
+        selected = select_columns(time_records, columns)
+        width = len(selected)
+        return iter_keyset(
+            self.db.engine,
+            select(*selected).where(self._condition(task_id, start_date, end_date)),
+            [time_records.c.start_time, literal_column("time_records.rowid")],
+            lambda conn, rows: [tuple(row[:width]) for row in rows],
+            fetch_size,
+        )
+
+    def delete(self, record_id: UUID) -> bool:
+        """
+        時間記録の削除
+
+        Args:
+            record_id: 削除する記録ID
+
+        Returns:
+            bool: 削除に成功した場合はTrue
+        """
+        return self.delete_many([record_id]) > 0
+
+    def delete_many(self, record_ids: List[UUID]) -> int:
+        """
+        複数の時間記録を1トランザクションで一括削除
+
+        Args:
+            record_ids: 削除する記録IDのリスト
+
+        Returns:
+            int: 削除された時間記録数
+        """
+        deleted = 0
+        with self.db.engine.begin() as conn:
+            contributions = self._stored_contributions(conn, record_ids)
+            for chunk in chunked(record_ids):
+                result = conn.execute(
+                    delete(time_records).where(time_records.c.id.in_(chunk))
+                )
+                deleted += result.rowcount
+            apply_record_contributions(conn, contributions)
+        return deleted
+
+    def aggregate_hours(
+        self,
+        scope: str,
+        start_date: date,
+        end_date: date,
+        granularity: str = GRANULARITY_DAY,
+        keys: Optional[Sequence[Union[UUID, str]]] = None
+    ) -> List[TimeRollup]:
+        """
+        期間内の作業時間を集計テーブルから取得
+
+        Args:
+            scope: 集計の単位（"task"、"project" または "category"）
+            start_date: 期間の開始日
+            end_date: 期間の終了日
+            granularity: 集計の粒度（"day" または "week"。週は期間と重なる週すべて）
+            keys: 集計対象（タスクID、プロジェクトID またはカテゴリ名。省略時はすべて）
+
+        Returns:
+            List[TimeRollup]: 集計対象・区間順の作業時間集計
+
+        Raises:
+            ValueError: 不明な単位・粒度が指定された場合
+        """
+        with self.db.engine.connect() as conn:
+            return query_rollups(conn, scope, start_date, end_date, granularity, keys)
+
+    def rebuild_rollups(self) -> None:
+        """作業時間集計を時間記録から作り直す（集計と時間記録が食い違った場合の復旧用）"""
+        with self.db.engine.begin() as conn:
+            rebuild_rollups(conn)
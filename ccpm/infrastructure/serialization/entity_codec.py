@@ -0,0 +1,747 @@
+"""
+エンティティの一括エンコード・デコード（JSON / バイナリ）
+"""
+import json
+import struct
+from datetime import datetime, timedelta
+from itertools import accumulate, chain
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from uuid import UUID, uuid4
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+
+# 項目の型
+KIND_STR = "str"
+KIND_INT = "int"
+KIND_FLOAT = "float"
+KIND_OPTIONAL_FLOAT = "optional_float"
+KIND_UUID = "uuid"
+KIND_DATETIME = "datetime"
+KIND_UUID_LIST = "uuid_list"
+KIND_STR_LIST = "str_list"
+KIND_FEEDING_BUFFERS = "feeding_buffers"
+
+# キーがない（または空の）場合の補完方法
+FILL_NEW_ID = "new_id"
+FILL_NOW = "now"
+
+# バイナリ形式のヘッダー: マジック, 形式バージョン, エンティティ種別, 件数
+BINARY_MAGIC = b"CCPM"
+BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sBBI")
+
+# 日時は 1970-01-01 からのマイクロ秒（None は最小値）で保持
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NULL_DATETIME = -(2 ** 63)
+_NULL_LENGTH = -1
+# None の実数は NaN で保持
+_NULL_FLOAT = float("nan")
+
+
+class FieldSpec:
+    """
+    エンコード・デコード対象の1項目の定義
+    """
+
+    __slots__ = ("key", "attr", "kind", "required", "default", "fill", "read")
+
+    def __init__(
+        self,
+        key: str,
+        kind: str,
+        attr: Optional[str] = None,
+        required: bool = False,
+        default: Any = None,
+        fill: Optional[str] = None,
+        read: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        項目定義の初期化
+
+        Args:
+            key: 辞書表現のキー
+            kind: 項目の型（KIND_*）
+            attr: エンティティの属性名（省略時は key と同じ）
+            required: 辞書表現に必須のキーかどうか
+            default: キーがない場合の値
+            fill: 日時・ID のキーがない（または空の）場合の補完方法（FILL_* または None）
+            read: エンコード時に値を取得する関数（省略時は属性値をそのまま使用）
+        """
+        self.key = key
+        self.kind = kind
+        self.attr = attr if attr else key
+        self.required = required
+        self.default = default
+        self.fill = fill
+        self.read = read
+
+    def values(self, entities: Sequence[Any]) -> List[Any]:
+        """
+        エンティティ群からエンコードする値の列を取得
+
+        Args:
+            entities: エンティティのリスト
+
+        Returns:
+            List[Any]: 値の列
+        """
+        if self.read is not None:
+            return [self.read(entity) for entity in entities]
+        attr = self.attr
+        return [getattr(entity, attr) for entity in entities]
+
+
+class EntityCodec:
+    """
+    1種類のエンティティを一括でエンコード・デコードするコーデック
+
+    項目定義（フィールドプラン）に沿って、エンティティ群を項目ごとの列単位で
+    まとめて変換します。UUID は1回の呼び出しの中で
+    同じ値を1度だけ変換するため、依存関係やプロジェクトIDのように同じ値が
+    繰り返し現れる場合に特に効果があります。
+    デコード時はエンティティの __init__ を経由せず、スロットに直接値を設定します。
+    to_dict / from_dict と同じ辞書表現・既定値を扱います。
+    """
+
+    def __init__(
+        self,
+        entity_type: Type[Any],
+        type_code: int,
+        fields: Sequence[FieldSpec],
+        derived: Sequence[Tuple[str, Callable[[Any], Any]]] = ()
+    ):
+        """
+        コーデックの初期化
+
+        Args:
+            entity_type: エンティティのクラス
+            type_code: バイナリ形式でのエンティティ種別番号
+            fields: 項目定義のリスト
+            derived: 派生項目（キー, 算出関数）のリスト（辞書表現でのみ出力）
+
+        Raises:
+            ValueError: 項目定義がエンティティのスロットと一致しない場合
+        """
+        slots = set(getattr(entity_type, "__slots__", ()))
+        attrs = {spec.attr for spec in fields}
+        if slots != attrs:
+            raise ValueError(
+                f"{entity_type.__name__} の項目定義がスロットと一致しません: "
+                f"{sorted(slots ^ attrs)}"
+            )
+
+        self.entity_type = entity_type
+        self.type_code = type_code
+        self.fields = list(fields)
+        self.derived = list(derived)
+        self._build_entities = _compile_entity_builder(
+            entity_type, [spec.attr for spec in self.fields]
+        )
+        keys = [spec.key for spec in self.fields]
+        self._build_rows = _compile_row_builder(keys)
+        self._build_rows_with_derived = _compile_row_builder(
+            keys + [key for key, _ in self.derived]
+        )
+
+    def to_dicts(
+        self,
+        entities: Sequence[Any],
+        derived: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        エンティティ群を辞書表現のリストに変換
+
+        Args:
+            entities: エンティティのリスト
+            derived: 派生項目（予実差異、バッファ消費率など）を含めるかどうか
+
+        Returns:
+            List[Dict[str, Any]]: to_dict と同じ形式の辞書のリスト
+        """
+        uuid_strings: Dict[UUID, str] = {}
+        columns = [
+            _to_plain(spec.kind, spec.values(entities), uuid_strings)
+            for spec in self.fields
+        ]
+        if not derived:
+            return self._build_rows(*columns)
+        for _, compute in self.derived:
+            columns.append([compute(entity) for entity in entities])
+        return self._build_rows_with_derived(*columns)
+
+    def from_dicts(self, items: Sequence[Dict[str, Any]]) -> List[Any]:
+        """
+        辞書表現のリストからエンティティ群を作成
+
+        派生項目のキーは無視します。
+
+        Args:
+            items: to_dict 形式の辞書のリスト
+
+        Returns:
+            List[Any]: 作成されたエンティティのリスト
+
+        Raises:
+            KeyError: 必須のキーがない場合
+            ValueError: 値を変換できない場合
+        """
+        uuids: Dict[str, UUID] = {}
+        now = datetime.now()
+        columns = []
+        for spec in self.fields:
+            key = spec.key
+            if spec.required:
+                raw = [item[key] for item in items]
+            else:
+                default = spec.default
+                raw = [item.get(key, default) for item in items]
+            columns.append(_from_plain(spec, raw, uuids, now))
+        return self._build_entities(*columns)
+
+    def dumps_json(self, entities: Sequence[Any], derived: bool = False) -> str:
+        """
+        エンティティ群を JSON 配列の文字列に変換
+
+        Args:
+            entities: エンティティのリスト
+            derived: 派生項目を含めるかどうか
+
+        Returns:
+            str: JSON 文字列
+        """
+        return json.dumps(self.to_dicts(entities, derived), ensure_ascii=False)
+
+    def loads_json(self, text: str) -> List[Any]:
+        """
+        JSON 配列の文字列からエンティティ群を作成
+
+        Args:
+            text: dumps_json で作成した JSON 文字列
+
+        Returns:
+            List[Any]: 作成されたエンティティのリスト
+        """
+        return self.from_dicts(json.loads(text))
+
+    def pack(self, entities: Sequence[Any]) -> bytes:
+        """
+        エンティティ群をバイナリ形式に変換
+
+        ヘッダーに続けて項目ごとの列（数値・日時は固定長配列、文字列は長さの配列と
+        連結した UTF-8、UUID は16バイトの連結）を並べた形式です。
+        派生項目は含みません。日時はタイムゾーンなし（naive）のものに限ります。
+
+        Args:
+            entities: エンティティのリスト
+
+        Returns:
+            bytes: バイナリ表現
+        """
+        parts = [
+            _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, self.type_code, len(entities))
+        ]
+        for spec in self.fields:
+            _pack_column(spec.kind, spec.values(entities), parts)
+        return b"".join(parts)
+
+    def unpack(self, data: bytes) -> List[Any]:
+        """
+        バイナリ形式からエンティティ群を作成
+
+        Args:
+            data: pack で作成したバイナリ
+
+        Returns:
+            List[Any]: 作成されたエンティティのリスト
+
+        Raises:
+            ValueError: 形式・バージョン・エンティティ種別が一致しない場合、またはデータが壊れている場合
+        """
+        view = memoryview(data)
+        try:
+            magic, version, type_code, size = _HEADER.unpack_from(view, 0)
+        except struct.error as e:
+            raise ValueError("バイナリ形式のヘッダーを読み込めません") from e
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("対応していないバイナリ形式です")
+        if type_code != self.type_code:
+            raise ValueError(
+                f"{self.entity_type.__name__} のデータではありません（種別番号: {type_code}）"
+            )
+
+        reader = _Reader(view, _HEADER.size)
+        uuids: Dict[bytes, UUID] = {}
+        try:
+            columns = [
+                _unpack_column(spec.kind, size, reader, uuids) for spec in self.fields
+            ]
+        except (struct.error, UnicodeDecodeError) as e:
+            raise ValueError("バイナリ形式のデータが壊れています") from e
+        if reader.offset != len(view):
+            raise ValueError("バイナリ形式のデータの長さが一致しません")
+        return self._build_entities(*columns)
+
+
+def _compile_entity_builder(
+    entity_type: Type[Any],
+    attrs: List[str]
+) -> Callable[..., List[Any]]:
+    """
+    項目ごとの列からエンティティ群を作成する関数を生成
+
+    __init__ を経由せずにインスタンスを作成し、スロットへ直接代入する処理を
+    項目定義から1度だけ組み立てます。
+
+    Args:
+        entity_type: エンティティのクラス
+        attrs: 列の順の属性名
+
+    Returns:
+        Callable[..., List[Any]]: 列を引数に取り、エンティティのリストを返す関数
+    """
+    columns = [f"c{i}" for i in range(len(attrs))]
+    values = [f"v{i}" for i in range(len(attrs))]
+    assignments = "".join(
+        f"        entity.{attr} = {value}\n" for attr, value in zip(attrs, values)
+    )
+    source = (
+        f"def build({', '.join(columns)}):\n"
+        f"    entities = []\n"
+        f"    append = entities.append\n"
+        f"    for {', '.join(values)}, in zip({', '.join(columns)}):\n"
+        f"        entity = new(cls)\n"
+        f"{assignments}"
+        f"        append(entity)\n"
+        f"    return entities\n"
+    )
+    namespace: Dict[str, Any] = {"new": object.__new__, "cls": entity_type}
+    exec(source, namespace)
+    build: Callable[..., List[Any]] = namespace["build"]
+    return build
+
+
+def _compile_row_builder(keys: List[str]) -> Callable[..., List[Dict[str, Any]]]:
+    """
+    項目ごとの列から辞書のリストを作成する関数を生成
+
+    Args:
+        keys: 列の順の辞書キー
+
+    Returns:
+        Callable[..., List[Dict[str, Any]]]: 列を引数に取り、辞書のリストを返す関数
+    """
+    columns = [f"c{i}" for i in range(len(keys))]
+    values = [f"v{i}" for i in range(len(keys))]
+    items = ", ".join(f"{key!r}: {value}" for key, value in zip(keys, values))
+    source = (
+        f"def build({', '.join(columns)}):\n"
+        f"    return [{{{items}}} for {', '.join(values)}, "
+        f"in zip({', '.join(columns)})]\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    build: Callable[..., List[Dict[str, Any]]] = namespace["build"]
+    return build
+
+
+def _to_plain(kind: str, values: List[Any], uuid_strings: Dict[UUID, str]) -> List[Any]:
+    """
+    属性値の列を辞書表現の値の列に変換
+
+    Args:
+        kind: 項目の型
+        values: 属性値の列
+        uuid_strings: UUID → 文字列の変換済みキャッシュ
+
+    Returns:
+        List[Any]: 辞書表現の値の列
+    """
+    def uuid_str(value: UUID) -> str:
+        text = uuid_strings.get(value)
+        if text is None:
+            text = uuid_strings[value] = str(value)
+        return text
+
+    if kind == KIND_UUID:
+        return [uuid_str(value) for value in values]
+    if kind == KIND_DATETIME:
+        return [value.isoformat() if value else None for value in values]
+    if kind == KIND_UUID_LIST:
+        return [[uuid_str(value) for value in items] for items in values]
+    if kind == KIND_STR_LIST:
+        return [list(items) for items in values]
+    if kind == KIND_FEEDING_BUFFERS:
+        return [
+            [
+                {
+                    "merge_task_id": uuid_str(buffer.merge_task_id),
+                    "feeding_chain": [
+                        uuid_str(task_id) for task_id in buffer.feeding_chain
+                    ],
+                    "size": buffer.size,
+                    "consumed": buffer.consumed,
+                }
+                for buffer in buffers
+            ]
+            for buffers in values
+        ]
+    return values
+
+
+def _from_plain(
+    spec: FieldSpec,
+    values: List[Any],
+    uuids: Dict[str, UUID],
+    now: datetime
+) -> List[Any]:
+    """
+    辞書表現の値の列を属性値の列に変換
+
+    Args:
+        spec: 項目定義
+        values: 辞書表現の値の列
+        uuids: 文字列 → UUID の変換済みキャッシュ
+        now: 日時の補完に使う現在時刻
+
+    Returns:
+        List[Any]: 属性値の列
+    """
+    def parse_uuid(text: str) -> UUID:
+        value = uuids.get(text)
+        if value is None:
+            value = uuids[text] = UUID(text)
+        return value
+
+    kind = spec.kind
+    if kind == KIND_UUID:
+        if spec.fill == FILL_NEW_ID:
+            return [parse_uuid(text) if text else uuid4() for text in values]
+        return [parse_uuid(text) for text in values]
+    if kind == KIND_DATETIME:
+        fill = now if spec.fill == FILL_NOW else None
+        parse = datetime.fromisoformat
+        return [parse(text) if text else fill for text in values]
+    if kind == KIND_FLOAT:
+        return [float(value) for value in values]
+    if kind == KIND_OPTIONAL_FLOAT:
+        return [None if value is None else float(value) for value in values]
+    if kind == KIND_INT:
+        return [int(value) for value in values]
+    if kind == KIND_UUID_LIST:
+        return [[parse_uuid(text) for text in items] for items in values]
+    if kind == KIND_STR_LIST:
+        return [list(items) for items in values]
+    if kind == KIND_FEEDING_BUFFERS:
+        return [
+            [
+                FeedingBuffer(
+                    merge_task_id=parse_uuid(data["merge_task_id"]),
+                    feeding_chain=[parse_uuid(text) for text in data["feeding_chain"]],
+                    size=float(data["size"]),
+                    consumed=float(data.get("consumed", 0.0)),
+                )
+                for data in items
+            ]
+            for items in values
+        ]
+    return values
+
+
+class _Reader:
+    """
+    バイナリ形式の読み込み位置を管理する補助クラス
+    """
+
+    __slots__ = ("view", "offset")
+
+    def __init__(self, view: memoryview, offset: int):
+        self.view = view
+        self.offset = offset
+
+    def array(self, code: str, size: int) -> Tuple[Any, ...]:
+        """固定長の数値配列を読み込み"""
+        layout = struct.Struct(f"<{size}{code}")
+        values = layout.unpack_from(self.view, self.offset)
+        self.offset += layout.size
+        return values
+
+    def raw(self, length: int) -> bytes:
+        """バイト列を読み込み"""
+        end = self.offset + length
+        if end > len(self.view):
+            raise struct.error("データが途中で終わっています")
+        data = self.view[self.offset:end].tobytes()
+        self.offset = end
+        return data
+
+
+def _pack_array(code: str, values: Sequence[Any], parts: List[bytes]) -> None:
+    """固定長の数値配列を書き込み"""
+    parts.append(struct.pack(f"<{len(values)}{code}", *values))
+
+
+def _pack_strings(values: Sequence[Optional[str]], parts: List[bytes]) -> None:
+    """文字列の列を書き込み（文字数の配列と連結した UTF-8）"""
+    _pack_array(
+        "i", [_NULL_LENGTH if value is None else len(value) for value in values], parts
+    )
+    data = "".join(value for value in values if value is not None).encode(
+        "utf-8", "surrogatepass"
+    )
+    _pack_array("Q", [len(data)], parts)
+    parts.append(data)
+
+
+def _unpack_strings(size: int, reader: _Reader) -> List[Optional[str]]:
+    """文字列の列を読み込み"""
+    lengths = reader.array("i", size)
+    (byte_length,) = reader.array("Q", 1)
+    text = reader.raw(byte_length).decode("utf-8", "surrogatepass")
+    has_null = _NULL_LENGTH in lengths
+    sizes = [max(length, 0) for length in lengths] if has_null else lengths
+    ends = list(accumulate(sizes))
+    if (ends[-1] if ends else 0) != len(text):
+        raise struct.error("文字列の長さが一致しません")
+    values: List[Optional[str]] = [
+        text[end - length:end] for length, end in zip(sizes, ends)
+    ]
+    if has_null:
+        for row, length in enumerate(lengths):
+            if length == _NULL_LENGTH:
+                values[row] = None
+    return values
+
+
+def _pack_uuids(values: Iterable[UUID], parts: List[bytes]) -> None:
+    """UUID の列を書き込み（16バイトの連結）"""
+    parts.append(b"".join(value.bytes for value in values))
+
+
+def _unpack_uuids(size: int, reader: _Reader, uuids: Dict[bytes, UUID]) -> List[UUID]:
+    """UUID の列を読み込み"""
+    data = reader.raw(size * 16)
+
+    def parse(key: bytes) -> UUID:
+        value = uuids[key] = UUID(bytes=key)
+        return value
+
+    keys = [data[offset:offset + 16] for offset in range(0, len(data), 16)]
+    return [uuids[key] if key in uuids else parse(key) for key in keys]
+
+
+def _split(values: List[Any], counts: Sequence[int]) -> List[List[Any]]:
+    """連結された値を件数ごとのリストに分割"""
+    bounds = list(accumulate(counts, initial=0))
+    if bounds[-1] != len(values):
+        raise struct.error("リストの長さが一致しません")
+    return [values[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _pack_column(kind: str, values: List[Any], parts: List[bytes]) -> None:
+    """
+    属性値の列をバイナリ形式で書き込み
+
+    Args:
+        kind: 項目の型
+        values: 属性値の列
+        parts: 書き込み先
+    """
+    if kind == KIND_STR:
+        _pack_strings(values, parts)
+    elif kind == KIND_INT:
+        _pack_array("q", values, parts)
+    elif kind == KIND_FLOAT:
+        _pack_array("d", values, parts)
+    elif kind == KIND_OPTIONAL_FLOAT:
+        _pack_array(
+            "d", [_NULL_FLOAT if value is None else value for value in values], parts
+        )
+    elif kind == KIND_UUID:
+        _pack_uuids(values, parts)
+    elif kind == KIND_DATETIME:
+        _pack_array(
+            "q",
+            [
+                _NULL_DATETIME if value is None else (value - _EPOCH) // _MICROSECOND
+                for value in values
+            ],
+            parts,
+        )
+    elif kind == KIND_UUID_LIST:
+        _pack_array("I", [len(items) for items in values], parts)
+        _pack_uuids(chain.from_iterable(values), parts)
+    elif kind == KIND_STR_LIST:
+        _pack_array("I", [len(items) for items in values], parts)
+        _pack_strings(list(chain.from_iterable(values)), parts)
+    elif kind == KIND_FEEDING_BUFFERS:
+        buffers = list(chain.from_iterable(values))
+        _pack_array("I", [len(items) for items in values], parts)
+        _pack_uuids((buffer.merge_task_id for buffer in buffers), parts)
+        _pack_array("d", [buffer.size for buffer in buffers], parts)
+        _pack_array("d", [buffer.consumed for buffer in buffers], parts)
+        _pack_array("I", [len(buffer.feeding_chain) for buffer in buffers], parts)
+        _pack_uuids(
+            chain.from_iterable(buffer.feeding_chain for buffer in buffers), parts
+        )
+    else:
+        raise ValueError(f"不明な項目の型です: {kind}")
+
+
+def _unpack_column(
+    kind: str,
+    size: int,
+    reader: _Reader,
+    uuids: Dict[bytes, UUID]
+) -> List[Any]:
+    """
+    バイナリ形式から属性値の列を読み込み
+
+    Args:
+        kind: 項目の型
+        size: エンティティ数
+        reader: 読み込み位置
+        uuids: バイト列 → UUID の変換済みキャッシュ
+
+    Returns:
+        List[Any]: 属性値の列
+    """
+    if kind == KIND_STR:
+        return _unpack_strings(size, reader)
+    if kind == KIND_INT:
+        return list(reader.array("q", size))
+    if kind == KIND_FLOAT:
+        return list(reader.array("d", size))
+    if kind == KIND_OPTIONAL_FLOAT:
+        return [None if value != value else value for value in reader.array("d", size)]
+    if kind == KIND_UUID:
+        return _unpack_uuids(size, reader, uuids)
+    if kind == KIND_DATETIME:
+        return [
+            None if value == _NULL_DATETIME else _EPOCH + _MICROSECOND * value
+            for value in reader.array("q", size)
+        ]
+    if kind == KIND_UUID_LIST:
+        counts = reader.array("I", size)
+        return _split(_unpack_uuids(sum(counts), reader, uuids), counts)
+    if kind == KIND_STR_LIST:
+        counts = reader.array("I", size)
+        return _split(_unpack_strings(sum(counts), reader), counts)
+    if kind == KIND_FEEDING_BUFFERS:
+        counts = reader.array("I", size)
+        total = sum(counts)
+        merge_ids = _unpack_uuids(total, reader, uuids)
+        sizes = reader.array("d", total)
+        consumed = reader.array("d", total)
+        chain_counts = reader.array("I", total)
+        chains = _split(_unpack_uuids(sum(chain_counts), reader, uuids), chain_counts)
+        buffers = [
+            FeedingBuffer(
+                merge_task_id=merge_id,
+                feeding_chain=feeding_chain,
+                size=buffer_size,
+                consumed=used,
+            )
+            for merge_id, feeding_chain, buffer_size, used in zip(
+                merge_ids, chains, sizes, consumed
+            )
+        ]
+        return _split(buffers, counts)
+    raise ValueError(f"不明な項目の型です: {kind}")
+
+
+TASK_CODEC = EntityCodec(
+    Task,
+    type_code=1,
+    fields=[
+        FieldSpec("id", KIND_UUID, fill=FILL_NEW_ID),
+        FieldSpec("project_id", KIND_UUID, required=True),
+        FieldSpec("name", KIND_STR, required=True),
+        FieldSpec("description", KIND_STR, default=""),
+        FieldSpec("status", KIND_STR, default="未着手"),
+        FieldSpec("priority", KIND_INT, default=3),
+        FieldSpec("estimated_hours", KIND_FLOAT, default=0.0),
+        FieldSpec("actual_hours", KIND_FLOAT, default=0.0),
+        FieldSpec("dependencies", KIND_UUID_LIST, default=[]),
+        FieldSpec("start_date", KIND_DATETIME),
+        FieldSpec("end_date", KIND_DATETIME),
+        FieldSpec("category", KIND_STR, default=""),
+        FieldSpec("tags", KIND_STR_LIST, default=[]),
+        FieldSpec("resource", KIND_STR, default=""),
+        FieldSpec("created_at", KIND_DATETIME, fill=FILL_NOW),
+        FieldSpec("updated_at", KIND_DATETIME, fill=FILL_NOW),
+    ],
+    derived=[
+        ("variance", attrgetter("variance")),
+        ("variance_ratio", attrgetter("variance_ratio")),
+    ],
+)
+
+PROJECT_CODEC = EntityCodec(
+    Project,
+    type_code=2,
+    fields=[
+        FieldSpec("id", KIND_UUID, fill=FILL_NEW_ID),
+        FieldSpec("name", KIND_STR, required=True),
+        FieldSpec("description", KIND_STR, default=""),
+        FieldSpec("start_date", KIND_DATETIME, fill=FILL_NOW),
+        FieldSpec("planned_end_date", KIND_DATETIME),
+        FieldSpec("actual_end_date", KIND_DATETIME),
+        FieldSpec("status", KIND_STR, default="未着手"),
+        FieldSpec("buffer_size", KIND_FLOAT, default=0.0),
+        FieldSpec("buffer_consumed", KIND_FLOAT, default=0.0),
+        FieldSpec("feeding_buffers", KIND_FEEDING_BUFFERS, default=[]),
+        FieldSpec("critical_chain", KIND_UUID_LIST, attr="_critical_chain", default=[]),
+        FieldSpec("created_at", KIND_DATETIME, fill=FILL_NOW),
+        FieldSpec("updated_at", KIND_DATETIME, fill=FILL_NOW),
+    ],
+    derived=[
+        ("buffer_consumption_rate", attrgetter("buffer_consumption_rate")),
+    ],
+)
+
+TIME_RECORD_CODEC = EntityCodec(
+    TimeRecord,
+    type_code=3,
+    fields=[
+        FieldSpec("id", KIND_UUID, fill=FILL_NEW_ID),
+        FieldSpec("task_id", KIND_UUID, required=True),
+        FieldSpec("start_time", KIND_DATETIME, fill=FILL_NOW),
+        FieldSpec("end_time", KIND_DATETIME),
+        FieldSpec(
+            "duration",
+            KIND_OPTIONAL_FLOAT,
+            attr="_duration",
+            read=attrgetter("duration"),
+        ),
+        FieldSpec("description", KIND_STR, default=""),
+        FieldSpec("created_at", KIND_DATETIME, fill=FILL_NOW),
+    ],
+)
+
+_CODECS: Dict[Type[Any], EntityCodec] = {
+    codec.entity_type: codec for codec in (TASK_CODEC, PROJECT_CODEC, TIME_RECORD_CODEC)
+}
+
+
+def codec_for(entity_type: Type[Any]) -> EntityCodec:
+    """
+    エンティティのクラスに対応するコーデックを取得
+
+    Args:
+        entity_type: エンティティのクラス（Task、Project または TimeRecord）
+
+    Returns:
+        EntityCodec: 対応するコーデック
+
+    Raises:
+        ValueError: 対応するコーデックがない場合
+    """
+    codec = _CODECS.get(entity_type)
+    if codec is None:
+        raise ValueError(f"コーデックが定義されていないエンティティです: {entity_type.__name__}")
+    return codec
@@ -0,0 +1,285 @@
+"""
+1行1エンティティのレコードストリーム（JSON Lines / CSV）の読み書き
+"""
+import csv
+import json
+from typing import Any, Dict, Iterator, List, Sequence, TextIO, Tuple
+
+from ccpm.infrastructure.serialization.entity_codec import (
+    KIND_DATETIME,
+    KIND_FEEDING_BUFFERS,
+    KIND_FLOAT,
+    KIND_INT,
+    KIND_OPTIONAL_FLOAT,
+    KIND_STR_LIST,
+    KIND_UUID,
+    KIND_UUID_LIST,
+    PROJECT_CODEC,
+    TASK_CODEC,
+    TIME_RECORD_CODEC,
+    EntityCodec,
+)
+
+# 出力形式
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+FORMATS = (FORMAT_JSONL, FORMAT_CSV)
+
+# レコード種別
+RECORD_HEADER = "header"
+RECORD_PROJECT = "project"
+RECORD_TASK = "task"
+RECORD_TIME_RECORD = "time_record"
+
+# ストリーム形式のバージョン
+STREAM_VERSION = 1
+
+RECORD_CODECS: Dict[str, EntityCodec] = {
+    RECORD_PROJECT: PROJECT_CODEC,
+    RECORD_TASK: TASK_CODEC,
+    RECORD_TIME_RECORD: TIME_RECORD_CODEC,
+}
+
+# CSV の列: レコード種別と、全エンティティの項目の和集合（最初に現れた順）
+CSV_TYPE_COLUMN = "type"
+CSV_COLUMNS: List[str] = [CSV_TYPE_COLUMN] + list(
+    dict.fromkeys(spec.key for codec in RECORD_CODECS.values() for spec in codec.fields)
+)
+
+# CSV のセルに JSON 文字列で格納する項目の型
+_JSON_KINDS = (KIND_UUID_LIST, KIND_STR_LIST, KIND_FEEDING_BUFFERS)
+# CSV の空セルを「値なし」として扱う項目の型
+_NULLABLE_KINDS = (KIND_UUID, KIND_DATETIME, KIND_OPTIONAL_FLOAT)
+# CSV の空セルを「キーなし」（既定値）として扱う項目の型
+_DEFAULTED_KINDS = (KIND_INT, KIND_FLOAT) + _JSON_KINDS
+
+
+def _codec(record_type: str) -> EntityCodec:
+    """
+    レコード種別に対応するコーデックを取得
+
+    Args:
+        record_type: レコード種別
+
+    Returns:
+        EntityCodec: 対応するコーデック
+
+    Raises:
+        ValueError: 不明なレコード種別の場合
+    """
+    codec = RECORD_CODECS.get(record_type)
+    if codec is None:
+        raise ValueError(f"不明なレコード種別です: {record_type}")
+    return codec
+
+
+def _check_format(format: str) -> None:
+    """
+    出力形式を検証
+
+    Args:
+        format: 出力形式
+
+    Raises:
+        ValueError: 不明な形式の場合
+    """
+    if format not in FORMATS:
+        raise ValueError(f"不明な形式です: {format}")
+
+
+class RecordWriter:
+    """
+    エンティティを1行1レコードでストリームに書き出すライター
+
+    JSON Lines では {"type": レコード種別, "data": to_dict 形式の辞書} を1行ずつ、
+    CSV ではレコード種別の列と全項目の列を持つ表を書き出します（リスト項目は JSON 文字列）。
+    エンティティはバッチ単位で変換してすぐに書き出すため、ライター自体はデータを保持しません。
+    """
+
+    def __init__(self, stream: TextIO, format: str = FORMAT_JSONL):
+        """
+        ライターの初期化（CSV の場合は見出し行を書き出す）
+
+        Args:
+            stream: 書き込み先のテキストストリーム
+            format: 出力形式（"jsonl" または "csv"）
+
+        Raises:
+            ValueError: 不明な形式の場合
+        """
+        _check_format(format)
+        self.stream = stream
+        self.format = format
+        self.count = 0
+        self._csv = None
+        if format == FORMAT_CSV:
+            self._csv = csv.DictWriter(
+                stream, fieldnames=CSV_COLUMNS, lineterminator="\n"
+            )
+            self._csv.writeheader()
+
+    def write_header(self, data: Dict[str, Any]) -> None:
+        """
+        ストリームの先頭情報（形式バージョン・件数など）を書き出す
+
+        CSV では列構成が固定のため書き出しません。
+
+        Args:
+            data: 先頭情報
+        """
+        if self._csv is None:
+            self._write_line(RECORD_HEADER, {"format_version": STREAM_VERSION, **data})
+
+    def write(self, record_type: str, entities: Sequence[Any]) -> None:
+        """
+        エンティティのバッチを書き出す
+
+        Args:
+            record_type: レコード種別
+            entities: エンティティのリスト
+
+        Raises:
+            ValueError: 不明なレコード種別の場合
+        """
+        codec = _codec(record_type)
+        rows = codec.to_dicts(entities, derived=False)
+        if self._csv is None:
+            for row in rows:
+                self._write_line(record_type, row)
+        else:
+            kinds = {spec.key: spec.kind for spec in codec.fields}
+            self._csv.writerows(_to_csv_row(record_type, row, kinds) for row in rows)
+        self.count += len(rows)
+
+    def _write_line(self, record_type: str, data: Dict[str, Any]) -> None:
+        """
+        JSON Lines の1行を書き出す
+
+        Args:
+            record_type: レコード種別
+            data: レコードの内容
+        """
+        self.stream.write(
+            json.dumps({"type": record_type, "data": data}, ensure_ascii=False)
+        )
+        self.stream.write("\n")
+
+
+def _to_csv_row(
+    record_type: str,
+    row: Dict[str, Any],
+    kinds: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    辞書表現を CSV の1行に変換
+
+    Args:
+        record_type: レコード種別
+        row: to_dict 形式の辞書
+        kinds: キー → 項目の型
+
+    Returns:
+        Dict[str, Any]: CSV の1行
+    """
+    line: Dict[str, Any] = {CSV_TYPE_COLUMN: record_type}
+    for key, value in row.items():
+        if value is None:
+            continue
+        line[key] = (
+            json.dumps(value, ensure_ascii=False)
+            if kinds[key] in _JSON_KINDS
+            else value
+        )
+    return line
+
+
+def iter_records(
+    stream: TextIO,
+    format: str = FORMAT_JSONL
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    ストリームからレコードを1件ずつ読み込むイテレータ
+
+    Args:
+        stream: 読み込み元のテキストストリーム
+        format: 入力形式（"jsonl" または "csv"）
+
+    Returns:
+        Iterator[Tuple[str, Dict[str, Any]]]: (レコード種別, to_dict 形式の辞書) のイテレータ
+
+    Raises:
+        ValueError: 不明な形式・レコード種別の場合、または行を解釈できない場合
+    """
+    _check_format(format)
+    if format == FORMAT_CSV:
+        return _iter_csv_records(stream)
+    return _iter_jsonl_records(stream)
+
+
+def _iter_jsonl_records(stream: TextIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    JSON Lines のレコードを読み込むイテレータ
+
+    Args:
+        stream: 読み込み元のテキストストリーム
+
+    Returns:
+        Iterator[Tuple[str, Dict[str, Any]]]: (レコード種別, 辞書) のイテレータ
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            record_type = record["type"]
+            data = record["data"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"{line_number}行目を解釈できません: {e}") from e
+        if record_type != RECORD_HEADER:
+            _codec(record_type)
+        yield record_type, data
+
+
+def _iter_csv_records(stream: TextIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    CSV のレコードを読み込むイテレータ
+
+    空のセルは項目の型に応じて「値なし」または「キーなし（既定値）」として扱います。
+
+    Args:
+        stream: 読み込み元のテキストストリーム
+
+    Returns:
+        Iterator[Tuple[str, Dict[str, Any]]]: (レコード種別, 辞書) のイテレータ
+    """
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None or CSV_TYPE_COLUMN not in reader.fieldnames:
+        raise ValueError(f"CSV に {CSV_TYPE_COLUMN} 列がありません")
+
+    plans = {
+        record_type: [(spec.key, spec.kind) for spec in codec.fields]
+        for record_type, codec in RECORD_CODECS.items()
+    }
+    for row in reader:
+        record_type = row[CSV_TYPE_COLUMN]
+        plan = plans.get(record_type)
+        if plan is None:
+            raise ValueError(f"{reader.line_num}行目: 不明なレコード種別です: {record_type}")
+        data: Dict[str, Any] = {}
+        for key, kind in plan:
+            value = row.get(key)
+            if value is None:
+                continue
+            if value == "":
+                if kind in _NULLABLE_KINDS:
+                    data[key] = None
+                elif kind not in _DEFAULTED_KINDS:
+                    data[key] = value
+                continue
+            if kind in _JSON_KINDS:
+                try:
+                    value = json.loads(value)
+                except ValueError as e:
+                    raise ValueError(f"{reader.line_num}行目の {key} を解釈できません: {e}") from e
+            data[key] = value
+        yield record_type, data
@@ -0,0 +1,486 @@
+"""
+グラフ描画サービス（ワーカープロセスでの描画と、内容ハッシュによる2段キャッシュ）
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from ccpm.config import (
+    CHART_CACHE_SIZE,
+    CHART_DIR,
+    CHART_DISK_CACHE_BYTES,
+    CHART_WORKERS,
+)
+from ccpm.presentation.charts.renderers import (
+    RENDERER_VERSION,
+    init_worker,
+    render_chart,
+)
+
+# ロガーの設定
+logger = logging.getLogger(__name__)
+
+# 描画関数: (グラフの種類, 系列, オプション) → PNG データ
+RenderFunction = Callable[[str, Dict[str, Any], Dict[str, Any]], bytes]
+
+
+def _json_default(value: Any) -> Any:
+    """
+    JSON に直接変換できない値を正規化（numpy 配列・日時・UUID）
+
+    Args:
+        value: 変換する値
+
+    Returns:
+        Any: JSON 互換の値
+
+    Raises:
+        TypeError: 変換できない値の場合
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"グラフの系列に使えない値です: {type(value).__name__}")
+
+
+def normalize(value: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    系列・オプションをワーカーに渡せる JSON 互換の値に変換
+
+    Args:
+        value: 系列またはオプション
+
+    Returns:
+        Dict[str, Any]: JSON 互換の辞書
+    """
+    normalized: Dict[str, Any] = json.loads(json.dumps(value, default=_json_default))
+    return normalized
+
+
+def _coerce_numbers(value: Any) -> Any:
+    """
+    整数を浮動小数点数にそろえる（1 と 1.0 を同じ値として扱うため）
+
+    Args:
+        value: 正規化済みの JSON 互換の値
+
+    Returns:
+        Any: 整数を浮動小数点数に変換した値
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _coerce_numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_coerce_numbers(item) for item in value]
+    return value
+
+
+def chart_key(
+    kind: str,
+    series: Dict[str, Any],
+    options: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    グラフの内容ハッシュ（キャッシュキー）を計算
+
+    系列とオプションを normalize で正規化し、整数を浮動小数点数にそろえた JSON と
+    描画関数のバージョンから計算するため、プロットする値が同じであれば呼び出し元や
+    辞書の順序、numpy 配列かリストか、1 と 1.0 の違いによらず同じキーになります。
+
+    Args:
+        kind: グラフの種類
+        series: プロットする系列
+        options: 描画オプション
+
+    Returns:
+        str: 16進数のハッシュ値
+    """
+    payload = json.dumps(
+        [
+            RENDERER_VERSION,
+            kind,
+            _coerce_numbers(normalize(series)),
+            _coerce_numbers(normalize(options or {})),
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ChartRenderService:
+    """
+    グラフを描画して PNG を返すサービス
+
+    描画はワーカープロセス（Agg バックエンド）で行い、GUI のスレッドは Future を受け取るだけで
+    待たされません。結果は内容ハッシュをキーとして、メモリ上の LRU とディスクの2段で
+    キャッシュするため、系列が変わらないグラフは描画せずにすぐ返します。
+    同じグラフの描画が実行中の場合は、その Future を共有します。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = CHART_CACHE_SIZE,
+        max_disk_bytes: int = CHART_DISK_CACHE_BYTES,
+        workers: int = CHART_WORKERS,
+        executor: Optional[Executor] = None,
+        render_function: RenderFunction = render_chart
+    ):
+        """
+        描画サービスの初期化
+
+        Args:
+            cache_dir: ディスクキャッシュのディレクトリ（省略時は設定ファイルの値）
+            max_entries: メモリに保持する最大グラフ数
+            max_disk_bytes: ディスクキャッシュの上限（バイト、0 でディスクキャッシュを使わない）
+            workers: 描画ワーカープロセス数（executor を指定した場合は無視）
+            executor: 描画に使う実行器（省略時は Agg バックエンドのプロセスプール）
+            render_function: 描画関数（プロセスプールで使う場合は pickle できる関数）
+
+        Raises:
+            ValueError: max_entries が1未満、または max_disk_bytes が負の場合
+        """
+        if max_entries < 1:
+            raise ValueError("キャッシュの最大エントリ数は1以上である必要があります")
+        if max_disk_bytes < 0:
+            raise ValueError("ディスクキャッシュの上限は0以上である必要があります")
+
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else CHART_DIR
+        self.render_function = render_function
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker
+        )
+        self._owns_executor = executor is None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.max_disk_bytes:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(
+                path.stat().st_size for path in self.cache_dir.glob("*/*.png")
+            )
+
+    def submit(
+        self,
+        kind: str,
+        series: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None
+    ) -> Future:
+        """
+        グラフの描画を依頼（キャッシュにある場合は完了済みの Future を返す）
+
+        Args:
+            kind: グラフの種類
+            series: プロットする系列
+            options: 描画オプション
+
+        Returns:
+            Future: PNG データを結果とする Future
+        """
+        options = options or {}
+        key = chart_key(kind, series, options)
+        with self._lock:
+            data = self._get_memory(key)
+            if data is None:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    self.hits += 1
+                    return pending
+        if data is not None:
+            return _completed(data)
+
+        data = self._get_disk(key)
+        if data is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._put_memory(key, data)
+            return _completed(data)
+
+        with self._lock:
+            # ディスクを読んでいる間に他のスレッドが同じグラフの描画を依頼した場合はそれを共有
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.hits += 1
+                return pending
+            self.misses += 1
+            future = self._executor.submit(
+                self.render_function, kind, normalize(series), normalize(options)
+            )
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._on_rendered(key, done))
+        return future
+
+    def render(
+        self,
+        kind: str,
+        series: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """
+        グラフを描画して結果を待つ
+
+        Args:
+            kind: グラフの種類
+            series: プロットする系列
+            options: 描画オプション
+            timeout: 待つ最大秒数
+
+        Returns:
+            bytes: PNG データ
+
+        Raises:
+            ValueError: 不明なグラフの種類の場合
+        """
+        data: bytes = self.submit(kind, series, options).result(timeout)
+        return data
+
+    async def render_async(
+        self,
+        kind: str,
+        series: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        イベントループを止めずにグラフの描画を待つ
+
+        Args:
+            kind: グラフの種類
+            series: プロットする系列
+            options: 描画オプション
+
+        Returns:
+            bytes: PNG データ
+        """
+        return await asyncio.wrap_future(self.submit(kind, series, options))
+
+    def get_cached(
+        self,
+        kind: str,
+        series: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None
+    ) -> Optional[bytes]:
+        """
+        描画せずにキャッシュ済みのグラフだけを取得
+
+        Args:
+            kind: グラフの種類
+            series: プロットする系列
+            options: 描画オプション
+
+        Returns:
+            Optional[bytes]: PNG データ、キャッシュにない場合はNone
+        """
+        key = chart_key(kind, series, options)
+        with self._lock:
+            data = self._get_memory(key)
+        if data is not None:
+            return data
+        data = self._get_disk(key)
+        if data is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._put_memory(key, data)
+        return data
+
+    def _on_rendered(self, key: str, future: Future) -> None:
+        """
+        描画完了時にキャッシュへ格納
+
+        Args:
+            key: キャッシュキー
+            future: 完了した Future
+        """
+        with self._lock:
+            self._pending.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            data = future.result()
+            self._put_memory(key, data)
+        self._put_disk(key, data)
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        """
+        メモリキャッシュから取得（呼び出し側でロックを保持）
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            Optional[bytes]: PNG データ、存在しない場合はNone
+        """
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+        return data
+
+    def _put_memory(self, key: str, data: bytes) -> None:
+        """
+        メモリキャッシュに格納し、上限を超えた分を古い順に破棄（呼び出し側でロックを保持）
+
+        Args:
+            key: キャッシュキー
+            data: PNG データ
+        """
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> Path:
+        """
+        ディスクキャッシュのパス
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            Path: PNG ファイルのパス
+        """
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    def _get_disk(self, key: str) -> Optional[bytes]:
+        """
+        ディスクキャッシュから取得し、最近使用したものとして更新日時を更新
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            Optional[bytes]: PNG データ、存在しない場合はNone
+        """
+        if not self.max_disk_bytes:
+            return None
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _put_disk(self, key: str, data: bytes) -> None:
+        """
+        ディスクキャッシュに格納し、上限を超えた場合は使われていない順に削除
+
+        Args:
+            key: キャッシュキー
+            data: PNG データ
+        """
+        if not self.max_disk_bytes or len(data) > self.max_disk_bytes:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            temporary.write_bytes(data)
+            os.replace(temporary, path)
+        except OSError as e:
+            logger.warning(f"Failed to write chart cache {path}: {e}")
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data)
+            over = self._disk_bytes > self.max_disk_bytes
+        if over:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """ディスクキャッシュを上限の9割まで、更新日時の古い順に削除"""
+        files = []
+        for path in self.cache_dir.glob("*/*.png"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = self.max_disk_bytes * 0.9
+        for _, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def clear(self) -> None:
+        """メモリとディスクのキャッシュをすべて削除（統計値はそのまま）"""
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = 0
+        if self.max_disk_bytes:
+            for path in self.cache_dir.glob("*/*.png"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        キャッシュの統計情報を取得
+
+        Returns:
+            Dict[str, Any]: エントリ数、ディスク使用量、ヒット数、ディスクヒット数、ミス数、破棄数
+        """
+        return {
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "disk_bytes": self._disk_bytes,
+            "max_disk_bytes": self.max_disk_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "pending": len(self._pending),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        描画ワーカーを停止
+
+        Args:
+            wait: 実行中の描画の完了を待つかどうか
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+
+def _completed(data: bytes) -> Future:
+    """
+    結果が確定した Future を作成
+
+    Args:
+        data: 結果の PNG データ
+
+    Returns:
+        Future: 完了済みの Future
+    """
+    future: Future = Future()
+    future.set_result(data)
+    return future
@@ -0,0 +1,215 @@
+"""
+matplotlib（Agg バックエンド）によるグラフの描画関数
+
+描画関数はワーカープロセスで実行されるため、プロットする系列とオプションを
+JSON 互換の値で受け取り、PNG のバイト列を返します。
+"""
+import io
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from ccpm.config import BUFFER_STATUS_THRESHOLDS, CHART_DPI
+
+# グラフの種類
+CHART_FEVER = "fever"
+CHART_BURNDOWN = "burndown"
+CHART_WORKLOAD_HEATMAP = "workload_heatmap"
+
+# 描画内容が変わる修正をしたら上げる（キャッシュキーに含まれる）
+RENDERER_VERSION = 1
+
+# バッファステータスの色（BufferStatus.get_color_hex と同じ値）
+ZONE_COLORS = {"green": "#28a745", "yellow": "#ffc107", "red": "#dc3545"}
+
+
+def init_worker() -> None:
+    """ワーカープロセスの初期化（GUI を持たない Agg バックエンドを選択）"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _new_figure(options: Dict[str, Any]) -> Any:
+    """
+    pyplot を介さずに Figure を作成（プロセス内の状態を共有しない）
+
+    Args:
+        options: 描画オプション（width, height, dpi）
+
+    Returns:
+        Figure: Agg キャンバスを持つ Figure
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(
+        figsize=(options.get("width", 6.4), options.get("height", 4.8)),
+        dpi=options.get("dpi", CHART_DPI),
+    )
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _to_png(figure: Any) -> bytes:
+    """
+    Figure を PNG のバイト列に変換
+
+    Args:
+        figure: 描画済みの Figure
+
+    Returns:
+        bytes: PNG データ
+    """
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def render_fever_chart(series: Dict[str, Any], options: Dict[str, Any]) -> bytes:
+    """
+    フィーバーチャート（完了率とバッファ消費率の推移）を描画
+
+    領域の境界は BufferCalculationService の相対消費率（バッファ消費率 / 完了率）の
+    閾値に対応する直線です。
+
+    Args:
+        series: 系列（"labels" は省略可）
+            {"completion": [0.0〜1.0], "consumption": [0.0〜1.0], "labels": [str]}
+        options: 描画オプション（title, thresholds, width, height, dpi）
+
+    Returns:
+        bytes: PNG データ
+    """
+    thresholds = options.get("thresholds") or BUFFER_STATUS_THRESHOLDS
+    completion = [value * 100 for value in series["completion"]]
+    consumption = [value * 100 for value in series["consumption"]]
+
+    figure = _new_figure(options)
+    axes = figure.add_subplot()
+    x = [0.0, 100.0]
+    green = [value * thresholds["green"] for value in x]
+    yellow = [value * thresholds["yellow"] for value in x]
+    axes.fill_between(x, 0, green, color=ZONE_COLORS["green"], alpha=0.35, linewidth=0)
+    axes.fill_between(
+        x, green, yellow, color=ZONE_COLORS["yellow"], alpha=0.35, linewidth=0
+    )
+    axes.fill_between(x, yellow, 100, color=ZONE_COLORS["red"], alpha=0.35, linewidth=0)
+
+    axes.plot(
+        completion,
+        consumption,
+        color="#343a40",
+        marker="o",
+        markersize=3,
+        linewidth=1.5,
+    )
+    for label, px, py in zip(series.get("labels") or [], completion, consumption):
+        if label:
+            axes.annotate(
+                label, (px, py), textcoords="offset points", xytext=(4, 4), fontsize=8
+            )
+
+    axes.set_xlim(0, 100)
+    axes.set_ylim(0, 100)
+    axes.set_xlabel("Critical chain completion (%)")
+    axes.set_ylabel("Buffer consumption (%)")
+    axes.set_title(options.get("title", "Fever chart"))
+    return _to_png(figure)
+
+
+def render_burndown(series: Dict[str, Any], options: Dict[str, Any]) -> bytes:
+    """
+    バーンダウンチャート（残作業時間の推移）を描画
+
+    Args:
+        series: {"dates": [ISO 形式の日付], "remaining": [float], "ideal": [float]（省略可）}
+        options: 描画オプション（title, width, height, dpi）
+
+    Returns:
+        bytes: PNG データ
+    """
+    dates = [datetime.fromisoformat(value) for value in series["dates"]]
+
+    figure = _new_figure(options)
+    axes = figure.add_subplot()
+    axes.plot(
+        dates,
+        series["remaining"],
+        color="#007bff",
+        marker="o",
+        markersize=3,
+        label="Remaining",
+    )
+    if series.get("ideal"):
+        axes.plot(
+            dates, series["ideal"], color="#6c757d", linestyle="--", label="Ideal"
+        )
+    axes.set_ylim(bottom=0)
+    axes.set_ylabel("Remaining hours")
+    axes.set_title(options.get("title", "Burndown"))
+    axes.legend(loc="upper right")
+    figure.autofmt_xdate()
+    return _to_png(figure)
+
+
+def render_workload_heatmap(series: Dict[str, Any], options: Dict[str, Any]) -> bytes:
+    """
+    担当者×日付の作業負荷ヒートマップを描画
+
+    Args:
+        series: {"resources": [str], "days": [str], "hours": [[float]]（担当者ごとの行）}
+        options: 描画オプション（title, capacity, width, height, dpi）
+
+    Returns:
+        bytes: PNG データ
+    """
+    resources = series["resources"]
+    days = series["days"]
+
+    figure = _new_figure(options)
+    axes = figure.add_subplot()
+    image = axes.imshow(
+        series["hours"],
+        aspect="auto",
+        cmap="YlOrRd",
+        vmin=0,
+        vmax=options.get("capacity"),
+        interpolation="nearest",
+    )
+    axes.set_yticks(range(len(resources)), labels=resources)
+    step = max(1, len(days) // 15)
+    axes.set_xticks(
+        range(0, len(days), step), labels=days[::step], rotation=45, ha="right"
+    )
+    axes.set_title(options.get("title", "Workload"))
+    figure.colorbar(image, ax=axes, label="Hours")
+    return _to_png(figure)
+
+
+# グラフの種類 → 描画関数
+CHART_RENDERERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], bytes]] = {
+    CHART_FEVER: render_fever_chart,
+    CHART_BURNDOWN: render_burndown,
+    CHART_WORKLOAD_HEATMAP: render_workload_heatmap,
+}
+
+
+def render_chart(kind: str, series: Dict[str, Any], options: Dict[str, Any]) -> bytes:
+    """
+    グラフの種類に応じた描画関数で PNG を描画（ワーカープロセスの入口）
+
+    Args:
+        kind: グラフの種類
+        series: プロットする系列
+        options: 描画オプション
+
+    Returns:
+        bytes: PNG データ
+
+    Raises:
+        ValueError: 不明なグラフの種類の場合
+    """
+    renderer = CHART_RENDERERS.get(kind)
+    if renderer is None:
+        raise ValueError(f"不明なグラフの種類です: {kind}")
+    return renderer(series, options)
@@ -0,0 +1,58 @@
+"""
+テスト共通のフィクスチャ
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, List, Sequence
+
+import pytest
+
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+
+Concurrently = Callable[[Sequence[Callable[[], None]]], None]
+
+
+@pytest.fixture
+def db() -> DatabaseManager:
+    """スキーマを作成したインメモリデータベース"""
+    manager = DatabaseManager("sqlite://")
+    manager.init_schema()
+    return manager
+
+
+@pytest.fixture
+def file_db(tmp_path: Path) -> Iterator[DatabaseManager]:
+    """スキーマを作成したファイルのデータベース（接続ごとに別々のトランザクションになる）"""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'ccpm.db'}")
+    manager.init_schema()
+    yield manager
+    manager.dispose()
+
+
+@pytest.fixture
+def concurrently() -> Concurrently:
+    """関数をそれぞれ別のスレッドで同時に開始し、すべての終了を待つ（例外は再送出）"""
+
+    def run(functions: Sequence[Callable[[], None]]) -> None:
+        barrier = threading.Barrier(len(functions))
+        errors: List[BaseException] = []
+
+        def worker(function: Callable[[], None]) -> None:
+            barrier.wait()
+            try:
+                function()
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [
+            threading.Thread(target=worker, args=(function,)) for function in functions
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    return run
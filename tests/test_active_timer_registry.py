@@ -0,0 +1,85 @@
+"""
+記録中のタイマーのWIP制限のテスト
+"""
+
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ccpm.application.services.active_timer_registry import (
+    ActiveTimerRegistry,
+    WipLimitExceededError,
+)
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from ccpm.infrastructure.repositories.sqlite_time_repository import SqliteTimeRepository
+
+
+def make_tasks(db: DatabaseManager, count: int) -> List[Task]:
+    """同じ担当者のタスク"""
+    project = SqliteProjectRepository(db).save(Project(name="WIP"))
+    tasks = [
+        Task(name=f"task-{i}", project_id=project.id, resource="佐藤")
+        for i in range(count)
+    ]
+    return SqliteTaskRepository(db).save_many(tasks)
+
+
+def make_registry(db: DatabaseManager, wip_limit: int = 1) -> ActiveTimerRegistry:
+    """データベースを共有する別々のレジストリ（別プロセスの想定）"""
+    return ActiveTimerRegistry(
+        SqliteTimeRepository(db), SqliteTaskRepository(db), wip_limit
+    )
+
+
+def test_limit_is_checked_against_the_database(db: DatabaseManager) -> None:
+    """他のレジストリが開始したタイマーも制限の判定に含まれる"""
+    tasks = make_tasks(db, 2)
+    first, second = make_registry(db), make_registry(db)
+
+    started = first.start(tasks[0].id)
+    with pytest.raises(WipLimitExceededError) as raised:
+        second.start(tasks[1].id)
+    assert raised.value.active_task_ids == [tasks[0].id]
+
+    # 同じタスクは既存の記録中の時間記録を返す
+    assert second.start(tasks[0].id).id == started.id
+    assert len(SqliteTimeRepository(db).find_active_records()) == 1
+
+
+def test_concurrent_starts_do_not_exceed_limit(tmp_path: Path) -> None:
+    """別々の接続から同時に開始しても制限を超えない"""
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'timers.db'}")
+    db.init_schema()
+    tasks = make_tasks(db, 8)
+    registries = [make_registry(db, wip_limit=2) for _ in tasks]
+    barrier = threading.Barrier(len(tasks))
+    outcomes: List[bool] = []
+
+    def start(registry: ActiveTimerRegistry, task: Task) -> None:
+        barrier.wait()
+        try:
+            registry.start(task.id)
+            outcomes.append(True)
+        except WipLimitExceededError:
+            outcomes.append(False)
+
+    threads = [
+        threading.Thread(target=start, args=(registry, task))
+        for registry, task in zip(registries, tasks)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes.count(True) == 2
+    assert len(SqliteTimeRepository(db).find_active_records()) == 2
+    db.dispose()
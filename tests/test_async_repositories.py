@@ -0,0 +1,177 @@
+"""
+非同期リポジトリと asyncio.gather による並行読み込みのテスト
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterator, Tuple
+
+import pytest
+
+from ccpm.application.services.dashboard_query import DashboardQueryService
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.async_repositories import (
+    AsyncProjectRepository,
+    AsyncTaskRepository,
+    AsyncTimeRepository,
+    RepositoryExecutor,
+)
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from ccpm.infrastructure.repositories.sqlite_time_repository import SqliteTimeRepository
+
+Repositories = Tuple[
+    SqliteProjectRepository, SqliteTaskRepository, SqliteTimeRepository
+]
+
+
+@pytest.fixture
+def executor(file_db: DatabaseManager) -> Iterator[RepositoryExecutor]:
+    """接続プールに合わせた実行器"""
+    executor = RepositoryExecutor.for_database(file_db)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def repositories(file_db: DatabaseManager) -> Repositories:
+    """プロジェクト・タスク・時間記録を登録した同期リポジトリ"""
+    projects = SqliteProjectRepository(file_db)
+    tasks = SqliteTaskRepository(file_db)
+    records = SqliteTimeRepository(file_db)
+    base = datetime(2026, 3, 2, 9, 0)
+    for i in range(4):
+        project = projects.save(
+            Project(
+                name=f"project-{i}",
+                start_date=base,
+                status="進行中" if i % 2 else "未着手",
+                buffer_size=10.0,
+                buffer_consumed=float(i),
+            )
+        )
+        previous = None
+        for j in range(3):
+            task = tasks.save(
+                Task(
+                    name=f"task-{i}-{j}",
+                    project_id=project.id,
+                    status="完了" if j < i else "未着手",
+                    estimated_hours=4.0 + j,
+                    dependencies=[previous.id] if previous else [],
+                )
+            )
+            records.save(
+                TimeRecord(
+                    task_id=task.id,
+                    start_time=base + timedelta(days=i, hours=j),
+                    end_time=base + timedelta(days=i, hours=j + 1),
+                )
+            )
+            previous = task
+    return projects, tasks, records
+
+
+def test_dashboard_fan_out_matches_sync_reads(
+    repositories: Repositories, executor: RepositoryExecutor
+) -> None:
+    """gather で並行に読み込んだダッシュボードが、同期で順に読み込んだ結果と一致する"""
+    projects, tasks, records = repositories
+    service = DashboardQueryService(
+        AsyncProjectRepository(projects, executor),
+        AsyncTaskRepository(tasks, executor),
+        AsyncTimeRepository(records, executor),
+    )
+    since = datetime(2026, 3, 3)
+    until = datetime(2026, 3, 10)
+
+    data = asyncio.run(service.load_dashboard(since=since, until=until))
+
+    expected = [
+        service.build_overview(project, tasks.find_by_project_id(project.id))
+        for project in projects.find_all()
+    ]
+    assert [overview.project.to_dict() for overview in data.overviews] == [
+        overview.project.to_dict() for overview in expected
+    ]
+    for actual, overview in zip(data.overviews, expected):
+        assert [task.to_dict() for task in actual.tasks] == [
+            task.to_dict() for task in overview.tasks
+        ]
+        assert actual.completion == overview.completion
+        assert actual.buffer_status == overview.buffer_status
+    assert [record.to_dict() for record in data.time_records] == [
+        record.to_dict() for record in records.find_by_date_range(since, until)
+    ]
+
+    filtered = asyncio.run(service.load_dashboard(status="進行中"))
+    assert [overview.project.id for overview in filtered.overviews] == [
+        project.id for project in projects.find_by_status("進行中")
+    ]
+    assert filtered.time_records == []
+
+
+def test_gathered_repository_calls_match_sync_calls(
+    repositories: Repositories, executor: RepositoryExecutor
+) -> None:
+    """非同期リポジトリのメソッドを同時に実行しても、同期メソッドと同じ結果を返す"""
+    projects, tasks, records = repositories
+    async_projects = AsyncProjectRepository(projects, executor)
+    async_tasks = AsyncTaskRepository(tasks, executor)
+    async_records = AsyncTimeRepository(records, executor)
+    project_ids = [project.id for project in projects.find_all()]
+
+    async def load() -> tuple:
+        return await asyncio.gather(
+            async_projects.count(),
+            async_projects.find_columns(["id", "name"]),
+            async_tasks.count(),
+            async_records.find_by_task_ids([task.id for task in tasks.find_all()]),
+            *(async_tasks.find_by_project_id(project_id) for project_id in project_ids),
+        )
+
+    project_count, columns, task_count, time_records, *by_project = asyncio.run(load())
+
+    assert project_count == projects.count()
+    assert columns == list(projects.iter_columns(["id", "name"]))
+    assert task_count == tasks.count()
+    assert [record.to_dict() for record in time_records] == [
+        record.to_dict()
+        for record in records.find_by_task_ids([task.id for task in tasks.find_all()])
+    ]
+    for project_id, project_tasks in zip(project_ids, by_project):
+        assert [task.to_dict() for task in project_tasks] == [
+            task.to_dict() for task in tasks.find_by_project_id(project_id)
+        ]
+
+
+def test_load_project_overview(
+    repositories: Repositories, executor: RepositoryExecutor
+) -> None:
+    """1プロジェクトの概要を読み込み、存在しないプロジェクトはNoneを返す"""
+    projects, tasks, _ = repositories
+    service = DashboardQueryService(
+        AsyncProjectRepository(projects, executor),
+        AsyncTaskRepository(tasks, executor),
+    )
+    project = projects.find_all()[1]
+
+    overview = asyncio.run(service.load_project_overview(project.id))
+    expected = service.build_overview(project, tasks.find_by_project_id(project.id))
+
+    assert overview is not None
+    assert overview.completion == expected.completion
+    assert overview.buffer_status == expected.buffer_status
+    assert asyncio.run(service.load_project_overview(Task("x", project.id).id)) is None
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_executor_rejects_non_positive_workers(max_workers: int) -> None:
+    """同時実行数が1未満の実行器は作成できない"""
+    with pytest.raises(ValueError):
+        RepositoryExecutor(max_workers=max_workers)
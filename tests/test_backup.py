@@ -0,0 +1,119 @@
+"""
+差分・圧縮バックアップの作成・復元・保持方針のテスト
+"""
+
+import zlib
+from pathlib import Path
+from typing import List, Set
+
+import pytest
+
+from ccpm.domain.entities.project import Project
+from ccpm.infrastructure.db.backup import BackupManager, RetentionPolicy
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+
+
+@pytest.fixture
+def manager(file_db: DatabaseManager, tmp_path: Path) -> BackupManager:
+    """ページ単位のチャンクで保存するバックアップ管理"""
+    return BackupManager(file_db, tmp_path / "backups", chunk_size=4096)
+
+
+def stored_chunks(manager: BackupManager) -> Set[str]:
+    """格納済みのチャンクのダイジェスト"""
+    return {path.name for path in manager.chunk_dir.glob("*/*")}
+
+
+def project_names(db_path: Path) -> List[str]:
+    """データベースファイルのプロジェクト名"""
+    db = DatabaseManager(f"sqlite:///{db_path}")
+    try:
+        return sorted(
+            project.name for project in SqliteProjectRepository(db).find_all()
+        )
+    finally:
+        db.dispose()
+
+
+def test_unchanged_database_stores_no_new_chunks(manager: BackupManager) -> None:
+    """変更がなければ2回目のスナップショットは既存のチャンクだけを参照する"""
+    first = manager.create_snapshot()
+    chunks = stored_chunks(manager)
+    second = manager.create_snapshot()
+
+    assert first.new_chunks == len(chunks) > 0
+    assert second.new_chunks == 0
+    assert second.chunks == first.chunks
+    assert stored_chunks(manager) == chunks
+    assert [snapshot.id for snapshot in manager.list_snapshots()] == [
+        first.id,
+        second.id,
+    ]
+
+
+def test_corrupted_chunk_fails_restore(manager: BackupManager, tmp_path: Path) -> None:
+    """内容がダイジェストと一致しないチャンクがあれば復元しない"""
+    snapshot = manager.create_snapshot()
+    digest = snapshot.chunks[0]
+    manager._chunk_path(digest).write_bytes(zlib.compress(b"corrupted"))
+
+    target = tmp_path / "restored.db"
+    with pytest.raises(ValueError):
+        manager.restore(target_path=target)
+    assert not target.exists()
+
+    manager._chunk_path(digest).write_bytes(b"not compressed")
+    with pytest.raises(ValueError):
+        manager.restore(target_path=target)
+
+
+def test_restore_at_picks_the_snapshot_of_that_time(
+    file_db: DatabaseManager, manager: BackupManager, tmp_path: Path
+) -> None:
+    """指定日時の時点で最新のスナップショットから復元する"""
+    repository = SqliteProjectRepository(file_db)
+    repository.save(Project(name="first"))
+    first = manager.create_snapshot()
+    repository.save(Project(name="second"))
+    second = manager.create_snapshot()
+
+    assert (
+        manager.restore(at=first.created_at, target_path=tmp_path / "a.db").id
+        == first.id
+    )
+    assert project_names(tmp_path / "a.db") == ["first"]
+    assert manager.restore(target_path=tmp_path / "b.db").id == second.id
+    assert project_names(tmp_path / "b.db") == ["first", "second"]
+    with pytest.raises(ValueError):
+        manager.restore(at=first.created_at.replace(year=2000))
+
+    restored: List[bool] = []
+    manager.on_restore.append(lambda: restored.append(True))
+    manager.restore(at=first.created_at)
+    assert [project.name for project in repository.find_all()] == ["first"]
+    assert restored == [True]
+
+
+def test_retention_deletes_only_unreferenced_chunks(
+    file_db: DatabaseManager, manager: BackupManager, tmp_path: Path
+) -> None:
+    """保持しないスナップショットだけが参照するチャンクを削除し、保持したものは復元できる"""
+    repository = SqliteProjectRepository(file_db)
+    snapshots = []
+    for i in range(3):
+        repository.save(Project(name=f"project-{i}", description="x" * 5000))
+        snapshots.append(manager.create_snapshot())
+    kept = snapshots[-1]
+    unreferenced = stored_chunks(manager) - set(kept.chunks)
+    assert unreferenced
+
+    removed = manager.apply_retention(RetentionPolicy(keep_last=1, keep_daily=0))
+
+    assert removed == (2, len(unreferenced))
+    assert stored_chunks(manager) == set(kept.chunks)
+    assert [snapshot.id for snapshot in manager.list_snapshots()] == [kept.id]
+    manager.restore(target_path=tmp_path / "kept.db")
+    assert project_names(tmp_path / "kept.db") == [f"project-{i}" for i in range(3)]
@@ -0,0 +1,104 @@
+"""
+バッファ変更イベントの記録のテスト
+"""
+
+import random
+from datetime import date
+from typing import Callable, Sequence
+
+from ccpm.domain.entities.project import Project
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.db.schema import buffer_events, buffer_snapshots
+from ccpm.infrastructure.repositories.sqlite_buffer_history_repository import (
+    SqliteBufferHistoryRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+
+
+def saved_project(db: DatabaseManager) -> Project:
+    """バッファサイズ10・消費済み4で保存したプロジェクト"""
+    project = Project(name="履歴", start_date=date(2026, 1, 5))
+    project.buffer_size = 10.0
+    project.buffer_consumed = 4.0
+    return SqliteProjectRepository(db).save(project)
+
+
+def test_changes_are_recorded_with_absolute_values(db: DatabaseManager) -> None:
+    project = saved_project(db)
+    project.buffer_consumed = 5.0
+    SqliteProjectRepository(db).save(project)
+
+    events = SqliteBufferHistoryRepository(db).find_events(project.id)
+    assert [(event.buffer_size, event.buffer_consumed) for event in events] == [
+        (10.0, 0.0),
+        (10.0, 4.0),
+        (10.0, 5.0),
+    ]
+
+
+def test_project_without_history_is_seeded_from_its_row(db: DatabaseManager) -> None:
+    project = saved_project(db)
+    # 履歴の記録を始める前から存在するプロジェクトを再現する
+    with db.engine.begin() as conn:
+        conn.execute(buffer_events.delete())
+        conn.execute(buffer_snapshots.delete())
+
+    project.buffer_consumed = 5.0
+    SqliteProjectRepository(db).save(project)
+    history = SqliteBufferHistoryRepository(db)
+    events = history.find_events(project.id)
+    assert len(events) == 1
+    assert (events[0].size_delta, events[0].consumed_delta) == (0.0, 1.0)
+    assert (events[0].buffer_size, events[0].buffer_consumed) == (10.0, 5.0)
+
+    assert history.record_progress(project.id, 0.5)
+    state = history.latest_states([project.id])[project.id]
+    assert (state.buffer_size, state.buffer_consumed) == (10.0, 5.0)
+
+
+def test_progress_without_history_is_seeded_from_its_row(db: DatabaseManager) -> None:
+    project = saved_project(db)
+    with db.engine.begin() as conn:
+        conn.execute(buffer_events.delete())
+        conn.execute(buffer_snapshots.delete())
+
+    history = SqliteBufferHistoryRepository(db)
+    assert history.record_progress(project.id, 0.25)
+    state = history.latest_states([project.id])[project.id]
+    assert (state.buffer_size, state.buffer_consumed) == (10.0, 4.0)
+    assert state.completion == 0.25
+
+
+def test_concurrent_saves_log_consistent_events(
+    file_db: DatabaseManager,
+    concurrently: Callable[[Sequence[Callable[[], None]]], None],
+) -> None:
+    """別々の接続から同時に保存しても、イベントの増減が最終的なバッファの値と一致する"""
+    project = saved_project(file_db)
+
+    def editor(seed: int) -> Callable[[], None]:
+        def edit() -> None:
+            rng = random.Random(seed)
+            repository = SqliteProjectRepository(file_db)
+            for _ in range(10):
+                stored = repository.find_by_id(project.id)
+                assert stored is not None
+                stored.buffer_size = float(rng.randint(8, 12))
+                stored.buffer_consumed = float(rng.randint(0, 8))
+                repository.save(stored)
+
+        return edit
+
+    concurrently([editor(seed) for seed in range(6)])
+
+    final = SqliteProjectRepository(file_db).find_by_id(project.id)
+    assert final is not None
+    events = SqliteBufferHistoryRepository(file_db).find_events(project.id)
+    size = consumed = 0.0
+    for event in events:
+        size += event.size_delta
+        consumed += event.consumed_delta
+        assert (event.buffer_size, event.buffer_consumed) == (size, consumed)
+    assert (size, consumed) == (final.buffer_size, final.buffer_consumed)
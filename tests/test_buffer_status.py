@@ -0,0 +1,83 @@
+"""
+バッファステータスの一括判定と個別判定の一致のテスト
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.services.buffer_calculation import BufferCalculationService
+from ccpm.domain.value_objects.buffer_status import (
+    BufferStatus,
+    BufferStatusBatch,
+    BufferStatusColor,
+    ThresholdProfile,
+)
+
+PROFILES = [
+    None,
+    {"green": 0.33, "yellow": 0.67},
+    {"green": 0.1, "yellow": 0.1},
+    {"green": 0.0, "yellow": 0.5},
+    {"green": 0.7, "yellow": 1.0},
+]
+
+
+def around_thresholds(thresholds: Dict[str, float]) -> List[float]:
+    """各閾値ちょうどと、その前後の最も近い浮動小数点数、および範囲外の値"""
+    values = [-0.5, 0.0, 0.5, 1.0, 1.5]
+    for bound in (thresholds["green"], thresholds["yellow"]):
+        values += [
+            float(np.nextafter(bound, -np.inf)),
+            bound,
+            float(np.nextafter(bound, np.inf)),
+            bound - 1e-9,
+            bound + 1e-9,
+        ]
+    return values
+
+
+@pytest.mark.parametrize("thresholds", PROFILES)
+def test_batch_colors_match_scalar_status(thresholds: Dict[str, float]) -> None:
+    """閾値ちょうどとその前後の消費率で、一括判定と個別判定の色が一致する"""
+    profile = ThresholdProfile.of(thresholds)
+    rates = around_thresholds(profile.mapping)
+
+    batch = BufferStatusBatch(np.array(rates), thresholds)
+
+    expected = [BufferStatus(rate, thresholds) for rate in rates]
+    assert batch.colors() == [status.color for status in expected]
+    assert [batch[i] for i in range(len(batch))] == expected
+    counts = batch.counts()
+    for color in BufferStatusColor:
+        assert counts[color] == sum(status.color == color for status in expected)
+
+
+@pytest.mark.parametrize("thresholds", PROFILES)
+def test_service_batch_matches_scalar_service(thresholds: Dict[str, float]) -> None:
+    """get_buffer_statuses が get_buffer_status をプロジェクトごとに呼んだ結果と一致する"""
+    service = BufferCalculationService(thresholds=thresholds)
+    rng = np.random.default_rng(20)
+    # 完了率0で消費率をそのまま閾値付近に置く行と、ランダムな行
+    rates = around_thresholds(service.thresholds.mapping)
+    sizes = np.concatenate([np.ones(len(rates)), rng.choice([0.0, 5.0, 12.5], 200)])
+    consumed = np.concatenate([rates, rng.uniform(0.0, 15.0, 200)])
+    completion = np.concatenate([np.zeros(len(rates)), rng.uniform(0.0, 1.0, 200)])
+    completion[-20:] = 0.0
+
+    batch = service.get_buffer_statuses(sizes, consumed, completion)
+
+    expected = [
+        service.get_buffer_status(
+            Project(name="p", buffer_size=size, buffer_consumed=used), done
+        )
+        for size, used, done in zip(
+            sizes.tolist(), consumed.tolist(), completion.tolist()
+        )
+    ]
+    assert batch.colors() == [status.color for status in expected]
+    np.testing.assert_array_equal(
+        batch.consumption_rates, [status.consumption_rate for status in expected]
+    )
@@ -0,0 +1,268 @@
+"""
+キャッシュ付きリポジトリの書き込みと読み込み結果の登録の整合性のテスト
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional
+from uuid import UUID
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.cached_repositories import (
+    PROJECT,
+    TASK,
+    CachedProjectRepository,
+    CachedTaskRepository,
+    EntityCache,
+)
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+
+class InterleavedTaskRepository(SqliteTaskRepository):
+    """読み込み直後（キャッシュに登録する前）に別の処理を割り込ませるリポジトリ"""
+
+    def __init__(self, db: DatabaseManager):
+        super().__init__(db)
+        self.after_read: Optional[Callable[[], None]] = None
+
+    def _interleave(self) -> None:
+        callback, self.after_read = self.after_read, None
+        if callback is not None:
+            callback()
+
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        task = super().find_by_id(task_id)
+        self._interleave()
+        return task
+
+    def find_by_project_id(self, project_id: UUID) -> List[Task]:
+        tasks = super().find_by_project_id(project_id)
+        self._interleave()
+        return tasks
+
+
+class InterleavedProjectRepository(SqliteProjectRepository):
+    """読み込み直後（キャッシュに登録する前）に別の処理を割り込ませるリポジトリ"""
+
+    def __init__(self, db: DatabaseManager):
+        super().__init__(db)
+        self.after_read: Optional[Callable[[], None]] = None
+
+    def find_all(self) -> List[Project]:
+        projects = super().find_all()
+        callback, self.after_read = self.after_read, None
+        if callback is not None:
+            callback()
+        return projects
+
+
+def make_tasks(db: DatabaseManager, count: int = 3) -> List[Task]:
+    """プロジェクトとタスクを保存"""
+    project = Project(name="project")
+    SqliteProjectRepository(db).save(project)
+    tasks = [Task(name=f"task-{i}", project_id=project.id) for i in range(count)]
+    SqliteTaskRepository(db).save_many(tasks)
+    return tasks
+
+
+def test_write_through_is_visible_to_other_sessions(db: DatabaseManager) -> None:
+    """保存した内容が別セッションの ID 検索とプロジェクト単位の一覧に反映される"""
+    cache = EntityCache(100)
+    tasks = make_tasks(db)
+    reader = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    assert [task.name for task in reader.find_by_project_id(tasks[0].project_id)] == [
+        "task-0",
+        "task-1",
+        "task-2",
+    ]
+
+    writer = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    task = writer.find_by_id(tasks[1].id)
+    assert task is not None
+    task.name = "renamed"
+    writer.save(task)
+
+    session = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    found = session.find_by_id(tasks[1].id)
+    assert found is not None and found.name == "renamed"
+    listing = session.find_by_project_id(tasks[0].project_id)
+    assert [task.name for task in listing] == ["task-0", "renamed", "task-2"]
+
+
+def test_task_moved_after_listing_leaves_old_listing(db: DatabaseManager) -> None:
+    """一覧から読み込んだタスクを別のプロジェクトに移すと、以前の一覧から外れる"""
+    cache = EntityCache(100)
+    tasks = make_tasks(db)
+    other = SqliteProjectRepository(db).save(Project(name="other"))
+    old_project_id = tasks[0].project_id
+    session = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    listed = session.find_by_project_id(old_project_id)
+    assert session.find_by_project_id(other.id) == []
+
+    listed[0].project_id = other.id
+    session.save(listed[0])
+
+    reader = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    assert [task.name for task in reader.find_by_project_id(old_project_id)] == [
+        "task-1",
+        "task-2",
+    ]
+    assert [task.name for task in reader.find_by_project_id(other.id)] == ["task-0"]
+
+
+def test_task_moved_after_its_entry_is_dropped_leaves_old_listing(
+    db: DatabaseManager,
+) -> None:
+    """ID のエントリが破棄された後に移したタスクも、以前の一覧から外れる"""
+    cache = EntityCache(100)
+    tasks = make_tasks(db)
+    other = SqliteProjectRepository(db).save(Project(name="other"))
+    session = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    session.find_by_project_id(tasks[0].project_id)
+    cache.invalidate(TASK, tasks[0].id)
+
+    moved = SqliteTaskRepository(db).find_by_id(tasks[0].id)
+    assert moved is not None
+    moved.project_id = other.id
+    CachedTaskRepository(SqliteTaskRepository(db), cache).save(moved)
+
+    reader = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    listing = reader.find_by_project_id(tasks[0].project_id)
+    assert [task.id for task in listing] == [task.id for task in tasks[1:]]
+
+
+def test_fill_started_before_save_does_not_overwrite_it(db: DatabaseManager) -> None:
+    """読み込みと登録の間に保存された場合、古い読み込み結果はキャッシュに登録しない"""
+    cache = EntityCache(100)
+    tasks = make_tasks(db)
+    inner = InterleavedTaskRepository(db)
+    reader = CachedTaskRepository(inner, cache)
+    writer = CachedTaskRepository(SqliteTaskRepository(db), cache)
+
+    def save_newer() -> None:
+        newer = SqliteTaskRepository(db).find_by_id(tasks[0].id)
+        assert newer is not None
+        newer.name = "newer"
+        writer.save(newer)
+
+    inner.after_read = save_newer
+    stale = reader.find_by_id(tasks[0].id)
+    assert stale is not None and stale.name == "task-0"
+    cached = cache.peek(TASK, tasks[0].id)
+    assert cached is not None and cached.name == "newer"
+
+    inner.after_read = save_newer
+    reader.find_by_project_id(tasks[0].project_id)
+    session = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    assert session.find_by_project_id(tasks[0].project_id)[0].name == "newer"
+
+
+def test_listing_fill_started_before_save_is_discarded(db: DatabaseManager) -> None:
+    """一覧の読み込み中に保存されたプロジェクトは、古い一覧で上書きされない"""
+    cache = EntityCache(100)
+    project = Project(name="before")
+    SqliteProjectRepository(db).save(project)
+    inner = InterleavedProjectRepository(db)
+    reader = CachedProjectRepository(inner, cache)
+    writer = CachedProjectRepository(SqliteProjectRepository(db), cache)
+
+    def save_newer() -> None:
+        newer = SqliteProjectRepository(db).find_by_id(project.id)
+        assert newer is not None
+        newer.name = "after"
+        writer.save(newer)
+
+    inner.after_read = save_newer
+    assert [p.name for p in reader.find_all()] == ["before"]
+    cached = cache.peek(PROJECT, project.id)
+    assert cached is not None and cached.name == "after"
+    session = CachedProjectRepository(SqliteProjectRepository(db), cache)
+    assert [p.name for p in session.find_all()] == ["after"]
+
+
+def test_fill_after_delete_is_discarded(db: DatabaseManager) -> None:
+    """読み込み中に削除されたタスクはキャッシュに登録しない"""
+    cache = EntityCache(100)
+    tasks = make_tasks(db)
+    inner = InterleavedTaskRepository(db)
+    reader = CachedTaskRepository(inner, cache)
+    deleter = CachedTaskRepository(SqliteTaskRepository(db), cache)
+
+    def delete_task() -> None:
+        deleter.delete(tasks[2].id)
+
+    inner.after_read = delete_task
+    reader.find_by_id(tasks[2].id)
+    assert cache.peek(TASK, tasks[2].id) is None
+    assert (
+        CachedTaskRepository(SqliteTaskRepository(db), cache).find_by_id(tasks[2].id)
+        is None
+    )
+
+
+def test_fill_is_discarded_after_write_records_are_evicted() -> None:
+    """書き込みの記録が上限で破棄された後は、それより前に始めた読み込みを登録しない"""
+    cache = EntityCache(2)
+    version = cache.current_version()
+    for key in range(5):
+        cache.put(TASK, key, f"value-{key}")
+    assert not cache.fill(TASK, 0, "stale", version)
+    assert cache.fill(TASK, 0, "fresh", cache.current_version())
+    assert cache.peek(TASK, 0) == "fresh"
+
+
+def test_overlapping_writes_drop_the_entry() -> None:
+    """保存が重なった場合は前後関係が分からないため、エントリを破棄する"""
+    cache = EntityCache(10)
+    first = cache.current_version()
+    second = cache.current_version()
+    assert cache.write(TASK, 0, "second", second)
+    assert not cache.write(TASK, 0, "first", first)
+    assert cache.peek(TASK, 0) is None
+    assert cache.write(TASK, 0, "third", cache.current_version())
+    assert cache.peek(TASK, 0) == "third"
+
+
+def test_concurrent_saves_and_reads_converge(tmp_path: Path) -> None:
+    """複数スレッドで保存と読み込みを繰り返しても、キャッシュは最後に保存した内容になる"""
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'ccpm.db'}")
+    db.init_schema()
+    cache = EntityCache(100)
+    tasks = make_tasks(db, count=4)
+    errors: List[Exception] = []
+
+    def work(worker: int) -> None:
+        try:
+            for step in range(30):
+                session = CachedTaskRepository(SqliteTaskRepository(db), cache)
+                task = tasks[(worker + step) % len(tasks)]
+                if worker % 2:
+                    session.find_by_id(task.id)
+                    session.find_by_project_id(task.project_id)
+                else:
+                    loaded = SqliteTaskRepository(db).find_by_id(task.id)
+                    assert loaded is not None
+                    loaded.name = f"{worker}-{step}"
+                    session.save(loaded)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    stored = {task.id: task.name for task in SqliteTaskRepository(db).find_all()}
+    session = CachedTaskRepository(SqliteTaskRepository(db), cache)
+    for task in tasks:
+        found = session.find_by_id(task.id)
+        assert found is not None and found.name == stored[task.id]
+    listing = session.find_by_project_id(tasks[0].project_id)
+    assert {task.id: task.name for task in listing} == stored
@@ -0,0 +1,140 @@
+"""
+グラフ描画サービスのキャッシュキーと2段キャッシュのテスト
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pytest
+
+from ccpm.presentation.charts.chart_service import ChartRenderService, chart_key
+from ccpm.presentation.charts.renderers import CHART_BURNDOWN, CHART_FEVER
+
+FEVER = {"completion": [0.0, 0.25, 0.5], "consumption": [0.0, 0.1, 0.4]}
+
+
+class CountingRenderer:
+    """描画した内容を記録し、呼び出しごとに異なる PNG データを返す描画関数"""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(
+        self, kind: str, series: Dict[str, Any], options: Dict[str, Any]
+    ) -> bytes:
+        self.release.wait()
+        self.calls.append((kind, series, options))
+        return f"png-{len(self.calls)}".encode()
+
+
+@pytest.fixture
+def renderer() -> CountingRenderer:
+    """呼び出しを記録する描画関数"""
+    return CountingRenderer()
+
+
+@pytest.fixture
+def service(tmp_path: Path, renderer: CountingRenderer) -> Iterator[ChartRenderService]:
+    """スレッドで描画し、一時ディレクトリにディスクキャッシュを置くサービス"""
+    executor = ThreadPoolExecutor(max_workers=2)
+    service = ChartRenderService(
+        cache_dir=tmp_path / "charts",
+        max_entries=2,
+        executor=executor,
+        render_function=renderer,
+    )
+    yield service
+    executor.shutdown()
+
+
+def test_key_changes_with_the_plotted_data() -> None:
+    """系列・オプション・グラフの種類のいずれかが変われば別のキーになる"""
+    key = chart_key(CHART_FEVER, FEVER)
+
+    assert chart_key(CHART_FEVER, dict(FEVER, consumption=[0.0, 0.1, 0.45])) != key
+    assert chart_key(CHART_FEVER, dict(FEVER, labels=["a", "b", "c"])) != key
+    assert chart_key(CHART_FEVER, FEVER, {"title": "p"}) != key
+    assert chart_key(CHART_BURNDOWN, FEVER) != key
+
+
+def test_key_ignores_representation_of_the_same_data() -> None:
+    """辞書の順序・numpy 配列・整数と浮動小数点数の違いではキーが変わらない"""
+    key = chart_key(CHART_FEVER, FEVER, {"width": 6, "height": 4})
+
+    assert (
+        chart_key(
+            CHART_FEVER,
+            {
+                "consumption": np.array([0, 0.1, 0.4]),
+                "completion": np.array([0, 0.25, 0.5]),
+            },
+            {"height": 4.0, "width": 6.0},
+        )
+        == key
+    )
+    assert chart_key(
+        CHART_BURNDOWN, {"dates": [datetime(2026, 3, 2)], "remaining": [1]}
+    ) == chart_key(
+        CHART_BURNDOWN, {"dates": ["2026-03-02T00:00:00"], "remaining": [1.0]}
+    )
+
+
+def test_repeated_render_hits_the_memory_cache(
+    service: ChartRenderService, renderer: CountingRenderer
+) -> None:
+    """同じ内容の2回目以降の描画は描画関数を呼ばずにキャッシュから返す"""
+    first = service.render(CHART_FEVER, FEVER)
+    again = service.render(
+        CHART_FEVER, {key: list(value) for key, value in FEVER.items()}
+    )
+    changed = service.render(CHART_FEVER, dict(FEVER, consumption=[0.0, 0.2, 0.5]))
+
+    assert first == again != changed
+    assert len(renderer.calls) == 2
+    assert service.stats()["hits"] == 1
+    assert service.stats()["misses"] == 2
+    assert service.get_cached(CHART_FEVER, FEVER) == first
+
+
+def test_disk_cache_survives_memory_eviction_and_restart(
+    tmp_path: Path, service: ChartRenderService, renderer: CountingRenderer
+) -> None:
+    """メモリから破棄されたグラフや再起動後のグラフはディスクキャッシュから返す"""
+    first = service.render(CHART_FEVER, FEVER)
+    for i in range(2):
+        service.render(CHART_FEVER, dict(FEVER, labels=[str(i)] * 3))
+    assert service.stats()["evictions"] == 1
+
+    assert service.render(CHART_FEVER, FEVER) == first
+    assert service.stats()["disk_hits"] == 1
+    assert len(renderer.calls) == 3
+
+    restarted = ChartRenderService(
+        cache_dir=tmp_path / "charts",
+        executor=ThreadPoolExecutor(max_workers=1),
+        render_function=renderer,
+    )
+    try:
+        assert restarted.get_cached(CHART_FEVER, FEVER) == first
+        assert len(renderer.calls) == 3
+    finally:
+        restarted._executor.shutdown()
+
+
+def test_concurrent_requests_share_the_pending_render(
+    service: ChartRenderService, renderer: CountingRenderer
+) -> None:
+    """描画中の同じグラフの依頼は実行中の Future を共有する"""
+    renderer.release.clear()
+    futures = [service.submit(CHART_FEVER, FEVER) for _ in range(3)]
+    renderer.release.set()
+
+    assert len({future.result(timeout=5) for future in futures}) == 1
+    assert len(renderer.calls) == 1
+    assert service.stats()["pending"] == 0
@@ -0,0 +1,90 @@
+"""
+モンテカルロ完了予測のテスト
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.completion_forecast import (
+    CHUNK_TRIALS,
+    CompletionForecastService,
+)
+
+
+def make_tasks(project: Project) -> List[Task]:
+    """完了済みタスク（予実比率の標本）と未着手のタスクの DAG"""
+    history = [
+        Task(
+            name=f"done-{i}",
+            project_id=project.id,
+            estimated_hours=4.0,
+            actual_hours=hours,
+            status="完了",
+            category="実装",
+        )
+        for i, hours in enumerate([3.0, 4.0, 5.0, 6.0, 8.0, 4.5])
+    ]
+    design = Task(name="design", project_id=project.id, estimated_hours=8.0)
+    build = Task(
+        name="build", project_id=project.id, estimated_hours=16.0, category="実装"
+    )
+    test = Task(name="test", project_id=project.id, estimated_hours=6.0)
+    build.dependencies.append(design.id)
+    test.dependencies.extend([design.id, build.id])
+    return history + [design, build, test]
+
+
+def test_same_seed_gives_same_percentiles_serial_and_pooled() -> None:
+    """同じシードなら単一プロセスでもプロセスプールでも同じ予測になる"""
+    project = Project(name="forecast", start_date=datetime(2026, 4, 1))
+    tasks = make_tasks(project)
+    trials = CHUNK_TRIALS * 2 + 500
+    base_date = datetime(2026, 4, 1)
+
+    serial = CompletionForecastService(trials=trials).predict_completion(
+        project, tasks, base_date=base_date, seed=42
+    )
+    pooled = CompletionForecastService(trials=trials, workers=2).predict_completion(
+        project, tasks, base_date=base_date, seed=42
+    )
+
+    assert serial.trials == pooled.trials == trials
+    assert serial.percentiles == pooled.percentiles
+    assert (serial.lower_hours, serial.upper_hours) == (
+        pooled.lower_hours,
+        pooled.upper_hours,
+    )
+    assert serial.mean_hours == pooled.mean_hours
+    assert serial.percentiles[50] <= serial.percentiles[85] <= serial.percentiles[95]
+    # 完了タスクの消化分を除いた最長パス（design → build → test）の見積り付近
+    assert 20.0 < serial.percentiles[50] < 45.0
+
+
+def test_project_without_start_date_uses_now() -> None:
+    """開始日のないプロジェクトは現在時刻を基準日時とする"""
+    project = Project(name="forecast")
+    before = datetime.now()
+    forecast = CompletionForecastService(trials=100).predict_completion(
+        project, make_tasks(project), seed=1
+    )
+    assert before <= forecast.base_date <= datetime.now()
+
+
+def test_future_start_date_is_the_base_date() -> None:
+    """開始日が未来のプロジェクトは開始日を基準日時とする"""
+    start = datetime.now() + timedelta(days=30)
+    project = Project(name="forecast", start_date=start)
+    forecast = CompletionForecastService(trials=100).predict_completion(
+        project, make_tasks(project), seed=1
+    )
+    assert forecast.base_date == start
+
+
+@pytest.mark.parametrize("trials", [0, -1])
+def test_trials_must_be_positive(trials: int) -> None:
+    with pytest.raises(ValueError):
+        CompletionForecastService(trials=trials)
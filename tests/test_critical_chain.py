@@ -0,0 +1,116 @@
+"""
+クリティカルチェーン・フロート・準クリティカルパスのテスト
+"""
+
+import itertools
+import time
+from typing import List
+from uuid import uuid4
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.services.task_graph import TaskGraph
+
+
+def make_chain(estimates: List[float]) -> List[Task]:
+    """見積り工数の順に直列に依存するタスクリストを作成"""
+    project_id = uuid4()
+    tasks: List[Task] = []
+    for i, hours in enumerate(estimates):
+        task = Task(name=f"task-{i}", project_id=project_id, estimated_hours=hours)
+        if tasks:
+            task.dependencies.append(tasks[-1].id)
+        tasks.append(task)
+    return tasks
+
+
+def make_diamonds(count: int) -> List[Task]:
+    """重みがすべて1.0のダイヤモンドを直列につないだタスクリストを作成（パス数は 2^count）"""
+    project_id = uuid4()
+    tasks = [Task(name="start", project_id=project_id, estimated_hours=1.0)]
+    for i in range(count):
+        join = tasks[-1]
+        left = Task(name=f"left-{i}", project_id=project_id, estimated_hours=1.0)
+        right = Task(name=f"right-{i}", project_id=project_id, estimated_hours=1.0)
+        end = Task(name=f"end-{i}", project_id=project_id, estimated_hours=1.0)
+        left.dependencies.append(join.id)
+        right.dependencies.append(join.id)
+        end.dependencies.extend([left.id, right.id])
+        tasks.extend([left, right, end])
+    return tasks
+
+
+def all_path_lengths(graph: TaskGraph) -> List[float]:
+    """全パスを列挙してパス長を求める（検証用）"""
+    lengths: List[float] = []
+
+    def walk(node: int, length: float) -> None:
+        if not graph.successors[node]:
+            lengths.append(length)
+        for succ in graph.successors[node]:
+            walk(succ, length + graph.weights[succ])
+
+    for node, preds in enumerate(graph.predecessors):
+        if not preds:
+            walk(node, graph.weights[node])
+    return sorted(lengths, reverse=True)
+
+
+def test_schedule_treats_rounding_error_as_zero_float() -> None:
+    """加算誤差によるわずかなフロートがあってもクリティカルと判定する"""
+    tasks = make_chain([0.1, 0.2, 0.7])
+    schedules = CriticalChainService().calculate_schedule(tasks)
+
+    for task in tasks:
+        assert schedules[task.id].total_float == 0.0
+        assert schedules[task.id].free_float == 0.0
+        assert schedules[task.id].is_critical
+
+
+def test_schedule_keeps_real_float() -> None:
+    """並行する短いタスクのフロートは保持する"""
+    project_id = uuid4()
+    start = Task(name="start", project_id=project_id, estimated_hours=1.0)
+    long = Task(name="long", project_id=project_id, estimated_hours=5.0)
+    short = Task(name="short", project_id=project_id, estimated_hours=2.0)
+    long.dependencies.append(start.id)
+    short.dependencies.append(start.id)
+    schedules = CriticalChainService().calculate_schedule([start, long, short])
+
+    assert schedules[long.id].is_critical
+    assert schedules[short.id].total_float == 3.0
+    assert not schedules[short.id].is_critical
+
+
+def test_k_heaviest_paths_matches_enumeration() -> None:
+    """上位k本のパス長が全パスの列挙結果と一致する"""
+    project_id = uuid4()
+    tasks = [
+        Task(name=f"task-{i}", project_id=project_id, estimated_hours=float(i % 4 + 1))
+        for i in range(12)
+    ]
+    for i, j in itertools.combinations(range(12), 2):
+        if (i * 7 + j * 3) % 5 == 0:
+            tasks[j].dependencies.append(tasks[i].id)
+    graph = TaskGraph.from_tasks(tasks)
+    expected = all_path_lengths(graph)
+
+    for k in (1, 3, 10, len(expected) + 5):
+        paths = graph.k_heaviest_paths(k)
+        assert [length for length, _ in paths] == expected[:k]
+        for length, path in paths:
+            assert sum(graph.weights[node] for node in path) == length
+            for pred, succ in zip(path, path[1:]):
+                assert pred in graph.predecessors[succ]
+
+
+def test_k_heaviest_paths_on_equal_weight_diamonds_is_not_exponential() -> None:
+    """同じ長さのパスが指数的に多くても、全パスを展開せずに上位k本を求める"""
+    tasks = make_diamonds(40)
+    started = time.perf_counter()
+    paths = CriticalChainService().find_near_critical_paths(tasks, k=3)
+    elapsed = time.perf_counter() - started
+
+    assert [length for length, _ in paths] == [81.0] * 3
+    assert len({tuple(path) for _, path in paths}) == 3
+    assert elapsed < 1.0
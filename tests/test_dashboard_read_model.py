@@ -0,0 +1,139 @@
+"""
+ダッシュボード読み取りモデルの差分再計算のテスト
+"""
+
+from typing import Any, List, Optional
+
+import pytest
+
+from ccpm.application.services.dashboard_read_model import (
+    DashboardReadModel,
+    ProjectSummary,
+)
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+
+class RecordingReadModel(DashboardReadModel):
+    """再計算したプロジェクトを記録する読み取りモデル"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.summarized: List[str] = []
+
+    def summarize(
+        self, project: Project, tasks: List[Task], revision: Optional[int] = None
+    ) -> ProjectSummary:
+        self.summarized.append(project.name)
+        return super().summarize(project, tasks, revision)
+
+    def take(self) -> List[str]:
+        """前回から再計算したプロジェクト名（名前順）"""
+        names, self.summarized = sorted(self.summarized), []
+        return names
+
+
+@pytest.fixture
+def project_repository(db: DatabaseManager) -> SqliteProjectRepository:
+    """インメモリデータベースのプロジェクトリポジトリ"""
+    return SqliteProjectRepository(db)
+
+
+@pytest.fixture
+def task_repository(db: DatabaseManager) -> SqliteTaskRepository:
+    """インメモリデータベースのタスクリポジトリ"""
+    return SqliteTaskRepository(db)
+
+
+@pytest.fixture
+def projects(project_repository: SqliteProjectRepository) -> List[Project]:
+    """保存済みの3つのプロジェクト"""
+    return project_repository.save_many(
+        [Project(name=name, buffer_size=10.0) for name in ("a", "b", "c")]
+    )
+
+
+@pytest.fixture
+def model(
+    project_repository: SqliteProjectRepository,
+    task_repository: SqliteTaskRepository,
+    projects: List[Project],
+) -> RecordingReadModel:
+    """全プロジェクトを一度計算した読み取りモデル"""
+    model = RecordingReadModel(project_repository, task_repository)
+    assert model.refresh() == 3
+    assert model.take() == ["a", "b", "c"]
+    return model
+
+
+def test_refresh_without_changes_recomputes_nothing(model: RecordingReadModel) -> None:
+    """変更がなければ refresh は何も再計算しない"""
+    assert model.refresh() == 0
+    assert model.take() == []
+
+
+def test_refresh_recomputes_only_changed_projects(
+    model: RecordingReadModel,
+    project_repository: SqliteProjectRepository,
+    projects: List[Project],
+) -> None:
+    """保存したプロジェクトだけを再計算し、サマリーに反映する"""
+    projects[1].name = "b2"
+    project_repository.save(projects[1])
+
+    assert model.refresh() == 1
+    assert model.take() == ["b2"]
+    summary = model.get_summary(projects[1].id)
+    assert summary is not None and summary.name == "b2"
+
+
+def test_task_save_and_move_recompute_their_projects(
+    model: RecordingReadModel,
+    task_repository: SqliteTaskRepository,
+    projects: List[Project],
+) -> None:
+    """タスクの保存は所属プロジェクトを、移動は移動元と移動先を再計算させる"""
+    task = task_repository.save(Task(name="t", project_id=projects[0].id))
+    assert model.refresh() == 1
+    assert model.take() == ["a"]
+    assert model.get_summary(projects[0].id).task_count == 1
+
+    task.project_id = projects[2].id
+    task_repository.save(task)
+    assert model.refresh() == 2
+    assert model.take() == ["a", "c"]
+    assert model.get_summary(projects[0].id).task_count == 0
+    assert model.get_summary(projects[2].id).task_count == 1
+
+    task.status = "完了"
+    task_repository.save(task)
+    assert model.refresh() == 1
+    assert model.take() == ["c"]
+    assert model.get_summary(projects[2].id).completed_task_count == 1
+
+
+def test_deleted_projects_are_evicted(
+    model: RecordingReadModel,
+    project_repository: SqliteProjectRepository,
+    projects: List[Project],
+) -> None:
+    """削除したプロジェクトのサマリーは一覧からも取り除かれる"""
+    project_repository.delete(projects[0].id)
+
+    assert model.refresh() == 0
+    assert model.get_summary(projects[0].id) is None
+    page = model.list_summaries(sort_by="name", descending=False)
+    assert [summary.name for summary in page.items] == ["b", "c"]
+    assert page.total == 2
+
+
+def test_invalidate_forces_recompute(model: RecordingReadModel) -> None:
+    """invalidate したプロジェクトは変更がなくても再計算する"""
+    model.invalidate()
+    assert model.refresh() == 3
+    assert model.take() == ["a", "b", "c"]
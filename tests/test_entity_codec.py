@@ -0,0 +1,162 @@
+"""
+エンティティの一括コーデックのテスト（to_dict / from_dict との一致）
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+from ccpm.infrastructure.serialization.entity_codec import (
+    PROJECT_CODEC,
+    TASK_CODEC,
+    TIME_RECORD_CODEC,
+    EntityCodec,
+    codec_for,
+)
+
+BASE = datetime(2026, 3, 2, 9, 15, 30, 123456)
+
+
+def make_tasks() -> List[Task]:
+    """日時・依存関係・タグのあるタスクと、省略可能な項目が None のタスク"""
+    first = Task(
+        name="設計",
+        project_id=Project(name="p").id,
+        description='説明\n改行と "引用符"',
+        status="完了",
+        priority=1,
+        estimated_hours=4.5,
+        actual_hours=6.25,
+        start_date=BASE,
+        end_date=BASE + timedelta(days=2),
+        category="設計",
+        tags=["api", "ui"],
+        resource="佐藤",
+        created_at=BASE,
+        updated_at=BASE + timedelta(microseconds=1),
+    )
+    second = Task(name="実装", project_id=first.project_id, dependencies=[first.id])
+    return [first, second]
+
+
+def make_projects() -> List[Project]:
+    """フィーディングバッファとクリティカルチェーンのあるプロジェクトと、終了日が None のプロジェクト"""
+    tasks = make_tasks()
+    full = Project(
+        name="full",
+        description="説明",
+        start_date=BASE,
+        planned_end_date=BASE + timedelta(days=30),
+        actual_end_date=BASE + timedelta(days=31),
+        status="完了",
+        buffer_size=12.0,
+        buffer_consumed=3.5,
+        feeding_buffers=[
+            FeedingBuffer(tasks[1].id, [tasks[0].id], size=2.0, consumed=0.5)
+        ],
+    )
+    full.critical_chain = [task.id for task in tasks]
+    return [full, Project(name="empty")]
+
+
+def make_time_records() -> List[TimeRecord]:
+    """終了済みの時間記録と記録中（終了時刻・作業時間が None）の時間記録"""
+    task_id = make_tasks()[0].id
+    return [
+        TimeRecord(
+            task_id=task_id,
+            start_time=BASE,
+            end_time=BASE + timedelta(hours=1, minutes=30),
+            description="作業",
+            created_at=BASE,
+        ),
+        TimeRecord(task_id=task_id, start_time=BASE + timedelta(hours=3)),
+    ]
+
+
+CASES = [
+    (TASK_CODEC, make_tasks, Task),
+    (PROJECT_CODEC, make_projects, Project),
+    (TIME_RECORD_CODEC, make_time_records, TimeRecord),
+]
+
+
+def dicts(entities: List[Any]) -> List[Dict[str, Any]]:
+    return [entity.to_dict() for entity in entities]
+
+
+@pytest.mark.parametrize("codec, make, entity_type", CASES)
+def test_to_dicts_matches_to_dict(
+    codec: EntityCodec, make: Any, entity_type: type
+) -> None:
+    """派生項目を含めて to_dict と同じ辞書になる"""
+    entities = make()
+    assert codec_for(entity_type) is codec
+    assert codec.to_dicts(entities) == dicts(entities)
+
+    derived = {key for key, _ in codec.derived}
+    assert codec.to_dicts(entities, derived=False) == [
+        {key: value for key, value in item.items() if key not in derived}
+        for item in dicts(entities)
+    ]
+
+
+@pytest.mark.parametrize("codec, make, entity_type", CASES)
+def test_from_dicts_matches_from_dict(
+    codec: EntityCodec, make: Any, entity_type: Any
+) -> None:
+    """from_dict と同じエンティティを作成する（None と日時を含む）"""
+    items = dicts(make())
+    decoded = codec.from_dicts(items)
+    assert all(type(entity) is entity_type for entity in decoded)
+    assert dicts(decoded) == dicts([entity_type.from_dict(item) for item in items])
+    assert dicts(decoded) == items
+
+
+@pytest.mark.parametrize("codec, make, entity_type", CASES)
+def test_json_and_binary_round_trip(
+    codec: EntityCodec, make: Any, entity_type: type
+) -> None:
+    """JSON とバイナリのどちらでも元のエンティティに戻る"""
+    entities = make()
+    assert dicts(codec.loads_json(codec.dumps_json(entities))) == dicts(entities)
+    assert dicts(codec.unpack(codec.pack(entities))) == dicts(entities)
+    assert codec.unpack(codec.pack([])) == []
+
+
+def test_missing_optional_keys_use_from_dict_defaults() -> None:
+    """省略可能なキーがない場合は from_dict と同じ既定値になる（ID と日時は補完）"""
+    item = {"name": "最小", "project_id": str(make_tasks()[0].project_id)}
+    decoded = TASK_CODEC.from_dicts([item])[0].to_dict()
+    expected = Task.from_dict(item).to_dict()
+    filled = {"id", "created_at", "updated_at"}
+    assert {k: v for k, v in decoded.items() if k not in filled} == {
+        k: v for k, v in expected.items() if k not in filled
+    }
+    assert all(decoded[key] is not None for key in filled)
+
+
+def test_none_project_start_date_is_filled_like_from_dict() -> None:
+    """開始日が None のプロジェクトは from_dict と同じく現在時刻で補完する"""
+    item = make_projects()[1].to_dict()
+    item["start_date"] = None
+    before = datetime.now()
+    decoded = PROJECT_CODEC.from_dicts([item])[0]
+    expected = Project.from_dict(item)
+    assert decoded.start_date is not None and expected.start_date is not None
+    assert before <= decoded.start_date <= datetime.now()
+
+
+def test_corrupted_or_foreign_binary_is_rejected() -> None:
+    data = TASK_CODEC.pack(make_tasks())
+    with pytest.raises(ValueError):
+        TASK_CODEC.unpack(data[:-3])
+    with pytest.raises(ValueError):
+        PROJECT_CODEC.unpack(data)
+    with pytest.raises(ValueError):
+        TASK_CODEC.unpack(b"XXXX" + data[4:])
@@ -0,0 +1,193 @@
+"""
+予実比率の統計テーブルの差分更新のテスト
+"""
+
+import random
+from typing import Callable, List, Sequence, Tuple
+
+from sqlalchemy import select
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.db.estimation_stats import rebuild_estimation_stats
+from ccpm.infrastructure.db.schema import estimation_stats, tasks
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+StatsRow = Tuple[str, str, str, int, float, float]
+
+
+def stats_rows(db: DatabaseManager) -> List[StatsRow]:
+    """統計テーブルの全行（平均と平方和は丸めて比較）"""
+    with db.engine.connect() as conn:
+        rows = conn.execute(select(estimation_stats)).all()
+    return sorted(
+        (
+            row.scope,
+            row.resource,
+            row.key,
+            row.count,
+            round(row.mean, 9),
+            round(row.m2, 6),
+        )
+        for row in rows
+    )
+
+
+def rebuilt_rows(db: DatabaseManager) -> List[StatsRow]:
+    """完了タスクから作り直した統計テーブルの全行"""
+    with db.engine.begin() as conn:
+        rebuild_estimation_stats(conn)
+    return stats_rows(db)
+
+
+def make_tasks(db: DatabaseManager, rng: random.Random, count: int) -> List[Task]:
+    """見積りのあるタスクを保存"""
+    project = SqliteProjectRepository(db).save(Project(name="統計"))
+    tasks = [
+        Task(
+            name=f"task-{i}",
+            project_id=project.id,
+            estimated_hours=float(rng.randint(1, 16)),
+            category=rng.choice(["設計", "実装", "テスト"]),
+            tags=rng.sample(["api", "ui", "db"], rng.randint(0, 2)),
+            resource=rng.choice(["", "佐藤", "鈴木"]),
+        )
+        for i in range(count)
+    ]
+    return SqliteTaskRepository(db).save_many(tasks)
+
+
+def test_incremental_stats_match_rebuild_after_complete_and_reopen(
+    db: DatabaseManager,
+) -> None:
+    """完了・再開・工数の変更・削除を繰り返した後の統計が、作り直した統計と一致する"""
+    rng = random.Random(21)
+    repository = SqliteTaskRepository(db)
+    tasks = make_tasks(db, rng, 12)
+
+    for _ in range(200):
+        task = rng.choice(tasks)
+        action = rng.random()
+        if action < 0.4:
+            task.actual_hours = float(rng.randint(1, 24))
+            task.complete()
+        elif action < 0.6:
+            task.status = "進行中"
+        elif action < 0.8:
+            task.actual_hours = float(rng.randint(1, 24))
+            task.resource = rng.choice(["", "佐藤", "鈴木"])
+        elif len(tasks) > 6:
+            repository.delete(task.id)
+            tasks.remove(task)
+            continue
+        repository.save(task)
+
+    incremental = stats_rows(db)
+    assert incremental
+    assert incremental == rebuilt_rows(db)
+
+
+def test_reopen_without_stats_row_rebuilds_instead_of_failing(
+    db: DatabaseManager,
+) -> None:
+    """統計の行がない完了タスクを再開しても保存は失敗せず、統計が作り直される"""
+    rng = random.Random(3)
+    repository = SqliteTaskRepository(db)
+    tasks = make_tasks(db, rng, 4)
+    for task in tasks:
+        task.actual_hours = 8.0
+        task.complete()
+    repository.save_many(tasks)
+    with db.engine.begin() as conn:
+        conn.execute(estimation_stats.delete())
+
+    tasks[0].status = "進行中"
+    repository.save(tasks[0])
+    repository.delete(tasks[1].id)
+
+    incremental = stats_rows(db)
+    assert incremental
+    assert incremental == rebuilt_rows(db)
+
+
+def test_project_delete_removes_task_samples(db: DatabaseManager) -> None:
+    """プロジェクトを削除すると所属タスクの標本も統計から取り消される"""
+    rng = random.Random(5)
+    tasks = make_tasks(db, rng, 3)
+    for task in tasks:
+        task.actual_hours = 4.0
+        task.complete()
+    SqliteTaskRepository(db).save_many(tasks)
+    assert stats_rows(db)
+
+    SqliteProjectRepository(db).delete(tasks[0].project_id)
+    assert stats_rows(db) == []
+
+
+def test_init_schema_backfills_new_stats_table(db: DatabaseManager) -> None:
+    """統計テーブルを新しく作成した場合は既存の完了タスクから統計を作る"""
+    rng = random.Random(7)
+    tasks = make_tasks(db, rng, 5)
+    for task in tasks:
+        task.actual_hours = float(rng.randint(1, 24))
+        task.complete()
+    SqliteTaskRepository(db).save_many(tasks)
+    expected = stats_rows(db)
+    estimation_stats.drop(db.engine)
+
+    db.init_schema()
+    assert expected
+    assert stats_rows(db) == expected
+
+
+def test_remove_missing_from_sketch_rebuilds_instead_of_failing(
+    db: DatabaseManager,
+) -> None:
+    """スケッチに含まれない標本を取り消しても保存は失敗せず、統計が作り直される"""
+    rng = random.Random(9)
+    repository = SqliteTaskRepository(db)
+    saved = make_tasks(db, rng, 3)
+    for task in saved:
+        task.actual_hours = 8.0
+        task.complete()
+    repository.save_many(saved)
+    # 統計を更新せずに実績工数だけが変わった行を再現する
+    with db.engine.begin() as conn:
+        conn.execute(
+            tasks.update()
+            .where(tasks.c.id == saved[0].id)
+            .values(actual_hours=saved[0].estimated_hours * 37.0)
+        )
+
+    saved[0].status = "進行中"
+    repository.save(saved[0])
+
+    incremental = stats_rows(db)
+    assert incremental
+    assert incremental == rebuilt_rows(db)
+
+
+def test_concurrent_saves_of_one_task_apply_its_sample_once(
+    file_db: DatabaseManager,
+    concurrently: Callable[[Sequence[Callable[[], None]]], None],
+) -> None:
+    """別々の接続から同じ完了タスクを同時に保存しても、標本は1回だけ反映される"""
+    rng = random.Random(13)
+    task = make_tasks(file_db, rng, 1)[0]
+    task.actual_hours = 6.0
+    task.complete()
+
+    def save() -> None:
+        repository = SqliteTaskRepository(file_db)
+        for _ in range(5):
+            repository.save(task)
+
+    concurrently([save for _ in range(6)])
+
+    incremental = stats_rows(file_db)
+    assert {row[3] for row in incremental} == {1}
+    assert incremental == rebuilt_rows(file_db)
@@ -0,0 +1,99 @@
+"""
+フィーディングバッファの識別とサイズ計算のテスト
+"""
+
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.services.feeding_buffer import FeedingBufferService
+
+
+def make_project() -> Tuple[Project, Dict[str, Task]]:
+    """
+    クリティカルチェーン a → b → c に2本のフィーディングチェーンが合流するプロジェクト
+
+    p は b に、w → y（x → y より長い）は c に合流します。
+    """
+    project = Project(name="feeding")
+    hours = {"a": 4.0, "b": 4.0, "c": 4.0, "p": 2.0, "x": 1.0, "w": 2.0, "y": 2.0}
+    tasks = {
+        name: Task(name=name, project_id=project.id, estimated_hours=value)
+        for name, value in hours.items()
+    }
+    edges = [("a", "b"), ("b", "c"), ("p", "b"), ("x", "y"), ("w", "y"), ("y", "c")]
+    for dependency, name in edges:
+        tasks[name].dependencies.append(tasks[dependency].id)
+    project.critical_chain = CriticalChainService().identify_critical_chain(
+        list(tasks.values())
+    )
+    return project, tasks
+
+
+def ids(tasks: Dict[str, Task], names: str) -> List[UUID]:
+    """タスク名（1文字ずつ）のタスクIDリスト"""
+    return [tasks[name].id for name in names]
+
+
+def test_identifies_each_feeding_chain_and_sizes_its_buffer() -> None:
+    """合流エッジごとに最長のフィーディングチェーンを選び、チェーン長 × 比率をサイズとする"""
+    project, tasks = make_project()
+    assert project.critical_chain == ids(tasks, "abc")
+
+    buffers = FeedingBufferService().identify_feeding_buffers(
+        list(tasks.values()), project.critical_chain
+    )
+
+    assert [
+        (buffer.merge_task_id, buffer.feeding_chain, buffer.size) for buffer in buffers
+    ] == [
+        (tasks["b"].id, ids(tasks, "p"), 1.0),
+        (tasks["c"].id, ids(tasks, "wy"), 2.0),
+    ]
+    assert (
+        FeedingBufferService(buffer_ratio=0.25)
+        .identify_feeding_buffers(list(tasks.values()), project.critical_chain)[1]
+        .size
+        == 1.0
+    )
+
+
+def test_update_keeps_consumption_at_the_same_merge_point() -> None:
+    """再計算しても同じ合流地点のバッファ消費量は引き継ぐ"""
+    project, tasks = make_project()
+    service = FeedingBufferService()
+    service.update_project_feeding_buffers(project, list(tasks.values()))
+    project.feeding_buffers[1].consumed = 1.5
+
+    tasks["w"].estimated_hours = 3.0
+    service.update_project_feeding_buffers(project, list(tasks.values()))
+
+    assert [buffer.size for buffer in project.feeding_buffers] == [1.0, 2.5]
+    assert [buffer.consumed for buffer in project.feeding_buffers] == [0.0, 1.5]
+    assert (
+        service.find_feeding_buffer(project, tasks["w"].id)
+        is project.feeding_buffers[1]
+    )
+    assert service.find_feeding_buffer(project, tasks["a"].id) is None
+
+
+def test_feeding_buffers_round_trip_through_project_dict() -> None:
+    """フィーディングバッファは Project.to_dict / from_dict で保存・復元される"""
+    project, tasks = make_project()
+    FeedingBufferService().update_project_feeding_buffers(project, list(tasks.values()))
+    project.feeding_buffers[0].consumed = 0.5
+
+    restored = Project.from_dict(project.to_dict())
+
+    assert restored.feeding_buffers == project.feeding_buffers
+    assert restored.feeding_buffers[0].consumption_rate == 0.5
+    assert restored.feeding_buffers[1].feeding_task_id == tasks["y"].id
+
+
+def test_no_feeding_buffers_without_critical_chain() -> None:
+    _, tasks = make_project()
+    assert (
+        FeedingBufferService().identify_feeding_buffers(list(tasks.values()), []) == []
+    )
@@ -0,0 +1,64 @@
+"""
+クリティカルチェーンの差分更新のテスト
+"""
+
+import random
+from typing import List
+from uuid import uuid4
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.critical_chain import CriticalChainService
+from ccpm.domain.services.incremental_critical_chain import IncrementalCriticalChain
+from ccpm.domain.services.task_graph import CycleError
+
+
+def make_dag(rng: random.Random, count: int) -> List[Task]:
+    """タスクリストの順に依存するランダムな DAG（見積り工数は同点が出やすい整数）"""
+    project_id = uuid4()
+    tasks: List[Task] = []
+    for i in range(count):
+        task = Task(
+            name=f"task-{i}",
+            project_id=project_id,
+            estimated_hours=float(rng.randint(1, 5)),
+        )
+        for dependency in rng.sample(tasks, min(len(tasks), rng.randint(0, 2))):
+            task.dependencies.append(dependency.id)
+        tasks.append(task)
+    return tasks
+
+
+def test_random_edits_match_full_recompute() -> None:
+    """ランダムな編集のたびに、全体を再計算した結果と一致する"""
+    rng = random.Random(2)
+    service = CriticalChainService()
+    tasks = make_dag(rng, 30)
+    incremental = IncrementalCriticalChain(tasks)
+    rejected = 0
+
+    for _ in range(300):
+        task = rng.choice(tasks)
+        action = rng.random()
+        if action < 0.4:
+            incremental.set_estimate(task.id, float(rng.randint(1, 5)))
+        elif action < 0.75:
+            dependency = rng.choice(tasks)
+            if dependency.id == task.id:
+                continue
+            before = list(task.dependencies)
+            try:
+                incremental.add_dependency(task.id, dependency.id)
+            except CycleError:
+                rejected += 1
+                assert task.dependencies == before
+        elif task.dependencies:
+            incremental.remove_dependency(task.id, rng.choice(task.dependencies))
+
+        expected = service.identify_critical_chain(tasks)
+        assert incremental.critical_chain == expected
+        by_id = {task.id: task for task in tasks}
+        assert incremental.chain_length == sum(
+            by_id[task_id].estimated_hours for task_id in expected
+        )
+
+    assert rejected > 0
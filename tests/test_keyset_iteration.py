@@ -0,0 +1,105 @@
+"""
+キーセットページネーションによる逐次取得のテスト
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from ccpm.infrastructure.repositories.sqlite_time_repository import SqliteTimeRepository
+
+CREATED_AT = datetime(2026, 3, 2, 9, 0)
+
+
+def save_tied_tasks(db: DatabaseManager, count: int) -> List[Task]:
+    """作成日時がすべて同じタスク（2つのプロジェクトに交互に所属）を保存"""
+    projects = SqliteProjectRepository(db).save_many(
+        [Project(name=f"project-{i}") for i in range(2)]
+    )
+    tasks = [
+        Task(
+            name=f"task-{i}",
+            project_id=projects[i % 2].id,
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+        for i in range(count)
+    ]
+    return SqliteTaskRepository(db).save_many(tasks)
+
+
+@pytest.mark.parametrize("fetch_size", [1, 4, 5, 7, 100])
+def test_iter_all_returns_each_tied_row_once(
+    db: DatabaseManager, fetch_size: int
+) -> None:
+    """作成日時が同じ行も、ページの境界で重複・欠落なく保存順に返す"""
+    tasks = save_tied_tasks(db, 20)
+    repository = SqliteTaskRepository(db)
+
+    found = list(repository.iter_all(fetch_size=fetch_size))
+    assert [task.id for task in found] == [task.id for task in tasks]
+
+    by_project = list(
+        repository.iter_by_project_id(tasks[1].project_id, fetch_size=fetch_size)
+    )
+    assert [task.id for task in by_project] == [task.id for task in tasks[1::2]]
+
+
+def test_iter_columns_pages_through_ties(db: DatabaseManager) -> None:
+    """指定した列だけのタプルも、取得件数より多い行をすべて返す"""
+    tasks = save_tied_tasks(db, 11)
+    repository = SqliteTaskRepository(db)
+    assert set(repository.iter_columns(["created_at"])) == {(CREATED_AT,)}
+    rows = list(repository.iter_columns(["id", "name"], fetch_size=3))
+    assert rows == [(task.id, task.name) for task in tasks]
+
+    project_rows = list(
+        SqliteProjectRepository(db).iter_columns(["name"], fetch_size=1)
+    )
+    assert sorted(project_rows) == [("project-0",), ("project-1",)]
+
+
+def test_time_records_page_in_start_time_order(db: DatabaseManager) -> None:
+    """時間記録は開始時刻順（同じ開始時刻は保存順）にページングする"""
+    task = save_tied_tasks(db, 1)[0]
+    records = [
+        TimeRecord(
+            task_id=task.id,
+            start_time=CREATED_AT + timedelta(hours=hours),
+            end_time=CREATED_AT + timedelta(hours=hours, minutes=30),
+        )
+        for hours in [3, 1, 1, 2, 1, 3]
+    ]
+    repository = SqliteTimeRepository(db)
+    repository.save_many(records)
+
+    expected = sorted(range(len(records)), key=lambda i: records[i].start_time)
+    found = list(repository.iter_all(fetch_size=2))
+    assert [record.id for record in found] == [records[i].id for i in expected]
+    assert len(list(repository.iter_columns(["id"], fetch_size=4))) == len(records)
+
+
+def test_empty_tables_yield_nothing(db: DatabaseManager) -> None:
+    assert list(SqliteProjectRepository(db).iter_all(fetch_size=2)) == []
+    assert list(SqliteTaskRepository(db).iter_all(fetch_size=2)) == []
+    assert list(SqliteTaskRepository(db).iter_columns(["id"], fetch_size=2)) == []
+    assert list(SqliteTimeRepository(db).iter_all(fetch_size=2)) == []
+
+
+def test_invalid_fetch_size_and_columns_are_rejected(db: DatabaseManager) -> None:
+    repository = SqliteTaskRepository(db)
+    with pytest.raises(ValueError):
+        repository.iter_all(fetch_size=-1)
+    with pytest.raises(ValueError):
+        repository.iter_columns(["no_such_column"])
+    with pytest.raises(ValueError):
+        repository.iter_columns([])
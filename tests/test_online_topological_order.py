@@ -0,0 +1,88 @@
+"""
+依存関係の追加時の循環検出とトポロジカル順序の差分更新のテスト
+"""
+
+import random
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.online_topological_order import OnlineTopologicalOrder
+from ccpm.domain.services.task_graph import CycleError, TaskGraph
+
+
+def make_tasks(count: int) -> List[Task]:
+    """依存関係のないタスクリスト"""
+    project_id = uuid4()
+    return [Task(name=f"task-{i}", project_id=project_id) for i in range(count)]
+
+
+def assert_valid_order(topology: OnlineTopologicalOrder) -> None:
+    """順序がノードの並べ替えで、すべてのエッジが順序に沿っていることを確認"""
+    graph = topology.graph
+    assert sorted(topology.order) == list(range(len(graph)))
+    for node, position in enumerate(topology.position):
+        assert topology.order[position] == node
+    for node, successors in enumerate(graph.successors):
+        for succ in successors:
+            assert topology.position[node] < topology.position[succ]
+
+
+def test_order_stays_valid_after_random_inserts() -> None:
+    """ランダムなエッジの追加後も順序が有効で、循環を作るエッジだけが拒否される"""
+    rng = random.Random(25)
+    graph = TaskGraph.from_tasks(make_tasks(40))
+    topology = OnlineTopologicalOrder(graph)
+    added = rejected = 0
+
+    for _ in range(400):
+        source, target = rng.sample(range(len(graph)), 2)
+        try:
+            topology.add_edge(source, target)
+            added += 1
+        except CycleError:
+            rejected += 1
+        assert_valid_order(topology)
+
+    assert added > 0 and rejected > 0
+
+
+def test_cycle_error_reports_the_offending_cycle() -> None:
+    """循環を作るエッジを追加すると、依存の向きに並んだ循環のタスクIDを報告する"""
+    tasks = make_tasks(5)
+    graph = TaskGraph.from_tasks(tasks)
+    topology = OnlineTopologicalOrder(graph)
+    # 0 → 1 → 2 → 3 と、循環に関係しない 1 → 4
+    for source, target in [(0, 1), (1, 2), (2, 3), (1, 4)]:
+        topology.add_edge(source, target)
+
+    with pytest.raises(CycleError) as raised:
+        topology.add_edge(3, 1)
+
+    cycle = raised.value.cycle
+    assert cycle == [tasks[3].id, tasks[1].id, tasks[2].id]
+    edges = {(tasks[s].id, tasks[t].id) for s, t in [(1, 2), (2, 3), (3, 1)]}
+    for position, task_id in enumerate(cycle):
+        assert (task_id, cycle[(position + 1) % len(cycle)]) in edges
+
+
+def test_rejected_edge_leaves_graph_and_order_unchanged() -> None:
+    """拒否したエッジはグラフにも順序にも反映されない"""
+    graph = TaskGraph.from_tasks(make_tasks(6))
+    topology = OnlineTopologicalOrder(graph)
+    for source, target in [(5, 4), (4, 3), (3, 2), (0, 1)]:
+        topology.add_edge(source, target)
+    predecessors = [list(preds) for preds in graph.predecessors]
+    successors = [list(succs) for succs in graph.successors]
+    order = list(topology.order)
+    position = list(topology.position)
+
+    with pytest.raises(CycleError):
+        topology.add_edge(2, 5)
+
+    assert graph.predecessors == predecessors
+    assert graph.successors == successors
+    assert topology.order == order
+    assert topology.position == position
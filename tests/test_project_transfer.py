@@ -0,0 +1,170 @@
+"""
+プロジェクトのエクスポート・インポートの往復のテスト
+"""
+
+import io
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+import pytest
+
+from ccpm.application.services.project_transfer import (
+    MERGE_COPY,
+    MERGE_REPLACE,
+    MERGE_UPSERT,
+    ProjectTransferService,
+)
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.domain.value_objects.feeding_buffer import FeedingBuffer
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from ccpm.infrastructure.repositories.sqlite_time_repository import SqliteTimeRepository
+from ccpm.infrastructure.serialization.record_stream import FORMAT_CSV, FORMAT_JSONL
+
+
+def make_service(db: DatabaseManager) -> ProjectTransferService:
+    """時間記録も扱うサービス（バッチ境界をまたぐよう小さいバッチサイズ）"""
+    return ProjectTransferService(
+        SqliteProjectRepository(db),
+        SqliteTaskRepository(db),
+        SqliteTimeRepository(db),
+        batch_size=3,
+    )
+
+
+def populate(db: DatabaseManager) -> Project:
+    """依存関係・タグ・時間記録・フィーディングバッファを持つプロジェクトを保存"""
+    start = datetime(2026, 4, 1, 9, 0)
+    project = Project(
+        name="移行プロジェクト",
+        description="説明, カンマ\n改行を含む",
+        start_date=start,
+        buffer_size=12.5,
+        buffer_consumed=3.0,
+    )
+    tasks = [
+        Task(
+            name=f"タスク{i}",
+            project_id=project.id,
+            description=f"説明{i}",
+            priority=i % 5 + 1,
+            estimated_hours=float(i + 1),
+            actual_hours=i * 0.5,
+            category="実装" if i % 2 else "設計",
+            tags=["api", "db"][: i % 3],
+            resource=f"member-{i % 2}",
+            start_date=start + timedelta(days=i),
+        )
+        for i in range(8)
+    ]
+    # 後ろに現れるタスクへの依存も含める
+    tasks[1].dependencies.append(tasks[0].id)
+    tasks[2].dependencies.extend([tasks[0].id, tasks[7].id])
+    tasks[5].dependencies.append(tasks[2].id)
+    project.critical_chain = [tasks[7].id, tasks[2].id, tasks[5].id]
+    project.feeding_buffers = [
+        FeedingBuffer(tasks[5].id, [tasks[0].id, tasks[1].id], size=1.5, consumed=0.5)
+    ]
+    SqliteProjectRepository(db).save(project)
+    SqliteTaskRepository(db).save_many(tasks)
+    records = [
+        TimeRecord(
+            task_id=tasks[i % 8].id,
+            start_time=start + timedelta(hours=i),
+            end_time=start + timedelta(hours=i, minutes=45),
+            description=f"作業{i}",
+        )
+        for i in range(10)
+    ]
+    SqliteTimeRepository(db).save_many(records)
+    return project
+
+
+def snapshot(
+    db: DatabaseManager, project_id: UUID
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """プロジェクト・タスク・時間記録の辞書表現（比較用）"""
+    project = SqliteProjectRepository(db).find_by_id(project_id)
+    assert project is not None
+    tasks = SqliteTaskRepository(db).find_by_project_id(project_id)
+    records = SqliteTimeRepository(db).find_by_task_ids([task.id for task in tasks])
+    return (
+        project.to_dict(),
+        sorted((task.to_dict() for task in tasks), key=lambda item: item["id"]),
+        sorted((record.to_dict() for record in records), key=lambda item: item["id"]),
+    )
+
+
+def export(db: DatabaseManager, project_id: UUID, format: str) -> str:
+    """プロジェクトを文字列にエクスポート"""
+    stream = io.StringIO()
+    make_service(db).export_project(project_id, stream, format)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("format", [FORMAT_JSONL, FORMAT_CSV])
+def test_round_trip_into_empty_database(db: DatabaseManager, format: str) -> None:
+    """別のデータベースにインポートすると、すべての項目が元と一致する"""
+    project = populate(db)
+    exported = export(db, project.id, format)
+
+    target = DatabaseManager("sqlite://")
+    target.init_schema()
+    imported_id = make_service(target).import_project(
+        io.StringIO(exported), format, MERGE_UPSERT
+    )
+
+    assert imported_id == project.id
+    assert snapshot(target, imported_id) == snapshot(db, project.id)
+
+
+@pytest.mark.parametrize("strategy", [MERGE_REPLACE, MERGE_UPSERT])
+def test_reimport_keeps_ids(db: DatabaseManager, strategy: str) -> None:
+    """同じデータベースに ID を保ったまま取り込み直しても内容が変わらない"""
+    project = populate(db)
+    before = snapshot(db, project.id)
+    exported = export(db, project.id, FORMAT_JSONL)
+
+    make_service(db).import_project(io.StringIO(exported), FORMAT_JSONL, strategy)
+
+    assert snapshot(db, project.id) == before
+
+
+def test_copy_remaps_ids_and_references(db: DatabaseManager) -> None:
+    """copy では ID を振り直し、依存関係・クリティカルチェーン・時間記録の参照も付け替える"""
+    project = populate(db)
+    original_project, original_tasks, original_records = snapshot(db, project.id)
+    exported = export(db, project.id, FORMAT_JSONL)
+
+    copied_id = make_service(db).import_project(
+        io.StringIO(exported), FORMAT_JSONL, MERGE_COPY
+    )
+    copied_project, copied_tasks, copied_records = snapshot(db, copied_id)
+
+    assert copied_id != project.id
+    assert len(copied_tasks) == len(original_tasks)
+    assert len(copied_records) == len(original_records)
+    original_ids = {task["id"] for task in original_tasks}
+    copied_ids = {task["id"] for task in copied_tasks}
+    assert not original_ids & copied_ids
+
+    by_name = {task["name"]: task for task in copied_tasks}
+    names = {task["id"]: task["name"] for task in original_tasks}
+    copied_names = {task["id"]: task["name"] for task in copied_tasks}
+    for task in original_tasks:
+        copied = by_name[task["name"]]
+        assert [names[dep] for dep in task["dependencies"]] == [
+            copied_names[dep] for dep in copied["dependencies"]
+        ]
+        for key in ("description", "priority", "estimated_hours", "tags", "resource"):
+            assert copied[key] == task[key]
+    assert [names[task_id] for task_id in original_project["critical_chain"]] == [
+        copied_names[task_id] for task_id in copied_project["critical_chain"]
+    ]
+    assert {record["task_id"] for record in copied_records} <= copied_ids
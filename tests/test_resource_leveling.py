@@ -0,0 +1,90 @@
+"""
+リソース平準化スケジュールのテスト
+"""
+
+import random
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from ccpm.domain.entities.task import Task
+from ccpm.domain.services.resource_leveling import ResourceLevelingService
+from ccpm.domain.value_objects.resource_schedule import ResourceSchedule
+
+
+def make_tasks(seed: int, count: int = 40) -> List[Task]:
+    """担当者が重なるランダムな DAG（担当者なしのタスクも含む）"""
+    rng = random.Random(seed)
+    project_id = uuid4()
+    tasks: List[Task] = []
+    for i in range(count):
+        task = Task(
+            name=f"task-{i}",
+            project_id=project_id,
+            estimated_hours=float(rng.randint(1, 8)),
+            resource=rng.choice(["", "佐藤", "鈴木", "高橋"]),
+        )
+        for dependency in rng.sample(tasks, min(len(tasks), rng.randint(0, 2))):
+            task.dependencies.append(dependency.id)
+        tasks.append(task)
+    return tasks
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_schedule_respects_dependencies_and_resources(seed: int) -> None:
+    """依存タスクの終了後に開始し、同じ担当者のタスクは同時に実行しない"""
+    tasks = make_tasks(seed)
+    schedule = ResourceLevelingService().schedule(tasks)
+    start, finish = schedule.start_times, schedule.finish_times
+
+    for task in tasks:
+        assert finish[task.id] == start[task.id] + task.estimated_hours
+        for dependency_id in task.dependencies:
+            assert start[task.id] >= finish[dependency_id]
+
+    for resource in ("佐藤", "鈴木", "高橋"):
+        assigned = sorted(
+            (start[task.id], finish[task.id])
+            for task in tasks
+            if task.resource == resource
+        )
+        for (_, previous_finish), (next_start, _) in zip(assigned, assigned[1:]):
+            assert next_start >= previous_finish
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_critical_chain_is_contiguous_and_ends_at_makespan(seed: int) -> None:
+    """クリティカルチェーンは時刻0から隙間なく続き、所要時間の時刻で終わる"""
+    tasks = make_tasks(seed)
+    by_id = {task.id: task for task in tasks}
+    schedule = ResourceLevelingService().schedule(tasks)
+    chain = schedule.critical_chain
+
+    assert chain
+    assert schedule.start_times[chain[0]] == 0.0
+    assert schedule.finish_times[chain[-1]] == schedule.makespan
+    for previous, current in zip(chain, chain[1:]):
+        assert schedule.start_times[current] == schedule.finish_times[previous]
+        task = by_id[current]
+        assert previous in task.dependencies or (
+            task.resource and task.resource == by_id[previous].resource
+        )
+
+
+def test_resource_contention_extends_the_chain() -> None:
+    """依存関係のない同じ担当者のタスクは直列になり、チェーンに含まれる"""
+    project_id = uuid4()
+    first = Task(name="a", project_id=project_id, estimated_hours=3.0, resource="佐藤")
+    second = Task(name="b", project_id=project_id, estimated_hours=2.0, resource="佐藤")
+    schedule = ResourceLevelingService().schedule([first, second])
+
+    assert schedule.makespan == 5.0
+    assert schedule.critical_chain == [first.id, second.id]
+
+
+def test_empty_task_list() -> None:
+    schedule = ResourceLevelingService().schedule([])
+    assert isinstance(schedule, ResourceSchedule)
+    assert schedule.makespan == 0.0
+    assert schedule.critical_chain == []
@@ -0,0 +1,66 @@
+"""
+類似タスクインデックスの更新のテスト
+"""
+
+from typing import List
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.indexed_task_repository import (
+    IndexedTaskRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+
+def completed_tasks(project: Project, count: int) -> List[Task]:
+    """同じ名前の完了タスク"""
+    return [
+        Task(
+            name="ログイン画面の実装",
+            project_id=project.id,
+            status="完了",
+            estimated_hours=4.0,
+            actual_hours=5.0,
+            category="実装",
+        )
+        for _ in range(count)
+    ]
+
+
+def test_project_delete_evicts_its_tasks(db: DatabaseManager) -> None:
+    project_repository = SqliteProjectRepository(db)
+    repository = IndexedTaskRepository(SqliteTaskRepository(db))
+    kept, deleted = (
+        project_repository.save(Project(name=name)) for name in ("残す", "消す")
+    )
+    kept_tasks = repository.save_many(completed_tasks(kept, 2))
+    repository.save_many(completed_tasks(deleted, 3))
+    assert len(repository.index.search("ログイン画面", k=10)) == 5
+
+    project_repository.delete(deleted.id)
+    repository.projects_deleted([deleted.id])
+
+    found = repository.index.search("ログイン画面", k=10)
+    assert {task.task_id for task in found} == {task.id for task in kept_tasks}
+    assert len(repository.index) == 2
+
+
+def test_evicted_slots_survive_compaction(db: DatabaseManager) -> None:
+    project_repository = SqliteProjectRepository(db)
+    project = project_repository.save(Project(name="残す"))
+    other = project_repository.save(Project(name="消す"))
+    repository = IndexedTaskRepository(SqliteTaskRepository(db))
+    repository.save_many(completed_tasks(other, 2))
+    kept_tasks = repository.save_many(completed_tasks(project, 2))
+
+    repository.projects_deleted([other.id])
+    repository.index.compact()
+    repository.projects_deleted([project.id])
+    assert len(repository.index) == 0
+
+    rebuilt = IndexedTaskRepository(SqliteTaskRepository(db))
+    assert len(rebuilt.index) == len(kept_tasks) + 2
@@ -0,0 +1,211 @@
+"""
+SQLAlchemy リポジトリの一括保存のテスト
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Sequence
+from uuid import uuid4
+
+from sqlalchemy import Connection, Table, select
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.db.estimation_stats import rebuild_estimation_stats
+from ccpm.infrastructure.db.schema import estimation_stats, time_rollups
+from ccpm.infrastructure.db.time_rollup import rebuild_rollups
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from ccpm.infrastructure.repositories.sqlite_time_repository import SqliteTimeRepository
+
+
+def table_rows(db: DatabaseManager, table: Table) -> List[Any]:
+    """
+    テーブルの全行（浮動小数点は丸めて比較）
+
+    統計の最小値・最大値は取り消しでは狭まらないため比較しません。
+    """
+    columns = [
+        column for column in table.columns if column.name not in ("minimum", "maximum")
+    ]
+    with db.engine.connect() as conn:
+        rows = conn.execute(select(*columns)).all()
+    normalized = [
+        tuple(round(value, 6) if isinstance(value, float) else value for value in row)
+        for row in rows
+    ]
+    return sorted(normalized, key=str)
+
+
+def rebuilt_rows(
+    db: DatabaseManager, table: Table, rebuild: Callable[[Connection], None]
+) -> List[Any]:
+    """作り直した後のテーブルの全行"""
+    with db.engine.begin() as conn:
+        rebuild(conn)
+    return table_rows(db, table)
+
+
+def test_concurrent_saves_keep_derived_tables_consistent(
+    file_db: DatabaseManager,
+    concurrently: Callable[[Sequence[Callable[[], None]]], None],
+) -> None:
+    """別々の接続から同じタスクを同時に保存しても、統計と作業時間集計が保存後の行と一致する"""
+    projects = SqliteProjectRepository(file_db).save_many(
+        [Project(name=f"project-{i}") for i in range(2)]
+    )
+    tasks = SqliteTaskRepository(file_db).save_many(
+        [
+            Task(
+                name=f"task-{i}",
+                project_id=projects[0].id,
+                estimated_hours=4.0,
+                category="実装",
+            )
+            for i in range(4)
+        ]
+    )
+    start = datetime(2026, 3, 2, 9, 0)
+    SqliteTimeRepository(file_db).save_many(
+        [
+            TimeRecord(
+                task_id=task.id, start_time=start, end_time=start + timedelta(hours=2)
+            )
+            for task in tasks
+        ]
+    )
+
+    def editor(seed: int) -> Callable[[], None]:
+        def edit() -> None:
+            rng = random.Random(seed)
+            repository = SqliteTaskRepository(file_db)
+            for _ in range(15):
+                task = repository.find_by_id(rng.choice(tasks).id)
+                assert task is not None
+                task.project_id = rng.choice(projects).id
+                task.category = rng.choice(["設計", "実装"])
+                task.actual_hours = float(rng.randint(1, 8))
+                task.status = rng.choice(["完了", "進行中"])
+                repository.save(task)
+
+        return edit
+
+    concurrently([editor(seed) for seed in range(6)])
+
+    stats = table_rows(file_db, estimation_stats)
+    assert stats == rebuilt_rows(file_db, estimation_stats, rebuild_estimation_stats)
+    rollups = table_rows(file_db, time_rollups)
+    assert rollups
+    assert rollups == rebuilt_rows(file_db, time_rollups, rebuild_rollups)
+
+
+def make_tasks(project: Project, count: int) -> List[Task]:
+    """直前のタスクに依存し、タグを持つタスクのリスト"""
+    tasks: List[Task] = []
+    for i in range(count):
+        task = Task(
+            name=f"task-{i}",
+            project_id=project.id,
+            estimated_hours=float(i + 1),
+            tags=[f"tag-{i % 3}", "common"],
+            resource="佐藤" if i % 2 else "",
+        )
+        if tasks:
+            task.dependencies.extend([tasks[-1].id] + ([tasks[0].id] if i > 1 else []))
+        tasks.append(task)
+    return tasks
+
+
+def test_save_many_round_trips_dependencies_and_tags(db: DatabaseManager) -> None:
+    """一括保存したタスクは依存関係の順序とタグを含めて読み込める"""
+    project = SqliteProjectRepository(db).save(Project(name="bulk"))
+    repository = SqliteTaskRepository(db)
+    tasks = repository.save_many(make_tasks(project, 12))
+
+    found = repository.find_by_project_id(project.id)
+    assert {task.id for task in found} == {task.id for task in tasks}
+    by_id = {task.id: task for task in found}
+    for task in tasks:
+        assert by_id[task.id].to_dict() == task.to_dict()
+        stored = repository.find_by_id(task.id)
+        assert stored is not None and stored.to_dict() == task.to_dict()
+
+
+def test_save_many_upserts_existing_rows(db: DatabaseManager) -> None:
+    """保存済みのタスクを一括保存すると、行・依存関係・タグが置き換わる"""
+    project = SqliteProjectRepository(db).save(Project(name="bulk"))
+    repository = SqliteTaskRepository(db)
+    tasks = repository.save_many(make_tasks(project, 6))
+
+    for task in tasks[::2]:
+        task.name = f"{task.name}-renamed"
+        task.estimated_hours *= 2
+        task.tags = ["updated"]
+        task.dependencies = task.dependencies[:1]
+    added = Task(name="added", project_id=project.id, dependencies=[tasks[3].id])
+    repository.save_many(tasks[::2] + [added])
+
+    assert repository.count(project_id=project.id) == 7
+    for task in tasks + [added]:
+        stored = repository.find_by_id(task.id)
+        assert stored is not None and stored.to_dict() == task.to_dict()
+
+
+def test_delete_many_removes_rows_and_dependents(db: DatabaseManager) -> None:
+    """一括削除は削除した件数を返し、時間記録も削除する"""
+    project = SqliteProjectRepository(db).save(Project(name="bulk"))
+    repository = SqliteTaskRepository(db)
+    tasks = repository.save_many(make_tasks(project, 4))
+    time_repository = SqliteTimeRepository(db)
+    start = datetime(2026, 3, 2, 9, 0)
+    time_repository.save_many(
+        [
+            TimeRecord(
+                task_id=task.id, start_time=start, end_time=start + timedelta(hours=1)
+            )
+            for task in tasks
+        ]
+    )
+
+    assert repository.delete_many([tasks[2].id, tasks[3].id, uuid4()]) == 2
+    assert [task.id for task in repository.find_by_project_id(project.id)] == [
+        task.id for task in tasks[:2]
+    ]
+    assert {record.task_id for record in time_repository.find_all()} == {
+        task.id for task in tasks[:2]
+    }
+
+
+def test_project_and_time_record_save_many_upsert(db: DatabaseManager) -> None:
+    """プロジェクトと時間記録も一括保存で追加・更新できる"""
+    project_repository = SqliteProjectRepository(db)
+    projects = project_repository.save_many([Project(name=f"p-{i}") for i in range(3)])
+    projects[1].name = "renamed"
+    projects[1].buffer_size = 12.0
+    project_repository.save_many(projects[1:2])
+    assert project_repository.count() == 3
+    stored = project_repository.find_by_id(projects[1].id)
+    assert stored is not None and stored.to_dict() == projects[1].to_dict()
+
+    task = SqliteTaskRepository(db).save(Task(name="t", project_id=projects[0].id))
+    time_repository = SqliteTimeRepository(db)
+    start = datetime(2026, 3, 2, 9, 0)
+    records = time_repository.save_many(
+        [
+            TimeRecord(
+                task_id=task.id,
+                start_time=start + timedelta(days=day),
+                end_time=start + timedelta(days=day, hours=2),
+            )
+            for day in range(3)
+        ]
+    )
+    records[0].description = "updated"
+    time_repository.save_many(records[:1])
+    assert [
+        record.to_dict() for record in time_repository.find_by_task_id(task.id)
+    ] == [record.to_dict() for record in sorted(records, key=lambda r: r.start_time)]
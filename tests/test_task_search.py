@@ -0,0 +1,195 @@
+"""
+タスク検索（FTS5 全文検索・絞り込み・ページ分割）のテスト
+"""
+
+import random
+from typing import List, Set
+from uuid import UUID
+
+import pytest
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.value_objects.task_search import TaskSearchCriteria
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+
+WORDS = ["design", "review", "deploy", "api", "ui", "db", "report", "Design", "x"]
+TAGS = ["backend", "frontend", "urgent", "qa"]
+
+
+@pytest.fixture
+def project(db: DatabaseManager) -> Project:
+    """タスクを登録するプロジェクト"""
+    return SqliteProjectRepository(db).save(Project(name="project"))
+
+
+@pytest.fixture
+def repository(db: DatabaseManager) -> SqliteTaskRepository:
+    """インメモリデータベースのタスクリポジトリ"""
+    return SqliteTaskRepository(db)
+
+
+def search_all(
+    repository: SqliteTaskRepository, criteria: TaskSearchCriteria, page_size: int = 7
+) -> List[UUID]:
+    """すべてのページを順に検索して、見つかったタスクIDを並べる"""
+    found: List[UUID] = []
+    page = 0
+    while True:
+        result = repository.search(criteria, page, page_size)
+        found += [task.id for task in result.tasks]
+        if not result.has_next:
+            return found
+        page += 1
+
+
+def matching_ids(
+    repository: SqliteTaskRepository, criteria: TaskSearchCriteria
+) -> Set[UUID]:
+    """TaskSearchCriteria.matches で全件を照合した結果"""
+    return {task.id for task in repository.find_all() if criteria.matches(task)}
+
+
+def test_search_matches_in_memory_filter(
+    repository: SqliteTaskRepository, project: Project
+) -> None:
+    """ランダムな条件の検索結果が、全件を matches で照合した結果と一致する"""
+    rng = random.Random(23)
+    repository.save_many(
+        [
+            Task(
+                name=" ".join(rng.sample(WORDS, 2)),
+                description=" ".join(rng.sample(WORDS, 3)),
+                project_id=project.id,
+                priority=rng.randint(1, 5),
+                tags=rng.sample(TAGS, rng.randint(0, 3)),
+            )
+            for _ in range(60)
+        ]
+    )
+    for _ in range(80):
+        criteria = TaskSearchCriteria(
+            text=" ".join(rng.sample(WORDS, rng.randint(0, 2))),
+            priorities=rng.sample(range(1, 6), rng.randint(0, 3)),
+            tags=rng.sample(TAGS, rng.randint(0, 2)),
+        )
+        found = search_all(repository, criteria)
+        assert len(found) == len(set(found))
+        assert set(found) == matching_ids(repository, criteria), criteria.to_dict()
+
+
+def test_index_follows_update_and_delete(
+    db: DatabaseManager, repository: SqliteTaskRepository, project: Project
+) -> None:
+    """タスクの更新と削除が全文検索の索引に反映される"""
+    task = repository.save(
+        Task(name="quarterly report", description="draft", project_id=project.id)
+    )
+    assert search_all(repository, TaskSearchCriteria("report")) == [task.id]
+
+    task.name = "quarterly summary"
+    task.description = "final"
+    repository.save(task)
+    assert search_all(repository, TaskSearchCriteria("report")) == []
+    assert search_all(repository, TaskSearchCriteria("draft")) == []
+    assert search_all(repository, TaskSearchCriteria("summary final")) == [task.id]
+
+    repository.delete(task.id)
+    assert search_all(repository, TaskSearchCriteria("summary")) == []
+    with db.engine.begin() as conn:
+        # 外部コンテンツの索引と tasks が一致しない場合は例外になる
+        conn.exec_driver_sql(
+            "INSERT INTO tasks_fts (tasks_fts) VALUES ('integrity-check')"
+        )
+
+
+def test_short_terms_fall_back_to_substring_match(
+    repository: SqliteTaskRepository, project: Project
+) -> None:
+    """3文字未満の語は索引を使わず部分一致で照合し、関連度は付けない"""
+    ui = repository.save(Task(name="build UI", project_id=project.id))
+    guide = repository.save(
+        Task(name="guide", description="style", project_id=project.id)
+    )
+    repository.save(Task(name="backend", project_id=project.id))
+
+    result = repository.search(TaskSearchCriteria("ui"))
+    assert {task.id for task in result.tasks} == {ui.id, guide.id}
+    assert result.scores is None
+
+    result = repository.search(TaskSearchCriteria("ui style"))
+    assert [task.id for task in result.tasks] == [guide.id]
+    assert result.scores is not None and len(result.scores) == 1
+
+    percent = repository.save(Task(name="50% done", project_id=project.id))
+    assert search_all(repository, TaskSearchCriteria("%")) == [percent.id]
+
+
+def test_tags_are_anded(repository: SqliteTaskRepository, project: Project) -> None:
+    """複数のタグはすべてを持つタスクだけが対象になる"""
+    both = repository.save(
+        Task(name="a", project_id=project.id, tags=["backend", "urgent"])
+    )
+    repository.save(Task(name="b", project_id=project.id, tags=["backend"]))
+    repository.save(Task(name="c", project_id=project.id, tags=["urgent", "qa"]))
+
+    assert search_all(repository, TaskSearchCriteria(tags=["backend", "urgent"])) == [
+        both.id
+    ]
+    assert len(search_all(repository, TaskSearchCriteria(tags=["urgent"]))) == 2
+    assert search_all(repository, TaskSearchCriteria(tags=["backend", "qa"])) == []
+
+
+def test_pagination_totals(repository: SqliteTaskRepository, project: Project) -> None:
+    """総数・ページ数・次ページの有無が正しく、ページをつなげると重複も欠落もない"""
+    saved = repository.save_many(
+        [Task(name=f"task {i:02d}", project_id=project.id) for i in range(25)]
+    )
+    criteria = TaskSearchCriteria("task")
+
+    pages = [repository.search(criteria, page, 10) for page in range(4)]
+
+    assert [page.total for page in pages] == [25] * 4
+    assert [page.page_count for page in pages] == [3] * 4
+    assert [len(page.tasks) for page in pages] == [10, 10, 5, 0]
+    assert [page.has_next for page in pages] == [True, True, False, False]
+    found = [task.id for page in pages for task in page.tasks]
+    assert sorted(found) == sorted(task.id for task in saved)
+
+    empty = repository.search(TaskSearchCriteria("nothing"), 0, 10)
+    assert (empty.total, empty.page_count, empty.has_next) == (0, 1, False)
+    with pytest.raises(ValueError):
+        repository.search(criteria, -1, 10)
+    with pytest.raises(ValueError):
+        repository.search(criteria, 0, 0)
+
+
+def test_results_are_ordered_by_bm25(
+    repository: SqliteTaskRepository, project: Project
+) -> None:
+    """関連度の高い順に並び、名前に含むタスクは説明だけに含むタスクより、短い名前は長い名前より上位になる"""
+    repository.save_many(
+        [Task(name=f"filler {i}", project_id=project.id) for i in range(20)]
+    )
+    in_description = repository.save(
+        Task(name="misc", description="plan the migration", project_id=project.id)
+    )
+    in_long_name = repository.save(
+        Task(name="migration of the billing system", project_id=project.id)
+    )
+    in_name = repository.save(Task(name="migration", project_id=project.id))
+
+    result = repository.search(TaskSearchCriteria("migration"))
+
+    assert [task.id for task in result.tasks] == [
+        in_name.id,
+        in_long_name.id,
+        in_description.id,
+    ]
+    assert result.scores is not None
+    assert result.scores == sorted(result.scores, reverse=True)
+    assert all(score > 0 for score in result.scores)
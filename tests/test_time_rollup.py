@@ -0,0 +1,145 @@
+"""
+作業時間集計の差分更新のテスト
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Callable, List, Sequence, Tuple
+
+from sqlalchemy import select
+
+from ccpm.domain.entities.project import Project
+from ccpm.domain.entities.task import Task
+from ccpm.domain.entities.time_record import TimeRecord
+from ccpm.infrastructure.db.db_manager import DatabaseManager
+from ccpm.infrastructure.db.schema import time_rollups
+from ccpm.infrastructure.repositories.sqlite_project_repository import (
+    SqliteProjectRepository,
+)
+from ccpm.infrastructure.repositories.sqlite_task_repository import SqliteTaskRepository
+from ccpm.infrastructure.repositories.sqlite_time_repository import SqliteTimeRepository
+
+RollupRow = Tuple[str, str, str, str, float, int]
+
+
+def rollup_rows(db: DatabaseManager) -> List[RollupRow]:
+    """集計テーブルの全行（作業時間は丸めて比較）"""
+    with db.engine.connect() as conn:
+        rows = conn.execute(select(time_rollups)).all()
+    return sorted(
+        (
+            row.granularity,
+            row.scope,
+            row.scope_key,
+            str(row.bucket),
+            round(row.hours, 9),
+            row.record_count,
+        )
+        for row in rows
+    )
+
+
+def test_incremental_rollups_match_rebuild(db: DatabaseManager) -> None:
+    """時間記録とタスクをランダムに編集した後の集計が、作り直した集計と一致する"""
+    rng = random.Random(11)
+    project_repository = SqliteProjectRepository(db)
+    task_repository = SqliteTaskRepository(db)
+    time_repository = SqliteTimeRepository(db)
+
+    projects = [Project(name=f"project-{i}") for i in range(3)]
+    project_repository.save_many(projects)
+    tasks = [
+        Task(
+            name=f"task-{i}",
+            project_id=rng.choice(projects).id,
+            category=rng.choice(["設計", "実装", "テスト"]),
+        )
+        for i in range(8)
+    ]
+    task_repository.save_many(tasks)
+    base = datetime(2026, 3, 2, 9, 0)
+    records: List[TimeRecord] = []
+
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.4 or not records:
+            start = base + timedelta(days=rng.randint(0, 20), hours=rng.randint(0, 8))
+            record = TimeRecord(
+                task_id=rng.choice(tasks).id,
+                start_time=start,
+                end_time=start + timedelta(minutes=rng.randint(10, 240)),
+            )
+            records.append(time_repository.save(record))
+        elif action < 0.6:
+            record = rng.choice(records)
+            record.start_time = base + timedelta(days=rng.randint(0, 20))
+            record.end_time = record.start_time + timedelta(
+                minutes=rng.randint(10, 240)
+            )
+            record.task_id = rng.choice(tasks).id
+            time_repository.save(record)
+        elif action < 0.7:
+            batch = rng.sample(records, min(3, len(records)))
+            for record in batch:
+                record.duration = rng.uniform(0.1, 3.0)
+            time_repository.save_many(batch)
+        elif action < 0.8:
+            record = records.pop(rng.randrange(len(records)))
+            time_repository.delete(record.id)
+        elif action < 0.95:
+            task = rng.choice(tasks)
+            task.project_id = rng.choice(projects).id
+            task.category = rng.choice(["設計", "実装", "テスト", "調整"])
+            task_repository.save(task)
+        elif len(tasks) > 4:
+            # タスクを削除すると時間記録も連鎖して削除される
+            task = tasks.pop(rng.randrange(len(tasks)))
+            task_repository.delete(task.id)
+            records = [record for record in records if record.task_id != task.id]
+
+    incremental = rollup_rows(db)
+    assert incremental
+    time_repository.rebuild_rollups()
+    assert incremental == rollup_rows(db)
+
+
+def test_incremental_rollups_match_rebuild_under_concurrent_saves(
+    file_db: DatabaseManager,
+    concurrently: Callable[[Sequence[Callable[[], None]]], None],
+) -> None:
+    """別々の接続から同じ時間記録を同時に保存し直しても、集計が作り直した集計と一致する"""
+    project = SqliteProjectRepository(file_db).save(Project(name="集計"))
+    tasks = SqliteTaskRepository(file_db).save_many(
+        [Task(name=f"task-{i}", project_id=project.id) for i in range(2)]
+    )
+    base = datetime(2026, 3, 2, 9, 0)
+    record = SqliteTimeRepository(file_db).save(
+        TimeRecord(
+            task_id=tasks[0].id, start_time=base, end_time=base + timedelta(hours=2)
+        )
+    )
+
+    def editor(seed: int) -> Callable[[], None]:
+        def edit() -> None:
+            rng = random.Random(seed)
+            repository = SqliteTimeRepository(file_db)
+            for _ in range(10):
+                stored = repository.find_by_id(record.id)
+                assert stored is not None
+                stored.task_id = rng.choice(tasks).id
+                stored.start_time = base + timedelta(days=rng.randint(0, 9))
+                stored.end_time = stored.start_time + timedelta(
+                    minutes=rng.randint(10, 240)
+                )
+                repository.save(stored)
+
+        return edit
+
+    concurrently([editor(seed) for seed in range(6)])
+
+    incremental = rollup_rows(file_db)
+    assert incremental
+    assert {row[5] for row in incremental} == {1}
+    time_repository = SqliteTimeRepository(file_db)
+    time_repository.rebuild_rollups()
+    assert incremental == rollup_rows(file_db)